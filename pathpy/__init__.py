@@ -25,12 +25,14 @@ __version__ = "3.1.1"
 
 # import os
 import sys
+from typing import TYPE_CHECKING
 
 # import utils
 from pathpy.utils.config import config  # noqa: F401
 from pathpy.utils.logger import logger  # noqa: F401
 from pathpy.utils.progress import tqdm  # noqa: F401
 from pathpy.utils.errors import FileFormatError, NetworkError, MissingModuleError
+from pathpy.utils.lazy import DeferredMethod, import_attribute
 
 
 # import symbols into root namespace
@@ -42,74 +44,89 @@ from pathpy.core.api import (
     NodeCollection,
     EdgeCollection,
     PathCollection,
+    PathStore,
     HyperEdgeCollection
 )
 
 # import models
-from pathpy.models.api import (
-    Network,
-    TemporalNetwork,
-    DirectedAcyclicGraph,
-    HigherOrderNetwork,
-    HigherOrderNode,
-    HigherOrderEdge,
-    NullModel,
-    MultiOrderModel,
-    MOGen
-)
-
-from pathpy.visualisations.api import (
-    plot,
-    layout
-)
-
-# import submodules
-from pathpy import io
-from pathpy import converters
-from pathpy import algorithms
-from pathpy import statistics
-from pathpy import processes
-from pathpy import generators
+from pathpy.models.network import Network
+
+# submodules, models and visualisations are imported when they are first
+# accessed, since they import pandas, scipy and others (PEP 562)
+_SUBMODULES = frozenset(['io', 'converters', 'algorithms', 'statistics',
+                         'processes', 'generators'])
+
+_ATTRIBUTES = {
+    'TemporalNetwork': 'pathpy.models.temporal_network',
+    'DirectedAcyclicGraph': 'pathpy.models.directed_acyclic_graph',
+    'HigherOrderNetwork': 'pathpy.models.higher_order_network',
+    'HigherOrderNode': 'pathpy.models.higher_order_network',
+    'HigherOrderEdge': 'pathpy.models.higher_order_network',
+    'NullModel': 'pathpy.models.null_model',
+    'MultiOrderModel': 'pathpy.models.multi_order_model',
+    'MOGen': 'pathpy.models.MOGen',
+    'plot': 'pathpy.visualisations.api',
+    'layout': 'pathpy.visualisations.api',
+    'LayoutCache': 'pathpy.visualisations.api',
+}
+
+
+def __getattr__(name: str):
+    """Import submodules and objects when they are first accessed."""
+    value = import_attribute(__name__, name, _SUBMODULES, _ATTRIBUTES)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the names of the module including lazily imported names."""
+    return sorted(set(globals()) | _SUBMODULES | set(_ATTRIBUTES))
+
+
+if TYPE_CHECKING:
+    from pathpy.models.api import (
+        TemporalNetwork,
+        DirectedAcyclicGraph,
+        HigherOrderNetwork,
+        HigherOrderNode,
+        HigherOrderEdge,
+        NullModel,
+        MultiOrderModel,
+        MOGen
+    )
+    from pathpy.visualisations.api import plot, layout, LayoutCache
+    from pathpy import (io, converters, algorithms, statistics, processes,
+                        generators)
 
 
 # add functions to Network class
 
-# load external functions to the network
-Network.adjacency_matrix = algorithms.adjacency_matrix  # type: ignore
-Network.transition_matrix = algorithms.transition_matrix  # type: ignore
-Network.distance_matrix = algorithms.distance_matrix  # type: ignore
-Network.diameter = algorithms.diameter  # type: ignore
-Network.avg_path_length = algorithms.avg_path_length
-
-Network.betweenness_centrality = algorithms.betweenness_centrality  # type: ignore
-Network.closeness_centrality = algorithms.closeness_centrality  # type: ignore
-
-Network.find_connected_components = algorithms.find_connected_components  # type: ignore
-Network.largest_connected_component = algorithms.largest_connected_component  # type: ignore
-Network.largest_component_size = algorithms.largest_component_size  # type: ignore
-Network.is_connected = algorithms.is_connected
-
-Network.mean_degree = statistics.mean_degree
-Network.mean_neighbor_degree = statistics.mean_neighbor_degree
-Network.degree_sequence = statistics.degree_sequence
-Network.degree_assortativity = statistics.degree_assortativity
-Network.degree_central_moment = statistics.degree_central_moment
-Network.degree_distribution = statistics.degree_distribution
-Network.degree_generating_function = statistics.degree_generating_function
-Network.degree_raw_moment = statistics.degree_raw_moment
-Network.molloy_reed_fraction = statistics.molloy_reed_fraction
+# load external functions to the network when they are first called
+for _name in ['adjacency_matrix', 'transition_matrix', 'distance_matrix',
+              'diameter', 'avg_path_length', 'betweenness_centrality',
+              'closeness_centrality', 'find_connected_components',
+              'largest_connected_component', 'largest_component_size',
+              'is_connected']:
+    setattr(Network, _name, DeferredMethod('pathpy.algorithms', _name))
 
-Network.avg_clustering_coefficient = statistics.avg_clustering_coefficient
-Network.local_clustering_coefficient = statistics.local_clustering_coefficient
+for _name in ['mean_degree', 'mean_neighbor_degree', 'degree_sequence',
+              'degree_assortativity', 'degree_central_moment',
+              'degree_distribution', 'degree_generating_function',
+              'degree_raw_moment', 'molloy_reed_fraction',
+              'avg_clustering_coefficient', 'local_clustering_coefficient']:
+    setattr(Network, _name, DeferredMethod('pathpy.statistics', _name))
 
-Network.plot = plot
+Network.plot = DeferredMethod('pathpy.visualisations.api', 'plot')
 
 
 # create logger for the the init file
 LOG = logger(__name__)
 
-# check in which environment pathpy is running
+# check in which environment pathpy is running, where IPython is only
+# imported if pathpy runs in IPython
 try:
+    if 'IPython' not in sys.modules:
+        raise ModuleNotFoundError('IPython')
     from IPython import get_ipython  # noqa: F401
 except ModuleNotFoundError:
     config['environment']['IDE'] = 'console'
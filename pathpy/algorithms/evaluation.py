@@ -12,11 +12,14 @@ from __future__ import annotations
 from typing import Optional, Union
 from functools import singledispatch
 
+import numpy as np
 from numpy.random import choice, shuffle, permutation
 
 from pathpy import logger
-from pathpy.models.api import Network
-from pathpy.models.api import TemporalNetwork
+from pathpy.models.network import Network
+from pathpy.models.temporal_network import TemporalNetwork
+from pathpy.utils.errors import ParameterError
+from pathpy.generators.edge_swaps import EdgeSwapChain
 
 # create logger
 LOG = logger(__name__)
@@ -156,26 +159,70 @@ def adjusted_mutual_information(clustering_1: dict, clustering_2: dict):
     raise NotImplementedError('Adjusted mutual information is not implemented')
 
 
-def shuffle_temporal_network(net: TemporalNetwork):
+def shuffle_temporal_network(net: TemporalNetwork, method: str = 'timestamps',
+                             swaps: Optional[int] = None) -> TemporalNetwork:
     """
     Randomly reassigns timestamps (start, end, duration) of edges in a temporal network.
     This is useful to generate a random baseline for temporal patterns in temporal networks.
-    """
-    timestamps = []
-    edges = []
 
-    for edge in net.edges[:]:
-        timestamps.append((edge.start, edge.end))
-        edges.append(edge.uid)
+    Parameters
+    ----------
+
+    net: TemporalNetwork
 
-    shuffled_net = TemporalNetwork(directed=net.directed, multiedges=net.multiedges, uid='{0}_shuffled'.format(net.uid), **net.attributes)
+        The temporal network to be shuffled.
 
-    permute = permutation(len(timestamps))
-    
-    for i in range(len(timestamps)):
-        ots = timestamps[i]
-        nts = timestamps[permute[i]]
-        e = net.edges[edges[i]]
-        shuffled_net.add_edge(e.v, e.w, start=nts[0], end=nts[1], **e.attributes)
+    method: str = 'timestamps'
+
+        The randomization of the temporal network:
 
-    return shuffled_net
+        'timestamps': the times of events are permuted across all events, which preserves
+        the aggregate network and the number of events of each edge.
+
+        'links': the timelines, i.e. the sequences of events, are permuted across edges,
+        which preserves the aggregate network and the correlations of events on each edge.
+
+        'edge_swap': the aggregate network is randomized by degree-preserving double edge
+        swaps, where each edge keeps its timeline.
+
+    swaps: Optional[int] = None
+
+        The number of attempted edge swaps for method 'edge_swap'. If None, ten swaps per
+        edge are attempted.
+    """
+    edges = list(net.edges)
+    events = [edge._sorted_events() for edge in edges]
+
+    # events are given by the index of their edge, their times and attributes
+    item = np.repeat(np.arange(len(edges)), [len(e) for e in events])
+    start = np.array([s for e in events for s, _, _ in e])
+    end = np.array([t for e in events for _, t, _ in e])
+    attributes = [a for e in events for _, _, a in e]
+
+    index = net.nodes.index
+    v = np.array([index[e.v.uid] for e in edges], dtype=np.int64)
+    w = np.array([index[e.w.uid] for e in edges], dtype=np.int64)
+
+    if method == 'timestamps':
+        permute = permutation(len(start))
+        start, end = start[permute], end[permute]
+    elif method == 'links':
+        item = permutation(len(edges))[item]
+    elif method == 'edge_swap':
+        chain = EdgeSwapChain(v, w, len(index), directed=net.directed,
+                              multiedges=net.multiedges)
+        chain.swap(10 * len(edges) if swaps is None else swaps)
+        v, w = chain.edges()
+    else:
+        msg = 'Unknown method "{0}", supported methods are timestamps, links and edge_swap'.format(method)
+        LOG.error(msg)
+        raise ParameterError(msg)
+
+    keys = {key for a in attributes for key in a}
+    uids = np.array([e.uid for e in edges], dtype=object)[item] if net.multiedges else None
+
+    return TemporalNetwork.from_arrays(
+        v[item], w[item], start, end, nodes=sorted(index, key=index.__getitem__),
+        directed=net.directed, multiedges=net.multiedges, uids=uids,
+        edge_attributes={key: [a.get(key) for a in attributes] for key in keys},
+        uid='{0}_shuffled'.format(net.uid), **net.attributes)
@@ -13,7 +13,7 @@
 
 from pathpy.core.node import Node, NodeCollection
 from pathpy.core.edge import Edge, EdgeCollection
-from pathpy.core.path import Path, PathCollection
+from pathpy.core.path import Path, PathCollection, PathStore
 from pathpy.core.hyperedge import HyperEdge, HyperEdgeCollection
 
 # =============================================================================
@@ -22,13 +22,17 @@ LOG = logger(__name__)
 class PathPyObject:
     """Base class for all pathpy core objects."""
 
+    # core objects store their variables in slots rather than in a dict per
+    # object, subclasses without slots get a dict as usual
+    __slots__ = ('_uid', '_has_python_uid', '_attributes', '__weakref__')
+
     def __init__(self, uid: Optional[str] = None, **kwargs: Any) -> None:
         """Initialize the base class."""
 
         # declare variable
         self._uid: str
         self._has_python_uid: bool
-        self._attributes: Any
+        self._attributes: Optional[dict]
 
         # assign node identifier
         if uid is not None:
@@ -38,8 +42,9 @@ class PathPyObject:
             self._uid = hex(id(self))
             self._has_python_uid = True
 
-        # update attributes
-        self._attributes = kwargs
+        # update attributes, where the dict of attributes is only created if
+        # attributes are given
+        self._attributes = kwargs or None
 
     def __setitem__(self, key: Any, value: Any) -> None:
         """Add a specific attribute to the object.
@@ -68,7 +73,8 @@ class PathPyObject:
         >>> u['color'] = 'blue'
 
         """
-
+        if self._attributes is None:
+            self._attributes = {}
         self._attributes[key] = value
 
     def __getitem__(self, key: Any) -> Any:
@@ -104,6 +110,8 @@ class PathPyObject:
         'blue'
 
         """
+        if self._attributes is None:
+            return None
         return self._attributes.get(key, None)
 
     def __repr__(self) -> str:
@@ -186,6 +194,8 @@ class PathPyObject:
         'red'
 
         """
+        if self._attributes is None:
+            self._attributes = {}
         return self._attributes
 
     def update(self, **kwargs: Any) -> None:
@@ -213,7 +223,8 @@ class PathPyObject:
         {'color': 'green', 'shape': 'rectangle'}
 
         """
-
+        if self._attributes is None:
+            self._attributes = {}
         self._attributes.update(**kwargs)
 
     def copy(self):
@@ -310,18 +321,21 @@ class PathPyObject:
         """
         value: float
         weight = False if weight is None else weight
+        attributes = self._attributes or {}
 
         if not weight:
             value = default
         elif isinstance(weight, str) and weight != 'weight':
-            value = float(self.attributes.get(weight, 0.0))
+            value = float(attributes.get(weight, 0.0))
         else:
-            value = float(self.attributes.get('weight', default))
+            value = float(attributes.get('weight', default))
         return value
 
 
 class PathPySet(frozenset):
     """Class to store unordered relationships between objects."""
+    __slots__ = ()
+
     def __new__(cls, args, **kwargs):
         """Create a new PathPySet object."""
         # pylint: disable=unused-argument
@@ -332,44 +346,44 @@ class PathPySet(frozenset):
 
 
 class PathPyTuple(tuple):
-    """Class to store un/directed and ordered relationships between objects."""
+    """Class to store undirected and ordered relationships between objects.
+
+    Directed relationships are stored as plain tuples.
+    """
+    __slots__ = ()
+
+    # only undirected relationships are PathPyTuple objects
+    directed = False
+
     def __new__(cls, args, directed=True):
         """Create a new PathPyTuple object."""
-        # pylint: disable=unused-argument
+        if directed:
+            return tuple(args)
         return super(PathPyTuple, cls).__new__(cls, args)
 
-    def __init__(self, _, directed=True):
-        """ Initialize the new tuple class."""
-        # pylint: disable=super-init-not-called
-        # self._reversed = self[::-1]
-        self.directed = directed
-
     def __hash__(self):
-        return super().__hash__() if self.directed else super().__hash__() \
-            + hash(self[::-1])
+        return super().__hash__() + hash(self[::-1])
 
     def __eq__(self, other):
-        return super().__eq__(other) if self.directed else super().__eq__(other) \
-            or self[::-1] == other
+        return super().__eq__(other) or self[::-1] == other
 
     def __repr__(self):
-        return super().__repr__() if self.directed else '|'+super().__repr__()[1:-1]+'|'
+        return '|'+super().__repr__()[1:-1]+'|'
 
 
 class PathPyRelation(tuple):
-    """Relations object."""
+    """Relations object.
+
+    Directed and ordered relations are plain tuples, where the direction is
+    stored by the object owning the relation. Undirected relations are
+    :py:class:`PathPyTuple` and unordered relations :py:class:`PathPySet`
+    objects.
+    """
 
     def __new__(cls, args, directed=True, ordered=True):
-        """Create a new PathPySet object."""
+        """Create a new relation object."""
         return PathPyTuple(args, directed=directed) if ordered else PathPySet(args)
 
-    def __init__(self, _, directed=True, ordered=True):
-        """ Initialize the new tuple class."""
-        # pylint: disable=super-init-not-called
-        # self._reversed = self[::-1]
-        self.directed = directed
-        self.ordered = ordered
-
 
 class PathPyCounter(Counter):
     """A counter object for pathpy objects"""
@@ -407,6 +421,7 @@ class PathPyCounter(Counter):
 
 class PathPyEmpty(str):
     """Empty element"""
+    __slots__ = ()
 
     def __new__(cls, args):
         return super(PathPyEmpty, cls).__new__(cls, args)
@@ -423,6 +438,7 @@ class PathPyEmpty(str):
 
 class PathPyPath(PathPyObject):
     """Base class for a path."""
+    __slots__ = ('_directed', '_ordered', '_relations', '_objects')
 
     def __init__(self, *args: Union[str, PathPyObject],
                  uid: Optional[str] = None,
@@ -547,7 +563,8 @@ class PathPyPath(PathPyObject):
     def directed(self, directed: bool) -> None:
         """Set the direction of the path"""
         self._directed = directed
-        self._relations.directed = directed
+        self._relations = PathPyRelation(
+            self._relations, directed=directed, ordered=self._ordered)
 
     def items(self):
         """Return a new view of the container’s items ((key, value) pairs)."""
@@ -191,6 +191,8 @@ class Edge(PathPyPath):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, v: Union[str, PathPyObject],
                  w: Union[str, PathPyObject],
                  uid: Optional[str] = None,
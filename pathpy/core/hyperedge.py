@@ -23,6 +23,8 @@ LOG = logger(__name__)
 class HyperEdge(PathPyPath):
     """Base class for a hyperedge.  """
 
+    __slots__ = ()
+
     def __init__(self, *nodes: Union[str, PathPyObject],
                  uid: Optional[str] = None, **kwargs: Any) -> None:
         """Initialize the node object."""
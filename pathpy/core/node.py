@@ -119,6 +119,8 @@ class Node(PathPyPath):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *node: Union[str, PathPyObject],
                  uid: Optional[str] = None, **kwargs: Any) -> None:
         """Initialize the node object."""
@@ -8,8 +8,11 @@
 #
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
-from typing import Any, Optional, Union
+from __future__ import annotations
+from typing import Any, Iterator, Optional, Sequence, Union
+from collections import Counter
 from singledispatchmethod import singledispatchmethod  # NOTE: not needed at 3.9
+import numpy as np
 
 from pathpy import logger
 from pathpy.core.core import PathPyObject, PathPyPath, PathPyCollection
@@ -20,6 +23,7 @@ LOG = logger(__name__)
 
 class Path(PathPyPath):
     """Base class for a path."""
+    __slots__ = ()
 
     def summary(self) -> str:
         """Returns a summary of the path. """
@@ -157,6 +161,192 @@ class PathCollection(PathPyCollection):
         for arg in args:
             self.remove(*arg, **kwargs)
 
+
+class PathStore:
+    """A compact store of observed paths and their frequencies.
+
+    Different from a PathCollection, no objects are created for nodes and
+    paths. Instead, node uids are interned, i.e. mapped to consecutive integer
+    codes, and the frequencies of paths are accumulated in a counter keyed by
+    tuples of node codes. Stores can be filled independently, e.g. from
+    different shards of a file, and merged afterwards. Higher-order networks
+    and multi-order models can be fitted to a path store directly.
+
+    Parameters
+    ----------
+    directed : bool = True
+
+        Whether or not the paths are directed.
+
+    Examples
+    --------
+    >>> from pathpy import PathStore
+    >>> store = PathStore()
+    >>> store.add('a', 'b', 'c', count=2)
+    >>> store.add('b', 'c')
+    >>> store.subpath_counts(1)
+    Counter({('b', 'c'): 3, ('a', 'b'): 2})
+
+    """
+
+    def __init__(self, directed: bool = True) -> None:
+        """Initialize the path store."""
+        self.directed: bool = directed
+
+        # node uids and their integer codes
+        self.nodes: list = []
+        self.index: dict = {}
+
+        # frequencies of paths given as tuples of node codes
+        self.counter: Counter = Counter()
+
+        # cached arrays of the paths
+        self._arrays: Optional[tuple] = None
+
+    def __len__(self) -> int:
+        """Returns the number of distinct paths."""
+        return len(self.counter)
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Iterates over the distinct paths as tuples of node uids."""
+        nodes = self.nodes
+        for codes in self.counter:
+            yield tuple(nodes[code] for code in codes)
+
+    def items(self) -> Iterator[tuple]:
+        """Iterates over the paths and their frequencies."""
+        nodes = self.nodes
+        for codes, count in self.counter.items():
+            yield tuple(nodes[code] for code in codes), count
+
+    def encode(self, uids: Sequence[str]) -> tuple:
+        """Returns the codes of the given node uids, where unknown uids are
+        added to the interning table."""
+        index = self.index
+        try:
+            return tuple([index[uid] for uid in uids])
+        except KeyError:
+            for uid in uids:
+                if uid not in index:
+                    index[uid] = len(self.nodes)
+                    self.nodes.append(uid)
+            return tuple([index[uid] for uid in uids])
+
+    def add(self, *uids: str, count: Union[int, float] = 1) -> None:
+        """Adds a path given by a sequence of node uids."""
+        self.counter[self.encode(uids)] += count
+        self._arrays = None
+
+    def update(self, other: PathStore) -> None:
+        """Adds the paths of another store, e.g. of a different shard."""
+        mapping = self.encode(other.nodes)
+        counter = self.counter
+        for codes, count in other.counter.items():
+            counter[tuple([mapping[code] for code in codes])] += count
+        self._arrays = None
+
+    def arrays(self) -> tuple:
+        """Returns the paths as arrays `indptr`, `indices` and `counts`, where
+        the node codes of the i-th path are `indices[indptr[i]:indptr[i+1]]`.
+        """
+        if self._arrays is None:
+            lengths = np.fromiter((len(codes) for codes in self.counter),
+                                  dtype=np.int64, count=len(self.counter))
+            indptr = np.zeros(len(lengths)+1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+            indices = np.fromiter(
+                (code for codes in self.counter for code in codes),
+                dtype=np.int64, count=int(indptr[-1]))
+            counts = np.array(list(self.counter.values()))
+            if counts.dtype.kind not in 'iuf':
+                counts = counts.astype(np.float64)
+            self._arrays = (indptr, indices, counts)
+        return self._arrays
+
+    def subpath_counts(self, length: int,
+                       observed: Optional[bool] = None) -> Counter:
+        """Returns the frequencies of all subpaths with the given length.
+
+        Parameters
+        ----------
+        length : int
+
+            number of edges of the subpaths, i.e. the subpaths consist of
+            `length+1` nodes
+
+        observed : Optional[bool] = None
+
+            If True, only paths with exactly the given length are counted. If
+            False, only subpaths of longer paths are counted. If None, both
+            are counted.
+
+        Returns
+        -------
+        Counter
+
+            frequencies of the subpaths given as tuples of node uids, which
+            are ordered by their first occurrence
+
+        """
+        indptr, indices, counts = self.arrays()
+        size = max(length, 0) + 1
+
+        # number of subpaths in each path
+        lengths = np.diff(indptr)
+        if observed is None:
+            select = lengths >= size
+        elif observed:
+            select = lengths == size
+        else:
+            select = lengths > size
+        windows = (lengths - size + 1)[select]
+        total = int(windows.sum())
+        if total == 0:
+            return Counter()
+
+        # start positions and nodes of all subpaths
+        offsets = np.arange(total) - np.repeat(np.cumsum(windows) - windows,
+                                               windows)
+        starts = np.repeat(indptr[:-1][select], windows) + offsets
+        subpaths = indices[starts[:, None] + np.arange(size)]
+        weights = np.repeat(counts[select], windows)
+
+        # subpaths are identified by a single integer key if possible
+        if len(self.nodes) ** size < 2 ** 63:
+            keys = subpaths @ (len(self.nodes) ** np.arange(size,
+                                                            dtype=np.int64))
+            _, first, inverse = np.unique(keys, return_index=True,
+                                          return_inverse=True)
+        else:
+            _, first, inverse = np.unique(subpaths, axis=0, return_index=True,
+                                          return_inverse=True)
+        unique = subpaths[first]
+        frequencies = np.bincount(inverse.ravel(), weights=weights,
+                                  minlength=len(unique))
+        if counts.dtype.kind in 'iu':
+            frequencies = frequencies.astype(np.int64)
+
+        nodes = self.nodes
+        order = np.argsort(first)
+        return Counter({tuple(nodes[code] for code in unique[i]): frequency
+                        for i, frequency in zip(order.tolist(),
+                                                frequencies[order].tolist())})
+
+    def to_paths(self) -> PathCollection:
+        """Returns a PathCollection with the paths of the store."""
+        paths = PathCollection(directed=self.directed)
+        for path, count in self.items():
+            paths.add(*path, count=count)
+        return paths
+
+    @classmethod
+    def from_paths(cls, paths: PathCollection) -> PathStore:
+        """Returns a path store with the paths of a PathCollection."""
+        store = cls(directed=paths.directed)
+        for uid, path in paths.items():
+            store.add(*path.relations, count=paths.counter[uid])
+        return store
+
 # =============================================================================
 # eof
 #
@@ -8,9 +8,10 @@
 #
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
-from typing import Any, Optional, Union
+from typing import Any, Iterator, List, Optional, Sequence, Union
 from singledispatchmethod import singledispatchmethod  # NOTE: not needed at 3.9
-from intervaltree import IntervalTree
+from intervaltree import Interval, IntervalTree
+import numpy as np
 import pandas as pd
 
 from pathpy import logger, config
@@ -33,14 +34,21 @@ class TemporalPathPyObject(PathPyObject):
         self._start = float('-inf')
         self._end = float('inf')
 
-        # initialize an intervaltree to save events
-        self._events = IntervalTree()
-
-        # add new events
-        self.event(**kwargs)
+        # add the first event, where the intervaltree to save events is only
+        # created when the events are accessed
+        if kwargs.pop('active', True):
+            start, end, kwargs = _get_start_end(**kwargs)
+            if not start < end:
+                raise ValueError('Null events not allowed: '
+                                 '{0}'.format(Interval(start, end)))
+            self._set_events([start], [end], [kwargs])
+        else:
+            self._events = IntervalTree()
+            self.event(active=False, **kwargs)
 
         # variable to store changes in the events
-        self._len_events = len(self._events)
+        self._len_events = len(self._bulk_events[0]) \
+            if self._bulk_events is not None else len(self._events)
 
     def __iter__(self):
         self._clean_events()
@@ -136,11 +144,321 @@ class TemporalPathPyObject(PathPyObject):
         self._start = self._events.begin()
         self._end = self._events.end()
 
+    def _sorted_events(self) -> list:
+        """Returns the events as sorted (start, end, attributes) tuples.
+
+        Events added in bulk are returned without creating the interval tree,
+        unless they overlap and have to be cleaned first.
+        """
+        if self._bulk_events is not None:
+            start, end, attributes = (
+                values.tolist() if isinstance(values, np.ndarray) else values
+                for values in self._bulk_events)
+            events = sorted(zip(start, end, range(len(start))))
+            if all(e[1] <= f[0] for e, f in zip(events[:-1], events[1:])):
+                return [(s, e, attributes[i] or {}) for s, e, i in events]
+
+        self._clean_events()
+        return [(i.begin, i.end, i.data) for i in sorted(self._events)]
+
     def last(self):
         """return the last added intervall"""
         interval = sorted(self._events)[-1]
         return interval.begin, interval.end, interval.data
 
+    @property
+    def _events(self) -> IntervalTree:
+        """Interval tree of events, which is created on first access if
+        events were added in bulk."""
+        if self._bulk_events is not None:
+            self._tree = IntervalTree(
+                Interval(start, end, {} if attributes is None else attributes)
+                for start, end, attributes in zip(*self._bulk_events))
+            self._bulk_events = None
+        return self._tree
+
+    @_events.setter
+    def _events(self, tree: IntervalTree) -> None:
+        self._tree: IntervalTree = tree
+        self._bulk_events: Optional[tuple] = None
+
+    def _set_events(self, start: list, end: list,
+                    attributes: Optional[list] = None) -> None:
+        """Replaces all events of the object.
+
+        The interval tree of the events is only created when the events are
+        accessed, such that large numbers of objects can be created without
+        building one interval tree per object.
+
+        Parameters
+        ----------
+        start: list
+
+            start times of events
+
+        end: list
+
+            end times of events
+
+        attributes: Optional[list] = None
+
+            attribute dictionaries of events, where None denotes events
+            without attributes
+        """
+        if attributes is None:
+            attributes = [None] * len(start)
+        self._bulk_events = (start, end, attributes)
+        self._start = min(start)
+        self._end = max(end)
+        self._attributes = dict(attributes[-1] or {})
+
+        # events added in bulk have not been cleaned yet
+        self._len_events = -1
+
+
+class EventIndex:
+    """Index of the events of all objects in a temporal collection.
+
+    Different from an interval tree, the start and end times of events are
+    stored in numpy arrays sorted by start time, where the data of each event
+    is the uid of the corresponding object. Events can be added in bulk in
+    O(n) and are merged into the sorted arrays when the index is queried,
+    where only the added events are sorted. A running maximum of end times
+    gives the first event that can overlap a queried time, such that
+    queries do not scan the events before it.
+    Queries support the slicing and iteration interface of
+    :py:class:`intervaltree.IntervalTree`, i.e. they return
+    :py:class:`intervaltree.Interval` objects.
+
+    Examples
+    --------
+    >>> index = EventIndex()
+    >>> index.extend([1, 3], [2, 5], ['a-b', 'b-c'])
+    >>> index[4:6]
+    {Interval(3, 5, 'b-c')}
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._begin: np.ndarray = np.empty(0, dtype=np.int64)
+        self._end: np.ndarray = np.empty(0, dtype=np.int64)
+        self._data: np.ndarray = np.empty(0, dtype=object)
+
+        # running maximum of the end times in the order of start times
+        self._reach: np.ndarray = np.empty(0, dtype=np.int64)
+
+        # chunks of events that have not been merged into the arrays yet
+        self._chunks: List[tuple] = []
+        self._buffer: List[tuple] = []
+
+    def __setitem__(self, index: slice, data: Any) -> None:
+        """Adds a single event with a given start and end time."""
+        if not index.start < index.stop:
+            raise ValueError('EventIndex: Null events not allowed: '
+                             '{0}'.format(Interval(index.start, index.stop, data)))
+        self._buffer.append((index.start, index.stop, data))
+
+    def extend(self, begin: Sequence, end: Sequence, data: Sequence) -> None:
+        """Adds multiple events.
+
+        Parameters
+        ----------
+        begin: Sequence
+
+            start times of events
+
+        end: Sequence
+
+            end times of events
+
+        data: Sequence
+
+            data, e.g. the object uid, of each event
+        """
+        begin, end = np.asarray(begin), np.asarray(end)
+        if isinstance(data, np.ndarray) and data.dtype == object:
+            _data = data
+        else:
+            _data = np.empty(len(begin), dtype=object)
+            _data[:] = data.tolist() if hasattr(data, 'tolist') else list(data)
+        if len(begin) == 0:
+            return
+        if not np.all(begin < end):
+            raise ValueError('EventIndex: Null events not allowed')
+        self._chunks.append((begin, end, _data))
+
+    def _compact(self, limit: int = 0) -> None:
+        """Merges added events into the sorted arrays.
+
+        Only the added events are sorted, after which they are inserted
+        behind the indexed events with the same start time. Hence, adding m
+        events to an index of n events takes O(m log m + n) rather than a
+        sort of all events.
+
+        Parameters
+        ----------
+        limit: int = 0
+
+            maximal number of added events which are not merged but kept in
+            a single unsorted chunk, which is scanned by queries
+        """
+        if self._buffer:
+            begin, end, data = zip(*self._buffer)
+            self._buffer = []
+            self.extend(begin, end, data)
+        if not self._chunks:
+            return
+
+        begin = np.concatenate([c[0] for c in self._chunks])
+        end = np.concatenate([c[1] for c in self._chunks])
+        data = np.concatenate([c[2] for c in self._chunks])
+        self._chunks = [(begin, end, data)]
+        if len(begin) <= limit:
+            return
+        self._chunks = []
+
+        # sort added events by start time, end time and data, such that
+        # duplicate events are adjacent and can be removed as in an interval
+        # tree, where indexed events with the same start time are compared
+        # as well
+        indexed = self._same_begin(begin)
+        flags = np.concatenate((np.zeros(len(indexed), dtype=bool),
+                                np.ones(len(begin), dtype=bool)))
+        begin = np.concatenate((self._begin[indexed], begin))
+        end = np.concatenate((self._end[indexed], end))
+        data = np.concatenate((self._data[indexed], data))
+        codes = pd.factorize(data)[0]
+        order = np.lexsort((flags, codes, end, begin))
+        begin, end, data, codes, flags = begin[order], end[order], \
+            data[order], codes[order], flags[order]
+        unique = np.ones(len(begin), dtype=bool)
+        unique[1:] = (begin[1:] != begin[:-1]) | (end[1:] != end[:-1]) | \
+            (codes[1:] != codes[:-1])
+        added = unique & flags
+        begin, end, data = begin[added], end[added], data[added]
+
+        # merge the sorted events into the sorted arrays
+        n, m = len(self._begin), len(begin)
+        merged = np.zeros(n + m, dtype=bool)
+        merged[np.searchsorted(self._begin, begin, side='right') +
+               np.arange(m)] = True
+        order = np.empty(n + m, dtype=np.int64)
+        order[~merged] = np.arange(n)
+        order[merged] = np.arange(n, n + m)
+        self._begin = np.concatenate((self._begin, begin))[order]
+        self._end = np.concatenate((self._end, end))[order]
+        self._data = np.concatenate((self._data, data))[order]
+        self._reach = np.maximum.accumulate(self._end)
+
+    def _same_begin(self, begin: np.ndarray) -> np.ndarray:
+        """Returns the positions of indexed events which start at one of the
+        given times."""
+        if not len(self._begin):
+            return np.empty(0, dtype=np.int64)
+        times = np.unique(begin)
+        left = np.searchsorted(self._begin, times, side='left')
+        counts = np.searchsorted(self._begin, times, side='right') - left
+        offsets = np.cumsum(counts) - counts
+        return np.repeat(left - offsets, counts) + np.arange(counts.sum())
+
+    def _overlapping(self, start: Any, n: int) -> np.ndarray:
+        """Returns the positions of events among the first n events which end
+        after a given time."""
+        first = np.searchsorted(self._reach[:n], start, side='right')
+        if first >= n:
+            return np.empty(0, dtype=np.int64)
+        return first + np.flatnonzero(self._end[first:n] > start)
+
+    def _intervals(self, index: np.ndarray, arrays: Optional[tuple] = None
+                   ) -> set:
+        """Returns the events at the given positions as intervals."""
+        begin, end, data = arrays or (self._begin, self._end, self._data)
+        return set(Interval(*event) for event in zip(
+            begin[index].tolist(), end[index].tolist(), data[index].tolist()))
+
+    def __getitem__(self, index: Union[slice, Any]) -> set:
+        """Returns the events overlapping a point in time or a time range."""
+        if isinstance(index, slice):
+            if index.start is None and index.stop is None:
+                self._compact()
+                return self._intervals(slice(None))
+            start = self.begin() if index.start is None else index.start
+            stop = self.end() if index.stop is None else index.stop
+        else:
+            start = stop = index
+
+        # events added since the last merge are scanned separately as long
+        # as they are few compared to the indexed events
+        self._compact(limit=max(256, len(self._begin) // 16))
+        if isinstance(index, slice):
+            n = np.searchsorted(self._begin, stop, side='left')
+        else:
+            n = np.searchsorted(self._begin, stop, side='right')
+        events = self._intervals(self._overlapping(start, n))
+        if self._chunks:
+            begin, end, _ = self._chunks[0]
+            if isinstance(index, slice):
+                added = (begin < stop) & (end > start)
+            else:
+                added = (begin <= stop) & (end > start)
+            events |= self._intervals(np.flatnonzero(added), self._chunks[0])
+        return events
+
+    def __iter__(self) -> Iterator[Interval]:
+        """Iterates through all events in the order of their start times."""
+        self._compact()
+        for event in zip(self._begin.tolist(), self._end.tolist(),
+                         self._data.tolist()):
+            yield Interval(*event)
+
+    def __len__(self) -> int:
+        """Returns the number of events."""
+        self._compact()
+        return len(self._begin)
+
+    def begin(self) -> Any:
+        """Returns the earliest start time of all events."""
+        self._compact()
+        return _scalar(self._begin[0]) if len(self._begin) else 0
+
+    def end(self) -> Any:
+        """Returns the latest end time of all events."""
+        self._compact()
+        return _scalar(self._reach[-1]) if len(self._reach) else 0
+
+    def arrays(self) -> tuple:
+        """Returns the arrays of start times, end times and data of all
+        events, sorted by start time."""
+        self._compact()
+        return self._begin, self._end, self._data
+
+    def remove(self, interval: Interval) -> None:
+        """Removes a single event."""
+        self._compact()
+        match = np.flatnonzero((self._begin == interval.begin) &
+                               (self._end == interval.end) &
+                               (self._data == interval.data))
+        if len(match) == 0:
+            raise ValueError(interval)
+        self._delete(match)
+
+    def remove_data(self, data: Any) -> None:
+        """Removes all events with the given data, e.g. of an object."""
+        self._compact()
+        self._delete(np.flatnonzero(self._data == data))
+
+    def _delete(self, index: np.ndarray) -> None:
+        """Deletes the events at the given positions."""
+        self._begin = np.delete(self._begin, index)
+        self._end = np.delete(self._end, index)
+        self._data = np.delete(self._data, index)
+        self._reach = np.maximum.accumulate(self._end)
+
+
+def _scalar(value: Any) -> Any:
+    """Converts numpy scalars to python objects."""
+    return value.item() if isinstance(value, np.generic) else value
+
 
 def _get_start_end(*args, **kwargs) -> tuple:
     """Helper function to extract the start and end time"""
@@ -24,6 +24,9 @@ from pathpy.generators.random_graphs import (ER_nm,
                                              k_regular_random
                                              )
 from pathpy.generators.lattice import (lattice_network)
+from pathpy.generators.edge_swaps import (EdgeSwapChain,
+                                          edge_swap_randomize)
+from pathpy.generators.ensemble import (ensemble)
 
 # =============================================================================
 # eof
@@ -0,0 +1,269 @@
+"""Degree-preserving randomization of networks by double edge swaps"""
+# !/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : edge_swaps.py -- Markov chain of double edge swaps
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 09:37 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse  # pylint: disable=import-error
+
+from pathpy import logger
+from pathpy.models.network import Network
+from pathpy.generators.random_graphs import _adjacency, _integers
+
+# create logger
+LOG = logger(__name__)
+
+# number of swaps whose random numbers are drawn at once
+_BATCH = 1 << 16
+
+
+class EdgeSwapChain:
+    """Markov chain of degree-preserving double edge swaps.
+
+    The state of the chain is an edge list of integer node indices. In each
+    step, two random edges (a, b) and (c, d) are replaced by (a, d) and
+    (c, b), which preserves the degrees of all nodes, i.e. the in- and
+    out-degrees in directed networks. Swaps which would create loops or
+    multiple edges are rejected, where a hashed set of all edges allows to
+    test for multiple edges in constant time. Edges of undirected networks
+    are swapped in both orientations.
+
+    Parameters
+    ----------
+    v : Sequence[int]
+
+        indices of the source nodes of edges
+
+    w : Sequence[int]
+
+        indices of the target nodes of edges
+
+    n : int
+
+        number of nodes
+
+    directed : bool = False
+
+        Whether or not edges are directed.
+
+    loops : bool = False
+
+        Whether or not swaps can create self-loops.
+
+    multiedges : bool = False
+
+        Whether or not swaps can create multiple edges between the same pair
+        of nodes.
+
+    Examples
+    --------
+    Sample the number of triangles in networks with the degrees of a network
+
+    >>> import pathpy as pp
+    >>> n = pp.generators.Watts_Strogatz(n=1000, s=3, p=0.05)
+    >>> chain = pp.generators.EdgeSwapChain.from_network(n)
+    >>> chain.swap(10 * n.number_of_edges())
+    >>> triangles = [(A @ A).multiply(A).sum() / 6
+    ...              for A in chain.samples(1000, thinning=100)]
+
+    """
+
+    def __init__(self, v: Sequence[int], w: Sequence[int], n: int,
+                 directed: bool = False, loops: bool = False,
+                 multiedges: bool = False) -> None:
+        self.v: list = np.asarray(v, dtype=np.int64).tolist()
+        self.w: list = np.asarray(w, dtype=np.int64).tolist()
+        self.n = n
+        self.directed = directed
+        self.loops = loops
+        self.multiedges = multiedges
+        self.nodes: Optional[list] = None
+        self.accepted = 0
+        self.attempted = 0
+        self.keys = {self._key(a, b) for a, b in zip(self.v, self.w)}
+
+    @classmethod
+    def from_network(cls, network: Network, loops: bool = False,
+                     multiedges: bool = False) -> EdgeSwapChain:
+        """Creates a chain whose initial state are the edges of a network,
+        where nodes are given by their indices in `network.nodes.index`."""
+        index = network.nodes.index
+        chain = cls([index[e.v.uid] for e in network.edges],
+                    [index[e.w.uid] for e in network.edges],
+                    network.number_of_nodes(), directed=network.directed,
+                    loops=loops, multiedges=multiedges)
+        chain.nodes = sorted(index, key=index.__getitem__)
+        return chain
+
+    def _key(self, a: int, b: int) -> int:
+        """Returns the key of an edge in the hashed edge set."""
+        if self.directed or a <= b:
+            return a * self.n + b
+        return b * self.n + a
+
+    def swap(self, attempts: int, rng: Optional[Any] = None) -> int:
+        """Attempts a number of double edge swaps and returns the number of
+        accepted swaps, where random numbers are drawn from rng or numpy's
+        global random state."""
+        rng = np.random if rng is None else rng
+        m = len(self.v)
+        if m < 2:
+            return 0
+
+        v, w, keys, key = self.v, self.w, self.keys, self._key
+        check_loops = not self.loops
+        check_edges = not self.multiedges
+        accepted = 0
+
+        for first in range(0, attempts, _BATCH):
+            size = min(_BATCH, attempts - first)
+            edges = _integers(rng, m, (2, size)).tolist()
+            flips = np.zeros(size, dtype=bool) if self.directed else \
+                rng.random(size) < 0.5
+
+            for i, j, flip in zip(edges[0], edges[1], flips.tolist()):
+                if i == j:
+                    continue
+                a, b, c, d = v[i], w[i], v[j], w[j]
+                if flip:
+                    c, d = d, c
+                if check_loops and (a == d or c == b):
+                    continue
+                if check_edges:
+                    new_i, new_j = key(a, d), key(c, b)
+                    if new_i == new_j or new_i in keys or new_j in keys:
+                        continue
+                    keys.discard(key(a, b))
+                    keys.discard(key(c, d))
+                    keys.add(new_i)
+                    keys.add(new_j)
+                w[i], v[j], w[j] = d, c, b
+                accepted += 1
+
+        self.accepted += accepted
+        self.attempted += attempts
+        return accepted
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the indices of the source and target nodes of the current
+        edges."""
+        return np.array(self.v, dtype=np.int64), \
+            np.array(self.w, dtype=np.int64)
+
+    def adjacency_matrix(self) -> sparse.csr_matrix:
+        """Returns the sparse adjacency matrix of the current edges."""
+        return _adjacency(*self.edges(), self.n, directed=self.directed)
+
+    def samples(self, samples: int, thinning: Optional[int] = None,
+                statistic: Optional[Callable[[sparse.csr_matrix], Any]] = None
+                ) -> Iterator[Any]:
+        """Yields samples of the chain, which are separated by a number of
+        swap attempts.
+
+        Parameters
+        ----------
+        samples : int
+
+            number of samples
+
+        thinning : Optional[int] = None
+
+            number of swaps attempted between consecutive samples. If None,
+            one swap per edge is attempted.
+
+        statistic : Optional[Callable[[scipy.sparse.csr_matrix], Any]] = None
+
+            function that is evaluated on the adjacency matrix of each
+            sample. If None, the adjacency matrices are returned.
+
+        """
+        thinning = len(self.v) if thinning is None else thinning
+        for _ in range(samples):
+            self.swap(thinning)
+            A = self.adjacency_matrix()
+            yield A if statistic is None else statistic(A)
+
+    def to_network(self, **kwargs: Any) -> Network:
+        """Returns a network with the current edges."""
+        nodes = self.nodes if self.nodes is not None else \
+            [str(i) for i in range(self.n)]
+        return Network.from_arrays(*self.edges(), nodes=nodes,
+                                   directed=self.directed,
+                                   multiedges=self.multiedges, **kwargs)
+
+
+def edge_swap_randomize(network: Network, swaps: Optional[int] = None,
+                        loops: bool = False,
+                        multiedges: bool = False) -> Network:
+    """Generates a random network with the same degree sequence as a given
+    network by double edge swaps.
+
+    Different from `Molloy_Reed_randomize`, the randomization starts from the
+    edges of the network, so it never fails for degree sequences which are
+    hard to realize by matching link stubs. For directed networks, the in-
+    and out-degrees of all nodes are preserved.
+
+    Parameters
+    ----------
+    network : Network
+
+        network to be randomized
+
+    swaps : Optional[int] = None
+
+        number of attempted swaps. If None, ten swaps per edge are attempted.
+
+    loops : bool = False
+
+        Whether or not swaps can create self-loops.
+
+    multiedges : bool = False
+
+        Whether or not swaps can create multiple edges between the same pair
+        of nodes.
+
+    Examples
+    --------
+    >>> import pathpy as pp
+    >>> n = pp.generators.ER_nm(n=100, m=300, directed=True)
+    >>> r = pp.generators.edge_swap_randomize(n)
+    >>> r.indegrees() == n.indegrees()
+    True
+
+    """
+    chain = EdgeSwapChain.from_network(network, loops=loops,
+                                       multiedges=multiedges)
+    chain.swap(10 * network.number_of_edges() if swaps is None else swaps)
+    return chain.to_network()
+
+
+def _edge_swap_pairs(v: np.ndarray, w: np.ndarray, n: int,
+                     directed: bool = False, loops: bool = False,
+                     multiedges: bool = False, swaps: Optional[int] = None,
+                     rng: Optional[Any] = None) -> Tuple[np.ndarray,
+                                                         np.ndarray]:
+    """Returns the node pairs after double edge swaps of the given edges."""
+    chain = EdgeSwapChain(v, w, n, directed=directed, loops=loops,
+                          multiedges=multiedges)
+    chain.swap(10 * len(v) if swaps is None else swaps, rng=rng)
+    return chain.edges()
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -0,0 +1,215 @@
+"""Sampling of statistics in ensembles of random graphs"""
+# !/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : ensemble.py -- Sample ensembles of random graphs
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 09:34 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse  # pylint: disable=import-error
+
+from pathpy import logger
+from pathpy.models.network import Network
+from pathpy.utils import parallel
+from pathpy.utils.errors import ParameterError
+from pathpy.generators.random_graphs import (max_edges,
+                                             is_graphic_Erdos_Gallai,
+                                             _adjacency,
+                                             _ER_nm_pairs,
+                                             _ER_np_pairs,
+                                             _Molloy_Reed_pairs)
+from pathpy.generators.edge_swaps import _edge_swap_pairs
+
+# create logger
+LOG = logger(__name__)
+
+# random graph models that can be sampled
+MODELS = ('ER_nm', 'ER_np', 'Molloy_Reed', 'edge_swap')
+
+# function returning the node pairs of a sample for a random number
+# generator, number of nodes and directedness of the samples
+Sampler = Tuple[Callable[..., Tuple[np.ndarray, np.ndarray]], int, bool]
+
+
+def ensemble(model: str, network: Network, samples: int = 100,
+             n_jobs: int = 1,
+             statistic: Optional[Callable[[sparse.csr_matrix], Any]] = None,
+             loops: bool = False, multiedges: bool = False,
+             random_state: Optional[Any] = None) -> Iterator[Any]:
+    """Samples a statistic in an ensemble of random graphs.
+
+    The random graphs are randomized versions of a given network, i.e. they
+    are generated with the parameters of `ER_nm_randomize`,
+    `ER_np_randomize`, `Molloy_Reed_randomize` or `edge_swap_randomize`.
+    Rather than creating a
+    network for each sample, the statistic is evaluated on the sparse
+    adjacency matrix of the sample, whose rows and columns follow
+    `network.nodes.index`. This allows to compare statistics of a network
+    to thousands of samples of a null model.
+
+    Each sample draws its random numbers from its own stream, which is
+    spawned from a common seed sequence. The samples thus only depend on
+    `random_state` (or the state of numpy's global random number generator if
+    `random_state` is None), but not on the number of processes.
+
+    Parameters
+    ----------
+    model : str
+
+        random graph model, i.e. one of 'ER_nm', 'ER_np', 'Molloy_Reed' or
+        'edge_swap'
+
+    network : Network
+
+        network which determines the parameters of the model, i.e. the
+        number of nodes and edges, the directedness or the degree sequence
+
+    samples : int = 100
+
+        number of samples
+
+    n_jobs : int = 1
+
+        number of processes used to generate samples in parallel. If -1, one
+        process per CPU is used.
+
+    statistic : Optional[Callable[[scipy.sparse.csr_matrix], Any]] = None
+
+        function that is evaluated on the adjacency matrix of each sample. If
+        None, the adjacency matrices are returned.
+
+    loops : bool = False
+
+        Whether or not samples of Erdös-Renyi and edge swap models can
+        contain loops.
+
+    multiedges : bool = False
+
+        Whether or not samples can contain multiple edges between the same
+        pair of nodes.
+
+    random_state : Optional[Any] = None
+
+        entropy of the seed sequence from which the random streams of all
+        samples are spawned
+
+    Returns
+    -------
+    Iterator[Any]
+
+        iterator over the statistic (or adjacency matrix) of each sample,
+        which are generated while the iterator is consumed
+
+    Examples
+    --------
+    Compare the transitivity of a network to a configuration model
+
+    >>> import numpy as np
+    >>> import pathpy as pp
+    >>> def transitivity(A):
+    ...     k = np.asarray(A.sum(axis=1)).ravel()
+    ...     return (A @ A).multiply(A).sum() / np.sum(k * (k - 1))
+    >>> n = pp.generators.Watts_Strogatz(n=1000, s=3, p=0.05)
+    >>> null = np.array(list(pp.generators.ensemble(
+    ...     'Molloy_Reed', n, samples=1000, n_jobs=4, statistic=transitivity)))
+    >>> np.mean(null >= transitivity(n.adjacency_matrix()))
+    0.0
+
+    """
+    sampler = _sampler(model, network, loops=loops, multiedges=multiedges)
+
+    # independent random streams for all samples
+    streams = parallel.seed_sequence(random_state).spawn(samples)
+    n_jobs = parallel.number_of_jobs(n_jobs, samples)
+
+    return _samples(sampler, statistic, streams, n_jobs)
+
+
+def _sampler(model: str, network: Network, loops: bool = False,
+             multiedges: bool = False) -> Sampler:
+    """Returns a sampler of node pairs with the parameters of a network."""
+    n = network.number_of_nodes()
+    m = network.number_of_edges()
+    directed = network.directed
+
+    if model == 'ER_nm':
+        pairs = partial(_ER_nm_pairs, n, m, directed=directed, loops=loops,
+                        multiedges=multiedges)
+    elif model == 'ER_np':
+        M = max_edges(n, directed=directed, loops=loops)
+        pairs = partial(_ER_np_pairs, n, m/M if M > 0 else 0.0,
+                        directed=directed, loops=loops)
+    elif model == 'Molloy_Reed':
+        # degrees are listed in order of node indices
+        degrees = np.asarray(network.degree_sequence(), dtype=np.int64)
+        if not is_graphic_Erdos_Gallai(degrees):
+            msg = 'Degree sequence of the network is not graphic'
+            LOG.error(msg)
+            raise ParameterError(msg)
+        pairs = partial(_Molloy_Reed_pairs, degrees, multiedge=multiedges)
+        directed = False
+    elif model == 'edge_swap':
+        index = network.nodes.index
+        pairs = partial(_edge_swap_pairs,
+                        np.array([index[e.v.uid] for e in network.edges]),
+                        np.array([index[e.w.uid] for e in network.edges]),
+                        n, directed=directed, loops=loops,
+                        multiedges=multiedges)
+    else:
+        msg = 'Unknown model "{0}", supported models are {1}'.format(
+            model, ', '.join(MODELS))
+        LOG.error(msg)
+        raise ParameterError(msg)
+
+    return pairs, n, directed
+
+
+def _samples(sampler: Sampler, statistic: Optional[Callable],
+             streams: List[np.random.SeedSequence],
+             n_jobs: int) -> Iterator[Any]:
+    """Yields the statistics of the samples in the order of the streams."""
+    if n_jobs == 1:
+        for stream in streams:
+            yield _sample(sampler, statistic, stream)
+        return
+
+    # distribute batches of samples across worker processes
+    for results in parallel.imap_batches(
+            partial(_sample_batch, sampler, statistic),
+            parallel.batches(streams, n_jobs), n_jobs):
+        yield from results
+
+
+def _sample(sampler: Sampler, statistic: Optional[Callable],
+            stream: np.random.SeedSequence) -> Any:
+    """Generates a single sample, whose random numbers are drawn from a
+    generator of the given stream, and evaluates the statistic."""
+    pairs, n, directed = sampler
+    A = _adjacency(*pairs(rng=parallel.generator(stream)), n,
+                   directed=directed)
+    return A if statistic is None else statistic(A)
+
+
+def _sample_batch(sampler: Sampler, statistic: Optional[Callable],
+                  streams: List[np.random.SeedSequence]) -> List[Any]:
+    """Generates a batch of samples."""
+    return [_sample(sampler, statistic, stream) for stream in streams]
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -10,39 +10,39 @@
 # =============================================================================
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Optional
 
 import numpy as np
 
 from pathpy import logger
-from pathpy.core.api import Node
-from pathpy.models.api import Network
+from pathpy.models.network import Network
 
 # create logger
 LOG = logger(__name__)
 
 
-def _multi_dim_range(start, stop, dims) -> Tuple:
-    if not dims:
-        yield ()
-        return
-    for outer in _multi_dim_range(start, stop, dims - 1):
-        for inner in range(start, stop):
-            yield outer + (inner,)
-
-
 def lattice_network(start: Optional[int]=0, stop: Optional[int]=10, dims: Optional[int]=2) -> Network:
     """
     Generates a n-dimensional lattice network with coordinates in each dimension 
     ranging from start (inclusive) to stop (exclusive)
     """
-    network = Network(directed=False)
-
-    for pos in _multi_dim_range(start, stop, dims):
-        network.add_node(Node("".join(str(i)+'-' for i in pos).strip('-'), pos=np.array(pos)))
-    
-    for v in network.nodes:
-        for w in network.nodes:
-            if np.sum(np.abs(v['pos']-w['pos']))==1 and (v.uid, w.uid) not in network.edges:
-                network.add_edge(v, w)
-    return network
+    size = max(stop - start, 0)
+
+    # coordinates of all nodes in lexicographic order
+    positions = np.indices((size,) * dims).reshape(dims, -1).T + start
+    nodes = ['-'.join(str(i) for i in pos) for pos in positions.tolist()]
+
+    # nodes are connected to their successors along each dimension
+    index = np.arange(len(nodes)).reshape((size,) * dims)
+    v, w = [], []
+    for d in range(dims):
+        source = np.take(index, np.arange(size - 1), axis=d)
+        target = np.take(index, np.arange(1, size), axis=d)
+        v.append(source.ravel())
+        w.append(target.ravel())
+
+    return Network.from_arrays(
+        np.concatenate(v) if v else np.empty(0, dtype=np.int64),
+        np.concatenate(w) if w else np.empty(0, dtype=np.int64),
+        nodes=nodes, directed=False,
+        node_attributes={'pos': list(positions)})
@@ -10,15 +10,14 @@
 # =============================================================================
 from __future__ import annotations
 
-from typing import Optional, Union, Dict
+from typing import Any, Optional, Union, Dict, Tuple
 
 import numpy as np
-import random
 import scipy
+from scipy import sparse  # pylint: disable=import-error
 
-from pathpy import logger, tqdm
-from pathpy.core.api import Node, Edge
-from pathpy.models.api import Network
+from pathpy import logger
+from pathpy.models.network import Network
 from pathpy.utils.errors import ParameterError
 
 # create logger
@@ -74,6 +73,200 @@ def max_edges(n: int, directed: bool = False, multiedges: bool = False, loops: b
         return int(n*(n-1))
 
 
+def _node_uids(n: int, node_uids: Optional[list] = None) -> list:
+    """Returns the given node uids or numeric node uids."""
+    if node_uids is None or len(node_uids) != n:
+        LOG.info('No valid node uids given, generating numeric node uids')
+        return [str(i) for i in range(n)]
+    return list(node_uids)
+
+
+def _pairs(index: np.ndarray, n: int, directed: bool = False,
+           loops: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Maps linear indices in [0, max_edges(n)) to node pairs.
+
+    Directed pairs are enumerated row by row. Undirected pairs (v, w) are
+    enumerated as the lower triangle with w < v (or w <= v with loops).
+    """
+    index = np.asarray(index, dtype=np.int64)
+    if directed and loops:
+        return index // n, index % n
+    if directed:
+        v, w = index // (n-1), index % (n-1)
+        return v, w + (w >= v)
+
+    # row v of the lower triangle starts at v*(v+shift)/2
+    shift = 1 if loops else -1
+    v = ((np.sqrt(8.0 * index + 1) - shift) // 2).astype(np.int64)
+    # correct rounding errors of the square root
+    v -= v * (v + shift) // 2 > index
+    v += (v + 1) * (v + 1 + shift) // 2 <= index
+    return v, index - v * (v + shift) // 2
+
+
+def _keys(v: np.ndarray, w: np.ndarray, n: int,
+          directed: bool = False) -> np.ndarray:
+    """Returns integer keys of node pairs, which are symmetric for undirected
+    pairs."""
+    if directed:
+        return v * n + w
+    return np.minimum(v, w) * n + np.maximum(v, w)
+
+
+def _duplicated(keys: np.ndarray) -> np.ndarray:
+    """Returns a mask of the keys that occurred before."""
+    duplicated = np.ones(len(keys), dtype=bool)
+    duplicated[np.unique(keys, return_index=True)[1]] = False
+    return duplicated
+
+
+def _adjacency(v: np.ndarray, w: np.ndarray, n: int,
+               directed: bool = False) -> sparse.csr_matrix:
+    """Returns the sparse adjacency matrix of node pairs, where undirected
+    edges are stored in both directions and loops only once."""
+    if not directed:
+        other = v != w
+        v, w = np.concatenate([v, w[other]]), np.concatenate([w, v[other]])
+    return sparse.csr_matrix((np.ones(len(v)), (v, w)), shape=(n, n))
+
+
+def _contains(sorted_keys: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Returns a mask of the keys that are contained in a sorted array."""
+    if len(sorted_keys) == 0:
+        return np.zeros(len(keys), dtype=bool)
+    position = np.minimum(np.searchsorted(sorted_keys, keys),
+                          len(sorted_keys) - 1)
+    return sorted_keys[position] == keys
+
+
+def _integers(rng: Any, high: int, size: Any) -> np.ndarray:
+    """Draws integers in [0, high) from a generator or numpy's random
+    module."""
+    if isinstance(rng, np.random.Generator):
+        return rng.integers(high, size=size, dtype=np.int64)
+    return rng.randint(high, size=size, dtype=np.int64)
+
+
+def _ER_nm_pairs(n: int, m: int, directed: bool = False, loops: bool = False,
+                 multiedges: bool = False,
+                 rng: Optional[Any] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Samples the node pairs of a G(n, m) network, where random numbers are
+    drawn from rng or numpy's global random state."""
+    rng = np.random if rng is None else rng
+    pairs = max_edges(n, directed=directed, loops=loops)
+    if m == 0 or pairs == 0:
+        index = np.empty(0, dtype=np.int64)
+    elif multiedges:
+        index = _integers(rng, pairs, m)
+    elif 2 * m > pairs:
+        index = rng.permutation(pairs)[:m]
+    else:
+        # batch rejection sampling, where pairs that were sampled before are
+        # discarded
+        index = np.empty(0, dtype=np.int64)
+        while len(index) < m:
+            size = int(1.1 * (m - len(index))) + 16
+            index = np.concatenate(
+                [index, _integers(rng, pairs, size)])
+            index = index[~_duplicated(index)]
+        index = index[:m]
+    return _pairs(index, n, directed=directed, loops=loops)
+
+
+def _ER_np_pairs(n: int, p: float, directed: bool = False,
+                 loops: bool = False,
+                 rng: Optional[Any] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Samples the node pairs of a G(n, p) network, where random numbers are
+    drawn from rng or numpy's global random state."""
+    rng = np.random if rng is None else rng
+    pairs = max_edges(n, directed=directed, loops=loops)
+    if p <= 0 or pairs == 0:
+        index = np.empty(0, dtype=np.int64)
+    elif p >= 1:
+        index = np.arange(pairs, dtype=np.int64)
+    else:
+        # geometric skipping (Batagelj and Brandes 2005), i.e. the gaps between
+        # consecutive edges in the sequence of all pairs are geometric
+        size = int(pairs * p + 4 * np.sqrt(pairs * p) + 16)
+        chunks = []
+        last = -1
+        while last < pairs:
+            index = last + np.cumsum(rng.geometric(p, size=size))
+            chunks.append(index[index < pairs])
+            last = index[-1]
+        index = np.concatenate(chunks)
+    return _pairs(index, n, directed=directed, loops=loops)
+
+
+def _Watts_Strogatz_pairs(n: int, s: int, p: float = 0.0,
+                          loops: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Generates the node pairs of a rewired ring lattice."""
+    # construct a ring lattice (dimension 1)
+    offsets = np.arange(0, s) if loops else np.arange(1, s+1)
+    v = np.repeat(np.arange(n, dtype=np.int64), len(offsets))
+    w = (v + np.tile(offsets, n)) % n
+    unique = ~_duplicated(_keys(v, w, n))
+    v, w = v[unique], w[unique]
+
+    if p == 0:
+        return v, w
+
+    # Rewire each link with probability p, where the new targets of all
+    # rewired links are drawn in rounds until they are neither loops nor
+    # existing links. Note that this could potentially result in an
+    # infinite loop depending on parameters.
+    pending = np.flatnonzero(np.random.random_sample(len(v)) < p)
+    kept = np.ones(len(v), dtype=bool)
+    kept[pending] = False
+    existing = np.sort(_keys(v[kept], w[kept], n))
+    while len(pending) > 0:
+        x = np.random.randint(n, size=len(pending), dtype=np.int64)
+        keys = _keys(v[pending], x, n)
+        valid = ~_contains(existing, keys) & ~_duplicated(keys)
+        if not loops:
+            valid &= x != v[pending]
+        w[pending[valid]] = x[valid]
+        existing = np.sort(np.concatenate([existing, keys[valid]]))
+        pending = pending[~valid]
+    return v, w
+
+
+def _Molloy_Reed_pairs(degrees: np.ndarray, multiedge: bool = False,
+                       relax: bool = False,
+                       rng: Optional[Any] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Pairs randomly shuffled link stubs of a degree sequence, where random
+    numbers are drawn from rng or numpy's global random state."""
+    rng = np.random if rng is None else rng
+    n = len(degrees)
+    stubs = np.repeat(np.arange(n, dtype=np.int64), degrees)
+    rng.shuffle(stubs)
+    v, w = stubs[0::2].copy(), stubs[1::2].copy()
+
+    def invalid(v, w):
+        mask = v == w
+        if not multiedge:
+            mask |= _duplicated(_keys(v, w, n))
+        return mask
+
+    if relax:
+        valid = ~invalid(v, w)
+        return v[valid], w[valid]
+
+    # stubs of loops and multi-edges are paired again together with the stubs
+    # of randomly chosen valid edges, until all edges are valid
+    bad = invalid(v, w)
+    while bad.any():
+        good = np.flatnonzero(~bad)
+        release = rng.choice(
+            good, size=min(len(good), int(bad.sum())), replace=False)
+        redo = np.concatenate([np.flatnonzero(bad), release])
+        pool = np.concatenate([v[redo], w[redo]])
+        rng.shuffle(pool)
+        v[redo], w[redo] = pool[:len(redo)], pool[len(redo):]
+        bad = invalid(v, w)
+    return v, w
+
+
 def ER_nm(n: int, m: int,
           directed: bool = False,
           loops: bool = False,
@@ -128,24 +321,10 @@ def ER_nm(n: int, m: int,
             'Given network type with n nodes can have at most {} edges.'.format(M))
         return None
 
-    network = Network(directed=directed)
-
-    if node_uids is None or len(node_uids) != n:
-        LOG.info('No valid node uids given, generating numeric node uids')
-        node_uids = []
-        for i in range(n):
-            node_uids.append(str(i))
-
-    for i in range(n):
-        network.add_node(node_uids[i])
-
-    edges = 0
-    while edges < m:
-        v, w = np.random.choice(node_uids, size=2, replace=loops)
-        if multiedges or network.nodes[w] not in network.successors[v]:
-            network.add_edge(v, w)
-            edges += 1
-    return network
+    v, w = _ER_nm_pairs(n, m, directed=directed, loops=loops,
+                        multiedges=multiedges)
+    return Network.from_arrays(v, w, nodes=_node_uids(n, node_uids),
+                               directed=directed, multiedges=multiedges)
 
 
 def ER_nm_randomize(network: Network, loops: bool = False, multiedges: bool = False) -> Union[Network, None]:
@@ -236,28 +415,9 @@ def ER_np(n: int, p: float, directed: bool = False, loops: bool = False,
     ...
 
     """
-    network = Network(directed=directed)
-
-    if node_uids is None or len(node_uids) != n:
-        LOG.info('No valid node uids given, generating numeric node uids')
-        node_uids = []
-        for i in range(n):
-            node_uids.append(str(i))
-
-    for i in range(n):
-        network.add_node(node_uids[i])
-
-    for s in tqdm(range(n), 'generating G(n,p) network'):
-        if directed:
-            x = n
-        else:
-            x = s+1
-        for t in range(x):
-            if t == s and not loops:
-                continue
-            if np.random.random_sample() < p:
-                network.add_edge(node_uids[s], node_uids[t])
-    return network
+    v, w = _ER_np_pairs(n, p, directed=directed, loops=loops)
+    return Network.from_arrays(v, w, nodes=_node_uids(n, node_uids),
+                               directed=directed)
 
 
 def ER_np_randomize(network: Network, loops: bool = False) -> Network:
@@ -309,54 +469,9 @@ def Watts_Strogatz(n: int, s: int, p: float = 0.0, loops: bool = False,
     ...
 
     """
-    network = Network(directed=False)
-    if node_uids is None or len(node_uids) != n:
-        LOG.info('No valid node uids given, generating numeric node uids')
-        node_uids = []
-        for i in range(n):
-            network.add_node(Node(str(i)))
-            node_uids.append(str(i))
-    else:
-        for i in range(n):
-            network.add_node(node_uids[i])
-
-    # construct a ring lattice (dimension 1)
-    for i in range(n):
-        if loops:
-            x = 0
-            y = s
-        else:
-            x = 1
-            y = s+1
-        for j in range(x, y):
-            v = network.nodes[node_uids[i]]
-            w = network.nodes[node_uids[(i+j) % n]]
-            if (v.uid, w.uid) not in network.edges:
-                network.add_edge(v, w)
-
-    if p == 0:
-        # nothing to do here
-        return network
-
-    # Rewire each link with probability p
-    for edge in tqdm(list(network.edges.values()), 'generating WS network'):
-        if np.random.rand() < p:
-            # Delete original link and remember source node
-            v = edge.v.uid
-            network.remove_edge(edge)
-
-            # Find new random tgt, which is not yet connected to src
-            new_target = None
-
-            # This loop repeatedly chooses a random target until we find
-            # a target not yet connected to src. Note that this could potentially
-            # result in an infinite loop depending on parameters.
-            while new_target is None:
-                x = node_uids[np.random.randint(n)]
-                if (x != v or loops) and (v, x) not in network.edges:
-                    new_target = x
-            network.add_edge(v, new_target)
-    return network
+    v, w = _Watts_Strogatz_pairs(n, s, p, loops=loops)
+    return Network.from_arrays(v, w, nodes=_node_uids(n, node_uids),
+                               directed=False)
 
 
 def is_graphic_Erdos_Gallai(degrees):
@@ -392,21 +507,20 @@ def is_graphic_Erdos_Gallai(degrees):
     True
 
     """
-    degree_sequence = sorted(degrees, reverse=True)
-    S = sum(degree_sequence)
+    degree_sequence = -np.sort(-np.asarray(degrees, dtype=np.int64))
     n = len(degree_sequence)
-    if S % 2 != 0:
+    if degree_sequence.sum() % 2 != 0:
         return False
-    for r in range(1, n):
-        M = 0
-        S = 0
-        for i in range(1, r+1):
-            S += degree_sequence[i-1]
-        for i in range(r+1, n+1):
-            M += min(r, degree_sequence[i-1])
-        if S > r * (r-1) + M:
-            return False
-    return True
+
+    # for all r, the sum of the r largest degrees must not exceed
+    # r*(r-1) + sum_{i>r} min(r, d_i)
+    prefix = np.concatenate([[0], np.cumsum(degree_sequence)])
+    r = np.arange(1, n+1)
+    # number of nodes with degree at least r
+    at_least = np.searchsorted(-degree_sequence, -r, side='right')
+    rest = np.maximum(r, at_least)
+    M = r * np.maximum(at_least - r, 0) + prefix[-1] - prefix[rest]
+    return bool(np.all(prefix[1:] <= r * (r-1) + M))
 
 
 def generate_degree_sequence(n, distribution: Union[Dict[float, float], scipy.stats.rv_continuous, scipy.stats.rv_discrete], **distribution_args) -> np.array:
@@ -458,6 +572,11 @@ def Molloy_Reed(degrees: Union[np.array, Dict[int, float]], multiedge: bool = Fa
         List of integer node degrees. The number of nodes of the generated
         network corresponds to len(degrees).
 
+    multiedge : bool
+
+        If True, multiple edges between the same pair of nodes are added,
+        while self-loops are still avoided.
+
     relax : bool
 
         If True, we conceptually allow self-loops and multi-edges, but do not
@@ -491,44 +610,10 @@ def Molloy_Reed(degrees: Union[np.array, Dict[int, float]], multiedge: bool = Fa
     if not is_graphic_Erdos_Gallai(degrees):
         return None
 
-    # create empty network with n nodes
-    n = len(degrees)
-    network = Network(directed=False, multiedges=multiedge)
-
-    if node_uids is None or len(node_uids) != n:
-        LOG.info('No valid node uids given, generating numeric node uids')
-        node_uids = []
-        for i in range(n):
-            node_uids.append(str(i))
-    
-    for i in range(n):
-        network.add_node(node_uids[i])
-
-    # generate link stubs based on degree sequence
-    stubs = []
-    for i in range(n):
-        for _ in range(int(degrees[i])):
-            stubs.append(str(node_uids[i]))
-
-    # connect randomly chosen pairs of link stubs
-    while(len(stubs) > 0):
-        v, w = np.random.choice(stubs, 2, replace=False)
-
-        if v == w or (multiedge == False and relax == False and network.nodes[w] in network.successors[v]):
-            # remove random edge and add stubs
-            if network.number_of_edges()>0:
-                edge = random.choice(list(network.edges))
-                stubs.append(edge.v.uid)
-                stubs.append(edge.w.uid)
-                network.remove_edge(edge)
-        else:
-            if not network.nodes[w] in network.successors[v]:
-                network.add_edge(v, w)
-            stubs.remove(v)
-            stubs.remove(w)            
-            
-
-    return network
+    degrees = np.asarray(degrees, dtype=np.int64)
+    v, w = _Molloy_Reed_pairs(degrees, multiedge=multiedge, relax=relax)
+    return Network.from_arrays(v, w, nodes=_node_uids(len(degrees), node_uids),
+                               directed=False, multiedges=multiedge)
 
 
 def Molloy_Reed_randomize(network: Network) -> Optional[Network]:
@@ -17,6 +17,7 @@ from pathpy.io.pandas import (
     to_temporal_network
 )
 from pathpy.io import network_recognition
+from pathpy.io.snapshot import save, load
 
 from pathpy.io import graphml
 from pathpy.io import csv
@@ -24,6 +25,8 @@ from pathpy.io import sql
 from pathpy.io import graphtool
 from pathpy.io import konect
 from pathpy.io import infomap
+from pathpy.io import snapshot
+from pathpy.io import parquet
 from pathpy.io import network_recognition
 
 # =============================================================================
@@ -10,16 +10,18 @@
 # =============================================================================
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Sequence, Union
+import contextlib
+import io
+import multiprocessing
+import os
 
 import pandas as pd  # pylint: disable=import-error
 
 from pathpy import logger
 from pathpy.io.pandas import to_network, to_temporal_network, to_dataframe, add_attributes as aa
 
-from pathpy.core.api import Node, NodeCollection
-from pathpy.core.api import Edge, EdgeCollection
-# from pathpy.core.path import Path, PathCollection
+from pathpy.core.api import PathStore
 
 # pseudo load class for type checking
 if TYPE_CHECKING:
@@ -34,13 +36,23 @@ LOG = logger(__name__)
 def read_dataframe(filename: str,
                    sep: str = ',',
                    header: bool = True,
-                   names: Optional[list] = None) -> pd.DataFrame:
-    """Read csv database as a pandas data frame."""
+                   names: Optional[list] = None,
+                   chunksize: Optional[int] = None,
+                   dtype: Optional[Any] = None
+                   ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """Read csv database as a pandas data frame.
+
+    If `chunksize` is given, an iterator over data frames with at most
+    `chunksize` rows is returned instead. The optional `dtype` is passed to
+    `pandas.read_csv`, e.g. to read node columns as `category`.
+    """
 
     if header:
-        frame = pd.read_csv(filename, sep=sep)
+        frame = pd.read_csv(filename, sep=sep, chunksize=chunksize,
+                            dtype=dtype)
     else:
-        frame = pd.read_csv(filename, header=0, names=names, sep=sep)
+        frame = pd.read_csv(filename, header=0, names=names, sep=sep,
+                            chunksize=chunksize, dtype=dtype)
 
     # return pandas data frame
     return frame
@@ -58,13 +70,19 @@ def read_network(filename: str = None,
                  sep: str = ',',
                  header: bool = True,
                  names: Optional[list] = None,
-                 bipartite: book = False,
+                 bipartite: bool = False,
+                 chunksize: Optional[int] = None,
+                 dtype: Optional[Any] = None,
                  **kwargs: Any) -> Network:
-    """Reads a network from a csvfile."""
+    """Reads a network from a csvfile.
+
+    If `chunksize` is given, the file is streamed in chunks and only the
+    unique edges are kept in memory while reading.
+    """
     # pylint: disable=too-many-arguments
 
-    frame = read_dataframe(filename=filename, sep=sep,
-                           header=header, names=names)
+    frame = read_dataframe(filename=filename, sep=sep, header=header,
+                           names=names, chunksize=chunksize, dtype=dtype)
 
     net = to_network(frame, loops=loops, directed=directed,
                      multiedges=multiedges, bipartite=bipartite, **kwargs)
@@ -79,12 +97,18 @@ def read_temporal_network(filename: Optional[str] = None,
                           sep: str = ',',
                           header: bool = True,
                           names: Optional[list] = None,
+                          chunksize: Optional[int] = None,
+                          dtype: Optional[Any] = None,
                           **kwargs: Any) -> TemporalNetwork:
-    """Read temporal network from a csv database."""
+    """Read temporal network from a csv database.
+
+    If `chunksize` is given, the file is streamed in chunks, which are stored
+    as compact arrays of events until the temporal network is created.
+    """
     # pylint: disable=too-many-arguments
 
-    frame = read_dataframe(filename=filename, sep=sep,
-                           header=header, names=names)
+    frame = read_dataframe(filename=filename, sep=sep, header=header,
+                           names=names, chunksize=chunksize, dtype=dtype)
 
     net = to_temporal_network(frame, loops=loops, directed=directed,
                               multiedges=multiedges, **kwargs)
@@ -97,9 +121,10 @@ def read_pathcollection(filename: str, separator: str = ',',
                         maxlines: int = None) -> PathCollection:
     """Read path in edgelist format
 
-    Reads data from a file containing multiple lines of *edges* of the form
-    "v,w,frequency,X" (where frequency is optional and X are arbitrary
-    additional columns). The default separating character ',' can be changed.
+    Reads data from a file containing multiple lines of *paths* of the form
+    "v,w,x,frequency" (where frequency is optional). The default separating
+    character ',' can be changed. The file is read with `read_pathstore`,
+    i.e. the frequencies of repeated paths are added up.
 
     Parameters
     ----------
@@ -117,59 +142,113 @@ def read_pathcollection(filename: str, separator: str = ',',
         None means the entire file is read
 
     """
+    store = read_pathstore(filename, separator=separator, frequency=frequency,
+                           directed=directed, maxlines=maxlines)
+    return store.to_paths()
+
+
+def read_pathstore(filename: Union[str, Sequence[str]], separator: str = ',',
+                   frequency: bool = False, directed: bool = True,
+                   maxlines: Optional[int] = None, shards: int = 1,
+                   processes: Optional[int] = None) -> PathStore:
+    """Read paths in edgelist format into a compact path store.
+
+    Different from `read_pathcollection`, the file is streamed line by line
+    and no objects are created for nodes and paths. Node uids are interned as
+    integer codes and the frequencies of paths are accumulated in a counter
+    keyed by tuples of codes, such that the memory needed only grows with
+    the number of distinct paths. Each file can be split into shards of
+    roughly equal size, which are read in parallel and merged afterwards.
+    The returned store can be passed to `HigherOrderNetwork.fit` and
+    `MultiOrderModel.fit`.
 
-    from pathpy.core.path import Path, PathCollection
-
-    nodes: dict = {}
-    edges: dict = {}
-    paths: dict = {}
-
-    with open(filename, 'r') as csv:
-        for n, line in enumerate(csv):
-            fields = line.rstrip().split(separator)
-            assert len(fields) >= 1, 'Error: empty line: {0}'.format(line)
-
-            if frequency:
-                path = tuple(fields[:-1])
-                freq = float(fields[-1])
-            else:
-                path = tuple(fields)
-                freq = 1.0
-
-            for node in path:
-                if node not in nodes:
-                    nodes[node] = Node(node)
-
-            if len(path) == 1 and path not in paths:
-                paths[path] = Path(nodes[path[0]], frequency=freq)
-
-            else:
-                edge_list = []
-                for u, v in zip(path[:-1], path[1:]):
-                    if (u, v) not in edges:
-                        edges[(u, v)] = Edge(nodes[u], nodes[v])
-                    edge_list.append(edges[(u, v)])
+    Parameters
+    ----------
+    filename : Union[str, Sequence[str]]
+        path to edgelist file or a list of files, e.g. shards of a path log
+    separator : str
+        character separating the nodes
+    frequency : bool
+        is a frequency given? if ``True`` it is the last element in the
+        edge (i.e. ``a,b,2``)
+    directed : bool
+        are the paths directed or undirected
+    maxlines : Optional[int]
+        number of lines to read from each shard (useful to test large
+        files). None means the entire file is read
+    shards : int
+        number of byte ranges into which each file is split
+    processes : Optional[int]
+        number of worker processes used to read the shards. If None, the
+        shards are read sequentially.
+
+    Examples
+    --------
+    >>> import pathpy as pp
+    >>> store = pp.io.csv.read_pathstore('paths.csv', frequency=True,
+    ...                                  shards=8, processes=4)
+    >>> hon = pp.HigherOrderNetwork(order=2)
+    >>> hon.fit(store)
 
-                if path not in paths:
-                    paths[path] = Path(*edge_list, frequency=freq)
+    """
+    filenames = [filename] if isinstance(filename, str) else list(filename)
+    tasks = [(name, start, end, separator, frequency, maxlines)
+             for name in filenames for start, end in _shards(name, shards)]
 
-            if maxlines is not None and n >= maxlines:
+    if processes is not None and processes > 1 and len(tasks) > 1:
+        with multiprocessing.Pool(processes) as pool:
+            stores = pool.starmap(_read_shard, tasks)
+    else:
+        stores = [_read_shard(*task) for task in tasks]
+
+    # merge the stores of all shards
+    store = PathStore(directed=directed)
+    for shard in stores:
+        store.update(shard)
+    return store
+
+
+def _shards(filename: str, shards: int) -> list:
+    """Returns the byte ranges of a file split into shards."""
+    size = os.path.getsize(filename)
+    shards = max(1, shards)
+    bounds = [size * i // shards for i in range(shards + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _read_shard(filename: str, start: int, end: int, separator: str = ',',
+                frequency: bool = False,
+                maxlines: Optional[int] = None) -> PathStore:
+    """Reads the lines starting within a byte range into a path store."""
+    store = PathStore()
+    counter, encode = store.counter, store.encode
+
+    with open(filename, 'rb') as csv:
+        # skip the line which started in the previous shard
+        position = start
+        if start > 0:
+            csv.seek(start - 1)
+            position += len(csv.readline()) - 1
+
+        lines = 0
+        for line in csv:
+            if position >= end or (maxlines is not None and lines >= maxlines):
                 break
+            position += len(line)
+            lines += 1
 
-    ncoll = NodeCollection()
-    for node in nodes.values():
-        ncoll.add(node)
+            fields = line.decode('utf-8').rstrip().split(separator)
+            if fields == ['']:
+                continue
 
-    ecoll = EdgeCollection(nodes=ncoll)
-    for edge in edges.values():
-        ecoll._add(edge)
-
-    _paths = PathCollection(directed=directed, nodes=ncoll, edges=ecoll)
-
-    for _path in paths.values():
-        _paths._add(_path)
+            if frequency:
+                freq = float(fields.pop())
+                count = int(freq) if freq.is_integer() else freq
+            else:
+                count = 1
+            counter[encode(fields)] += count
 
-    return _paths
+    return store
 
 
 def write_dataframe(frame: pd.DataFrame, path_or_buf: Any = None,
@@ -225,12 +304,30 @@ def write(network: Union[Network, TemporalNetwork],
           path_or_buf: Any = None,
           include_edge_uid: bool = False,
           export_indices: bool = False,
+          chunksize: Optional[int] = None,
           **pdargs: Any) -> None:
-    """Stores all edges including edge attributes in a csv file."""
-    frame = to_dataframe(network=network, include_edge_uid=include_edge_uid,
-                         export_indices=export_indices)
+    """Stores all edges including edge attributes in a csv file.
 
-    return write_dataframe(frame, path_or_buf=path_or_buf, **pdargs)
+    If `chunksize` is given, the edges are exported and written in chunks of
+    rows, such that the full data frame is never created.
+    """
+    frame = to_dataframe(network=network, include_edge_uid=include_edge_uid,
+                         export_indices=export_indices, chunksize=chunksize)
+
+    if chunksize is None:
+        return write_dataframe(frame, path_or_buf=path_or_buf, **pdargs)
+
+    header = pdargs.pop('header', True)
+    with contextlib.ExitStack() as stack:
+        buffer = io.StringIO() if path_or_buf is None else path_or_buf
+        if isinstance(buffer, str):
+            buffer = stack.enter_context(
+                open(buffer, mode='w', newline='',
+                     encoding=pdargs.pop('encoding', None)))
+        for i, chunk in enumerate(frame):
+            write_dataframe(chunk, path_or_buf=buffer,
+                            header=header if i == 0 else False, **pdargs)
+        return buffer.getvalue() if path_or_buf is None else None
 
 # =============================================================================
 # eof
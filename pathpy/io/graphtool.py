@@ -11,6 +11,7 @@
 from __future__ import annotations
 
 import json
+import mmap
 from pathpy.utils.errors import FileFormatError, NetworkError
 import pickle
 import struct
@@ -19,10 +20,10 @@ from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 from urllib import request
 from urllib.error import HTTPError
 
-from numpy import array
+import numpy as np
 
 from pathpy import logger
-from pathpy.io.pandas import to_network, to_temporal_network
+from pathpy.io.pandas import to_temporal_network
 from pathpy.models.network import Network
 from pathpy.models.temporal_network import TemporalNetwork
 from pathpy import FileFormatError, NetworkError, MissingModuleError
@@ -33,6 +34,13 @@ import pandas as pd
 LOG = logger(__name__)
 
 
+# numpy types of scalar property values, indexed by graphtool type index
+_SCALAR_TYPES = {0: 'u1', 1: 'i2', 2: 'i4', 3: 'i8', 4: 'f8'}
+
+# numpy types of vector property values, indexed by graphtool type index
+_VECTOR_TYPES = {7: 'u1', 8: 'i2', 9: 'i4', 10: 'i8', 11: 'f8'}
+
+
 def _parse_property_value(data: bytes, ptr: int, type_index: int, endianness: str) -> Tuple[Optional[Any], int]:
     """
     Parses a property value as well as the number of processed bytes.
@@ -62,82 +70,44 @@ def _parse_property_value(data: bytes, ptr: int, type_index: int, endianness: st
 
     Tuple (v, n) consisting of the property value v and the number of bytes n processed
     """
-    import pickle5 as pickle
-    
-    if type_index == 0:
-        return (bool(data[ptr]), 1)
-    elif type_index == 1:
-        return (struct.unpack(endianness + 'h', data[ptr:ptr+2])[0], 2)
-    elif type_index == 2:
-        return (struct.unpack(endianness + 'i', data[ptr:ptr+4])[0], 4)
-    elif type_index == 3:
-        return (struct.unpack(endianness + 'q', data[ptr:ptr+8])[0], 8)
-    elif type_index == 4:
-        return (struct.unpack(endianness + 'd', data[ptr:ptr+8])[0], 8)
+    if type_index in _SCALAR_TYPES:
+        value = np.frombuffer(data, dtype=endianness + _SCALAR_TYPES[type_index],
+                              count=1, offset=ptr)[0].item()
+        if type_index == 0:
+            value = bool(value)
+        return (value, int(_SCALAR_TYPES[type_index][1]))
     elif type_index == 5:
         LOG.warning('pathpy does not support properties with type long double. Properties have been dropped.')
         return (None, 16)
     elif type_index == 6:
-        str_len = struct.unpack(endianness + 'Q', data[ptr:ptr+8])[0]
-        str = data[ptr+8:ptr+8+str_len].decode('utf-8')
-        return (str, 8 + str_len)
-    elif type_index == 7:
-        num_values = struct.unpack(endianness + 'Q', data[ptr:ptr+8])[0]
-        offset = 8
-        vals = []
-        for i in range(num_values):
-            vals.append(bool(data[ptr+offset:ptr+offset+1]))
-            offset += 1
-        return (array(vals), 8 + num_values)
-    elif type_index == 8:
-        num_values = struct.unpack(endianness + 'Q', data[ptr:ptr+8])[0]
-        offset = 8
-        vals = []
-        for i in range(num_values):
-            vals.append(struct.unpack(endianness + 'h', data[ptr+offset:ptr+offset+2])[0])
-            offset += 4
-        return (array(vals), 8 + 2*num_values)
-    elif type_index == 9:
-        num_values = struct.unpack(endianness + 'Q', data[ptr:ptr+8])[0]
-        offset = 8
-        vals = []
-        for i in range(num_values):
-            vals.append(struct.unpack(endianness + 'i', data[ptr+offset:ptr+offset+4])[0])
-            offset += 4
-        return (array(vals), 8 + 4*num_values)
-    elif type_index == 10:
-        num_values = struct.unpack(endianness + 'Q', data[ptr:ptr+8])[0]
-        offset = 8
-        vals = []
-        for i in range(num_values):
-            vals.append(struct.unpack(endianness + 'Q', data[ptr+offset:ptr+offset+8])[0])
-            offset += 8
-        return (None, 8 + 8*num_values)
-    elif type_index == 11:
-        num_values = struct.unpack(endianness + 'Q', data[ptr:ptr+8])[0]
-        offset = 8
-        vals = []
-        for i in range(num_values):
-            vals.append(struct.unpack(endianness + 'd', data[ptr+offset:ptr+offset+8])[0])
-            offset += 8
-        return (array(vals), 8 + 8*num_values)
+        str_len = struct.unpack_from(endianness + 'Q', data, ptr)[0]
+        value = bytes(data[ptr+8:ptr+8+str_len]).decode('utf-8')
+        return (value, 8 + str_len)
+    elif type_index in _VECTOR_TYPES:
+        num_values = struct.unpack_from(endianness + 'Q', data, ptr)[0]
+        dtype = np.dtype(endianness + _VECTOR_TYPES[type_index])
+        vals = np.frombuffer(data, dtype=dtype, count=num_values,
+                             offset=ptr+8).astype(dtype.newbyteorder('='))
+        if type_index == 7:
+            vals = vals.astype(bool)
+        return (vals, 8 + dtype.itemsize*num_values)
     elif type_index == 12:
-        val_len = struct.unpack(endianness + 'Q', data[ptr:ptr+8])[0]
+        val_len = struct.unpack_from(endianness + 'Q', data, ptr)[0]
         LOG.warning('pathpy does not support properties with type vector<long double>. Properties have been dropped.')
         return (None, 8 + 16*val_len)
     elif type_index == 13:
-        num_strings = struct.unpack(endianness + 'Q', data[ptr:ptr+8])[0]
+        num_strings = struct.unpack_from(endianness + 'Q', data, ptr)[0]
         offset = 8
         strs = []
         for i in range(num_strings):
-            str_len = struct.unpack(endianness + 'Q', data[ptr+offset:ptr+offset+8])[0]
+            str_len = struct.unpack_from(endianness + 'Q', data, ptr+offset)[0]
             offset += 8
-            strs.append(data[ptr+offset:ptr+offset+str_len].decode('utf-8'))
+            strs.append(bytes(data[ptr+offset:ptr+offset+str_len]).decode('utf-8'))
             offset += str_len
 
         return (strs, offset)
     elif type_index == 14:
-        val_len = struct.unpack(endianness + 'Q', data[ptr:ptr+8])[0]
+        val_len = struct.unpack_from(endianness + 'Q', data, ptr)[0]
         return (pickle.loads(data[ptr+8:ptr+8+val_len]), 8 + val_len)
     else:
         msg = 'Unknown type index {0} while parsing graphtool file'.format(type_index)
@@ -145,16 +115,78 @@ def _parse_property_value(data: bytes, ptr: int, type_index: int, endianness: st
         raise FileFormatError(msg)
 
 
+def _parse_property_map(data: bytes, ptr: int, type_index: int, endianness: str, n: int) -> Tuple[Optional[Any], int]:
+    """
+    Parses the values of a vertex or edge property map as well as the number
+    of processed bytes. Values with fixed width are read as a single numpy
+    array.
+
+    Parameters
+    ----------
+
+    data: bytes
+
+        byte array containing the data to be decoded
+
+    ptr: int
+
+        index of the first byte to be parsed
+
+    type_index: int
+
+        integer representing the type of the property values to be parsed
+
+    endianness: str
+
+        String representation of endianness
+
+    n: int
+
+        number of values, i.e. number of vertices or edges
+
+    Returns
+    -------
+
+    Tuple (v, n) consisting of an array or list of property values v and the
+    number of bytes n processed
+    """
+    if type_index in _SCALAR_TYPES:
+        dtype = np.dtype(endianness + _SCALAR_TYPES[type_index])
+        values = np.frombuffer(data, dtype=dtype, count=n, offset=ptr).astype(
+            dtype.newbyteorder('='))
+        if type_index == 0:
+            values = values.astype(bool)
+        return (values, n * dtype.itemsize)
+    elif type_index == 5:
+        LOG.warning('pathpy does not support properties with type long double. Properties have been dropped.')
+        return (None, n * 16)
+
+    values = []
+    start = ptr
+    for _ in range(n):
+        value, size = _parse_property_value(data, ptr, type_index, endianness)
+        values.append(value)
+        ptr += size
+    if type_index == 12:
+        values = None
+    return (values, ptr - start)
+
+
 def parse_graphtool_format(data: bytes, ignore_temporal: bool=False, multiedges: bool=False) -> Union[Network, TemporalNetwork]:
     """
     Decodes data in graphtool binary format and returns a pathpy network. For a documentation of 
     hte graphtool binary format, see see doc at https://graph-tool.skewed.de/static/doc/gt_format.html
 
+    Adjacency lists and property maps with fixed-width values are decoded with
+    `numpy.frombuffer`, and the network is created in bulk from the resulting
+    arrays (see `Network.from_arrays`).
+
     Parameters
     ----------
 
     data: bytes
-        Array of bys to be decoded
+        Array of bys to be decoded. Any object supporting the buffer protocol
+        can be used, e.g. a memory-mapped file.
 
     ignore_temporal: bool=False
         If False, this function will return a static or temporal network depending 
@@ -185,11 +217,11 @@ def parse_graphtool_format(data: bytes, ignore_temporal: bool=False, multiedges:
     ptr += 1
 
     # read length of comment
-    str_len = struct.unpack(graphtool_endianness + 'Q', data[ptr:ptr+8])[0]
+    str_len = struct.unpack_from(graphtool_endianness + 'Q', data, ptr)[0]
     ptr += 8
 
     # read string comment
-    comment = data[ptr:ptr+str_len].decode('ascii')
+    comment = bytes(data[ptr:ptr+str_len]).decode('ascii')
     ptr += str_len
 
     # read network directedness
@@ -197,64 +229,60 @@ def parse_graphtool_format(data: bytes, ignore_temporal: bool=False, multiedges:
     ptr += 1
 
     # read number of nodes
-    n_nodes = struct.unpack(graphtool_endianness + 'Q', data[ptr:ptr+8])[0]
+    n_nodes = struct.unpack_from(graphtool_endianness + 'Q', data, ptr)[0]
     ptr += 8
 
-    # create pandas dataframe
-    network_dict = {}
-    # n = Network(directed = directed, multiedges=True)
-
     # determine binary representation of neighbour lists
     if n_nodes<2**8:
-        fmt = 'B'
-        d = 1
+        fmt = 'u1'
     elif n_nodes<2**16:
-        fmt = 'H'
-        d = 2
+        fmt = 'u2'
     elif n_nodes<2**32:
-        fmt = 'I'
-        d = 4
+        fmt = 'u4'
     else:
-        fmt = 'Q'
-        d = 8
-
-    n_edges = 0
-    # parse lists of out-neighbors for all n nodes
+        fmt = 'u8'
+    neighbor_type = np.dtype(graphtool_endianness + fmt)
+
+    # locate the headers of the lists of out-neighbors of all n nodes
+    count = struct.Struct(graphtool_endianness + 'Q')
+    headers = np.empty(n_nodes, dtype=np.int64)
+    degrees = np.empty(n_nodes, dtype=np.int64)
+    start = ptr
     for v in range(n_nodes):
-        # read number of neighbors
-        num_neighbors = struct.unpack(graphtool_endianness + 'Q', data[ptr:ptr+8])[0]
-        ptr += 8
-
-        # add edges to record
-        for j in range(num_neighbors):
-            w = struct.unpack(graphtool_endianness + fmt, data[ptr:ptr+d])[0]
-            ptr += d
-            network_dict[n_edges] = [str(v), str(w)]
-            n_edges += 1
-    
-    network_data = pd.DataFrame.from_dict(network_dict, orient='index', columns=['v', 'w'])
+        degree = count.unpack_from(data, ptr)[0]
+        headers[v] = ptr
+        degrees[v] = degree
+        ptr += 8 + degree * neighbor_type.itemsize
+
+    # remove headers and decode all neighbor lists at once
+    block = np.frombuffer(data, dtype=np.uint8, count=ptr-start, offset=start)
+    mask = np.ones(len(block), dtype=bool)
+    mask[((headers - start)[:, None] + np.arange(8)).ravel()] = False
+    targets = block[mask].view(neighbor_type).astype(np.int64)
+    sources = np.repeat(np.arange(n_nodes, dtype=np.int64), degrees)
+    del block
+    n_edges = len(targets)
 
     # collect all attributes from property maps
     network_attributes = {}
-    edge_attribute_names = set()
-    node_attributes = defaultdict(lambda: dict())
-    edge_attributes = defaultdict(lambda: defaultdict(lambda: pd.NA))
-    
+    node_attributes = {}
+    edge_attributes = {}
+
     # parse property maps
-    property_maps = struct.unpack(graphtool_endianness + 'Q', data[ptr:ptr+8])[0]
+    property_maps = struct.unpack_from(graphtool_endianness + 'Q', data, ptr)[0]
     ptr += 8
 
     for i in range(property_maps):
-        key_type = struct.unpack(graphtool_endianness + 'B', data[ptr:ptr+1])[0]
+        key_type = data[ptr]
         ptr += 1
 
-        property_len  = struct.unpack(graphtool_endianness + 'Q', data[ptr:ptr+8])[0]
+        property_len  = struct.unpack_from(graphtool_endianness + 'Q', data, ptr)[0]
         ptr += 8
 
-        property_name = data[ptr:ptr+property_len].decode('ascii')
+        property_name = bytes(data[ptr:ptr+property_len]).decode('ascii')
         ptr += property_len
 
-        property_type = struct.unpack(graphtool_endianness + 'B', data[ptr:ptr+1])[0]
+        property_type = data[ptr]
         ptr += 1
 
         if key_type == 0: # network property
@@ -262,16 +290,15 @@ def parse_graphtool_format(data: bytes, ignore_temporal: bool=False, multiedges:
             network_attributes[property_name] = res[0]
             ptr += res[1]
         elif key_type == 1: # vertex property
-            for v in range(n_nodes):
-                res = _parse_property_value(data, ptr, property_type, graphtool_endianness)
-                node_attributes[str(v)][property_name] = res[0]
-                ptr += res[1]
+            res = _parse_property_map(data, ptr, property_type, graphtool_endianness, n_nodes)
+            if res[0] is not None:
+                node_attributes[property_name] = res[0]
+            ptr += res[1]
         elif key_type == 2: # edge property
-            for e in range(n_edges):
-                res = _parse_property_value(data, ptr, property_type, graphtool_endianness)
-                edge_attributes[e][property_name] = res[0]
-                edge_attribute_names.add(property_name)
-                ptr += res[1]
+            res = _parse_property_map(data, ptr, property_type, graphtool_endianness, n_edges)
+            if res[0] is not None:
+                edge_attributes[property_name] = res[0]
+            ptr += res[1]
         else:
             LOG.error('Unknown key type {0}'.format(key_type))
 
@@ -282,25 +309,33 @@ def parse_graphtool_format(data: bytes, ignore_temporal: bool=False, multiedges:
     LOG.info('directed \t= {0}'.format(directed))
     LOG.info('nodes \t\t= {0}'.format(n_nodes))
 
-    # add edge properties to data frame
-    for p in edge_attribute_names:
-        # due to use of default_dict, this will add NA values to edges which have missing properties
-        network_data[p] = [ edge_attributes[e][p] for e in range(n_edges) ]
+    # uids of nodes and edges stored by write_graphtool
+    nodes = node_attributes.pop('_uid', None)
+    nodes = np.arange(n_nodes).astype(str) if nodes is None else np.array(nodes, dtype=object)
+    uids = edge_attributes.pop('_uid', None)
 
-    # create network from pandas dataframe
+    # create network from arrays
     n: Optional[Union[Network, TemporalNetwork]] = None
-    if 'time' in edge_attribute_names and not ignore_temporal:
+    if 'time' in edge_attributes and not ignore_temporal:
+        network_data = pd.DataFrame({'v': nodes[sources], 'w': nodes[targets],
+                                     **edge_attributes})
+        if uids is not None:
+            network_data['uid'] = uids
         n = to_temporal_network(network_data, directed=directed, **network_attributes)
+
+        # for now we remove _pos for temporal networks due to type being incompatible with plotting
+        node_attributes.pop('_pos', None)
+        for v in nodes:
+            if v not in n.nodes:
+                n.add_node(v)
+        for p, values in node_attributes.items():
+            for v, value in zip(nodes, values):
+                n.nodes[v][p] = value
     else:
-        n = to_network(network_data, directed=directed, multiedges=multiedges, **network_attributes)
-    
-    for v in node_attributes:       
-        if v not in n.nodes:
-            n.add_node(v)
-        for p in node_attributes[v]:            
-            # for now we remove _pos for temporal networks due to type being incompatible with plotting
-            if p != '_pos' or ('time' not in edge_attribute_names or ignore_temporal):
-                n.nodes[v][p] = node_attributes[v][p]
+        n = Network.from_arrays(sources, targets, nodes=nodes, directed=directed,
+                                multiedges=multiedges, uids=uids,
+                                edge_attributes=edge_attributes,
+                                node_attributes=node_attributes, **network_attributes)
     return n
 
 
@@ -308,6 +343,8 @@ def read_graphtool(file: str, ignore_temporal: bool=False, multiedges: bool=Fals
     """
     Reads a file in graphtool binary format
 
+    Uncompressed files are memory-mapped rather than read into memory.
+
     Parameters
     ----------
 
@@ -319,21 +356,247 @@ def read_graphtool(file: str, ignore_temporal: bool=False, multiedges: bool=Fals
             try: 
                 import zstandard as zstd 
                 dctx = zstd.ZstdDecompressor()
-                data = f.read()
-                return parse_graphtool_format(dctx.decompress(data, max_output_size=len(data)))
+                data = dctx.stream_reader(f).readall()
+                return parse_graphtool_format(data, ignore_temporal, multiedges)
             except ModuleNotFoundError:
                 msg = 'Package zstandard is required to decompress graphtool files. Please install module, e.g., using "pip install zstandard".'
                 LOG.error(msg)                
                 raise MissingModuleError(msg)
-        else:    
-            return parse_graphtool_format(f.read(), ignore_temporal, multiedges)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return parse_graphtool_format(data, ignore_temporal, multiedges)
 
 
-def write_graphtool(network: Network, file: str):
+def _property_type(values: list) -> int:
+    """
+    Returns the graphtool type index used to store a list of property values.
+    """
+    def _all(types) -> bool:
+        return all(isinstance(v, types) for v in values)
+
+    def _vectors(types) -> bool:
+        return all(isinstance(v, (list, tuple, np.ndarray)) and
+                   all(isinstance(x, types) for x in v) for v in values)
+
+    if _all((bool, np.bool_)):
+        return 0
+    elif _all((int, np.integer)) and not _all((bool, np.bool_)):
+        return 3
+    elif _all((int, float, np.integer, np.floating)):
+        return 4
+    elif _all(str):
+        return 6
+    elif _vectors((bool, np.bool_)):
+        return 7
+    elif _vectors((int, np.integer)):
+        return 10
+    elif _vectors((int, float, np.integer, np.floating)):
+        return 11
+    elif _vectors(str):
+        return 13
+    return 14
+
+
+def _encode_property_value(value: Any, type_index: int, endianness: str) -> bytes:
+    """
+    Encodes a single property value in graphtool binary format.
+    """
+    if type_index in _SCALAR_TYPES:
+        return np.asarray(value, dtype=endianness + _SCALAR_TYPES[type_index]).tobytes()
+    elif type_index == 6:
+        value = value.encode('utf-8')
+        return struct.pack(endianness + 'Q', len(value)) + value
+    elif type_index in _VECTOR_TYPES:
+        return struct.pack(endianness + 'Q', len(value)) + np.asarray(
+            value, dtype=endianness + _VECTOR_TYPES[type_index]).tobytes()
+    elif type_index == 13:
+        return struct.pack(endianness + 'Q', len(value)) + b''.join(
+            _encode_property_value(v, 6, endianness) for v in value)
+    value = pickle.dumps(value)
+    return struct.pack(endianness + 'Q', len(value)) + value
+
+
+def _encode_property_map(key_type: int, name: str, values: list, endianness: str) -> bytes:
+    """
+    Encodes a network, vertex or edge property map in graphtool binary format.
+    Fixed-width values are encoded as a single numpy array.
+    """
+    type_index = _property_type(values)
+    name = name.encode('ascii')
+    header = bytes([key_type]) + struct.pack(endianness + 'Q', len(name)) + \
+        name + bytes([type_index])
+    if type_index in _SCALAR_TYPES:
+        return header + np.asarray(
+            values, dtype=endianness + _SCALAR_TYPES[type_index]).tobytes()
+    return header + b''.join(
+        _encode_property_value(v, type_index, endianness) for v in values)
+
+
+def write_graphtool(network: Network, file: str, comment: str = '', endianness: str = '<') -> None:
     """
     Writes a network to graphtool binary format
-    """ 
-    raise NotImplementedError()
+
+    The adjacency lists are written based on the integer index of nodes, and
+    node uids, network, node and edge attributes are stored as typed property
+    maps. Node and edge uids are stored in the property maps `_uid`, which
+    are used as uids by `read_graphtool`. Missing attribute values are stored
+    as NaN or empty strings. For temporal networks, each
+    activation of an edge is stored as separate edge with properties `time`
+    and `duration`. If the file name ends with `.zst`, the file is compressed
+    with zstandard.
+
+    For a documentation of the graphtool binary format, see
+    https://graph-tool.skewed.de/static/doc/gt_format.html
+
+    Parameters
+    ----------
+
+    network: Network
+        static or temporal network to write
+
+    file: str
+        Path of the graphtool file to be written
+
+    comment: str = ''
+        comment stored in the file header
+
+    endianness: str = '<'
+        byte order of the file, where '>' represents Big Endian and '<'
+        represents Little Endian
+
+    Examples
+    --------
+
+    >>> import pathpy as pp
+    >>> n = pp.Network(directed=False)
+    >>> n.add_edge('a', 'b', weight=2.0)
+    >>> pp.io.graphtool.write_graphtool(n, 'network.gt')
+    >>> n2 = pp.io.graphtool.read_graphtool('network.gt')
+    """
+    data = write_graphtool_format(network, comment, endianness)
+
+    if '.zst' in file:
+        try:
+            import zstandard as zstd
+        except ModuleNotFoundError:
+            msg = 'Package zstandard is required to compress graphtool files. Please install module, e.g., using "pip install zstandard".'
+            LOG.error(msg)
+            raise MissingModuleError(msg)
+        data = zstd.ZstdCompressor().compress(data)
+
+    with open(file, 'wb') as f:
+        f.write(data)
+
+
+def write_graphtool_format(network: Network, comment: str = '', endianness: str = '<') -> bytes:
+    """
+    Encodes a static or temporal network in graphtool binary format
+
+    Parameters
+    ----------
+
+    network: Network
+        static or temporal network to encode
+
+    comment: str = ''
+        comment stored in the file header
+
+    endianness: str = '<'
+        byte order, where '>' represents Big Endian and '<' represents Little
+        Endian
+
+    Returns
+    -------
+    bytes
+        network encoded in graphtool binary format
+    """
+    index = network.nodes.index
+    n_nodes = len(index)
+
+    # collect edges and their attributes
+    edges = network.edges[:] if isinstance(network, TemporalNetwork) else network.edges
+    sources, targets, uids = [], [], []
+    edge_attributes: defaultdict = defaultdict(dict)
+    for i, edge in enumerate(edges):
+        sources.append(index[edge.v.uid])
+        targets.append(index[edge.w.uid])
+        uids.append(edge.uid)
+        attributes = dict(edge.attributes)
+        if isinstance(network, TemporalNetwork):
+            start, end = attributes.pop('start'), attributes.pop('end')
+            if not isinstance(start, (int, float, np.integer, np.floating)):
+                msg = 'Only numeric time stamps can be stored in graphtool format'
+                LOG.error(msg)
+                raise FileFormatError(msg)
+            attributes['time'] = start
+            attributes['duration'] = end - start
+        for key, value in attributes.items():
+            edge_attributes[key][i] = value
+
+    # order edges by source node
+    order = np.argsort(np.array(sources, dtype=np.int64), kind='stable')
+    sources = np.array(sources, dtype=np.int64)[order]
+    targets = np.array(targets, dtype=np.int64)[order]
+    degrees = np.bincount(sources, minlength=n_nodes)
+
+    e = endianness
+    data = [b'\xe2\x9b\xbe\x20\x67\x74', bytes([1, e == '>'])]
+    data.append(struct.pack(e + 'Q', len(comment.encode('ascii'))) + comment.encode('ascii'))
+    data.append(bytes([network.directed]) + struct.pack(e + 'Q', n_nodes))
+
+    # adjacency lists, where each list is preceded by the number of neighbors
+    if n_nodes<2**8:
+        fmt = 'u1'
+    elif n_nodes<2**16:
+        fmt = 'u2'
+    elif n_nodes<2**32:
+        fmt = 'u4'
+    else:
+        fmt = 'u8'
+    width = np.dtype(fmt).itemsize
+    headers = 8*np.arange(n_nodes) + width*(np.cumsum(degrees) - degrees)
+    block = np.zeros(8*n_nodes + width*len(targets), dtype=np.uint8)
+    mask = np.zeros(len(block), dtype=bool)
+    mask[(headers[:, None] + np.arange(8)).ravel()] = True
+    block[mask] = degrees.astype(e + 'u8').view(np.uint8)
+    block[~mask] = targets.astype(e + fmt).view(np.uint8)
+    data.append(block.tobytes())
+
+    # property maps
+    maps = [_encode_property_map(0, 'uid', [network.uid], e)]
+    for key, value in network.attributes.items():
+        maps.append(_encode_property_map(0, key, [value], e))
+
+    nodes = list(network.nodes.values())
+    maps.append(_encode_property_map(1, '_uid', [v.uid for v in nodes], e))
+    node_keys = {key for v in nodes for key in v.attributes}
+    for key in sorted(node_keys):
+        values = [v.attributes.get(key, None) for v in nodes]
+        maps.append(_encode_property_map(1, key, _fill_missing(values), e))
+
+    maps.append(_encode_property_map(2, '_uid', [uids[i] for i in order], e))
+    for key in sorted(edge_attributes):
+        values = [edge_attributes[key].get(i, None) for i in order]
+        maps.append(_encode_property_map(2, key, _fill_missing(values), e))
+
+    data.append(struct.pack(e + 'Q', len(maps)))
+    data.extend(maps)
+    return b''.join(data)
+
+
+def _fill_missing(values: list) -> list:
+    """
+    Replaces missing property values by NaN for numbers and by empty strings
+    for strings, so that the values can be stored with a common type.
+    """
+    present = [v for v in values if v is not None]
+    if len(present) == len(values):
+        return values
+    if present and all(isinstance(v, (int, float, np.integer, np.floating)) for v in present):
+        return [float('nan') if v is None else v for v in values]
+    if present and all(isinstance(v, str) for v in present):
+        return ['' if v is None else v for v in values]
+    return values
 
 
 def list_netzschleuder_records(base_url: str='https://networks.skewed.de', **kwargs) -> Union[list, dict]:
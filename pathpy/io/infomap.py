@@ -8,21 +8,38 @@
 #
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
-from typing import Optional
-from collections import OrderedDict, Counter
-from pathpy.core.api import PathCollection
+from typing import Optional, Sequence, Tuple, Union
+import shlex
+
+import numpy as np
+import scipy.sparse as sparse
+
+from pathpy.core.api import PathCollection, PathStore
+from pathpy.utils.errors import FileFormatError
 from pathpy import logger
 
-def to_state_file(paths: PathCollection, file: str, max_memory: int=1) -> None:
+# create logger
+LOG = logger(__name__)
+
+# number of lines that are formatted before they are written
+_BATCH = 1 << 16
+
+
+def to_state_file(paths: Union[PathCollection, PathStore], file: str,
+                  max_memory: int = 1) -> None:
     """
     Writes paths from a PathCollection instance into a state file that can be read by InfoMap [1].
 
     .. [1] M. Rosvall, Daniel Axelsson, Carl T. Bergstrom, "The map equation" The European Physical Journal Special Topics 178.1 (2009): 13-23.
 
+    State nodes are generated in a single pass over the paths, where each
+    state is identified by an integer encoding of its k-gram, i.e. the memory
+    and the current node. The file is written in buffered batches of lines.
+
     Parameters
     ----------
-    paths : PathCollection
-        the PathCollection instance that will be used to generate the state file
+    paths : Union[PathCollection, PathStore]
+        the PathCollection (or PathStore) instance that will be used to generate the state file
 
     file : str
         Path where the state file will be saved
@@ -36,14 +53,16 @@ def to_state_file(paths: PathCollection, file: str, max_memory: int=1) -> None:
 
     Create a state file from a PathCollection with three paths
 
-    >>> pc = Counter( {('a', 'b'): 1, ('a', 'b', 'c'): 1} )
+    >>> pc = pp.PathCollection()
+    >>> pc.add('a', 'b')
+    >>> pc.add('a', 'b', 'c')
     >>> pp.io.infomap.to_state_file(pc, 'paths.state', max_memory=1)
     >>> with open('paths.state', 'r') as f:
     >>>     print(f.read())
     *Vertices 3
     1 "a"
-    3 "c"
     2 "b"
+    3 "c"
     *States
     1 1 "{}_a"
     2 2 "{}_b"
@@ -54,73 +73,203 @@ def to_state_file(paths: PathCollection, file: str, max_memory: int=1) -> None:
     1 3 1
     3 4 1
     """
-    # node set
-    nodes = set(paths.nodes.keys())
-
-    state_file = []
-    with open(file, mode='w') as f:        
-        # total number of nodes traversed by paths
-        n = len(nodes)
-
-        # generate list of nodes with 1-based index
-        state_file.append('*Vertices {0}'.format(n))
-
-        # sorting is only important that the same state file node indices are generated every time (since dictionaries do not preserve the order). This is only important for unit testing.
-        nodes_to_index = OrderedDict( { i[0]: i[1] for i in zip(sorted(nodes), range(1, n+1)) })
-        for v in nodes:
-            state_file.append('{0} "{1}"'.format(nodes_to_index[v], v))
-
-        # use paths to generate list of state nodes (with 1-based index) as well as links
-        state_file.append('*States')
-        
-        # sorting is only important that the same state file node indices are generated every time (since dictionaries do not preserve the order). This is only important for unit testing.
-        states_by_index = OrderedDict()
-        states_to_index = OrderedDict()
-        links = Counter()
-        i = 1
-        for p in paths:
-            for k in range(len(p.relations)-1):
-                current_node = p.relations[k]
-                next_node = p.relations[k+1]
-
-                # memory of predecessor = last up to max_order nodes (or empty if first node)
-                memory_pred = []
-                for j in range(max(0, k-max_memory), k):
-                    memory_pred.append(p.relations[j])
-
-                # memory of successor = last up to max_order nodes (or empty if last node)
-                memory_succ = []
-                if k+1<len(p.relations)-1:
-                    for j in range(max(0, k-max_memory+1), k+1):
-                        memory_succ.append(p.relations[j])
-                
-                current_state = '{' + '-'.join(memory_pred) + '}_' + current_node
-                next_state = '{' + '-'.join(memory_succ) + '}_' + next_node
-
-                # add state nodes with indices
-                if current_state not in states_to_index:
-                    states_by_index[i] = (current_node, current_state)
-                    states_to_index[current_state] = i
-                    i += 1
-                if next_state not in states_to_index:
-                    states_by_index[i] = (next_node, next_state)
-                    states_to_index[next_state] = i
-                    i += 1
-                links[(current_state, next_state)] += paths.counter[p.uid]
-
-        for index, item in states_by_index.items():
-            state_file.append('{0} {1} "{2}"'.format(index, nodes_to_index[item[0]], item[1]))
-
-        # write links to file
-        state_file.append('*Links')
-        for l in links:
-            state_file.append('{0} {1} {2}'.format(states_to_index[l[0]], states_to_index[l[1]], links[l]))
-        f.write('\n'.join(state_file))
-
-
-def from_state_file(file: str) -> Counter:
+    # sorting is only important that the same state file node indices are
+    # generated every time, vertices are listed in the order of the nodes
+    if isinstance(paths, PathStore):
+        uids = list(paths.nodes)
+        vertices = sorted(uids)
+        index = {uid: i for i, uid in enumerate(vertices)}
+        mapping = [index[uid] for uid in paths.nodes]
+        encoded = ((tuple([mapping[c] for c in codes]), count)
+                   for codes, count in paths.counter.items())
+    else:
+        uids = list(paths.nodes.keys())
+        vertices = sorted(uids)
+        index = {uid: i for i, uid in enumerate(vertices)}
+        encoded = ((tuple([index[uid] for uid in path.relations]),
+                    paths.counter[uid]) for uid, path in paths.items())
+
+    # states are identified by integer k-grams with digits (node index + 1)
+    # in base n+1, where leading zeros denote an empty memory
+    base = len(vertices) + 1
+    modulo = base ** max_memory
+    states: dict = {}
+    memories: list = []
+    links: dict = {}
+
+    for codes, count in encoded:
+        if len(codes) < 2:
+            continue
+        last = len(codes) - 1
+        window, previous = 0, -1
+        for i, code in enumerate(codes):
+            # the memory of the last node of a path is empty
+            key = (window * base if i < last else 0) + code + 1
+            state = states.get(key)
+            if state is None:
+                state = states[key] = len(states)
+                memories.append(codes[max(0, i-max_memory):i]
+                                if i < last else ())
+            if previous >= 0:
+                link = (previous, state)
+                links[link] = links.get(link, 0) + count
+            window = (window * base + code + 1) % modulo
+            previous = state
+
+    nodes = np.array([key % base - 1 for key in states], dtype=np.int64)
+    labels = ['{' + '-'.join(vertices[c] for c in memory) + '}_' +
+              vertices[nodes[i]] for i, memory in enumerate(memories)]
+
+    source = np.fromiter((s for s, _ in links), dtype=np.int64,
+                         count=len(links))
+    target = np.fromiter((t for _, t in links), dtype=np.int64,
+                         count=len(links))
+    matrix = sparse.coo_matrix(
+        (np.array(list(links.values())), (source, target)),
+        shape=(len(states), len(states)))
+
+    write_state_file(file, vertices, nodes, labels, matrix,
+                     order=[index[uid] for uid in uids])
+
+
+def write_state_file(file: str, vertices: Sequence[str], states: np.ndarray,
+                     labels: Sequence[str], links: sparse.spmatrix,
+                     order: Optional[Sequence[int]] = None) -> None:
+    """Writes state nodes and weighted links to a state file.
+
+    Parameters
+    ----------
+    file : str
+        Path where the state file will be saved
+
+    vertices : Sequence[str]
+        names of the physical nodes, which get the 1-based indices 1, ..., n
+
+    states : np.ndarray
+        index of the physical node of each state node
+
+    labels : Sequence[str]
+        names of the state nodes
+
+    links : scipy.sparse.spmatrix
+        weighted adjacency matrix of the state nodes, where the links of a
+        matrix in COO format are written in the order of its coordinates
+
+    order : Optional[Sequence[int]] = None
+        indices of the physical nodes in the order in which they are listed.
+        If None, they are listed in the order of their indices.
+
+    """
+    # links are written in the order of the coordinates
+    links = sparse.coo_matrix(links)
+
+    if order is None:
+        order = range(len(vertices))
+    lines = ['*Vertices {0}'.format(len(vertices))]
+    lines += ['{0} "{1}"'.format(i+1, vertices[i]) for i in order]
+    lines.append('*States')
+
+    with open(file, mode='w', buffering=1 << 20) as f:
+        f.write('\n'.join(lines))
+
+        for start in range(0, len(labels), _BATCH):
+            f.write(''.join(
+                '\n{0} {1} "{2}"'.format(start+i+1, node+1, label)
+                for i, (node, label) in enumerate(zip(
+                    states[start:start+_BATCH].tolist(),
+                    labels[start:start+_BATCH]))))
+
+        f.write('\n*Links')
+        for start in range(0, links.nnz, _BATCH):
+            stop = start + _BATCH
+            f.write(''.join(
+                '\n{0} {1} {2}'.format(s+1, t+1, w) for s, t, w in zip(
+                    links.row[start:stop].tolist(),
+                    links.col[start:stop].tolist(),
+                    links.data[start:stop].tolist())))
+
+
+def from_state_file(file: str) -> Tuple[list, np.ndarray, list,
+                                        sparse.csr_matrix]:
     """
-    Reads path statistics from a state file
-    """ 
-    raise NotImplementedError()
+    Reads state nodes and links from a state file
+
+    Parameters
+    ----------
+    file : str
+        Path of the state file
+
+    Returns
+    -------
+    Tuple[list, np.ndarray, list, scipy.sparse.csr_matrix]
+
+        the names of the physical nodes, the index of the physical node of
+        each state node, the names of the state nodes and the weighted
+        adjacency matrix of the state nodes, where physical and state nodes
+        are ordered by their ids in the file. The result can be written with
+        `write_state_file`.
+
+    Examples
+    --------
+    >>> vertices, states, labels, links = pp.io.infomap.from_state_file(
+    ...     'paths.state')
+    >>> pp.io.infomap.write_state_file('copy.state', vertices, states,
+    ...                                labels, links)
+
+    """
+    sections: dict = {'vertices': [], 'states': [], 'links': []}
+    section = None
+    with open(file, mode='r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('*'):
+                section = line[1:].split()[0].lower()
+                if section not in sections:
+                    msg = 'Unknown section "{}" in state file'.format(line)
+                    LOG.error(msg)
+                    raise FileFormatError(msg)
+                continue
+            if section is None:
+                msg = 'State file has to start with a section header'
+                LOG.error(msg)
+                raise FileFormatError(msg)
+            sections[section].append(line)
+
+    # physical nodes given as: id "name"
+    vertex_ids, vertices = [], []
+    for line in sections['vertices']:
+        fields = shlex.split(line)
+        vertex_ids.append(int(fields[0]))
+        vertices.append(fields[1] if len(fields) > 1 else fields[0])
+    order = np.argsort(vertex_ids, kind='stable')
+    vertex_index = {vertex_ids[i]: j for j, i in enumerate(order.tolist())}
+    vertices = [vertices[i] for i in order.tolist()]
+
+    # state nodes given as: id vertex "name"
+    state_ids, nodes, labels = [], [], []
+    for line in sections['states']:
+        fields = shlex.split(line)
+        state_ids.append(int(fields[0]))
+        nodes.append(vertex_index[int(fields[1])])
+        labels.append(fields[2] if len(fields) > 2 else fields[0])
+    order = np.argsort(state_ids, kind='stable')
+    state_index = np.empty(len(state_ids), dtype=np.int64)
+    state_index[order] = np.arange(len(state_ids))
+    lookup = dict(zip(state_ids, state_index.tolist()))
+    states = np.array(nodes, dtype=np.int64)[order]
+    labels = [labels[i] for i in order.tolist()]
+
+    # links given as: source target [weight]
+    data = np.loadtxt(sections['links'], ndmin=2) if sections['links'] \
+        else np.empty((0, 3))
+    weights = data[:, 2] if data.shape[1] > 2 else np.ones(len(data))
+    if np.all(weights == np.round(weights)):
+        weights = weights.astype(np.int64)
+    source = np.array([lookup[int(s)] for s in data[:, 0]], dtype=np.int64)
+    target = np.array([lookup[int(t)] for t in data[:, 1]], dtype=np.int64)
+    links = sparse.csr_matrix((weights, (source, target)),
+                              shape=(len(labels), len(labels)))
 
+    return vertices, states, labels, links
@@ -8,14 +8,20 @@
 #
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
-from pathpy.utils.errors import NetworkError
-import tarfile
+import hashlib
 import io
+import json
+import os
+import queue
+import shutil
+import tarfile
+import threading
 from urllib import request
 from urllib.error import HTTPError
 
-from typing import Union, Optional
+from typing import Any, BinaryIO, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd  # pylint: disable=import-error
 
 from pathpy import logger
@@ -23,12 +29,19 @@ from pathpy.io.pandas import to_network, to_temporal_network
 from pathpy.models.api import Network
 from pathpy.models.api import TemporalNetwork
 from pathpy import FileFormatError, NetworkError
+from pathpy.utils.helper import atomic_write
 
 # create logger
 LOG = logger(__name__)
 
+# implicit semantics of columns in TSV files
+TSV_COLUMNS = ['v', 'w', 'weight', 'time']
+
+# number of bytes which are decompressed at once in the background
+_BLOCK = 1 << 22
+
 
-def read_tsv_network(file: str, ignore_temporal: bool=False) -> Union[Network, TemporalNetwork]:
+def read_tsv_network(file: Union[str, bytes, BinaryIO], ignore_temporal: bool=False) -> Union[Network, TemporalNetwork]:
     """Reads a KONECT data file in TSV format and returns a pp.Network instance.
 
     The unified KONECT data format is a compressed .tar.bz2 file containing two
@@ -43,12 +56,18 @@ def read_tsv_network(file: str, ignore_temporal: bool=False) -> Union[Network, T
 
     For more information on the TSV file format, see Section 9 in referenced handbook.
 
+    The archive is read as a stream, where decompression runs in a background
+    thread while the edges are parsed by the C parser of pandas. All edges are
+    added to the network in bulk.
+
     .. [1] J Kunegis, "Handbook of Network Analysis - The Konect Project", https://github.com/kunegis/konect-handbook/blob/master/konect-handbook.pdf, 2019
 
     Parameters
     ----------
-    file: str, Bytes
-        Filename or byte stream from which data should be loaded
+    file: str, bytes, BinaryIO
+        Filename, bytes or binary stream from which data should be loaded.
+        A filename can refer to a compressed archive, to a directory with the
+        extracted files meta.* and out.*, or to a single out.* file.
 
     ignore_temporal: bool=False
         If False (default), a temporal or static network will be returned depending on the data.
@@ -99,83 +118,12 @@ def read_tsv_network(file: str, ignore_temporal: bool=False) -> Union[Network, T
     Number of edges:	315
     """
 
-    # implicit semantics of columns in TSV files
-    tsv_columns = ['v', 'w', 'weight', 'time']
-
-    if isinstance(file, str):
-        tar = tarfile.open(file, mode='r:bz2')
-    elif isinstance(file, bytes):
-        tar = tarfile.open(fileobj=io.BytesIO(file), mode='r:bz2')
+    attributes, directed, network_data = _read_tsv(file)
+    return _to_network(attributes, directed, network_data, ignore_temporal)
 
-    # network-level attributes
-    attributes = {}
 
-    directed = False
-    multiedges = False
-    network_data: pd.DataFrame = None
-
-    for tarinfo in tar:
-        if tarinfo.isfile():
-            f = tarinfo.path.split('/')[-1]
-
-            # read meta-data into attributes
-            if f.startswith('meta.'):
-                bytedata = tar.extractfile(tarinfo)
-                if bytedata:
-                    with io.TextIOWrapper(bytedata) as buffer:
-                        for line in buffer.readlines():
-                            s = line.split(': ', 1)
-                            # ignore empty lines
-                            if len(s) == 2:
-                                attributes[s[0].strip()] = s[1].strip()
-                else:
-                    msg = 'Could not extract tar file {0}'.format(f)
-                    LOG.error(msg)
-                    raise FileFormatError(msg)
-
-            # read network data
-            elif f.startswith('out.'):
-                bytedata = tar.extractfile(tarinfo)
-                if bytedata:
-                    with io.TextIOWrapper(bytedata) as buffer:
-                        # check whether network is directed
-                        directed = 'asym' in buffer.readline()
-
-                        # read pandas data frame
-                        network_data = pd.read_csv(
-                            buffer, sep=r'\s+', header=None, comment='%')
-                        network_data = network_data.dropna(axis=1, how='all')
-
-                        # extract which columns are present
-                        network_data.columns = [tsv_columns[i]
-                                                for i in range(len(network_data.columns))]
-                        duplicates = len(
-                            network_data[network_data.duplicated(['v', 'w'], keep=False)])
-                        if duplicates > 0:
-                            LOG.info('Found {} duplicate edges'.format(duplicates))
-                            multiedges = True
-                        LOG.info('Detected columns: {0}'.format(str([c for c in network_data.columns])))
-                else:
-                    msg = 'Could not extract tar file {0}'.format(f)
-                    LOG.error(msg)
-                    raise FileFormatError(msg)
-    if 'timeiso' in attributes:
-        try:
-            dt = pd.to_datetime(attributes['timeiso'])
-            attributes['time'] = attributes['timeiso']            
-        except ValueError:
-            LOG.warning('KONECT data contains invalid timeiso: {}'.format(
-                attributes['timeiso']))
-    if 'time' in network_data.columns and not ignore_temporal:
-        network_data.rename(columns= {'time': 'timestamp'}, inplace=True)
-        return to_temporal_network(network_data, 
-                directed=directed, multiedges=multiedges, **attributes)
-    else:
-        return to_network(network_data, 
-            directed=directed, multiedges=multiedges, **attributes)
-
-
-def read_konect_name(name, ignore_temporal: bool=False, base_url="http://konect.cc/files/download.tsv.") -> Optional[Union[Network, TemporalNetwork]]:
+def read_konect_name(name, ignore_temporal: bool=False, base_url="http://konect.cc/files/download.tsv.",
+                     cache: Optional[str]=None) -> Optional[Union[Network, TemporalNetwork]]:
     """Retrieves a data set with a given name from the KONECT repository and returns a corresponding
     instance of pp.Network.
 
@@ -217,6 +165,16 @@ def read_konect_name(name, ignore_temporal: bool=False, base_url="http://konect.
         If False (default), a temporal or static network will be returned depending on the data.
         If True, a static network will be returned even if the edges of the KONECT network contain a time attribute.
 
+    cache: Optional[str]=None
+
+        Directory in which downloaded data sets are stored as files
+        NAME-HASH.tar.bz2, where HASH is a hash of the url of the data set.
+        If a data set is found in the directory, it is read from disk
+        instead of being downloaded again. If None (default), data sets are
+        parsed while they are downloaded and are not stored. Parsed columns
+        are cached as NAME-HASH.npz, which allows to load data sets without
+        decompressing them again.
+
     Returns
     -------
 
@@ -263,13 +221,228 @@ def read_konect_name(name, ignore_temporal: bool=False, base_url="http://konect.
 
 
     """
+    url = base_url + name + '.tar.bz2'
     try:
-        f = request.urlopen(base_url + name + ".tar.bz2").read()
-        return read_tsv_network(f, ignore_temporal)
+        if cache is None:
+            # the archive is decompressed and parsed while it is downloaded
+            with request.urlopen(url) as response:
+                return read_tsv_network(response, ignore_temporal)
+
+        # parsed columns are cached next to the archive, such that data sets
+        # are decompressed only once, where files of different urls differ
+        key = '{0}-{1}'.format(name, hashlib.blake2b(
+            url.encode(), digest_size=4).hexdigest())
+        path = os.path.join(cache, key + '.tar.bz2')
+        arrays = os.path.join(cache, key + '.npz')
+        if os.path.isfile(arrays):
+            LOG.info('Reading {0} from cache {1}'.format(name, cache))
+            attributes, directed, network_data = _load(arrays)
+        else:
+            if not os.path.isfile(path):
+                _download(url, path)
+            attributes, directed, network_data = _read_tsv(path)
+            _save(arrays, attributes, directed, network_data)
+        return _to_network(attributes, directed, network_data, ignore_temporal)
     except HTTPError:
         raise NetworkError('Could not connect to KONECT server at {0}'.format(base_url))
 
 
+def _read_tsv(file: Union[str, bytes, BinaryIO]) -> Tuple[dict, bool, pd.DataFrame]:
+    """Reads the attributes, the directedness and the edges of a KONECT data set."""
+    # network-level attributes
+    attributes: dict = {}
+
+    directed = False
+    network_data: Optional[pd.DataFrame] = None
+
+    for name, stream in _members(file):
+        # read meta-data into attributes
+        if name.startswith('meta.'):
+            for line in stream.read().decode('utf-8', 'replace').splitlines():
+                s = line.split(': ', 1)
+                # ignore empty lines
+                if len(s) == 2:
+                    attributes[s[0].strip()] = s[1].strip()
+
+        # read network data
+        elif name.startswith('out.'):
+            directed, network_data = _read_out(stream)
+
+    if network_data is None:
+        msg = 'KONECT data contains no file out.*'
+        LOG.error(msg)
+        raise FileFormatError(msg)
+
+    return attributes, directed, network_data
+
+
+def _to_network(attributes: dict, directed: bool, network_data: pd.DataFrame,
+                ignore_temporal: bool) -> Union[Network, TemporalNetwork]:
+    """Adds the edges of a KONECT data set to a network in bulk."""
+    duplicates = int(network_data.duplicated(['v', 'w'], keep=False).sum())
+    multiedges = duplicates > 0
+    if multiedges:
+        LOG.info('Found {} duplicate edges'.format(duplicates))
+    LOG.info('Detected columns: {0}'.format(str([c for c in network_data.columns])))
+
+    if 'timeiso' in attributes:
+        try:
+            dt = pd.to_datetime(attributes['timeiso'])
+            attributes['time'] = attributes['timeiso']            
+        except ValueError:
+            LOG.warning('KONECT data contains invalid timeiso: {}'.format(
+                attributes['timeiso']))
+    if 'time' in network_data.columns and not ignore_temporal:
+        network_data.rename(columns= {'time': 'timestamp'}, inplace=True)
+        return to_temporal_network(network_data, 
+                directed=directed, multiedges=multiedges, **attributes)
+    else:
+        return to_network(network_data, 
+            directed=directed, multiedges=multiedges, **attributes)
+
+
+def _members(file: Union[str, bytes, BinaryIO]) -> Any:
+    """Yields the names and binary streams of the files of a KONECT data set."""
+    if isinstance(file, bytes):
+        file = io.BytesIO(file)
+
+    if isinstance(file, str) and os.path.isdir(file):
+        for name in sorted(os.listdir(file)):
+            path = os.path.join(file, name)
+            if os.path.isfile(path):
+                with open(path, 'rb') as stream:
+                    yield name, stream
+
+    elif isinstance(file, str) and not tarfile.is_tarfile(file):
+        # a single file is read as edge list
+        name = os.path.basename(file)
+        with open(file, 'rb') as stream:
+            yield name if name.startswith('out.') else 'out.' + name, stream
+
+    else:
+        # archives are read as a stream, such that they can be read directly
+        # from a download
+        if isinstance(file, str):
+            tar = tarfile.open(file, mode='r|*')
+        else:
+            tar = tarfile.open(fileobj=file, mode='r|*')
+        with tar:
+            for tarinfo in tar:
+                if tarinfo.isfile():
+                    stream = tar.extractfile(tarinfo)
+                    if stream is None:
+                        msg = 'Could not extract tar file {0}'.format(tarinfo.path)
+                        LOG.error(msg)
+                        raise FileFormatError(msg)
+                    yield tarinfo.path.split('/')[-1], stream
+
+
+def _read_out(stream: BinaryIO) -> Tuple[bool, pd.DataFrame]:
+    """Reads whether the network is directed and the edges from an out.* file."""
+    with _Prefetch(stream) as raw:
+        buffer = io.BufferedReader(raw, buffer_size=_BLOCK)
+
+        # check whether network is directed
+        directed = 'asym' in buffer.readline().decode('utf-8', 'replace')
+
+        # read pandas data frame
+        network_data = pd.read_csv(buffer, sep=r'\s+', header=None,
+                                   names=TSV_COLUMNS, comment='%')
+
+    # extract which columns are present
+    network_data = network_data[[c for c in network_data.columns if c in
+                                 ('v', 'w') or network_data[c].notna().any()]]
+    return directed, network_data
+
+
+def _save(file: str, attributes: dict, directed: bool,
+          network_data: pd.DataFrame) -> None:
+    """Stores the parsed columns of a KONECT data set in an uncompressed npz
+    file."""
+    meta = json.dumps({'attributes': attributes, 'directed': directed})
+    with atomic_write(file) as f:
+        np.savez(f, meta=np.array(meta), **{
+            column: network_data[column].to_numpy()
+            for column in network_data.columns})
+
+
+def _load(file: str) -> Tuple[dict, bool, pd.DataFrame]:
+    """Loads the parsed columns of a KONECT data set stored by `_save`."""
+    with np.load(file, allow_pickle=False) as data:
+        meta = json.loads(str(data['meta']))
+        network_data = pd.DataFrame({column: data[column] for column in
+                                     TSV_COLUMNS if column in data.files})
+    return meta['attributes'], meta['directed'], network_data
+
+
+def _download(url: str, path: str) -> None:
+    """Downloads a file, which is moved to the given path once it is complete."""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+
+    LOG.info('Downloading {0} to {1}'.format(url, path))
+    with atomic_write(path) as f, request.urlopen(url) as response:
+        shutil.copyfileobj(response, f, _BLOCK)
+
+
+class _Prefetch(io.RawIOBase):
+    """Binary stream which reads blocks of another stream ahead in a background
+    thread, such that decompression overlaps with parsing."""
+
+    def __init__(self, stream: BinaryIO, blocks: int = 4) -> None:
+        super().__init__()
+        self._queue: queue.Queue = queue.Queue(maxsize=blocks)
+        self._block = memoryview(b'')
+        self._eof = False
+        self._error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._fill, args=(stream,),
+                                        daemon=True)
+        self._thread.start()
+
+    def _fill(self, stream: BinaryIO) -> None:
+        """Reads blocks from the stream until it is exhausted or closed."""
+        try:
+            while not self._stop.is_set():
+                block = stream.read(_BLOCK)
+                if not block:
+                    break
+                self._put(block)
+        except Exception as error:  # pylint: disable=broad-except
+            self._error = error
+        self._put(b'')
+
+    def _put(self, block: bytes) -> None:
+        """Adds a block to the queue unless the stream is closed."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(block, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        while not self._block and not self._eof:
+            block = self._queue.get()
+            if not block:
+                self._eof = True
+                if self._error is not None:
+                    raise self._error
+            self._block = memoryview(block)
+        size = min(len(b), len(self._block))
+        b[:size] = self._block[:size]
+        self._block = self._block[size:]
+        return size
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        super().close()
+
+
 # =============================================================================
 # eof
 #
@@ -9,16 +9,16 @@
 # Copyright (c) 2016-2020 Pathpy Developers
 # =============================================================================
 from __future__ import annotations
-from typing import Any, Union, Optional
-from collections import Counter
+from typing import Any, Iterable, Iterator, Union, Optional
 
+import numpy as np
 import pandas as pd  # pylint: disable=import-error
 
 from pathpy import config, logger
 from pathpy.core.core import PathPyRelation
-from pathpy.core.api import Node
-from pathpy.core.api import Edge
+from pathpy.core.temporal import _get_start_end
 from pathpy.models.api import Network, TemporalNetwork
+from pathpy.models.temporal_network import _column
 
 # create logger
 LOG = logger(__name__)
@@ -38,7 +38,8 @@ def _check_column_name(frame: pd.DataFrame, name: str,
     return frame
 
 
-def to_network(df: pd.DataFrame, loops: bool = True, directed: bool = True,
+def to_network(df: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+               loops: bool = True, directed: bool = True,
                multiedges: bool = False, bipartite: bool=False, **kwargs: Any) -> Network:
     """Reads a network from a pandas data frame.
 
@@ -48,12 +49,19 @@ def to_network(df: pd.DataFrame, loops: bool = True, directed: bool = True,
     Each row in the data frame is mapped to one edge. Additional columns in the
     data frame will be mapped to edge attributes.
 
+    Instead of a single data frame, an iterable of data frames, e.g. the chunks
+    returned by `pandas.read_csv` with a `chunksize`, can be given. The chunks
+    are consumed one by one and only compact arrays of node indices and
+    attributes are kept in memory, where repeated edges are merged on the fly
+    unless `multiedges` is True.
+
     Parameters
     ----------
 
-    df: pandas.DataFrame
+    df: Union[pandas.DataFrame, Iterable[pandas.DataFrame]]
 
-        A data frame with rows containing edges and optional edge attributes.
+        A data frame (or an iterable of data frames) with rows containing
+        edges and optional edge attributes.
 
     loops: Optional[bool]=True
 
@@ -104,78 +112,15 @@ def to_network(df: pd.DataFrame, loops: bool = True, directed: bool = True,
 
     """
 
-    # if no v/w columns are included, pick first synonym
-    df = _check_column_name(df, 'v', config['edge']['v_synonyms'])
-    df = _check_column_name(df, 'w', config['edge']['w_synonyms'])
-
-    df['v'] = df['v'].astype(str)
-    df['w'] = df['w'].astype(str)
+    frames = [df] if isinstance(df, pd.DataFrame) else df
 
     LOG.debug('Creating %s network', directed)
 
-    # create a set of all node uids
-    v_set = set(df['v'])
-    w_set = set(df['w'])
-    node_set: set = set(v_set).union(w_set)
-
-    if None in node_set:
-        LOG.error('DataFrame minimally needs columns \'v\' and \'w\'')
-        raise IOError
-
-    # create dict with node.uid and node
-    nodes: dict = {n: Node(n) for n in node_set}
-    if bipartite:
-        for v in nodes:
-            if v in v_set:
-                nodes[v]['partition'] = 0
-                nodes[v]['color'] = 'darkblue'
-            elif v in w_set:
-                nodes[v]['partition'] = 1
-                nodes[v]['color'] = 'orange'
-
-    # initialize variables
-    edges: list = []
-    edge_set: set = set()
-
-    # counter for multiple edges
-    counter: Counter = Counter()
-
-    # TODO: Make this for loop faster!
-    for row in df.to_dict(orient='records'):
-        # get node and edge  uids
-        _v, _w = row.pop('v'), row.pop('w')
-        uid = row.pop('uid', None)
-
-        # check if edge was already generated
-        if (_v, _w) in edge_set and not multiedges:
-            counter[(_v, _w)] += 1
-
-        elif loops or _v != _w:
-            # generate edge object
-            edges.append(Edge(nodes[_v], nodes[_w],
-                              uid=uid, directed=directed, **row))
-            edge_set.add((_v, _w))
-            if not directed:
-                edge_set.add((_w, _v))
-        else:
-            continue
-
-    # check if multiple versions of the edges are given
-    if len(counter) > 0:
-        LOG.warning('%i edges existed already '
-                    'and were not be considered. '
-                    'To capture those edges, consider creating '
-                    'a multiedge and/or directed network.', sum(counter.values()))
-
-    # create network
-    net = Network(directed=directed, multiedges=multiedges, **kwargs)
-    net.add_edges(edges)
-
-    # update counter
-    for key, value in counter.items():
-        net.edges.counter[key] += value
-
-    return net
+    edges = _EdgeBuffer(directed=directed, multiedges=multiedges, loops=loops)
+    for frame in frames:
+        edges.append(frame)
+    return edges.to_network(bipartite=bipartite, **kwargs)
+
 
 def add_attributes(df: pd.DataFrame, network: Network):
     """Adds the columns of a data frame as attributes to nodes of an existing network, where the node
@@ -189,7 +134,8 @@ def add_attributes(df: pd.DataFrame, network: Network):
             network.nodes[row['v']][c] = row[c]
 
 
-def to_temporal_network(df: pd.DataFrame, loops: bool = True,
+def to_temporal_network(df: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                        loops: bool = True,
                         directed: bool = True, multiedges: bool = False,
                         **kwargs: Any) -> TemporalNetwork:
     """Reads a temporal network from a pandas data frame.
@@ -202,22 +148,27 @@ def to_temporal_network(df: pd.DataFrame, loops: bool = True,
     columns `start`, `end` or `timestamp`, `duration` respectively for networks
     where edges appear and exist for a certain time. Synonyms for those column
     names can be configured in config.cfg.  Each row in the data frame is
-    mapped to one temporal edge. Additional columns in the data frame will be
-    mapped to edge attributes.
+    mapped to one event of a temporal edge, where rows are grouped to edges by
+    node pairs in bulk. Additional columns in the data frame will be mapped to
+    edge attributes.
+
+    Instead of a single data frame, an iterable of data frames can be given,
+    which are consumed chunk by chunk and stored as compact arrays of node
+    indices, times and attributes until the temporal network is created.
 
     Parameters
     ----------
 
-    df: pandas.DataFrame
+    df: Union[pandas.DataFrame, Iterable[pandas.DataFrame]]
 
-        A data frame with rows containing time-stamped edges and optional edge
-        attributes.
+        A data frame (or an iterable of data frames) with rows containing
+        time-stamped edges and optional edge attributes.
 
     loops: Optional[bool]=True
 
-        Whether or not to ignore self-loops, i.e. rows in the data frame where
+        Whether or not to add self-loops, i.e. rows in the data frame where
         columns `v` and `w` (or configured synonyms) are identical. Default is
-        False.
+        True.
 
     directed: Optional[bool]=True
 
@@ -308,62 +259,228 @@ def to_temporal_network(df: pd.DataFrame, loops: bool = True,
 
     """
 
-    from pathpy.models.temporal_network import TemporalNetwork, TemporalEdge, TemporalNode
-
-    # if no v/w columns are included, pick first synonym
-    df = _check_column_name(df, 'v', config['edge']['v_synonyms'])
-    df = _check_column_name(df, 'w', config['edge']['w_synonyms'])
-
-    # get keyword for temporal objects
-    _start = config['temporal']['start']
-    _end = config['temporal']['end']
-    _timestamp = config['temporal']['timestamp']
-    _duration = config['temporal']['duration']
-
-    _key_words = {'start': _start, 'end': _end,
-                  'timestamp': _timestamp, 'duration': _duration}
-
-    # changes column names
-    for key, name in _key_words.items():
-        df = _check_column_name(
-            df, name, config['temporal'][key+'_synonyms'])
+    frames = [df] if isinstance(df, pd.DataFrame) else df
 
     LOG.debug('Creating %s network', directed)
 
-    node_set = set(df['v']).union(set(df['w']))
+    edges = _EdgeBuffer(directed=directed, multiedges=multiedges, loops=loops,
+                        temporal=True)
+    for frame in frames:
+        edges.append(frame)
+    return edges.to_temporal_network(**kwargs)
 
-    if None in node_set:
-        LOG.error('DataFrame minimally needs columns \'v\' and \'w\'')
-        raise IOError
 
-    # create dict with node.uid and node
-    nodes: dict = {str(n): TemporalNode(str(n)) for n in node_set}
+class _EdgeBuffer:
+    """Collects the edges given in a sequence of data frames.
 
-    # create empty network
-    net = TemporalNetwork(directed=directed, multiedges=multiedges, **kwargs)
+    The rows of each data frame are stored in compact arrays, where node uids
+    are interned and replaced by integer indices. For static networks without
+    multi-edges, repeated rows are merged into a single row with a count
+    whenever the number of buffered rows has doubled, such that the memory
+    needed is bounded by the number of unique edges rather than the number of
+    rows. The network is created in bulk once all rows have been added.
 
-    # TODO: Make this for loop faster!
-    for row in df.to_dict(orient='records'):
-        # get node and edge  uids
-        _v, _w = str(row.pop('v')), str(row.pop('w'))
-        uid = row.pop('uid', None)
-        net.add_edge(nodes[_v], nodes[_w], uid=uid,
-                     update_properties=False, **row)
-
-    net._add_edge_properties()
+    """
 
-    return net
+    def __init__(self, directed: bool = True, multiedges: bool = False,
+                 loops: bool = True, temporal: bool = False) -> None:
+        self.directed = directed
+        self.multiedges = multiedges
+        self.loops = loops
+        self.temporal = temporal
+
+        # node uids mapped to node indices
+        self.nodes: dict = {}
+
+        # chunks of columns and number of rows merged by _consolidate
+        self.chunks: list = []
+        self.duplicates = 0
+        self._rows = 0
+        self._pending = 0
+
+        self.key_words = {key: config['temporal'][key] for key in
+                          ['start', 'end', 'timestamp', 'duration']}
+
+    def append(self, frame: pd.DataFrame) -> None:
+        """Adds the rows of a data frame."""
+        # if no v/w columns are included, pick first synonym
+        frame = _check_column_name(frame, 'v', config['edge']['v_synonyms'])
+        frame = _check_column_name(frame, 'w', config['edge']['w_synonyms'])
+
+        if 'v' not in frame.columns or 'w' not in frame.columns or \
+                frame['v'].isnull().any() or frame['w'].isnull().any():
+            LOG.error('DataFrame minimally needs columns \'v\' and \'w\'')
+            raise IOError
+
+        chunk = {'v': self._intern(frame['v']), 'w': self._intern(frame['w'])}
+        exclude = ['v', 'w']
+
+        if self.temporal:
+            # changes column names
+            for key, name in self.key_words.items():
+                frame = _check_column_name(
+                    frame, name, config['temporal'][key+'_synonyms'])
+            start, end = _event_times(frame, self.key_words)
+            chunk['start'], chunk['end'] = _column(start), _column(end)
+            exclude += ['unit'] + list(self.key_words.values())
+
+        # remaining columns are mapped to edge uids and attributes
+        for column in frame.columns:
+            if column not in exclude:
+                chunk[column] = frame[column].to_numpy()
+        chunk['count'] = np.ones(len(frame), dtype=np.int64)
+
+        if not self.loops:
+            keep = chunk['v'] != chunk['w']
+            chunk = {key: values[keep] for key, values in chunk.items()}
+
+        self.chunks.append(chunk)
+        self._pending += len(chunk['v'])
+        if not self.temporal and not self.multiedges and \
+                self._pending > max(self._rows, 1 << 16):
+            self._consolidate()
+
+    def _intern(self, values: pd.Series) -> np.ndarray:
+        """Returns the node indices of the given node uids."""
+        # only unique values are converted to strings, which is fast for
+        # categorical columns
+        codes, uniques = pd.factorize(values)
+        index = self.nodes
+        mapping = np.fromiter(
+            (index.setdefault(uid, len(index))
+             for uid in np.asarray(uniques).astype(str).tolist()),
+            dtype=np.int64, count=len(uniques))
+        return mapping[codes]
+
+    def _columns(self) -> dict:
+        """Returns the concatenated columns of all chunks."""
+        names: dict = {}
+        for chunk in self.chunks:
+            names.update(dict.fromkeys(chunk))
+        columns = {}
+        for name in names:
+            parts = [chunk[name] if name in chunk else
+                     np.full(len(chunk['v']), None, dtype=object)
+                     for chunk in self.chunks]
+            columns[name] = np.concatenate(parts) if parts else \
+                np.empty(0, dtype=np.int64)
+        for name in ['v', 'w', 'count']:
+            columns.setdefault(name, np.empty(0, dtype=np.int64))
+        return columns
+
+    def _consolidate(self) -> None:
+        """Merges repeated edges, where the first row is kept."""
+        columns = self._columns()
+        a, b = columns['v'], columns['w']
+        if not self.directed:
+            a, b = np.minimum(a, b), np.maximum(a, b)
+        _, first, inverse = np.unique(a * len(self.nodes) + b,
+                                      return_index=True, return_inverse=True)
+        counts = np.bincount(inverse.ravel(), weights=columns['count'],
+                             minlength=len(first)).astype(np.int64)
+        order = np.argsort(first)
+        self.duplicates += len(a) - len(first)
+
+        columns = {key: values[first[order]]
+                   for key, values in columns.items()}
+        columns['count'] = counts[order]
+        self.chunks = [columns]
+        self._rows = len(first)
+        self._pending = 0
+
+    def to_network(self, bipartite: bool = False, **kwargs: Any) -> Network:
+        """Returns a network with all edges added so far."""
+        if not self.multiedges:
+            self._consolidate()
+            if self.duplicates > 0:
+                LOG.warning('%i edges existed already '
+                            'and were not be considered. '
+                            'To capture those edges, consider creating '
+                            'a multiedge and/or directed network.',
+                            self.duplicates)
+
+        columns = self._columns()
+        v, w = columns.pop('v'), columns.pop('w')
+        counts = columns.pop('count')
+        uids = columns.pop('uid', None)
+
+        node_attributes = {}
+        if bipartite:
+            source = np.zeros(len(self.nodes), dtype=bool)
+            source[v] = True
+            node_attributes['partition'] = np.where(source, 0, 1)
+            node_attributes['color'] = np.where(source, 'darkblue', 'orange')
+
+        return Network.from_arrays(
+            v, w, nodes=list(self.nodes), directed=self.directed,
+            multiedges=self.multiedges, uids=uids, edge_attributes=columns,
+            node_attributes=node_attributes, counts=counts, **kwargs)
+
+    def to_temporal_network(self, **kwargs: Any) -> TemporalNetwork:
+        """Returns a temporal network with all events added so far."""
+        columns = self._columns()
+        v, w = columns.pop('v'), columns.pop('w')
+        start = columns.pop('start', np.empty(0))
+        end = columns.pop('end', np.empty(0))
+        uids = columns.pop('uid', None)
+        del columns['count']
+
+        return TemporalNetwork.from_arrays(
+            v, w, start, end, nodes=list(self.nodes), directed=self.directed,
+            multiedges=self.multiedges, uids=uids, edge_attributes=columns,
+            **kwargs)
+
+
+def _event_times(df: pd.DataFrame, key_words: dict) -> tuple:
+    """Returns arrays with the start and end times of the rows of a data
+    frame, which are computed from the columns for start, end, timestamp and
+    duration."""
+    columns = {key: df[name] for key, name in key_words.items()
+               if name in df.columns}
+
+    # rows with non-numeric time information, e.g. dates given as strings, are
+    # parsed individually
+    if 'unit' in df.columns or not all(
+            pd.api.types.is_numeric_dtype(c) for c in columns.values()):
+        names = [name for name in list(key_words.values()) + ['unit']
+                 if name in df.columns]
+        times = [_get_start_end(**row)[:2]
+                 for row in df[names].to_dict(orient='records')]
+        if not times:
+            return np.empty(0), np.empty(0)
+        start, end = zip(*times)
+        return list(start), list(end)
+
+    n = len(df)
+    if 'timestamp' in columns:
+        start = columns['timestamp'].to_numpy()
+        duration = columns['duration'].to_numpy() if 'duration' in columns \
+            else config['temporal']['duration_value']
+        return start, start + duration
+
+    start = columns['start'].to_numpy() if 'start' in columns \
+        else np.full(n, float('-inf'))
+    end = columns['end'].to_numpy() if 'end' in columns \
+        else np.full(n, float('inf'))
+    if 'duration' in columns and 'start' in columns:
+        end = start + columns['duration'].to_numpy()
+    elif 'duration' in columns and 'end' in columns:
+        start = end - columns['duration'].to_numpy()
+    return start, end
 
 
 def from_network(network: Network, include_edge_uid: Optional[bool] = False,
-                 export_indices: Optional[bool] = False) -> pd.DataFrame:
+                 export_indices: Optional[bool] = False,
+                 chunksize: Optional[int] = None
+                 ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """Returns a pandas dataframe of the network.
 
     Returns a pandas dataframe data that contains all edges including all edge
     attributes. Node and network-level attributes are not included. To
     facilitate the import into network analysis tools that only support integer
     node identifiers, node uids can be replaced by a consecutive, zero-based
-    index.
+    index. The columns are created from arrays of node uids (or indices) and
+    aligned attribute columns, where missing attributes are None or NaN.
 
     Parameters
     ----------
@@ -382,10 +499,15 @@ def from_network(network: Network, include_edge_uid: Optional[bool] = False,
         Whether or not to use node indices rather than node uids. This is useful to
         import network data in tools that only support integer node identifiers.
 
+    chunksize: Optional[int]=None
+
+        If given, an iterator over data frames with at most `chunksize` edges
+        is returned, which all have the same columns.
+
     Returns
     -------
 
-    pandas.DataFrame
+    Union[pandas.DataFrame, Iterator[pandas.DataFrame]]
 
         pandas DataFrame containing the edges of the network
 
@@ -400,10 +522,10 @@ def from_network(network: Network, include_edge_uid: Optional[bool] = False,
     >>> n.add_edge('c', 'a', color='blue')
     >>> df = pp.io.to_dataframe(n)
     >>> print(df)
-        v  w  color
-    0   c  a   blue
-    1   b  c  green
-    2   a  b    red
+       v  w  color
+    0  a  b    red
+    1  b  c  green
+    2  c  a   blue
 
     Export static network with edge attributes, edge uids and node indices
 
@@ -414,43 +536,29 @@ def from_network(network: Network, include_edge_uid: Optional[bool] = False,
     >>> df = pp.io.to_dataframe(n, export_indices=True, include_edge_uid=True)
     >>> print(df)
        v  w            uid  color
-    0  2  0  0x2cf75244630   blue
+    0  0  1  0x2cf752449e8    red
     1  1  2  0x2cf75244a20  green
-    2  0  1  0x2cf752449e8    red
+    2  2  0  0x2cf75244630   blue
 
     """
-    df = pd.DataFrame()
-
-    for edge in network.edges:
-        v = edge.v.uid
-        w = edge.w.uid
-        if export_indices:
-            v = network.nodes.index[v]
-            w = network.nodes.index[w]
-        if include_edge_uid:
-            edge_frame = pd.DataFrame.from_dict(
-                {'v': [v], 'w': [w], 'uid': [edge.uid]})
-        else:
-            edge_frame = pd.DataFrame.from_dict({'v': [v], 'w': [w]})
-        data = pd.DataFrame.from_dict(
-            {k: [v] for k, v in edge.attributes.items()})
-        edge_frame = pd.concat([edge_frame, data], axis=1)
-        df = pd.concat([edge_frame, df], ignore_index=True, sort=False)
-    # TODO: This is a dirty fix, not ideal!
-    if 'nodes' in df.columns:
-        df = df.drop(columns=['nodes'])
-    return df
+    frames = _frames(network, include_edge_uid=include_edge_uid,
+                     export_indices=export_indices, chunksize=chunksize)
+    return frames if chunksize is not None else next(frames)
 
 
 def from_temporal_network(network: TemporalNetwork,
                           include_edge_uid: bool = False,
-                          export_indices: bool = False) -> pd.DataFrame:
+                          export_indices: bool = False,
+                          chunksize: Optional[int] = None
+                          ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """Returns a pandas dataframe of the temporal network.
 
     Returns a pandas dataframe data that contains all edges including all edge
     attributes. Node and network-level attributes are not included. To facilitate the
     import into network analysis tools that only support integer node identifiers,
-    node uids can be replaced by a consecutive, zero-based index.
+    node uids can be replaced by a consecutive, zero-based index. Each event of
+    a temporal edge is mapped to one row with columns `start` and `end`, where
+    rows are ordered by time.
 
     Parameters
     ----------
@@ -468,10 +576,15 @@ def from_temporal_network(network: TemporalNetwork,
         Whether or not to use node indices rather than node uids. This is useful to
         import network data in tools that only support integer node identifiers.
 
+    chunksize: Optional[int]=None
+
+        If given, an iterator over data frames with at most `chunksize` events
+        is returned, which all have the same columns.
+
     Returns
     -------
 
-    pandas.DataFrame
+    Union[pandas.DataFrame, Iterator[pandas.DataFrame]]
 
         pandas DataFrame containing the edges of the network
 
@@ -486,10 +599,10 @@ def from_temporal_network(network: TemporalNetwork,
     >>> n.add_edge('c', 'a', color='blue')
     >>> df = pp.io.to_dataframe(n)
     >>> print(df)
-        v  w  color
-    0   c  a   blue
-    1   b  c  green
-    2   a  b    red
+       v  w  color
+    0  a  b    red
+    1  b  c  green
+    2  c  a   blue
 
     Export static network with edge attributes, edge uids and node indices
 
@@ -500,33 +613,20 @@ def from_temporal_network(network: TemporalNetwork,
     >>> df = pp.io.to_dataframe(n, export_indices=True, include_edge_uid=True)
     >>> print(df)
        v  w            uid  color
-    0  2  0  0x2cf75244630   blue
+    0  0  1  0x2cf752449e8    red
     1  1  2  0x2cf75244a20  green
-    2  0  1  0x2cf752449e8    red
+    2  2  0  0x2cf75244630   blue
     """
-    frame = pd.DataFrame()
-
-    for edge in network.edges[:]:
-        v = edge.v.uid
-        w = edge.w.uid
-        if export_indices:
-            v = network.nodes.index[v]
-            w = network.nodes.index[w]
-        if include_edge_uid:
-            edge_frame = pd.DataFrame.from_dict(
-                {'v': [v], 'w': [w], 'uid': [edge.uid]})
-        else:
-            edge_frame = pd.DataFrame.from_dict({'v': [v], 'w': [w]})
-        data = pd.DataFrame.from_dict(
-            {k: [v] for k, v in edge.attributes.items()})
-        edge_frame = pd.concat([edge_frame, data], axis=1)
-        frame = pd.concat([edge_frame, frame], ignore_index=True)
-    return frame
+    frames = _frames(network, include_edge_uid=include_edge_uid,
+                     export_indices=export_indices, chunksize=chunksize)
+    return frames if chunksize is not None else next(frames)
 
 
 def to_dataframe(network: Union[Network, TemporalNetwork],
                  include_edge_uid: bool = False,
-                 export_indices: bool = False) -> pd.DataFrame:
+                 export_indices: bool = False,
+                 chunksize: Optional[int] = None
+                 ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """Returns a pandas dataframe of a static or temporal network.
 
     Returns a pandas dataframe data that contains all edges including all edge
@@ -550,10 +650,16 @@ def to_dataframe(network: Union[Network, TemporalNetwork],
         Whether or not to use node indices rather than node uids. This is useful to
         import network data in tools that only support integer node identifiers.
 
+    chunksize: Optional[int]=None
+
+        If given, an iterator over data frames with at most `chunksize` rows
+        is returned, e.g. to write large networks in chunks without creating
+        the full data frame.
+
     Returns
     -------
 
-    pandas.DataFrame
+    Union[pandas.DataFrame, Iterator[pandas.DataFrame]]
 
         pandas DataFrame containing the edges of the network
 
@@ -568,10 +674,10 @@ def to_dataframe(network: Union[Network, TemporalNetwork],
     >>> n.add_edge('c', 'a', color='blue')
     >>> df = pp.io.to_dataframe(n)
     >>> print(df)
-        v  w  color
-    0   c  a   blue
-    1   b  c  green
-    2   a  b    red
+       v  w  color
+    0  a  b    red
+    1  b  c  green
+    2  c  a   blue
 
     Export static network with edge attributes, edge uids and node indices
 
@@ -582,24 +688,99 @@ def to_dataframe(network: Union[Network, TemporalNetwork],
     >>> df = pp.io.to_dataframe(n, export_indices=True, include_edge_uid=True)
     >>> print(df)
        v  w            uid  color
-    0  2  0  0x2cf75244630   blue
+    0  0  1  0x2cf752449e8    red
     1  1  2  0x2cf75244a20  green
-    2  0  1  0x2cf752449e8    red
+    2  2  0  0x2cf75244630   blue
     """
 
     if isinstance(network, TemporalNetwork):
         frame = from_temporal_network(network,
                                       include_edge_uid=include_edge_uid,
-                                      export_indices=export_indices)
+                                      export_indices=export_indices,
+                                      chunksize=chunksize)
     elif isinstance(network, Network):
         frame = from_network(network, include_edge_uid=include_edge_uid,
-                             export_indices=export_indices)
+                             export_indices=export_indices,
+                             chunksize=chunksize)
     else:
         raise NotImplementedError(
             'Export to data frame is only implemented for Network and TemporalNetwork')
 
     return frame
 
+
+def _frames(network: Union[Network, TemporalNetwork],
+            include_edge_uid: bool = False, export_indices: bool = False,
+            chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """Yields the edges (or the events of temporal edges) of a network as data
+    frames with at most `chunksize` rows and the same columns."""
+    temporal = isinstance(network, TemporalNetwork)
+    edges = list(network.edges)
+
+    # events of temporal edges ordered by time, where the i-th event belongs
+    # to the edge with index item[i]
+    if temporal:
+        events = [edge._sorted_events() for edge in edges]
+        item = np.repeat(np.arange(len(edges)), [len(e) for e in events])
+        start = np.array([s for e in events for s, _, _ in e])
+        end = np.array([t for e in events for _, t, _ in e])
+        attributes = [a for e in events for _, _, a in e]
+        order = np.lexsort((end, start)) if len(start) else item
+        item, start, end = item[order], start[order], end[order]
+        attributes = [attributes[i] for i in order.tolist()]
+    else:
+        item = np.arange(len(edges))
+        attributes = [edge.attributes for edge in edges]
+
+    # attribute names in the order of their first occurrence
+    names = list(dict.fromkeys(key for a in attributes for key in a))
+    # TODO: This is a dirty fix, not ideal!
+    if 'nodes' in names:
+        names.remove('nodes')
+
+    # numeric attributes get the same dtype in all chunks
+    dtypes = {name: _numeric_dtype([a.get(name, None) for a in attributes])
+              for name in names}
+
+    # uids or indices of the nodes of all edges
+    index = network.nodes.index
+    if export_indices:
+        v = np.array([index[e.v.uid] for e in edges], dtype=np.int64)
+        w = np.array([index[e.w.uid] for e in edges], dtype=np.int64)
+    else:
+        v = np.array([e.v.uid for e in edges], dtype=object)
+        w = np.array([e.w.uid for e in edges], dtype=object)
+    uids = np.array([e.uid for e in edges], dtype=object)
+
+    size = chunksize if chunksize is not None else max(len(item), 1)
+    for first in range(0, max(len(item), 1), size):
+        rows = item[first:first+size]
+        columns = {'v': v[rows], 'w': w[rows]}
+        if include_edge_uid:
+            columns['uid'] = uids[rows]
+        if temporal:
+            columns['start'] = start[first:first+size]
+            columns['end'] = end[first:first+size]
+        chunk = attributes[first:first+size]
+        for name in names:
+            values = [a.get(name, None) for a in chunk]
+            columns[name] = pd.Series(values).to_numpy() \
+                if dtypes[name] is None else \
+                np.array(values, dtype=dtypes[name])
+        yield pd.DataFrame(
+            columns, index=pd.RangeIndex(first, first+len(rows)))
+
+
+def _numeric_dtype(values: list) -> Optional[type]:
+    """Returns the dtype of a column of numeric attributes, i.e. int64 or
+    float64 if values are missing, and None for other attributes."""
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind == 'integer' and None not in values:
+        return np.int64
+    if kind in ['integer', 'floating', 'mixed-integer-float']:
+        return np.float64
+    return None
+
 # =============================================================================
 # eof
 #
@@ -0,0 +1,393 @@
+"""Functions to read and write networks and paths in parquet files"""
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : parquet.py -- Read and write columnar parquet files
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 09:01 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+from __future__ import annotations
+
+import json
+from collections import Counter
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from pathpy import config, logger
+from pathpy.utils.errors import FileFormatError, MissingModuleError
+from pathpy.core.path import PathCollection, PathStore
+from pathpy.models.network import Network
+from pathpy.models.temporal_network import TemporalNetwork
+from pathpy.io.pandas import to_dataframe, to_network, to_temporal_network
+
+# create logger
+LOG = logger(__name__)
+
+# key of the pathpy meta data in the schema of parquet files
+META = b'pathpy'
+
+# default number of rows per row group
+ROW_GROUP_SIZE = 1 << 20
+
+
+def _pyarrow() -> tuple:
+    """Returns the pyarrow modules needed to read and write parquet files."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError:
+        msg = 'Package pyarrow is required to read and write parquet files. Please install module, e.g., using "pip install pyarrow".'
+        LOG.error(msg)
+        raise MissingModuleError(msg)
+    return pa, pc, pq
+
+
+def _metadata(schema: Any) -> dict:
+    """Returns the pathpy meta data stored in the schema of a parquet file."""
+    metadata = schema.metadata or {}
+    return json.loads(metadata[META]) if META in metadata else {}
+
+
+def write_network(network: Union[Network, TemporalNetwork], file: str,
+                  include_edge_uid: bool = True,
+                  row_group_size: int = ROW_GROUP_SIZE) -> None:
+    """Writes the edges of a static or temporal network to a parquet file.
+
+    Each edge (or each event of a temporal edge) is stored as one row with
+    columns `v`, `w`, `uid` and edge attributes, where temporal networks
+    additionally have columns `start` and `end`. Since events are written in
+    the order of time, the statistics of row groups allow to skip row groups
+    when reading time slices with `read_temporal_network`.
+
+    Parameters
+    ----------
+    network : Union[Network, TemporalNetwork]
+
+        network to be stored
+
+    file : str
+
+        path of the parquet file
+
+    include_edge_uid : bool = True
+
+        Whether or not to store the uids of edges.
+
+    row_group_size : int
+
+        maximal number of rows per row group
+
+    """
+    pa, _, pq = _pyarrow()
+
+    frame = to_dataframe(network, include_edge_uid=include_edge_uid)
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+
+    meta = {'type': type(network).__name__, 'uid': network.uid,
+            'directed': network.directed,
+            'multiedges': network.multiedges}
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), META: json.dumps(meta)})
+
+    pq.write_table(table, file, row_group_size=row_group_size)
+
+
+def read_network(file: str, loops: bool = True,
+                 directed: Optional[bool] = None,
+                 multiedges: Optional[bool] = None,
+                 filters: Optional[Any] = None, use_threads: bool = True,
+                 **kwargs: Any) -> Network:
+    """Reads a static network from a parquet file.
+
+    The file is expected to have columns `v` and `w` (or configured synonyms),
+    and additional columns are mapped to edge attributes as in
+    `pathpy.io.to_network`.
+
+    Parameters
+    ----------
+    file : str
+
+        path of the parquet file
+
+    loops : bool = True
+
+        Whether or not to add self-loops.
+
+    directed : Optional[bool] = None
+
+        Whether or not the network is directed. If None, the value stored by
+        `write_network` is used, and networks are directed otherwise.
+
+    multiedges : Optional[bool] = None
+
+        Whether or not multiple edges are added. If None, the value stored by
+        `write_network` is used, and multi-edges are ignored otherwise.
+
+    filters : Optional[Any] = None
+
+        filters passed to `pyarrow.parquet.read_table`, which are pushed down
+        to skip row groups
+
+    use_threads : bool = True
+
+        Whether or not row groups and columns are decoded in parallel.
+
+    kwargs : Any
+
+        Attributes assigned to the network.
+
+    """
+    _, _, pq = _pyarrow()
+
+    table = pq.read_table(file, filters=filters, use_threads=use_threads)
+    meta = _metadata(table.schema)
+    if meta.get('uid') is not None:
+        kwargs.setdefault('uid', meta['uid'])
+
+    return to_network(
+        table.to_pandas(), loops=loops,
+        directed=meta.get('directed', True) if directed is None else directed,
+        multiedges=meta.get('multiedges', False) if multiedges is None
+        else multiedges, **kwargs)
+
+
+def read_temporal_network(file: str, start: Optional[float] = None,
+                          end: Optional[float] = None, loops: bool = True,
+                          directed: Optional[bool] = None,
+                          multiedges: Optional[bool] = None,
+                          filters: Optional[Any] = None,
+                          use_threads: bool = True,
+                          **kwargs: Any) -> TemporalNetwork:
+    """Reads a temporal network or a time slice of it from a parquet file.
+
+    The time information of events is given by columns `start` and `end`, or
+    `timestamp` and optionally `duration` (or configured synonyms) as in
+    `pathpy.io.to_temporal_network`. If `start` or `end` are given, only
+    events which overlap with the interval [start, end) are read. The
+    condition is pushed down to the parquet reader, such that row groups
+    whose statistics do not match are skipped without being decoded.
+
+    Parameters
+    ----------
+    file : str
+
+        path of the parquet file
+
+    start : Optional[float] = None
+
+        start of the time slice to be read
+
+    end : Optional[float] = None
+
+        end of the time slice to be read
+
+    loops : bool = True
+
+        Whether or not to add self-loops.
+
+    directed : Optional[bool] = None
+
+        Whether or not the network is directed. If None, the value stored by
+        `write_network` is used, and networks are directed otherwise.
+
+    multiedges : Optional[bool] = None
+
+        Whether or not multiple edges are added. If None, the value stored by
+        `write_network` is used, and multi-edges are ignored otherwise.
+
+    filters : Optional[Any] = None
+
+        additional filters passed to `pyarrow.parquet.read_table`
+
+    use_threads : bool = True
+
+        Whether or not row groups and columns are decoded in parallel.
+
+    kwargs : Any
+
+        Attributes assigned to the network.
+
+    Examples
+    --------
+    >>> import pathpy as pp
+    >>> tn = pp.io.parquet.read_temporal_network('contacts.parquet',
+    ...                                          start=3600, end=7200)
+
+    """
+    _, pc, pq = _pyarrow()
+
+    schema = pq.read_schema(file)
+    meta = _metadata(schema)
+    if meta.get('uid') is not None:
+        kwargs.setdefault('uid', meta['uid'])
+
+    expression = _time_filter(schema.names, start, end, pc)
+    if filters is not None:
+        filters = pq.filters_to_expression(filters) \
+            if isinstance(filters, list) else filters
+        expression = filters if expression is None else expression & filters
+
+    table = pq.read_table(file, filters=expression, use_threads=use_threads)
+
+    return to_temporal_network(
+        table.to_pandas(), loops=loops,
+        directed=meta.get('directed', True) if directed is None else directed,
+        multiedges=meta.get('multiedges', False) if multiedges is None
+        else multiedges, **kwargs)
+
+
+def _time_filter(names: list, start: Optional[float], end: Optional[float],
+                 pc: Any) -> Any:
+    """Returns an expression selecting the events which overlap with the
+    interval [start, end)."""
+    if start is None and end is None:
+        return None
+
+    # column names of the time information in the file
+    columns = {}
+    for key in ['start', 'end', 'timestamp', 'duration']:
+        for name in [config['temporal'][key]] + \
+                list(config['temporal'][key+'_synonyms']):
+            if name in names:
+                columns[key] = pc.field(name)
+                break
+
+    if 'start' in columns or 'end' in columns:
+        begin = columns.get('start', None)
+        stop = columns.get('end', None)
+        if 'timestamp' in columns and begin is None:
+            begin = columns['timestamp']
+        if 'duration' in columns and stop is None and begin is not None:
+            stop = begin + columns['duration']
+    elif 'timestamp' in columns:
+        begin = columns['timestamp']
+        stop = begin + columns['duration'] if 'duration' in columns \
+            else begin + config['temporal']['duration_value']
+    else:
+        msg = 'File contains no time information to select a time slice'
+        LOG.error(msg)
+        raise FileFormatError(msg)
+
+    # events overlap if they begin before the end and end after the start,
+    # where conditions on single columns can be evaluated on row group
+    # statistics
+    expression = None
+    if end is not None and begin is not None:
+        expression = begin < end
+    if start is not None and stop is not None:
+        condition = stop > start
+        expression = condition if expression is None \
+            else expression & condition
+    return expression
+
+
+def write_pathcollection(paths: Union[PathCollection, PathStore],
+                         file: str,
+                         row_group_size: int = ROW_GROUP_SIZE) -> None:
+    """Writes paths and their frequencies to a parquet file.
+
+    Each path is stored as one row with a list column `path` of node uids
+    and a column `count`.
+
+    Parameters
+    ----------
+    paths : Union[PathCollection, PathStore]
+
+        paths to be stored
+
+    file : str
+
+        path of the parquet file
+
+    row_group_size : int
+
+        maximal number of rows per row group
+
+    """
+    pa, _, pq = _pyarrow()
+
+    store = paths if isinstance(paths, PathStore) \
+        else PathStore.from_paths(paths)
+    indptr, indices, counts = store.arrays()
+
+    # node uids are stored as dictionary encoded list values
+    values = pa.DictionaryArray.from_arrays(
+        pa.array(indices, type=pa.int64()),
+        pa.array(store.nodes, type=pa.string()))
+    table = pa.table({
+        'path': pa.ListArray.from_arrays(pa.array(indptr, type=pa.int64()),
+                                         values),
+        'count': pa.array(counts)})
+    table = table.replace_schema_metadata({META: json.dumps(
+        {'type': 'PathCollection', 'directed': store.directed})})
+
+    pq.write_table(table, file, row_group_size=row_group_size)
+
+
+def read_pathstore(file: str, use_threads: bool = True) -> PathStore:
+    """Reads paths and their frequencies from a parquet file into a compact
+    PathStore.
+
+    Parameters
+    ----------
+    file : str
+
+        path of the parquet file with a list column `path` of node uids and
+        an optional column `count`
+
+    use_threads : bool = True
+
+        Whether or not row groups and columns are decoded in parallel.
+
+    """
+    pa, pc, pq = _pyarrow()
+
+    table = pq.read_table(file, use_threads=use_threads)
+    if 'path' not in table.schema.names:
+        msg = 'Parquet file of paths requires a column "path"'
+        LOG.error(msg)
+        raise FileFormatError(msg)
+
+    paths = table['path'].combine_chunks()
+    indptr = paths.offsets.to_numpy()
+    values = paths.values
+    if not pa.types.is_dictionary(values.type):
+        values = pc.dictionary_encode(values)
+    codes = values.indices.to_numpy(zero_copy_only=False)
+    codes = codes[indptr[0]:indptr[-1]]
+    indptr = indptr - indptr[0]
+
+    counts = table['count'].to_numpy() if 'count' in table.schema.names \
+        else np.ones(len(table), dtype=np.int64)
+
+    store = PathStore(directed=_metadata(table.schema).get('directed', True))
+    mapping = np.array(store.encode(
+        [str(uid) for uid in values.dictionary.to_pylist()]), dtype=np.int64)
+    codes = mapping[codes]
+
+    counter: Counter = store.counter
+    for i, count in enumerate(counts.tolist()):
+        counter[tuple(codes[indptr[i]:indptr[i+1]].tolist())] += count
+    return store
+
+
+def read_pathcollection(file: str, use_threads: bool = True) -> PathCollection:
+    """Reads paths and their frequencies from a parquet file.
+
+    Parameters
+    ----------
+    file : str
+
+        path of the parquet file with a list column `path` of node uids and
+        an optional column `count`
+
+    use_threads : bool = True
+
+        Whether or not row groups and columns are decoded in parallel.
+
+    """
+    return read_pathstore(file, use_threads=use_threads).to_paths()
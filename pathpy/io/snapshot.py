@@ -0,0 +1,536 @@
+"""Functions to save and load pathpy objects in a binary array format"""
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : snapshot.py -- Binary snapshots of networks and path collections
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 08:07 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from pathpy import logger
+from pathpy.utils.errors import FileFormatError
+from pathpy.core.core import PathPyEmpty, PathPyRelation
+from pathpy.core.node import Node
+from pathpy.core.path import Path, PathCollection
+from pathpy.models.network import Network
+from pathpy.models.temporal_network import TemporalNetwork
+from pathpy.models.higher_order_network import (HigherOrderNetwork,
+                                                HigherOrderNode,
+                                                HigherOrderEdge)
+
+# create logger
+LOG = logger(__name__)
+
+# version of the snapshot layout
+VERSION = 1
+
+# name of the file with the meta data in a snapshot directory
+META = 'meta.json'
+
+
+def save(obj: Union[Network, PathCollection], path: str) -> None:
+    """Saves a network or path collection as a binary snapshot.
+
+    A snapshot stores the uids, counters and attributes of all objects as
+    typed numpy arrays, i.e. one array per column, together with the edge
+    list and a compressed sparse row (CSR) representation of the adjacency
+    of networks. For temporal networks, the start and end times as well as
+    the attributes of all events are stored as arrays. Snapshots can be
+    loaded without parsing text files and - if stored in a directory - all
+    numeric arrays can be memory-mapped.
+
+    If `path` ends with `.npz`, all arrays are stored in a single (zipped)
+    numpy archive. Otherwise `path` is a directory in which each array is
+    stored as a separate `.npy` file, while the meta data is stored in the
+    file `meta.json`.
+
+    Attribute values that are neither booleans, numbers nor strings are
+    pickled.
+
+    Parameters
+    ----------
+
+    obj: Union[Network, PathCollection]
+
+        Network, TemporalNetwork, HigherOrderNetwork or PathCollection to be
+        saved
+
+    path: str
+
+        path of the snapshot directory or of the `.npz` file
+
+    Examples
+    --------
+    >>> import pathpy as pp
+    >>> n = pp.Network(directed=False)
+    >>> n.add_edge('a', 'b', weight=2.0)
+    >>> pp.io.save(n, 'network')
+    >>> m = pp.io.load('network')
+    >>> m.edges['a', 'b']['weight']
+    2.0
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    meta: Dict[str, Any] = {'version': VERSION, 'uid': getattr(obj, 'uid', None),
+                            'directed': obj.directed, 'pickled': []}
+
+    if isinstance(obj, HigherOrderNetwork):
+        meta['type'] = 'HigherOrderNetwork'
+        meta['order'] = obj.order
+        _save_higher_order_network(obj, arrays)
+    elif isinstance(obj, TemporalNetwork):
+        meta['type'] = 'TemporalNetwork'
+        meta['multiedges'] = obj.multiedges
+        _save_network(obj, arrays, temporal=True)
+    elif isinstance(obj, Network):
+        meta['type'] = 'Network'
+        meta['multiedges'] = obj.multiedges
+        _save_network(obj, arrays)
+    elif isinstance(obj, PathCollection):
+        meta['type'] = 'PathCollection'
+        meta['multipaths'] = obj.multipaths
+        _save_path_collection(obj, arrays)
+    else:
+        msg = 'Cannot save object of type {0}'.format(type(obj).__name__)
+        LOG.error(msg)
+        raise FileFormatError(msg)
+
+    if isinstance(obj, Network):
+        _save_columns(arrays, 'network', [obj], skip=('uid',))
+
+    meta['pickled'] = sorted(name for name, array in arrays.items()
+                             if array.dtype == object)
+
+    if path.endswith('.npz'):
+        np.savez(path, meta=np.array(json.dumps(meta)), **arrays)
+    else:
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, META), 'w') as file:
+            json.dump(meta, file)
+        for name, array in arrays.items():
+            np.save(os.path.join(path, name + '.npy'), array)
+
+
+def load_arrays(path: str, mmap: bool = True) -> Tuple[dict, Dict[str, np.ndarray]]:
+    """Loads the meta data and arrays of a snapshot.
+
+    This gives direct access to the stored arrays without creating pathpy
+    objects, e.g. to use the CSR adjacency (arrays `adjacency.indptr`,
+    `adjacency.indices` and `adjacency.edges`) of a large network.
+
+    Parameters
+    ----------
+
+    path: str
+
+        path of the snapshot directory or of the `.npz` file
+
+    mmap: bool = True
+
+        If True, arrays of a snapshot directory are memory-mapped rather than
+        read into memory. Pickled arrays and arrays stored in `.npz` files are
+        always read into memory.
+
+    Returns
+    -------
+
+    Tuple[dict, Dict[str, np.ndarray]]
+
+        the meta data of the snapshot and a dictionary of arrays
+    """
+    if os.path.isdir(path):
+        meta_file = os.path.join(path, META)
+        if not os.path.exists(meta_file):
+            msg = 'No pathpy snapshot found in {0}'.format(path)
+            LOG.error(msg)
+            raise FileFormatError(msg)
+        with open(meta_file) as file:
+            meta = json.load(file)
+        pickled = set(meta['pickled'])
+        arrays = {}
+        for name in sorted(os.listdir(path)):
+            if not name.endswith('.npy'):
+                continue
+            key = name[:-4]
+            arrays[key] = np.load(
+                os.path.join(path, name), allow_pickle=key in pickled,
+                mmap_mode='r' if mmap and key not in pickled else None)
+    else:
+        with np.load(path, allow_pickle=True) as data:
+            if 'meta' not in data:
+                msg = 'No pathpy snapshot found in {0}'.format(path)
+                LOG.error(msg)
+                raise FileFormatError(msg)
+            meta = json.loads(str(data['meta']))
+            arrays = {key: data[key] for key in data if key != 'meta'}
+
+    if meta.get('version', 0) > VERSION:
+        msg = 'Snapshot version {0} is not supported'.format(meta['version'])
+        LOG.error(msg)
+        raise FileFormatError(msg)
+    return meta, arrays
+
+
+def load(path: str, mmap: bool = True) -> Union[Network, PathCollection]:
+    """Loads a network or path collection from a binary snapshot.
+
+    Different from reading text files, nodes and edges of static networks
+    are created in bulk from the stored arrays, and no attributes need to be
+    parsed.
+
+    Parameters
+    ----------
+
+    path: str
+
+        path of the snapshot directory or of the `.npz` file
+
+    mmap: bool = True
+
+        Whether or not to memory-map the arrays of a snapshot directory.
+
+    Returns
+    -------
+
+    Union[Network, PathCollection]
+
+        the Network, TemporalNetwork, HigherOrderNetwork or PathCollection
+        stored in the snapshot
+    """
+    meta, arrays = load_arrays(path, mmap=mmap)
+    attributes = _load_columns(arrays, 'network')
+    attributes = {k: v[0] for k, v in attributes.items() if v[0] is not None}
+
+    if meta['type'] == 'Network':
+        return _load_network(meta, arrays, attributes)
+    if meta['type'] == 'TemporalNetwork':
+        return _load_temporal_network(meta, arrays, attributes)
+    if meta['type'] == 'HigherOrderNetwork':
+        return _load_higher_order_network(meta, arrays, attributes)
+    if meta['type'] == 'PathCollection':
+        return _load_path_collection(meta, arrays)
+
+    msg = 'Unknown snapshot type {0}'.format(meta['type'])
+    LOG.error(msg)
+    raise FileFormatError(msg)
+
+
+def _save_network(network: Network, arrays: Dict[str, np.ndarray],
+                  temporal: bool = False) -> None:
+    """Stores nodes, edges, adjacency and events of a network."""
+    nodes = list(network.nodes)
+    edges = list(network.edges)
+    index = {v.uid: i for i, v in enumerate(nodes)}
+
+    _save_objects(arrays, 'nodes', nodes, network.nodes.counter)
+    _save_objects(arrays, 'edges', edges, network.edges.counter,
+                  attributes=not temporal)
+
+    v = np.array([index[e.v.uid] for e in edges], dtype=np.int64)
+    w = np.array([index[e.w.uid] for e in edges], dtype=np.int64)
+    arrays['edges.v'], arrays['edges.w'] = v, w
+
+    # compressed sparse row representation of the adjacency, where the
+    # successors of node i are indices[indptr[i]:indptr[i+1]]
+    source, target, edge = v, w, np.arange(len(edges), dtype=np.int64)
+    if not network.directed:
+        source, target = np.concatenate((v, w)), np.concatenate((w, v))
+        edge = np.concatenate((edge, edge))
+    order = np.argsort(source, kind='stable')
+    arrays['adjacency.indptr'] = np.concatenate(
+        ([0], np.cumsum(np.bincount(source, minlength=len(nodes))))).astype(np.int64)
+    arrays['adjacency.indices'] = target[order]
+    arrays['adjacency.edges'] = edge[order]
+
+    if not temporal:
+        return
+
+    # one row per event of a temporal edge, where events added in bulk are
+    # read without creating interval trees
+    rows: List[int] = []
+    start: List[Any] = []
+    end: List[Any] = []
+    events: List[dict] = []
+    for i, e in enumerate(edges):
+        for begin, finish, data in e._sorted_events():
+            rows.append(i)
+            start.append(begin)
+            end.append(finish)
+            events.append(data)
+    arrays['events.edge'] = np.array(rows, dtype=np.int64)
+    arrays['events.start'] = _encode_column(start)[0]
+    arrays['events.end'] = _encode_column(end)[0]
+    _save_columns(arrays, 'events', events)
+
+
+def _save_path_collection(paths: PathCollection,
+                          arrays: Dict[str, np.ndarray]) -> None:
+    """Stores the nodes and paths of a path collection."""
+    nodes = list(paths.nodes.values())
+    _save_objects(arrays, 'nodes', nodes, Counter())
+    _save_objects(arrays, 'paths', list(paths), paths.counter,
+                  parents={v.uid: i for i, v in enumerate(nodes)})
+
+
+def _save_higher_order_network(network: HigherOrderNetwork,
+                               arrays: Dict[str, np.ndarray]) -> None:
+    """Stores higher-order nodes, edges and path statistics."""
+    first_order = {}
+    for node in network.nodes:
+        for uid, obj in node.objects.items():
+            first_order.setdefault(uid, obj)
+    for counter in (network.observed, network.subpaths):
+        for relation in counter:
+            for uid in relation:
+                first_order.setdefault(uid, PathPyEmpty(uid))
+
+    parents = {uid: i for i, uid in enumerate(first_order)}
+    _save_objects(arrays, 'first_order', list(first_order.values()), Counter())
+    _save_network(network, arrays)
+
+    # higher-order nodes are stored as paths of first-order nodes
+    nodes = list(network.nodes)
+    arrays['nodes.indptr'] = np.concatenate(
+        ([0], np.cumsum([len(v.relations) for v in nodes]))).astype(np.int64)
+    arrays['nodes.relations'] = np.array(
+        [parents[uid] for v in nodes for uid in v.relations], dtype=np.int64)
+
+    for name, counter in (('observed', network.observed),
+                          ('subpaths', network.subpaths)):
+        relations = list(counter)
+        arrays[name + '.indptr'] = np.concatenate(
+            ([0], np.cumsum([len(r) for r in relations]))).astype(np.int64)
+        arrays[name + '.relations'] = np.array(
+            [parents[uid] for r in relations for uid in r], dtype=np.int64)
+        arrays[name + '.count'] = _encode_column(
+            [counter[r] for r in relations])[0]
+
+
+def _save_objects(arrays: Dict[str, np.ndarray], name: str, objects: list,
+                  counter: Counter, parents: Optional[dict] = None,
+                  attributes: bool = True) -> None:
+    """Stores uids, counts and attributes of objects as columns.
+
+    If `parents` is given, the relations of objects (e.g. the nodes
+    traversed by paths) are stored as indices of the parent objects.
+    """
+    arrays[name + '.uid'] = np.array([obj.uid for obj in objects], dtype=str)
+    arrays[name + '.count'] = _encode_column(
+        [counter.get(obj.uid, 0) for obj in objects])[0]
+
+    # objects without data, e.g. nodes created from uids in paths
+    empty = np.array([isinstance(obj, PathPyEmpty) for obj in objects],
+                     dtype=bool)
+    if empty.any():
+        arrays[name + '.empty'] = empty
+
+    if parents is not None:
+        arrays[name + '.indptr'] = np.concatenate(
+            ([0], np.cumsum([len(obj.relations) for obj in objects]))).astype(np.int64)
+        arrays[name + '.relations'] = np.array(
+            [parents[uid] for obj in objects for uid in obj.relations],
+            dtype=np.int64)
+
+    if attributes:
+        _save_columns(arrays, name, [
+            {} if isinstance(obj, PathPyEmpty) else obj.attributes
+            for obj in objects])
+
+
+def _save_columns(arrays: Dict[str, np.ndarray], name: str, rows: list,
+                  skip: tuple = ()) -> None:
+    """Stores a list of attribute dictionaries as one array per key."""
+    rows = [row.attributes if not isinstance(row, dict) else row
+            for row in rows]
+    keys = sorted({key for row in rows for key in row if key not in skip},
+                  key=str)
+    for i, key in enumerate(keys):
+        values, mask = _encode_column([row.get(key, None) for row in rows])
+        prefix = '{0}.attr{1}'.format(name, i)
+        arrays[prefix] = values
+        arrays[prefix + '.key'] = np.array(str(key))
+        if mask is not None:
+            arrays[prefix + '.mask'] = mask
+
+
+def _encode_column(values: list) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Converts a list of values into a typed array and a mask of present
+    values, where None denotes a missing value.
+
+    Columns that do not consist of booleans, numbers or strings only are
+    stored as object arrays.
+    """
+    mask = np.array([value is not None for value in values], dtype=bool)
+    present = [value for value in values if value is not None]
+    kinds = {type(value) for value in present}
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    if kinds <= {bool, np.bool_}:
+        dtype, fill = np.bool_, False
+    elif kinds & {bool, np.bool_}:
+        return array, None
+    else:
+        typed = np.asarray(present)
+        if typed.ndim != 1 or typed.dtype.kind not in 'iufU':
+            return array, None
+        dtype = typed.dtype
+        fill = '' if dtype.kind == 'U' else 0
+
+    if mask.all():
+        return np.asarray(values, dtype=dtype), None
+    array = np.full(len(values), fill, dtype=dtype)
+    array[mask] = present
+    return array, mask
+
+
+def _load_columns(arrays: Dict[str, np.ndarray], name: str) -> Dict[str, list]:
+    """Returns the stored attribute columns of objects as lists, where
+    missing values are None."""
+    columns = {}
+    i = 0
+    while '{0}.attr{1}'.format(name, i) in arrays:
+        prefix = '{0}.attr{1}'.format(name, i)
+        values = arrays[prefix].tolist()
+        if prefix + '.mask' in arrays:
+            values = [value if present else None for value, present in
+                      zip(values, arrays[prefix + '.mask'].tolist())]
+        columns[arrays[prefix + '.key'].item()] = values
+        i += 1
+    return columns
+
+
+def _rows(columns: Dict[str, list], n: int) -> List[dict]:
+    """Converts attribute columns into one dictionary per object."""
+    rows: List[dict] = [{} for _ in range(n)]
+    for key, values in columns.items():
+        for row, value in zip(rows, values):
+            if value is not None:
+                row[key] = value
+    return rows
+
+
+def _load_objects(arrays: Dict[str, np.ndarray], name: str) -> list:
+    """Creates node objects from stored uids and attributes."""
+    uids = arrays[name + '.uid'].tolist()
+    empty = arrays[name + '.empty'] if name + '.empty' in arrays \
+        else np.zeros(len(uids), dtype=bool)
+    rows = _rows(_load_columns(arrays, name), len(uids))
+    return [PathPyEmpty(uid) if e else Node(uid, **row)
+            for uid, e, row in zip(uids, empty.tolist(), rows)]
+
+
+def _set_counts(counter: Counter, uids: list, counts: np.ndarray) -> None:
+    """Restores the stored counts of objects."""
+    for uid, count in zip(uids, counts.tolist()):
+        counter[uid] = count
+
+
+def _load_network(meta: dict, arrays: Dict[str, np.ndarray],
+                  attributes: dict) -> Network:
+    """Creates a static network from a snapshot."""
+    network = Network.from_arrays(
+        arrays['edges.v'], arrays['edges.w'], nodes=arrays['nodes.uid'],
+        directed=meta['directed'], multiedges=meta['multiedges'],
+        uids=arrays['edges.uid'], edge_attributes=_load_columns(arrays, 'edges'),
+        node_attributes=_load_columns(arrays, 'nodes'),
+        uid=meta['uid'], **attributes)
+    _set_counts(network.nodes.counter, arrays['nodes.uid'].tolist(),
+                arrays['nodes.count'])
+    _set_counts(network.edges.counter, arrays['edges.uid'].tolist(),
+                arrays['edges.count'])
+    return network
+
+
+def _load_temporal_network(meta: dict, arrays: Dict[str, np.ndarray],
+                           attributes: dict) -> TemporalNetwork:
+    """Creates a temporal network from a snapshot."""
+    edge = arrays['events.edge']
+    return TemporalNetwork.from_arrays(
+        arrays['edges.v'][edge], arrays['edges.w'][edge],
+        arrays['events.start'], arrays['events.end'],
+        nodes=arrays['nodes.uid'], directed=meta['directed'],
+        multiedges=meta['multiedges'], uids=arrays['edges.uid'][edge],
+        edge_attributes=_load_columns(arrays, 'events'),
+        node_attributes=_load_columns(arrays, 'nodes'),
+        uid=meta['uid'], **attributes)
+
+
+def _load_higher_order_network(meta: dict, arrays: Dict[str, np.ndarray],
+                               attributes: dict) -> HigherOrderNetwork:
+    """Creates a higher-order network from a snapshot."""
+    network = HigherOrderNetwork(uid=meta['uid'], order=meta['order'],
+                                 **attributes)
+    first_order = _load_objects(arrays, 'first_order')
+
+    uids = arrays['nodes.uid'].tolist()
+    indptr = arrays['nodes.indptr'].tolist()
+    relations = arrays['nodes.relations'].tolist()
+    rows = _rows(_load_columns(arrays, 'nodes'), len(uids))
+    nodes = [HigherOrderNode(
+        *[first_order[j] for j in relations[indptr[i]:indptr[i+1]]],
+        uid=uid, **rows[i]) for i, uid in enumerate(uids)]
+    for node in nodes:
+        network.nodes._add(node, count=0)
+
+    edge_uids = arrays['edges.uid'].tolist()
+    rows = _rows(_load_columns(arrays, 'edges'), len(edge_uids))
+    for uid, v, w, row in zip(edge_uids, arrays['edges.v'].tolist(),
+                              arrays['edges.w'].tolist(), rows):
+        network.edges._add(HigherOrderEdge(nodes[v], nodes[w], uid=uid,
+                                           **row), count=0)
+
+    _set_counts(network.nodes.counter, uids, arrays['nodes.count'])
+    _set_counts(network.edges.counter, edge_uids, arrays['edges.count'])
+
+    for name, counter in (('observed', network.observed),
+                          ('subpaths', network.subpaths)):
+        indptr = arrays[name + '.indptr'].tolist()
+        relations = arrays[name + '.relations'].tolist()
+        for i, count in enumerate(arrays[name + '.count'].tolist()):
+            relation = PathPyRelation(tuple(
+                first_order[j].uid for j in relations[indptr[i]:indptr[i+1]]),
+                directed=True)
+            counter[relation] = count
+
+    network._add_node_properties()
+    network._add_edge_properties()
+    return network
+
+
+def _load_path_collection(meta: dict,
+                          arrays: Dict[str, np.ndarray]) -> PathCollection:
+    """Creates a path collection from a snapshot."""
+    paths = PathCollection(directed=meta['directed'],
+                           multipaths=meta['multipaths'])
+    nodes = _load_objects(arrays, 'nodes')
+
+    uids = arrays['paths.uid'].tolist()
+    indptr = arrays['paths.indptr'].tolist()
+    relations = arrays['paths.relations'].tolist()
+    rows = _rows(_load_columns(arrays, 'paths'), len(uids))
+    for i, (uid, count) in enumerate(zip(uids, arrays['paths.count'].tolist())):
+        path = Path(*[nodes[j] for j in relations[indptr[i]:indptr[i+1]]],
+                    uid=uid, directed=meta['directed'], **rows[i])
+        paths._add(path, count=count)
+    return paths
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
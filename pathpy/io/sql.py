@@ -11,7 +11,7 @@
 
 from __future__ import annotations
 from pathpy.utils.errors import ParameterError
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union, cast
 import sqlite3
 import tempfile
 import os
@@ -36,8 +36,19 @@ def read_dataframe(db_file: Optional[str] = None,
                    con: Optional[sqlite3.Connection] = None,
                    uri: Optional[bool] = False,
                    sql: Optional[str] = None,
-                   table: Optional[str] = None) -> pd.DataFrame:
-    """Read sql database as a pandas data frame."""
+                   table: Optional[str] = None,
+                   chunksize: Optional[int] = None,
+                   dtype: Optional[Any] = None
+                   ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """Read sql database as a pandas data frame.
+
+    If `chunksize` is given, an iterator over data frames with at most
+    `chunksize` rows is returned instead, which fetches the rows of the query
+    lazily, such that tables larger than the available memory can be
+    processed. A connection opened by this function is closed once the
+    iterator is exhausted. The optional `dtype` is passed to
+    `pandas.read_sql`, e.g. to read node columns as `category`.
+    """
 
     LOG.debug('Load sql file as pandas data frame.')
 
@@ -86,22 +97,47 @@ def read_dataframe(db_file: Optional[str] = None,
         # generate sql query
         sql = 'SELECT * from {}'.format(table)
 
+    # dtype hints are only passed if given, since older versions of pandas do
+    # not support them
+    pdargs = {} if dtype is None else {'dtype': dtype}
+
+    # read chunks of rows lazily
+    if chunksize is not None:
+        return _read_chunks(sql, cast(sqlite3.Connection, con), chunksize,
+                            path if con_close else None, **pdargs)
+
     # read to pandas data frame
-    frame = pd.read_sql(sql, con)
+    frame = pd.read_sql(sql, con, **pdargs)
 
     # close connection to the database
     if con_close:
-        _con = cast(sqlite3.Connection, con)
-        _con.close()
-        try:
-            shutil.rmtree(path)
-        except IOError:
-            pass
+        _close(cast(sqlite3.Connection, con), path)
 
     # return pandas data frame
     return frame
 
 
+def _read_chunks(sql: str, con: sqlite3.Connection, chunksize: int,
+                 path: Optional[str] = None,
+                 **pdargs: Any) -> Iterator[pd.DataFrame]:
+    """Yields the result of an sql query in chunks of rows, where the
+    connection is closed at the end if the temporary `path` is given."""
+    try:
+        yield from pd.read_sql(sql, con, chunksize=chunksize, **pdargs)
+    finally:
+        if path is not None:
+            _close(con, path)
+
+
+def _close(con: sqlite3.Connection, path: str) -> None:
+    """Closes a connection and removes the temporary directory."""
+    con.close()
+    try:
+        shutil.rmtree(path)
+    except IOError:
+        pass
+
+
 def read_network(db_file: Optional[str] = None,
                  loops: bool = True,
                  directed: bool = True,
@@ -110,11 +146,18 @@ def read_network(db_file: Optional[str] = None,
                  sql: Optional[str] = None,
                  table: Optional[str] = None,
                  uri: Optional[bool] = False,
+                 chunksize: Optional[int] = None,
+                 dtype: Optional[Any] = None,
                  **kwargs: Any) -> Network:
-    """Read network from a sqlite database."""
+    """Read network from a sqlite database.
+
+    If `chunksize` is given, the rows are streamed in chunks and only the
+    unique edges are kept in memory while reading.
+    """
     # pylint: disable=too-many-arguments
 
-    frame = read_dataframe(db_file=db_file, con=con, sql=sql, table=table, uri=uri)
+    frame = read_dataframe(db_file=db_file, con=con, sql=sql, table=table,
+                           uri=uri, chunksize=chunksize, dtype=dtype)
 
     net = to_network(frame, loops=loops, directed=directed,
                      multiedges=multiedges, **kwargs)
@@ -129,11 +172,18 @@ def read_temporal_network(db_file: Optional[str] = None,
                           con: Optional[sqlite3.Connection] = None,
                           sql: Optional[str] = None,
                           table: Optional[str] = None,
+                          chunksize: Optional[int] = None,
+                          dtype: Optional[Any] = None,
                           **kwargs: Any) -> TemporalNetwork:
-    """Read temporal network from a sqlite database."""
+    """Read temporal network from a sqlite database.
+
+    If `chunksize` is given, the rows are streamed in chunks, which are stored
+    as compact arrays of events until the temporal network is created.
+    """
     # pylint: disable=too-many-arguments
 
-    frame = read_dataframe(db_file=db_file, con=con, sql=sql, table=table)
+    frame = read_dataframe(db_file=db_file, con=con, sql=sql, table=table,
+                           chunksize=chunksize, dtype=dtype)
 
     net = to_temporal_network(frame, loops=loops, directed=directed,
                               multiedges=multiedges, **kwargs)
@@ -201,13 +251,34 @@ def write(network: Union[Network, TemporalNetwork],
           con: Optional[sqlite3.Connection] = None,
           include_edge_uid: bool = False,
           export_indices: bool = False,
+          chunksize: Optional[int] = None,
           **pdargs: Any) -> None:
-    """Stores all edges including edge attributes in a sql file."""
+    """Stores all edges including edge attributes in a sql file.
+
+    If `chunksize` is given, the edges are exported and appended to the
+    table in chunks of rows, such that the full data frame is never created.
+    """
     frame = to_dataframe(network=network, include_edge_uid=include_edge_uid,
-                         export_indices=export_indices)
+                         export_indices=export_indices, chunksize=chunksize)
+
+    if chunksize is None:
+        return write_dataframe(frame, table=table, filename=filename,
+                               con=con, **pdargs)
+
+    if con is None and filename is None:
+        LOG.error('Either an SQL connection or a filename is required')
+        raise IOError
 
-    return write_dataframe(frame, table=table, filename=filename,
-                           con=con, **pdargs)
+    _con = sqlite3.connect(filename) if con is None else con
+    try:
+        for i, chunk in enumerate(frame):
+            write_dataframe(chunk, table=table, con=_con,
+                            **(pdargs if i == 0 else
+                               {**pdargs, 'if_exists': 'append'}))
+    finally:
+        if con is None:
+            _con.close()
+    return None
 # =============================================================================
 # eof
 #
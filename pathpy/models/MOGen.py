@@ -552,23 +552,34 @@ class MOGen:
     def _generate_path_chunk(args):
         generated_paths_hon_chunk = collections.Counter()
 
-        for i in range(args['no_of_paths']):
-            generated_path = (args['start_node'],)
-            while generated_path[-1][-1] != '+':
-                c = np.random.choice(list(args['id_node_dict'].keys()),
-                                     p=np.ravel(args['mat'][args['node_id_dict'][generated_path[-1]]].todense()))
-                generated_path += ((args['id_node_dict'][c]),)
-            
-            generated_paths_hon_chunk[generated_path] += 1
-        
+        rng = np.random.default_rng(args['seed'])
+        sampler = args['sampler']
+        id_node_dict = args['id_node_dict']
+        is_end = np.array([id_node_dict[i][-1] == '+' for i in range(len(id_node_dict))])
+
+        # advance all paths of the chunk simultaneously until they reach an end node
+        generated_paths = [[args['node_id_dict'][args['start_node']]] for _ in range(args['no_of_paths'])]
+        current = np.array([p[-1] for p in generated_paths], dtype=np.int64)
+        active = np.arange(args['no_of_paths'])
+        while len(active) > 0:
+            current = sampler.sample(current, rng)
+            for i, c in zip(active, current):
+                if c >= 0:
+                    generated_paths[i].append(c)
+            running = (current >= 0) & ~is_end[np.maximum(current, 0)]
+            active = active[running]
+            current = current[running]
+
+        for p in generated_paths:
+            generated_paths_hon_chunk[tuple(id_node_dict[c] for c in p)] += 1
+
         return generated_paths_hon_chunk
-        
-        
+
+
     def predict(self, no_of_paths, max_order=None, seed=None, start_node=('*',),
                        no_of_processes=multiprocessing.cpu_count(), paths_per_process=1000):
-        
-        np.random.seed(None)
-        
+        from pathpy.processes.sampling import CSRAliasSampling
+
         if max_order:
             assert max_order in self.models
             mat = self.models[max_order]['T'].matrix
@@ -585,11 +596,17 @@ class MOGen:
         for i in range(max(1, int(np.floor(no_of_paths / paths_per_process))),0,-1):
             splits.append(round((no_of_paths-sum(splits))/i))
         
+        # alias tables of all rows are shared by all chunks, and each chunk
+        # draws from an independent random stream
+        sampler = CSRAliasSampling(mat)
+        seeds = np.random.SeedSequence(seed).spawn(len(splits))
+
         args = [{'no_of_paths': split,
                  'start_node': start_node,
                  'id_node_dict': id_node_dict,
                  'node_id_dict': node_id_dict,
-                 'mat': mat} for split in splits]
+                 'sampler': sampler,
+                 'seed': s} for split, s in zip(splits, seeds)]
                 
         generated_paths_hon = collections.Counter()
         with multiprocessing.Pool(no_of_processes) as p:
@@ -17,7 +17,7 @@ import numpy as np
 from pathpy import logger, tqdm
 from pathpy.core.core import PathPyRelation
 from pathpy.core.edge import Edge, EdgeCollection
-from pathpy.core.path import Path, PathCollection
+from pathpy.core.path import Path, PathCollection, PathStore
 from pathpy.models.classes import BaseHigherOrderNetwork
 from pathpy.models.network import Network
 from pathpy.algorithms.matrices import transition_matrix
@@ -166,6 +166,51 @@ class HigherOrderNetwork(BaseHigherOrderNetwork, Network):
                 else:
                     self._subpaths[edge.first_order_relations] += data.counter[uid]
 
+        self._complete(data, subpaths)
+
+    @fit.register(PathStore)
+    def _(self, data: PathStore, order: Optional[int] = None,
+          subpaths: bool = True) -> None:
+
+        # update
+        if order is not None:
+            self._order = order
+
+        # add higher-order nodes, i.e. subpaths of length order-1, which are
+        # counted in bulk
+        for node, count in data.subpath_counts(max(self.order, 1)-1).items():
+            if node not in self.nodes:
+                self.add_node(*node, uid='-'.join(node), count=0)
+            self.nodes.counter[self.nodes[node].uid] += count
+
+        # add higher-order edges, i.e. subpaths of length order
+        if self.order > 0:
+            observed = data.subpath_counts(self.order, observed=True) \
+                if order is not None else Counter()
+
+            for relation, count in data.subpath_counts(self.order).items():
+                _v = self.nodes[relation[:-1]]
+                _w = self.nodes[relation[1:]]
+
+                # check if edge exist otherwise add new edge
+                if (_v, _w) not in self.edges:
+                    self.add_edge(_v, _w, count=0)
+
+                # get edge and update counters
+                edge = self.edges[_v, _w]
+                self.edges.counter[edge.uid] += count
+
+                relation = edge.first_order_relations
+                if observed[relation]:
+                    self._observed[relation] += observed[relation]
+                if count != observed[relation]:
+                    self._subpaths[relation] += count - observed[relation]
+
+        self._complete(data, subpaths)
+
+    def _complete(self, data, subpaths: bool = True) -> None:
+        """Normalizes a zero-order network and adds all possible nodes."""
+
         # calculate frequencies for a zero-order network
         if self.order == 0:
             total = sum(self.nodes.counter.values())
@@ -182,8 +227,11 @@ class HigherOrderNetwork(BaseHigherOrderNetwork, Network):
         """Return a list of paths of given length."""
 
         # get paths of length 1
-        edges = set(e for p in collection for e in p.subpaths(
-            min_length=1, max_length=1, include_self=True, paths=False))
+        if isinstance(collection, PathStore):
+            edges = set(collection.subpath_counts(1))
+        else:
+            edges = set(e for p in collection for e in p.subpaths(
+                min_length=1, max_length=1, include_self=True, paths=False))
 
         possible = list(edges)
         for _ in tqdm(range(length - 1), desc='calculate possible paths'):
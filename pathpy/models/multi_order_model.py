@@ -9,7 +9,7 @@
 # Copyright (c) 2016-2019 Pathpy Developers
 # =============================================================================
 from __future__ import annotations
-from typing import Optional, Any
+from typing import Optional, Any, Union
 import datetime
 from collections import defaultdict
 import numpy as np
@@ -21,7 +21,7 @@ from pathpy import logger
 from pathpy.models.classes import BaseMultiOrderModel
 from pathpy.models.higher_order_network import HigherOrderNetwork
 from pathpy.models.null_model import NullModel
-from pathpy.core.path import PathCollection
+from pathpy.core.path import PathCollection, PathStore
 
 # create logger
 LOG = logger(__name__)
@@ -81,9 +81,14 @@ class MultiOrderModel(BaseMultiOrderModel):
 
         return dof
 
-    def fit(self, data: PathCollection, max_order: Optional[int] = None,
+    def fit(self, data: Union[PathCollection, PathStore],
+            max_order: Optional[int] = None,
             null_models: bool = True) -> None:
-        """Fit data to a MultiOrderModel"""
+        """Fit data to a MultiOrderModel
+
+        The data can either be given as PathCollection or as compact
+        PathStore, e.g. as read by `pathpy.io.csv.read_pathstore`.
+        """
 
         # Check max order
         if max_order is not None:
@@ -204,7 +209,14 @@ class MultiOrderModel(BaseMultiOrderModel):
                          longer_paths=True, log=True,
                          min_length=None):
         """Layer Likelihood"""
-        path_lengths = [len(p) for p in data]
+        # paths with their frequencies and lengths
+        if isinstance(data, PathStore):
+            paths = [(path, count, len(path)-1)
+                     for path, count in data.items()]
+        else:
+            paths = [(path, data.counter[path.uid], len(path))
+                     for path in data.values()]
+        path_lengths = [length for _, _, length in paths]
 
         if min_length is None:
             min_length = order
@@ -220,10 +232,10 @@ class MultiOrderModel(BaseMultiOrderModel):
         # initialize likelihood
         likelihood = 0
 
-        for path in data.values():
-            if min_length <= len(path) <= max_length:
+        for path, frequency, length in paths:
+            if min_length <= length <= max_length:
                 likelihood += self.path_likelihood(
-                    path, data.counter[path.uid], order=order, log=True)
+                    path, frequency, order=order, log=True)
 
         if not log:
             likelihood = np.exp(likelihood)
@@ -277,8 +289,8 @@ class MultiOrderModel(BaseMultiOrderModel):
 
         if order == 0:
             for _n in edges:
-                likelihood += np.log(hon.nodes.counter(
-                    hon.nodes[_n].uid)) * frequency
+                likelihood += np.log(hon.nodes.counter[
+                    hon.nodes[_n].uid]) * frequency
         else:
             for _v, _w in edges:
                 # calculate the log-likelihood
@@ -309,7 +321,12 @@ class MultiOrderModel(BaseMultiOrderModel):
     def _path_to_hon(self, path, order):
         """Helper function to convert path to hon node tuples."""
 
-        if order == 0:
+        # paths of a path store are given as tuples of node uids
+        if isinstance(path, tuple):
+            nodes = [path[i:i+max(order, 1)]
+                     for i in range(len(path)-max(order, 1)+1)]
+
+        elif order == 0:
             nodes = list((n,) for n in path.nodes)
 
         else:
@@ -10,9 +10,11 @@
 # Copyright (c) 2016-2019 Pathpy Developers
 # =============================================================================
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Tuple, Optional, Union, Dict, Set, cast
+from typing import TYPE_CHECKING, Any, Tuple, Optional, Union, Dict, Set, Sequence, cast
 from collections import defaultdict
 
+import numpy as np
+
 from pathpy import logger
 from pathpy.models.classes import BaseNetwork
 from pathpy.core.node import Node, NodeCollection
@@ -803,6 +805,151 @@ class Network(BaseNetwork):
 
         self._add_edge_properties()
 
+    @classmethod
+    def from_arrays(cls, v: Sequence, w: Sequence,
+                    nodes: Optional[Sequence[str]] = None,
+                    directed: bool = True, multiedges: bool = False,
+                    loops: bool = True, uids: Optional[Sequence[str]] = None,
+                    edge_attributes: Optional[Dict[str, Sequence]] = None,
+                    node_attributes: Optional[Dict[str, Sequence]] = None,
+                    counts: Optional[Sequence[int]] = None,
+                    **kwargs: Any) -> Network:
+        """Creates a network from arrays of source and target nodes.
+
+        Different from adding edges one by one, nodes and edges are created in
+        bulk and the network properties are computed once, i.e. the network is
+        constructed in O(n+m) time.
+
+        Parameters
+        ----------
+        v : Sequence
+
+            source nodes of edges, either as node uids or - if `nodes` is
+            given - as integer indices of nodes
+
+        w : Sequence
+
+            target nodes of edges, either as node uids or integer indices
+
+        nodes : Optional[Sequence[str]] = None
+
+            uids of all nodes, where the i-th uid belongs to the node with
+            index i. If None, the nodes are given by the uids in `v` and `w`
+            in the order of their first occurrence.
+
+        directed : bool = True
+
+            Whether or not the network is directed.
+
+        multiedges : bool = False
+
+            Whether or not multiple edges between the same node pair are
+            added. Otherwise only the first edge is added and the counter of
+            this edge is increased.
+
+        loops : bool = True
+
+            Whether or not to add self-loops.
+
+        uids : Optional[Sequence[str]] = None
+
+            uids of the edges
+
+        edge_attributes : Optional[Dict[str, Sequence]] = None
+
+            dictionary mapping attribute names to arrays of edge attributes
+
+        node_attributes : Optional[Dict[str, Sequence]] = None
+
+            dictionary mapping attribute names to arrays of node attributes,
+            which are aligned with `nodes`
+
+        counts : Optional[Sequence[int]] = None
+
+            number of observations of each edge, e.g. if repeated edges have
+            already been aggregated. If None, each edge is counted once.
+
+        kwargs : Any
+
+            Attributes assigned to the network.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from pathpy import Network
+        >>> net = Network.from_arrays(np.array([0, 1]), np.array([1, 2]),
+        ...                           nodes=['a', 'b', 'c'],
+        ...                           edge_attributes={'weight': [1.0, 2.0]})
+        >>> net.number_of_edges()
+        2
+
+        """
+        if nodes is None:
+            v, w, nodes = _factorize_nodes(v, w)
+        v = np.asarray(v, dtype=np.int64)
+        w = np.asarray(w, dtype=np.int64)
+        nodes = [str(uid) for uid in nodes]
+
+        edge_attributes = edge_attributes or {}
+        node_attributes = node_attributes or {}
+
+        # positions of the edges to be added
+        keep = np.arange(len(v))
+        if not loops:
+            keep = keep[v[keep] != w[keep]]
+
+        counts = np.ones(len(v), dtype=np.int64) if counts is None else \
+            np.asarray(counts, dtype=np.int64)
+        counts = counts[keep]
+        if not multiedges and len(keep) > 0:
+            a, b = v[keep], w[keep]
+            if not directed:
+                a, b = np.minimum(a, b), np.maximum(a, b)
+            _, first, inverse = np.unique(
+                a * len(nodes) + b, return_index=True, return_inverse=True)
+            duplicates = len(keep) - len(first)
+            counts = np.bincount(inverse.ravel(), weights=counts,
+                                 minlength=len(first)).astype(np.int64)
+            order = np.argsort(first)
+            keep, counts = keep[first[order]], counts[order]
+            if duplicates > 0:
+                LOG.warning('%i edges existed already '
+                            'and were not be considered. '
+                            'To capture those edges, consider creating '
+                            'a multiedge and/or directed network.',
+                            duplicates)
+
+        net = cls(directed=directed, multiedges=multiedges, **kwargs)
+
+        # create node objects, which are added without checking since they
+        # are known to be unique
+        _nodes = [net.nodes._default_class(uid) for uid in nodes]
+        for key, values in node_attributes.items():
+            for node, value in zip(_nodes, list(values)):
+                if value is not None:
+                    node[key] = value
+        for node in _nodes:
+            net.nodes._add(node)
+
+        # create edge objects
+        edge_class = net.edges._default_class
+        _uids = [None] * len(keep) if uids is None else \
+            [str(uids[i]) for i in keep]
+        columns = {key: np.asarray(values, dtype=object)[keep].tolist()
+                   for key, values in edge_attributes.items()}
+        for i, (_v, _w) in enumerate(zip(v[keep].tolist(), w[keep].tolist())):
+            edge = edge_class(_nodes[_v], _nodes[_w], uid=_uids[i],
+                              directed=directed,
+                              **{key: values[i] for key, values in columns.items()
+                                 if values[i] is not None})
+            net.edges._add(edge)
+            if counts[i] > 1:
+                net.edges.counter[edge.uid] += int(counts[i]) - 1
+
+        net._add_node_properties()
+        net._add_edge_properties()
+        return net
+
     def remove_node(self, node: Union[str, Node]) -> None:
         """Remove a single node from the network.
 
@@ -901,44 +1048,47 @@ class Network(BaseNetwork):
 
         edges = set(self.edges.values()).difference(self._properties['edges'])
 
+        # node objects by uid, which are looked up without dispatching on the
+        # type of the key
+        nodes = self.nodes._store
+        properties = self._properties
+        directed = self.directed
+
         for edge in edges:
 
             # update nodes in the network
             for uid, node in edge.nodes.items():
-                if uid not in self.nodes.keys():
+                if uid not in nodes:
                     self.nodes.add(node)
 
             # get node objects
-            node_v, node_w = self.nodes[edge.v.uid], self.nodes[edge.w.uid]
-            uid = edge.uid
+            node_v, node_w = nodes[edge.v.uid], nodes[edge.w.uid]
 
             _nodes: list = [(node_v, node_w), (node_w, node_v)]
 
             for _v, _w in _nodes:
-                self._properties['successors'][_v].add(_w)
-                self._properties['outgoing'][_v].add(edge)
-                self._properties['predecessors'][_w].add(_v)
-                self._properties['incoming'][_w].add(edge)
+                properties['successors'][_v].add(_w)
+                properties['outgoing'][_v].add(edge)
+                properties['predecessors'][_w].add(_v)
+                properties['incoming'][_w].add(edge)
 
-                if self.directed:
+                if directed:
                     break
 
             for _v, _w in _nodes:
-                self._properties['neighbors'][_v].add(_w)
-                self._properties['incident_edges'][_v].add(edge)
+                properties['neighbors'][_v].add(_w)
+                properties['incident_edges'][_v].add(edge)
 
-                self._properties['indegrees'][_v] = len(
-                    self._properties['incoming'][_v])
-                self._properties['outdegrees'][_v] = len(
-                    self._properties['outgoing'][_v])
-                self._properties['degrees'][_v] = len(
-                    self._properties['incident_edges'][_v])
+                properties['indegrees'][_v] = len(properties['incoming'][_v])
+                properties['outdegrees'][_v] = len(properties['outgoing'][_v])
+                properties['degrees'][_v] = len(
+                    properties['incident_edges'][_v])
 
             # update nodes of the edge
             edge.objects[node_v.uid] = node_v
             edge.objects[node_w.uid] = node_w
 
-            self._properties['edges'].add(edge)
+            properties['edges'].add(edge)
 
     def _remove_edge_properties(self, *args):
         """Helper function to update network properties."""
@@ -1026,6 +1176,21 @@ class Network(BaseNetwork):
         
         return network
 
+
+def _factorize_nodes(v: Sequence, w: Sequence) -> tuple:
+    """Returns integer indices of source and target nodes as well as the
+    node uids in the order of their first occurrence.
+
+    The values are factorized before they are converted to strings, such
+    that only unique values are converted."""
+    import pandas as pd  # imported on demand to keep `import pathpy` fast
+    codes, uniques = pd.factorize(np.concatenate((np.asarray(v),
+                                                  np.asarray(w))))
+    index, nodes = pd.factorize(np.asarray(uniques).astype(str))
+    codes = index[codes]
+    return codes[:len(codes)//2], codes[len(codes)//2:], nodes
+
+
 # =============================================================================
 # eof
 #
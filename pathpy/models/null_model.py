@@ -8,13 +8,13 @@
 #
 # Copyright (c) 2016-2019 Pathpy Developers
 # =============================================================================
-from typing import Optional, Any
+from typing import Optional, Any, Union
 from collections import Counter
 from singledispatchmethod import singledispatchmethod
 
 from pathpy import logger, tqdm
 from pathpy.models.higher_order_network import HigherOrderNetwork
-from pathpy.core.path import PathCollection
+from pathpy.core.path import PathCollection, PathStore
 from pathpy.models.network import Network
 
 # create logger
@@ -38,7 +38,9 @@ class NullModel(HigherOrderNetwork):
         raise NotImplementedError
 
     @fit.register(PathCollection)  # type: ignore
-    def _(self, data: PathCollection, order: Optional[int] = None) -> None:
+    @fit.register(PathStore)  # type: ignore
+    def _(self, data: Union[PathCollection, PathStore],
+          order: Optional[int] = None) -> None:
 
         # check order
         if order is not None:
@@ -55,11 +57,14 @@ class NullModel(HigherOrderNetwork):
         paths = self.possible_relations(data, self.order)
 
         subpaths: Counter = Counter()
-        for path in tqdm(data, desc='calculate possible sub-paths'):
-            for subpath in path.subpaths(min_length=self.order-1,
-                                         max_length=self.order-1,
-                                         include_self=True, paths=False):
-                subpaths[subpath] += data.counter[path.uid]
+        if isinstance(data, PathStore):
+            subpaths = data.subpath_counts(self.order-1)
+        else:
+            for path in tqdm(data, desc='calculate possible sub-paths'):
+                for subpath in path.subpaths(min_length=self.order-1,
+                                             max_length=self.order-1,
+                                             include_self=True, paths=False):
+                    subpaths[subpath] += data.counter[path.uid]
 
         for path in paths:
             # get higher-oder nodes
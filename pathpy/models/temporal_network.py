@@ -9,20 +9,21 @@
 # Copyright (c) 2016-2020 Pathpy Developers
 # =============================================================================
 from __future__ import annotations
-from typing import Any, Optional, Union
+from typing import Any, Dict, Optional, Sequence, Union
 from collections import defaultdict
 from singledispatchmethod import singledispatchmethod  # NOTE: not needed at 3.9
 
+import numpy as np
 import pandas as pd
-from intervaltree import IntervalTree
 
 from pathpy import logger
 from pathpy.core.core import PathPyObject
-from pathpy.core.temporal import TemporalPathPyObject, _get_start_end
+from pathpy.core.temporal import (TemporalPathPyObject, EventIndex,
+                                  _get_start_end)
 
 from pathpy.core.node import Node, NodeCollection
 from pathpy.core.edge import Edge, EdgeCollection
-from pathpy.models.network import Network
+from pathpy.models.network import Network, _factorize_nodes
 
 # from pathpy.core.base.attributes import TemporalAttributes
 
@@ -91,8 +92,8 @@ class TemporalNodeCollection(NodeCollection):
         # initialize the base class
         super().__init__(*args, **kwargs)
 
-        # initialize an intervaltree to save events
-        self._events = IntervalTree()
+        # initialize an index to save events
+        self._events = EventIndex()
 
         # class of objects
         self._default_class: Any = TemporalNode
@@ -145,11 +146,16 @@ class TemporalNodeCollection(NodeCollection):
         start, end, _ = obj.last()
         self._events[start:end] = element.uid
 
+    def _add_bulk(self, objs: list, start: Sequence, end: Sequence,
+                  uids: Sequence) -> None:
+        """Adds objects and extends the event index by all their events."""
+        for obj in objs:
+            super()._add(obj)
+        self._events.extend(start, end, uids)
+
     def _remove(self, obj) -> None:
         """Add an edge to the set of edges."""
-        for interval in sorted(self._events):
-            if interval.data == obj.uid:
-                self._events.remove(interval)
+        self._events.remove_data(obj.uid)
         super()._remove(obj)
 
 
@@ -165,8 +171,8 @@ class TemporalEdgeCollection(EdgeCollection):
         # indicator whether the network has multi-edges
         self._multiple: bool = kwargs.pop('multiedges', False)
 
-        # initialize an intervaltree to save events
-        self._events = IntervalTree()
+        # initialize an index to save events
+        self._events = EventIndex()
 
         # class of objects
         self._default_class: Any = TemporalEdge
@@ -219,11 +225,16 @@ class TemporalEdgeCollection(EdgeCollection):
         start, end, _ = obj.last()
         self._events[start:end] = element.uid
 
+    def _add_bulk(self, objs: list, start: Sequence, end: Sequence,
+                  uids: Sequence) -> None:
+        """Adds objects and extends the event index by all their events."""
+        for obj in objs:
+            super()._add(obj)
+        self._events.extend(start, end, uids)
+
     def _remove(self, obj) -> None:
         """Add an edge to the set of edges."""
-        for interval in sorted(self._events):
-            if interval.data == obj.uid:
-                self._events.remove(interval)
+        self._events.remove_data(obj.uid)
         super()._remove(obj)
 
 
@@ -287,6 +298,168 @@ class TemporalNetwork(BaseTemporalNetwork, Network):
         _max = max(self.nodes.end, self.edges.end)
         return _max if _max < float('inf') else _min
 
+    @classmethod
+    def from_arrays(cls, v: Sequence, w: Sequence, start: Sequence,
+                    end: Sequence, nodes: Optional[Sequence[str]] = None,
+                    directed: bool = True, multiedges: bool = False,
+                    loops: bool = True, uids: Optional[Sequence[str]] = None,
+                    edge_attributes: Optional[Dict[str, Sequence]] = None,
+                    node_attributes: Optional[Dict[str, Sequence]] = None,
+                    **kwargs: Any) -> TemporalNetwork:
+        """Creates a temporal network from arrays of time-stamped edges.
+
+        The i-th entries of the arrays give an event, where an edge between
+        nodes v[i] and w[i] is active from time start[i] until time end[i].
+        Different from adding edges one by one, events are grouped by node
+        pairs (or by edge uids for multi-edges) in bulk, one temporal edge is
+        created per group and the event index of the network is built once.
+
+        Parameters
+        ----------
+        v : Sequence
+
+            source nodes of events, either as node uids or - if `nodes` is
+            given - as integer indices of nodes
+
+        w : Sequence
+
+            target nodes of events, either as node uids or integer indices
+
+        start : Sequence
+
+            start times of events
+
+        end : Sequence
+
+            end times of events
+
+        nodes : Optional[Sequence[str]] = None
+
+            uids of all nodes, where the i-th uid belongs to the node with
+            index i. If None, the nodes are given by the uids in `v` and `w`
+            in the order of their first occurrence.
+
+        directed : bool = True
+
+            Whether or not the network is directed.
+
+        multiedges : bool = False
+
+            Whether or not events with different edge uids between the same
+            node pair belong to different edges.
+
+        loops : bool = True
+
+            Whether or not to add self-loops.
+
+        uids : Optional[Sequence[str]] = None
+
+            uids of the edges of events
+
+        edge_attributes : Optional[Dict[str, Sequence]] = None
+
+            dictionary mapping attribute names to arrays of event attributes
+
+        node_attributes : Optional[Dict[str, Sequence]] = None
+
+            dictionary mapping attribute names to arrays of node attributes,
+            which are aligned with `nodes`
+
+        kwargs : Any
+
+            Attributes assigned to the network.
+
+        Examples
+        --------
+        >>> from pathpy import TemporalNetwork
+        >>> net = TemporalNetwork.from_arrays(['a', 'a', 'b'], ['b', 'b', 'c'],
+        ...                                   start=[1, 3, 2], end=[2, 4, 5])
+        >>> net.number_of_edges()
+        2
+        >>> len(net.edges.events)
+        3
+
+        """
+        if nodes is None:
+            v, w, nodes = _factorize_nodes(v, w)
+        v = np.asarray(v, dtype=np.int64)
+        w = np.asarray(w, dtype=np.int64)
+        nodes = [str(uid) for uid in nodes]
+        start, end = _column(start), _column(end)
+        if not np.all(start < end):
+            msg = 'Null events with start time >= end time are not allowed'
+            LOG.error(msg)
+            raise ValueError(msg)
+
+        # positions of the events to be added
+        keep = np.arange(len(v))
+        if not loops:
+            keep = keep[v != w]
+        v, w, start, end = v[keep], w[keep], start[keep], end[keep]
+        if uids is not None:
+            uids = _column(uids)[keep]
+        columns = {key: _column(values)[keep]
+                   for key, values in (edge_attributes or {}).items()}
+
+        # assign events to edges, numbered in the order of first occurrence
+        if multiedges and uids is None:
+            group = np.arange(len(v))
+        elif multiedges:
+            group = pd.factorize(uids)[0]
+        else:
+            a, b = v, w
+            if not directed:
+                a, b = np.minimum(v, w), np.maximum(v, w)
+            group = pd.factorize(a * len(nodes) + b)[0]
+
+        order = np.argsort(group, kind='stable')
+        counts = np.bincount(group)
+        bounds = np.concatenate(([0], np.cumsum(counts))).tolist()
+        first = order[bounds[:-1]]
+
+        net = cls(directed=directed, multiedges=multiedges, **kwargs)
+
+        # create node objects
+        attributes = {key: _column(values).tolist()
+                      for key, values in (node_attributes or {}).items()}
+        _nodes = [net.nodes._default_class(uid, **{
+            key: values[i] for key, values in attributes.items()
+            if values[i] is not None}) for i, uid in enumerate(nodes)]
+        net.nodes._add_bulk(_nodes, np.full(len(nodes), float('-inf')),
+                            np.full(len(nodes), float('inf')), nodes)
+
+        # events of edges, sorted by edges
+        start, end = start[order], end[order]
+        _start, _end = start.tolist(), end.tolist()
+        keys = list(columns)
+        rows = None
+        if keys:
+            rows = [{key: value for key, value in zip(keys, values)
+                     if value is not None}
+                    for values in zip(*[columns[key][order].tolist()
+                                        for key in keys])]
+
+        # create edge objects, whose events are added in bulk
+        edge_class = net.edges._default_class
+        _uids = [None] * len(first) if uids is None else \
+            [str(uid) for uid in uids[first].tolist()]
+        edges = []
+        for i, (_v, _w) in enumerate(zip(v[first].tolist(), w[first].tolist())):
+            edge = edge_class(_nodes[_v], _nodes[_w], uid=_uids[i],
+                              directed=directed)
+            a, b = bounds[i], bounds[i+1]
+            edge._set_events(_start[a:b], _end[a:b],
+                             None if rows is None else rows[a:b])
+            edges.append(edge)
+
+        edge_uids = np.empty(len(edges), dtype=object)
+        edge_uids[:] = [e.uid for e in edges]
+        net.edges._add_bulk(edges, start, end, np.repeat(edge_uids, counts))
+
+        net._add_node_properties()
+        net._add_edge_properties()
+        return net
+
     def summary(self) -> str:
         """Returns a summary of the network.
 
@@ -358,6 +531,18 @@ class TemporalNetwork(BaseTemporalNetwork, Network):
                             start=current_interval[0], end=current_interval[1])
         return tn
 
+
+def _column(values: Sequence) -> np.ndarray:
+    """Returns a sequence of values as array, where values that are not
+    numbers are stored as python objects."""
+    array = np.asarray(values)
+    if array.ndim == 1 and array.dtype.kind in 'biuf':
+        return array
+    column = np.empty(len(values), dtype=object)
+    column[:] = values.tolist() if hasattr(values, 'tolist') else list(values)
+    return column
+
+
 # =============================================================================
 # eof
 #
@@ -12,6 +12,7 @@
 # pylint: disable=unused-import
 
 from pathpy.processes.random_walk import RandomWalk
-from pathpy.processes.epidemic_spreading import EpidemicSIR
-from pathpy.processes.sampling import VoseAliasSampling
+from pathpy.processes.epidemic_spreading import EpidemicSIR, EpidemicSIS, EpidemicSEIR
+from pathpy.processes.sampling import VoseAliasSampling, CSRAliasSampling
+from pathpy.processes.recorder import ExperimentRecorder
 from pathpy.processes.random_walk import HigherOrderRandomWalk
\ No newline at end of file
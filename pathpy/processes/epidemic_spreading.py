@@ -3,7 +3,7 @@
 # !/usr/bin/python -tt
 # -*- coding: utf-8 -*-
 # =============================================================================
-# File      : epidemic_spreading.py -- Classes implementing epidemic models in 
+# File      : epidemic_spreading.py -- Classes implementing epidemic models in
 #               (higher-order) networks
 # Author    : Ingo Scholtes <scholtes@uni-wuppertal.de>
 # Time-stamp: <Wed 2021-04-28 18:51 ingo>
@@ -11,27 +11,34 @@
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
 from __future__ import annotations
-import abc
-import operator
 from pathpy.models.temporal_network import TemporalNetwork
 
 from typing import Any, Iterable, Optional, Union, Dict, Set, Tuple
 
-from numpy import random
+import numpy as np
+import pandas as pd
 
-from pathpy.core.path import Path
-from pathpy.core.path import PathCollection
+from pathpy import logger
 from pathpy.models.network import Network
-from pathpy.models.network import Node
-from pathpy.models.network import Edge
-import numpy as np
+from pathpy.algorithms.matrices import adjacency_matrix
+from pathpy.utils.errors import ParameterError
 from .process import BaseProcess
 
+# create logger
+LOG = logger(__name__)
+
+# compartments of nodes
+SUSCEPTIBLE: int = 0
+INFECTED: int = 1
+RECOVERED: int = 2
+EXPOSED: int = 3
+
+
 class EpidemicSIR(BaseProcess):
     """Implementation of Susceptible-Infected-Removed (SIR) model for epidemic spreading.
-    
-    The SIR model is an epidemiological compartment model, in which the nodes are assigned to three 
-    compartments `susceptible` (those nodes that have not been infected but can potentially be infected), 
+
+    The SIR model is an epidemiological compartment model, in which the nodes are assigned to three
+    compartments `susceptible` (those nodes that have not been infected but can potentially be infected),
     `infected` (those nodes that are currently infected and can infect others), and `recovered` (those who
     have been infected in the past but are not infectious anymore).
 
@@ -39,6 +46,19 @@ class EpidemicSIR(BaseProcess):
 
     The basic reproduction number R0 of the process is given by the product of the recovery time and the infection probability.
 
+    The compartments of all nodes are stored in an int8 array (0 = susceptible,
+    1 = infected, 2 = recovered). In each step, the links from infected to
+    susceptible nodes (the frontier) are collected from a CSR adjacency
+    structure and all infections are sampled with a single vectorized
+    Bernoulli draw. For temporal networks, the links active at the current
+    time are looked up in an index of time-sorted link activations.
+
+    If `continuous` is True, the process is simulated as continuous-time Markov
+    process using Gillespie's algorithm, where each step corresponds to a
+    single event. In this case, `infection_prob` is interpreted as the rate
+    at which an infected node infects a susceptible neighbor, and infected
+    nodes recover at rate 1/recovery_time.
+
     Parameters
     ----------
 
@@ -51,8 +71,9 @@ class EpidemicSIR(BaseProcess):
     infection_prob: float
         probability that a susceptible node connected to an infected node is infected
 
-    source: Optional[Node]
-        source node that is initially infected
+    continuous: bool = False
+        whether to simulate the process in continuous time. Only supported
+        for static networks.
 
     Examples
     --------
@@ -65,125 +86,264 @@ class EpidemicSIR(BaseProcess):
     >>> print(sir.R0)
     2.5
 
+    Simulate the process in continuous time
+
+    >>> sir = pp.processes.EpidemicSIR(n, 10, 0.25, continuous=True)
+    >>> data = sir.run_experiment(steps=1000, runs=10)
+
     """
 
-    def __init__(self, network: Union[Network, TemporalNetwork], 
+    def __init__(self, network: Union[Network, TemporalNetwork],
                         recovery_time: int,
-                        infection_prob: float) -> None:
+                        infection_prob: float,
+                        continuous: bool = False) -> None:
         """
         Constructor
-        """       
+        """
 
-        super().__init__(network)
+        # recovery times are mean waiting times in continuous time
+        if continuous and not recovery_time > 0:
+            msg = 'Recovery time must be positive in continuous-time simulation'
+            LOG.error(msg)
+            raise ParameterError(msg)
 
         # Set model parameters
         self.infection_prob: float = infection_prob
         self.recovery_time: int = recovery_time
+        self.continuous: bool = continuous
+
+        # node uids in the order of the node index
+        self._index: Dict[str, int] = network.nodes.index
+        self._uids: np.ndarray = np.array(list(self._index), dtype=object)
+
+        if isinstance(network, TemporalNetwork):
+            if continuous:
+                msg = 'Continuous-time simulation is not supported for temporal networks'
+                LOG.error(msg)
+                raise ParameterError(msg)
+            self._init_event_index(network)
+        else:
+            # binary adjacency structure and its transpose in CSR format
+            A = adjacency_matrix(network)
+            A.data[:] = 1
+            self._adjacency = A
+            self._adjacency_t = A.transpose().tocsr()
+
+        super().__init__(network)
 
+    def _init_event_index(self, network: TemporalNetwork) -> None:
+        """Builds arrays of link activations sorted by their start time."""
+        starts, ends, uids = network.edges.events.arrays()
+
+        # map the edge uids of events to the indices of their nodes
+        codes, edges = pd.factorize(uids)
+        nodes = np.array([(self._index[network.edges[uid].v.uid],
+                           self._index[network.edges[uid].w.uid])
+                          for uid in edges], dtype=np.int64).reshape(-1, 2)
+        sources, targets = nodes[codes, 0], nodes[codes, 1]
+        if not network.directed:
+            sources, targets = np.concatenate((sources, targets)), \
+                np.concatenate((targets, sources))
+            starts, ends = np.concatenate((starts, starts)), \
+                np.concatenate((ends, ends))
+
+        order = np.argsort(starts, kind='stable')
+        self._event_source = sources[order]
+        self._event_target = targets[order]
+        self._event_start = np.asarray(starts)[order]
+        self._event_end = np.asarray(ends)[order]
+
+        # the maximal duration bounds the start times of active links
+        if len(order) > 0:
+            self._max_duration = np.max(self._event_end - self._event_start)
+        else:
+            self._max_duration = 0
 
     def random_seed(self):
-        return np.random.choice(list(self._network.nodes.uids))
+        return self._rng.choice(list(self._network.nodes.uids))
 
     def init(self, seed):
 
-        # Initialize compartments
-        self.susceptible: Set[str] = set()
-        self.infected: Set[str] = set()
-        self.recovered: Set[str] = set()
+        # Set all nodes in network to susceptible
+        self._state: np.ndarray = np.full(
+            len(self._uids), SUSCEPTIBLE, dtype=np.int8)
 
-        # infection times
-        self.infection_times: Dict[str, int] = dict()
+        # time at which nodes have entered their current compartment
+        self._since: np.ndarray = np.zeros(len(self._uids))
 
         if isinstance(self._network, TemporalNetwork):
             self._time = self._network.start
+        elif self.continuous:
+            self._time = 0.0
         else:
             self._time = 0
 
-        # Set all nodes in network to susceptible
-        for v in self.network.nodes.uids:
-            self.susceptible.add(v)
-        
-        self.infected.add(seed)
-        self.infection_times[seed] = self.time
-        self.susceptible.remove(seed)
+        s = self._index[seed]
+        self._state[s] = INFECTED
+        self._since[s] = self.time
+
+        if self.continuous:
+            # number of susceptible successors of each node
+            self._susceptible_successors: np.ndarray = self._adjacency @ (
+                self._state == SUSCEPTIBLE).astype(np.int64)
+
+    @property
+    def susceptible(self) -> Set[str]:
+        """Returns the set of susceptible nodes"""
+        return set(self._uids[self._state == SUSCEPTIBLE])
+
+    @property
+    def infected(self) -> Set[str]:
+        """Returns the set of infected nodes"""
+        return set(self._uids[self._state == INFECTED])
+
+    @property
+    def recovered(self) -> Set[str]:
+        """Returns the set of recovered nodes"""
+        return set(self._uids[self._state == RECOVERED])
+
+    @property
+    def infection_times(self) -> Dict[str, Any]:
+        """Returns the times at which the currently infected nodes have been infected"""
+        infected = np.flatnonzero(self._state == INFECTED)
+        return dict(zip(self._uids[infected], self._since[infected].tolist()))
+
+    @property
+    def states(self) -> np.ndarray:
+        """Returns the compartments of all nodes in the order of the node index"""
+        return self._state
+
+    def _set_state(self, nodes: np.ndarray, state: int) -> None:
+        """Moves nodes to a compartment at the current time."""
+        self._state[nodes] = state
+        self._since[nodes] = self._time
+
+    def _progress(self) -> np.ndarray:
+        """Moves nodes between compartments after the respective time spans and
+        returns the nodes whose state has changed."""
+        recovered = np.flatnonzero((self._state == INFECTED) & (
+            self._time - self._since > self.recovery_time))
+        self._set_state(recovered, self._recovered_state)
+        return recovered
+
+    def _frontier(self, sources: np.ndarray) -> np.ndarray:
+        """Returns the targets of all (active) links starting in the given nodes,
+        with one entry per link."""
+        if isinstance(self._network, TemporalNetwork):
+            # links with start <= t < end, where start > t - maximal duration
+            lo = np.searchsorted(self._event_start,
+                                 self._time - self._max_duration, side='right')
+            hi = np.searchsorted(self._event_start, self._time, side='right')
+            active = np.arange(lo, hi)
+            active = active[(self._event_end[active] > self._time) & (
+                self._state[self._event_source[active]] == INFECTED)]
+            return self._event_target[active]
+
+        indptr = self._adjacency.indptr
+        starts = indptr[sources]
+        counts = indptr[sources+1] - starts
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return self._adjacency.indices[offsets + np.arange(counts.sum())]
 
     def step(self) -> Set[str]:
         """
+        Simulates a single step of the process and returns the set of nodes
+        whose state has changed.
         """
-        newly_infected = set()
-        newly_recovered = set()
+        if self.continuous:
+            return self._event()
 
         # identify recovered nodes
-        for v in list(self.infected):
-            if self._time-self.infection_times[v] > self.recovery_time:
-                self.infected.remove(v)
-                self.recovered.add(v)
-                
-                # record nodes with changed state
-                newly_recovered.add(v)
-        
-    
-        # stop if no infected or susceptible nodes are left
-        # if not self.infected or not self.susceptible:
-        #     return newly_recovered        
-
-        # infection of neighbors
-        if isinstance(self._network, TemporalNetwork):
-            # for all infected nodes v
-            for v in self.infected:
-                # for all susceptible neighbors w
-                for w in self.network.successors[v]:
-                    if w in self.susceptible:
-                        # check if link (v,w) is active at current time
-                        for start, end, _ in self.network.edges[(v,w)].activities:
-                            if self.time >= start and self.time <= end:
-                                # print('found active neighbor')
-                                # infection probability
-                                if random.uniform()<=self.infection_prob:
-                                    
-                                    # record node with changed state
-                                    newly_infected.add(w)
-        else:
-            # for all infected nodes v
-            for v in self.infected:
-                # for all neighbors w
-                for w in self.network.successors[v]:
-                    if w.uid in self.susceptible and random.uniform()<=self.infection_prob:
-
-                        # record node with changed state
-                        newly_infected.add(w.uid)
+        changed = self._progress()
 
+        # infection of susceptible neighbors via a single Bernoulli draw
+        # for all links in the frontier
+        targets = self._frontier(np.flatnonzero(self._state == INFECTED))
+        targets = targets[self._state[targets] == SUSCEPTIBLE]
+        infected = np.unique(
+            targets[self._rng.random(len(targets)) <= self.infection_prob])
 
         # update compartments and infection time of all newly infected nodes
-        for w in newly_infected:
-            self.infection_times[w] = self.time
-            self.infected.add(w)
-            self.susceptible.remove(w)
+        self._set_state(infected, self._infected_state)
 
         self._time += 1
 
         # return list of nodes with changed state
-        return newly_infected.union(newly_recovered)
+        return set(self._uids[np.concatenate((changed, infected))])
+
+    def _event_rates(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the nodes, types and rates of all possible events, where the
+        type is either the new compartment of the node or -1 if the node
+        infects a successor."""
+        infected = np.flatnonzero(self._state == INFECTED)
+        nodes = np.concatenate((infected, infected))
+        kinds = np.repeat([-1, self._recovered_state], len(infected))
+        rates = np.concatenate((
+            self.infection_prob * self._susceptible_successors[infected],
+            np.full(len(infected), 1/self.recovery_time)))
+        return nodes, kinds, rates
+
+    def _move(self, v: int, state: int) -> None:
+        """Moves a single node to a compartment and updates the number of
+        susceptible successors."""
+        t = self._adjacency_t
+        predecessors = t.indices[t.indptr[v]:t.indptr[v+1]]
+        if self._state[v] == SUSCEPTIBLE:
+            self._susceptible_successors[predecessors] -= 1
+        if state == SUSCEPTIBLE:
+            self._susceptible_successors[predecessors] += 1
+        self._set_state(v, state)
+
+    def _event(self) -> Optional[Set[str]]:
+        """Simulates the next event of the continuous-time process."""
+        nodes, kinds, rates = self._event_rates()
+        total = rates.sum()
+        if total <= 0:
+            return None
+
+        # waiting time until the next event and event type
+        self._time += self._rng.exponential(1/total)
+        i = min(np.searchsorted(np.cumsum(rates), self._rng.random() * total,
+                                side='right'), len(rates)-1)
+        v, kind = nodes[i], kinds[i]
+
+        if kind < 0:
+            # infect a susceptible successor chosen uniformly at random
+            successors = self._adjacency.indices[
+                self._adjacency.indptr[v]:self._adjacency.indptr[v+1]]
+            successors = successors[self._state[successors] == SUSCEPTIBLE]
+            v = successors[int(self._rng.random() * len(successors))]
+            self._move(v, self._infected_state)
+        else:
+            self._move(v, kind)
+        return {self._uids[v]}
+
+    @property
+    def _infected_state(self) -> int:
+        """Compartment of newly infected nodes"""
+        return INFECTED
+
+    @property
+    def _recovered_state(self) -> int:
+        """Compartment of recovered nodes"""
+        return RECOVERED
 
     def node_state(self, v:str) -> int:
         """
         Returns the current status of a node
         """
-        if v in self.susceptible:
-            return 0
-        elif v in self.infected:
-            return 1
-        else:
-            return 2
+        return int(self._state[self._index[v]])
 
     def state_to_color(self, state) -> str:
         if state==0:
             return "blue"
         elif state==1:
             return "red"
+        elif state==3:
+            return "orange"
         else:
             return "gray"
-        
+
     @property
     def time(self) -> int:
         return self._time
@@ -193,3 +353,117 @@ class EpidemicSIR(BaseProcess):
         return self.infection_prob * self.recovery_time
 
 
+class EpidemicSIS(EpidemicSIR):
+    """Implementation of Susceptible-Infected-Susceptible (SIS) model for epidemic spreading.
+
+    Different from the SIR model, infected nodes do not acquire immunity but
+    become susceptible again after the recovery time.
+
+    Parameters
+    ----------
+
+    network: Network
+        The network on which to simulate the SIS process
+
+    recovery_time: int
+        number of steps after which a newly infected node will become susceptible
+
+    infection_prob: float
+        probability that a susceptible node connected to an infected node is infected
+
+    continuous: bool = False
+        whether to simulate the process in continuous time
+
+    Examples
+    --------
+
+    >>> import pathpy as pp
+    >>> n = pp.generators.ER_np(500, 0.01)
+    >>> sis = pp.processes.EpidemicSIS(n, 10, 0.25)
+    >>> data = sis.run_experiment(steps=100, runs=10)
+
+    """
+
+    @property
+    def _recovered_state(self) -> int:
+        """Compartment of recovered nodes"""
+        return SUSCEPTIBLE
+
+
+class EpidemicSEIR(EpidemicSIR):
+    """Implementation of Susceptible-Exposed-Infected-Removed (SEIR) model for epidemic spreading.
+
+    In the SEIR model, newly infected nodes are first exposed (state 3), i.e.
+    they are infected but not yet infectious. After the incubation time,
+    exposed nodes become infectious.
+
+    Parameters
+    ----------
+
+    network: Network
+        The network on which to simulate the SEIR process
+
+    recovery_time: int
+        number of steps after which an infectious node will recover
+
+    infection_prob: float
+        probability that a susceptible node connected to an infected node is infected
+
+    incubation_time: int
+        number of steps after which an exposed node becomes infectious
+
+    continuous: bool = False
+        whether to simulate the process in continuous time, where exposed
+        nodes become infectious at rate 1/incubation_time
+
+    Examples
+    --------
+
+    >>> import pathpy as pp
+    >>> n = pp.generators.ER_np(500, 0.01)
+    >>> seir = pp.processes.EpidemicSEIR(n, 10, 0.25, incubation_time=3)
+    >>> data = seir.run_experiment(steps=100, runs=10)
+
+    """
+
+    def __init__(self, network: Union[Network, TemporalNetwork],
+                 recovery_time: int,
+                 infection_prob: float,
+                 incubation_time: int,
+                 continuous: bool = False) -> None:
+        """
+        Constructor
+        """
+        if continuous and not incubation_time > 0:
+            msg = 'Incubation time must be positive in continuous-time simulation'
+            LOG.error(msg)
+            raise ParameterError(msg)
+        self.incubation_time: int = incubation_time
+        super().__init__(network, recovery_time, infection_prob, continuous)
+
+    @property
+    def exposed(self) -> Set[str]:
+        """Returns the set of exposed nodes"""
+        return set(self._uids[self._state == EXPOSED])
+
+    @property
+    def _infected_state(self) -> int:
+        """Compartment of newly infected nodes"""
+        return EXPOSED
+
+    def _progress(self) -> np.ndarray:
+        """Moves infectious nodes to the recovered and exposed nodes to the
+        infected compartment."""
+        recovered = super()._progress()
+        infectious = np.flatnonzero((self._state == EXPOSED) & (
+            self._time - self._since > self.incubation_time))
+        self._set_state(infectious, INFECTED)
+        return np.concatenate((recovered, infectious))
+
+    def _event_rates(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the nodes, types and rates of all possible events."""
+        nodes, kinds, rates = super()._event_rates()
+        exposed = np.flatnonzero(self._state == EXPOSED)
+        return (np.concatenate((nodes, exposed)),
+                np.concatenate((kinds, np.full(len(exposed), INFECTED))),
+                np.concatenate((rates, np.full(len(exposed), 1/self.incubation_time))))
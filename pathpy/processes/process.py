@@ -10,8 +10,10 @@
 # =============================================================================
 import abc
 from collections import defaultdict
+from functools import partial
 from typing import Iterable, TYPE_CHECKING, Any, Optional, List, Dict, Tuple, Union, Set
 
+import numpy as np
 from pandas import DataFrame
 
 from pathpy.core.classes import BaseClass
@@ -19,6 +21,8 @@ from pathpy.core.api import Node
 from pathpy.models.network import Network
 from pathpy.models.directed_acyclic_graph import DirectedAcyclicGraph
 from pathpy.models.temporal_network import TemporalNetwork, TemporalNode
+from pathpy.processes.recorder import ExperimentRecorder
+from pathpy.utils import parallel
 from pathpy import tqdm, logger
 
 # create logger
@@ -29,6 +33,10 @@ class BaseProcess:
     """Abstract base class for all implementations of discrete-time dynamical processes.
     """
 
+    # random number generator used by the process, which is numpy's global
+    # random state except for the runs of `run_experiment`
+    _rng: Any = np.random
+
     def __init__(self, network: Network):
         """initialize process."""
         self._network = network
@@ -76,47 +84,176 @@ class BaseProcess:
             else:
                 return None
 
-    def run_experiment(self, steps: int, runs: Optional[Union[int, Iterable[Any]]] = 1) -> DataFrame:
-        """Perform one or more simulation runs of the process with a given number of steps."""
+    def run_experiment(self, steps: int, runs: Optional[Union[int, Iterable[Any]]] = 1,
+                       columnar: bool = False, spill_to: Optional[str] = None,
+                       chunk_size: int = 65536, n_jobs: int = 1,
+                       random_state: Optional[Any] = None) -> Union[DataFrame, ExperimentRecorder]:
+        """Perform one or more simulation runs of the process with a given number of steps.
+
+        State changes are recorded in typed column arrays (see
+        `ExperimentRecorder`) rather than in one dictionary per change.
+
+        Each run draws its random numbers from its own stream, which is
+        spawned from a common seed sequence. The result of an experiment thus
+        only depends on `random_state` (or the state of numpy's global random
+        number generator if `random_state` is None), but not on the number of
+        processes used to simulate the runs.
+
+        Parameters
+        ----------
+        steps: int
+            number of steps to simulate in each run
+
+        runs: Optional[Union[int, Iterable[Any]]]=1
+            either the number of runs with random seeds or an iterable of seeds
+
+        columnar: bool=False
+            If True, the recorder containing the columnar data is returned.
+            Otherwise (default) the data is returned as pandas DataFrame with
+            columns run_id, seed, time, node and state.
+
+        spill_to: Optional[str]=None
+            directory to which full chunks of recorded data are written. If
+            None (default), all data are kept in memory.
+
+        chunk_size: int=65536
+            number of recorded state changes per chunk
+
+        n_jobs: int=1
+            number of processes used to simulate runs in parallel. If -1, one
+            process per CPU is used. Worker processes are forked where
+            possible, so that the network is shared rather than copied.
+
+        random_state: Optional[Any]=None
+            entropy of the seed sequence from which the random streams of all
+            runs are spawned
+
+        Examples
+        --------
+
+        Simulate 100 random walks in four processes
+
+        >>> n = pp.Network(directed=False)
+        >>> n.add_edge('a', 'b')
+        >>> rw = pp.processes.RandomWalk(n)
+        >>> data = rw.run_experiment(steps=100, runs=100, n_jobs=4, random_state=42)
+        """
+
+        # seed sequence from which the random streams are spawned
+        sequence = parallel.seed_sequence(random_state)
 
         # Generate initializations for different runs
         seeds: List = list()
         if type(runs) == int:
-            for s in range(runs):
-                seeds.append(self.random_seed())
+            self._rng = parallel.generator(sequence.spawn(1)[0])
+            try:
+                for s in range(runs):
+                    seeds.append(self.random_seed())
+            finally:
+                del self._rng
         else:
             for s in runs:
                 seeds.append(s)
 
-        results = list()
-        run_id: int = 0
-        for seed in tqdm(seeds):
+        # independent random streams for all runs
+        streams = sequence.spawn(len(seeds))
 
+        index = self.network.nodes.index
+        recorder = ExperimentRecorder(
+            index.keys(), seeds=seeds, chunk_size=chunk_size, spill=spill_to)
+
+        n_jobs = parallel.number_of_jobs(n_jobs, len(seeds))
+        if n_jobs == 1:
+            for run_id in tqdm(range(len(seeds))):
+                self._record_run(recorder, run_id, seeds[run_id],
+                                 streams[run_id], steps, index)
+        else:
+            # distribute batches of runs across worker processes
+            batches = parallel.batches(
+                list(zip(range(len(seeds)), seeds, streams)), n_jobs)
+            results = parallel.imap_batches(
+                partial(self._simulate_runs, steps), batches, n_jobs)
+            for _ in tqdm(batches):
+                recorder.extend(next(results))
+
+        recorder.flush()
+        if columnar:
+            return recorder
+        return recorder.to_dataframe()
+
+    def _record_run(self, recorder: ExperimentRecorder, run_id: int, seed: Any,
+                    stream: np.random.SeedSequence, steps: int, index: Dict[str, int]) -> None:
+        """Simulates a single run and records all state changes, where the run
+        draws its random numbers from a generator of the given stream."""
+        self._rng = parallel.generator(stream)
+        try:
             # initialize seed state and record initial state
             self.init(seed)
-            for v in self.network.nodes.uids:
-                results.append({'run_id': run_id, 'seed': seed,
-                               'time': self.time, 'node': v, 'state': self.node_state(v)})
+            recorder.record(run_id, self.time, np.arange(len(index)),
+                            [self.node_state(v) for v in index])
 
             # simulate the given number of steps
             for time, updated_nodes in self.simulation_run(steps, seed):
-                # print(updated_nodes)
                 # record the new state of each changed node
-                for v in updated_nodes:
-                    results.append({'run_id': run_id, 'seed': seed,
-                                   'time': time, 'node': v, 'state': self.node_state(v)})
-            run_id += 1
+                updated_nodes = list(updated_nodes)
+                recorder.record(run_id, time, [index[v] for v in updated_nodes],
+                                [self.node_state(v) for v in updated_nodes])
+        finally:
+            del self._rng
+
+    def _simulate_runs(self, steps: int, runs: List[Tuple[int, Any, np.random.SeedSequence]]) -> Dict[str, np.ndarray]:
+        """Simulates a batch of runs and returns the recorded columns."""
+        index = self.network.nodes.index
+        recorder = ExperimentRecorder(index.keys())
+        for run_id, seed, stream in runs:
+            self._record_run(recorder, run_id, seed, stream, steps, index)
+        return recorder.columns()
+
+    @staticmethod
+    def _experiment_runs(data: Union[DataFrame, ExperimentRecorder],
+                         run_ids: Optional[Iterable[int]] = None) -> Iterable[Tuple[int, Dict[str, np.ndarray]]]:
+        """Yields the recorded time, node and state columns of each simulation run.
 
-        return DataFrame.from_dict(results)
+        Parameters
+        ----------
+        data: Union[DataFrame, ExperimentRecorder]
+            recorded state changes of nodes, as returned by `run_experiment`
 
-    def plot(self, data: DataFrame, run_id: int = 0, timescale: Optional[int] = 1, **kwargs):
+        run_ids: Optional[Iterable[int]]=None
+            identifiers of runs to return. If None (default) all runs are
+            returned in ascending order.
+        """
+        if isinstance(data, ExperimentRecorder):
+            columns = data.columns()
+            run = columns['run_id']
+            time, state = columns['time'], columns['state']
+            node = data.nodes[columns['node_idx']]
+        else:
+            run = data['run_id'].to_numpy()
+            time = data['time'].to_numpy()
+            node = data['node'].to_numpy()
+            state = data['state'].to_numpy()
+
+        # group rows by run, preserving the order of recording within runs
+        order = np.argsort(run, kind='stable')
+        ids, first = np.unique(run[order], return_index=True)
+        bounds = dict(zip(ids.tolist(), zip(
+            first.tolist(), first[1:].tolist() + [len(order)])))
+
+        for run_id in (ids.tolist() if run_ids is None else run_ids):
+            start, end = bounds.get(run_id, (0, 0))
+            rows = order[start:end]
+            yield run_id, {'time': time[rows], 'node': node[rows],
+                           'state': state[rows]}
+
+    def plot(self, data: Union[DataFrame, ExperimentRecorder], run_id: int = 0, timescale: Optional[int] = 1, **kwargs):
         """
         Display an interactive plot of the evolution of a process based on a recorded simulation experiment
 
         Parameters
         ----------
-        data: DataFrame
-            A pandas dataframe containing the state changes recorded in a simulation of the process, as generated by function `run_experiment`
+        data: Union[DataFrame, ExperimentRecorder]
+            A pandas dataframe or recorder containing the state changes recorded in a simulation of the process, as generated by function `run_experiment`
 
         run_id: Optional[int]=0
             The integer identifier of the simulation run contained in `data` that shall be visualized. 
@@ -147,15 +284,24 @@ class BaseProcess:
         TemporalNetwork, plot, RandomWalk, HigherOrderRandomWalk, EpidemicSIR
         """
 
-        evolution: DataFrame = data.loc[data['run_id'] == run_id]
+        _, evolution = next(self._experiment_runs(data, [run_id]))
 
-        start_time = evolution.min()['time']
-        end_time = evolution.max()['time']
+        if len(evolution['time']) == 0:
+            LOG.warning('Run data does not contain time evolution')
+            return None
+
+        start_time = evolution['time'].min()
+        end_time = evolution['time'].max()
 
         if end_time <= start_time:
             LOG.warning('Run data does not contain time evolution')
             return None
 
+        # state of each node at the start time
+        initial = evolution['time'] == start_time
+        initial_state = dict(zip(evolution['node'][initial].tolist(),
+                                 evolution['state'][initial].tolist()))
+
         # create network with temporal attributes
         tn = TemporalNetwork(directed=self.network.directed)
 
@@ -163,8 +309,10 @@ class BaseProcess:
         for v in self.network.nodes.uids:
             tv = TemporalNode(v)
             tn.add_node(tv)
-            tv[start_time, 'color'] = self.state_to_color(evolution.loc[(
-                evolution['time'] == start_time) & (evolution['node'] == v)]['state'].values[0])
+            tv[start_time, 'color'] = self.state_to_color(initial_state[v])
+
+        changes = zip(evolution['node'].tolist(), evolution['time'].tolist(),
+                      evolution['state'].tolist())
 
         # if process is simulated on temporal network
         if isinstance(self.network, TemporalNetwork):
@@ -173,9 +321,8 @@ class BaseProcess:
                     edge.start, start_time), end=min(end_time, edge.end))
 
             # update states
-            for index, row in evolution.iterrows():
-                tn.nodes[row['node']][row['time'],
-                                      'color'] = self.state_to_color(row['state'])
+            for v, time, state in changes:
+                tn.nodes[v][time, 'color'] = self.state_to_color(state)
         # if process is simulated on static network
         else:
             # add all edges
@@ -184,12 +331,12 @@ class BaseProcess:
                             end=end_time*timescale)
 
             # update states
-            for index, row in evolution.iterrows():
-                tn.nodes[row['node']][row['time']*timescale,
-                                      'color'] = self.state_to_color(row['state'])
+            for v, time, state in changes:
+                tn.nodes[v][time*timescale,
+                            'color'] = self.state_to_color(state)
         return tn.plot(node_color=self.state_to_color(False), **kwargs)
 
-    def to_directed_acylic_graph(self, data: DataFrame, run_id: Optional[int] = 0, time_delta: Optional[int] = None, states: Optional[Iterable[Any]] = None) -> DirectedAcyclicGraph:
+    def to_directed_acylic_graph(self, data: Union[DataFrame, ExperimentRecorder], run_id: Optional[int] = 0, time_delta: Optional[int] = None, states: Optional[Iterable[Any]] = None) -> DirectedAcyclicGraph:
         """Returns a directed acyclic graph representation of all state changes over time.
         In this graph an edge (v_t' -> w_t) indicates that node w changed to state x at time t after a 
         connected node v previously changed its state to x at time t' < t (i.e. (v,w) exists in the network).
@@ -198,7 +345,7 @@ class BaseProcess:
 
         Parameters
         ----------
-        data: DataFrame
+        data: Union[DataFrame, ExperimentRecorder]
             recorded state changes of nodes, as returned by `run_experiment`
 
         run_id: Optional[int]=0
@@ -212,45 +359,56 @@ class BaseProcess:
             Only changes to states in this set will be considered. If None (default) all state changes will be considered
         """
         dag = DirectedAcyclicGraph(uid='{0}'.format(run_id))
-        run = data.loc[data['run_id'] == run_id]
+        _, run = next(self._experiment_runs(data, [run_id]))
+
+        times = run['time'].tolist()
+        nodes = run['node'].tolist()
+        values = run['state'].tolist()
+
+        # sort state changes of each node by time to look up the last
+        # change prior to a given time in O(log n)
+        changes: Dict[str, List[int]] = defaultdict(list)
+        for i in np.argsort(run['time'], kind='stable').tolist():
+            changes[nodes[i]].append(i)
+        change_times = {v: np.array([times[i] for i in rows])
+                        for v, rows in changes.items()}
+
+        predecessors = self._network.predecessors
+        if states is not None:
+            states = set(states)
 
-        for index, row in run.iterrows():
+        for t, w, state in zip(times, nodes, values):
             # add temporal node
-            state = row['state']
-            if states and state not in states:
+            if states is not None and state not in states:
                 continue
 
-            w = row['node']
-            t = row['time']
             uid = '{0}-{1}'.format(w, t)
             dag.add_node(uid, node_label=w, time=t, state=state)
 
             # find predecessor of node v that last changed its state
-            predecessors = []
-            for v in self._network.predecessors[w]:
-
-                # get all state changes of node v prior to time t
-                candidates = run.loc[(run['node'] == v.uid) & (run['time'] < t)]
-
-                if len(candidates) > 0:
-
-                    # find time stamp and new state of last state change
-                    r = candidates['time'].argmax()
-                    last_time = candidates.iloc[r]['time']
-                    last_state = candidates.iloc[r]['state']
-
-                    # check last state change and time difference
-                    if last_state in states and (time_delta is None or (t-last_time) < time_delta):
-                        pred_uid = '{0}-{1}'.format(v.uid, last_time)
-                        if pred_uid not in dag.nodes:
-                            predecessors.append(
-                                Node(pred_uid, node_label=v.uid, time=last_time, state=last_state))
-                        else:
-                            predecessors.append(dag.nodes[pred_uid])
-                        # predecessors = ['{0}-{1}'.format(v.uid, t_p)]
-                    # elif :
-
-            for v in predecessors:
+            preds = []
+            for v in predecessors[w]:
+                if v.uid not in changes:
+                    continue
+
+                # last state change of node v prior to time t
+                pos = np.searchsorted(change_times[v.uid], t, side='left')
+                if pos == 0:
+                    continue
+                r = changes[v.uid][pos-1]
+                last_time = times[r]
+                last_state = values[r]
+
+                # check last state change and time difference
+                if (states is None or last_state in states) and (time_delta is None or (t-last_time) < time_delta):
+                    pred_uid = '{0}-{1}'.format(v.uid, last_time)
+                    if pred_uid not in dag.nodes:
+                        preds.append(
+                            Node(pred_uid, node_label=v.uid, time=last_time, state=last_state))
+                    else:
+                        preds.append(dag.nodes[pred_uid])
+
+            for v in preds:
                 dag.add_edge(v, dag.nodes[uid])
 
         return dag
@@ -35,7 +35,8 @@ from pathpy.models.network import Edge
 
 from pathpy.algorithms.matrices import adjacency_matrix
 
-from .sampling import VoseAliasSampling
+from .sampling import CSRAliasSampling
+from .recorder import ExperimentRecorder
 from .process import BaseProcess
 
 # create custom types
@@ -150,29 +151,25 @@ class RandomWalk(BaseProcess):
         VoseAliasSampling, HigherOrderRandomWalk, BaseProcess
         """
 
-        # transition matrix of random walk
-        self._transition_matrix = RandomWalk.compute_transition_matrix(
-            network, weight, restart_prob)
+        # parameters of the random walk
+        self._weight: Optional[Weight] = weight
+        self._restart_prob: float = restart_prob
 
-        # initialize Vose Alias Samplers
-        self.reverse_index = {v: k for k, v in network.nodes.index.items()}
-        self.samplers = {v: VoseAliasSampling(np.nan_to_num(np.ravel(
-            self._transition_matrix[
-                network.nodes.index[v], :].todense()))) for v in network.nodes.uids}
+        # sparse transition matrix of the walk without restarts, where
+        # restarts are added as rank-one term when they are needed
+        self._edge_transitions, self._restarts = \
+            RandomWalk._transition_terms(network, weight, restart_prob)
+        self._transition_matrix: Optional[sp.sparse.csr_matrix] = None
 
-        # compute eigenvectors and eigenvalues of transition matrix
-        if network.number_of_nodes() > 2:
-            _, eigenvectors = spl.eigs(
-                self._transition_matrix.transpose(), k=1, which='LM')
-            pi = eigenvectors.reshape(eigenvectors.size, )
-        else:
-            eigenvals, eigenvectors = spla.eig(
-                self._transition_matrix.transpose().toarray())
-            x = np.argsort(-eigenvals)
-            pi = eigenvectors[x][:, 0]
+        # initialize alias tables of all nodes in flat arrays, restarts are
+        # drawn separately so that the tables only contain the edges
+        self.index = network.nodes.index
+        self.reverse_index = {v: k for k, v in self.index.items()}
+        self._sampler = CSRAliasSampling(
+            adjacency_matrix(network, weight=weight))
 
         # calculate stationary visitation probabilities
-        self._stationary_probabilities = np.real(pi/np.sum(pi))
+        self._stationary_probabilities = self._leading_eigenvector()
 
         self._network = network
         self.init(self.random_seed())
@@ -197,13 +194,13 @@ class RandomWalk(BaseProcess):
         # set number of times each node has been visited
         self._visitations = np.ravel(
             np.zeros(shape=(1, self._network.number_of_nodes())))
-        self._visitations[self._network.nodes.index[seed]] = 1
+        self._visitations[self.index[seed]] = 1
 
     def random_seed(self) -> str:
         """
         Returns a random node from the network, chosen uniformly at random
         """
-        return np.random.choice(list(self._network.nodes.uids))
+        return self._rng.choice(list(self._network.nodes.uids))
 
     def step(self) -> Iterable[str]:
         """
@@ -212,8 +209,8 @@ class RandomWalk(BaseProcess):
         """
 
         # determine next node
-        next_node = self.reverse_index[self.samplers[self._current_node].sample(
-        )]
+        next_node = self.reverse_index[int(self._next_nodes(
+            np.array([self.index[self._current_node]]), self._rng)[0])]
         # TODO: assertion will not hold if restart_prob > 0
         # assert (self._current_node, next_node) in self._network.edges, 'Assertion Error: {0} not in edge list'.format(
         #     (self._current_node, next_node))
@@ -222,12 +219,101 @@ class RandomWalk(BaseProcess):
         self._current_node = next_node
 
         # increment visitations and current time
-        self._visitations[self._network.nodes.index[self._current_node]] += 1
+        self._visitations[self.index[self._current_node]] += 1
         self._t += 1
 
         # return tuple of changed nodes, where the first node is the currently visited node
         return (self._current_node, previous_node)
 
+    def run_batch(self, steps: int, runs: Union[int, Iterable[str]] = 1,
+                  rng: Optional[Any] = None) -> np.ndarray:
+        """Simulates multiple independent random walks at once and returns their trajectories.
+
+        Different from `run_experiment`, which simulates one walker after the other and
+        records state changes in a data frame, this function advances all walkers
+        simultaneously. Each step draws the successors of all walkers with a single
+        vectorized call based on alias tables that are stored in flat arrays aligned with
+        the CSR representation of the (weighted) adjacency matrix. Restarts are drawn
+        for all walkers at once as well. Walkers in nodes without successors restart in
+        a node chosen uniformly at random.
+
+        Parameters
+        ----------
+        steps: int
+            The number of steps of each random walk
+
+        runs: Union[int, Iterable[str]] = 1
+            Either the number of walkers, which will start in nodes chosen uniformly at
+            random, or an iterable of node uids in which the walkers start.
+
+        rng: Optional[Any] = None
+            numpy random generator (or RandomState) used to draw random numbers. If None
+            (default), the global numpy random state is used.
+
+        Returns
+        -------
+        np.ndarray
+            Integer array with shape (walkers, steps+1), where entry [i, t] is the index
+            of the node visited by walker i at time t. Node indices correspond to
+            `network.nodes.index`.
+
+        Examples
+        --------
+        Generate 1000 random walks with 100 steps each and map them to node uids
+
+        >>> import numpy as np
+        >>> import pathpy as pp
+        >>> n = pp.Network(directed=False)
+        >>> n.add_edge('a', 'b', weight=1, uid='a-b')
+        >>> n.add_edge('b', 'c', weight=1, uid='b-c')
+        >>> n.add_edge('c', 'a', weight=2, uid='c-a')
+        >>> rw = pp.processes.RandomWalk(n, weight='weight', restart_prob=0.1)
+        >>> walks = rw.run_batch(steps=100, runs=1000,
+        ...                      rng=np.random.default_rng(42))
+        >>> walks.shape
+        (1000, 101)
+        >>> uids = np.array(list(n.nodes.index))
+        >>> uids[walks[0, :5]]
+        array(['c', 'a', 'c', 'a', 'c'], dtype='<U1')
+        """
+        rng = np.random if rng is None else rng
+        n = self._network.number_of_nodes()
+
+        # index of start node for each walker
+        if isinstance(runs, int):
+            current = (rng.random(runs) * n).astype(np.int64)
+        else:
+            current = np.array([self.index[v] for v in runs], dtype=np.int64)
+
+        walks = np.empty((len(current), steps+1), dtype=np.int64)
+        walks[:, 0] = current
+
+        for t in range(1, steps+1):
+            current = self._next_nodes(current, rng)
+            walks[:, t] = current
+
+        return walks
+
+    def _next_nodes(self, current: np.ndarray, rng: Optional[Any] = None) -> np.ndarray:
+        """Draws the indices of the next nodes for walkers in the given nodes.
+
+        Walkers restart with probability restart_prob in a node chosen uniformly at
+        random, all other walkers move to a successor drawn from the alias tables.
+        Walkers in nodes without successors restart as well.
+        """
+        rng = np.random if rng is None else rng
+        n = self._network.number_of_nodes()
+
+        nodes = self._sampler.sample(current, rng)
+
+        # teleport walkers that restart or that are stuck in a node
+        if self._restart_prob > 0:
+            nodes[rng.random(len(nodes)) < self._restart_prob] = -1
+        restart = nodes < 0
+        if restart.any():
+            nodes[restart] = (rng.random(restart.sum()) * n).astype(np.int64)
+        return nodes
+
     def node_state(self, v: str) -> bool:
         """
         Returns a boolean variable indicating whether the walker is currently 
@@ -281,33 +367,100 @@ class RandomWalk(BaseProcess):
             If specified, the numerical edge attribute that shall be used in the biased
             transition probabilities of the random walk.
 
+        restart_prob: float = 0
+
+            The per-step probability that a random walker restarts in a random node.
+            If positive, the returned matrix is dense.
+
+        """
+        T, restarts = RandomWalk._transition_terms(
+            network, weight, restart_prob)
+
+        # restarts turn the transition matrix into a dense matrix
+        if restart_prob > 0:
+            n = network.number_of_nodes()
+            T = sp.sparse.csr_matrix(
+                (1-restart_prob) * T.toarray() + restarts[:, None] / n)
+        return T
+
+    @staticmethod
+    def _transition_terms(network: Network, weight: Optional[Weight] = None,
+                          restart_prob: float = 0) -> Tuple[sp.sparse.csr_matrix, np.ndarray]:
+        """Returns the sparse transition matrix T of a random walk without restarts
+        and the restart probabilities r of all nodes, where nodes without successors
+        always restart if restart_prob > 0. The transition matrix with restarts is
+        given by (1-restart_prob) * T + r 1^T / n.
         """
         A = adjacency_matrix(network, weight=weight)
-        D = A.sum(axis=1)
-        n = network.number_of_nodes()
-        T = sp.sparse.lil_matrix((n, n))
-        zero_deg = 0
-        for i in range(n):
-            if D[i] == 0:
-                zero_deg += 1
-            for j in range(n):
-                if D[i] > 0:
-                    T[i, j] = restart_prob * \
-                        (1./n) + (1-restart_prob)*A[i, j]/D[i]
-                else:
-                    if restart_prob > 0:
-                        T[i, j] = 1./n
-                    else:
-                        T[i, j] = 0.0
+        D = np.ravel(A.sum(axis=1))
+
+        zero_deg = np.count_nonzero(D == 0)
         if zero_deg > 0:
             LOG.warning(
                 'Network contains {0} nodes with zero out-degree'.format(zero_deg))
-        return T.tocsr()
+
+        # row-normalize adjacency matrix
+        with np.errstate(divide='ignore'):
+            D_inv = np.where(D > 0, 1./D, 0.)
+        T = sp.sparse.csr_matrix(sp.sparse.diags(D_inv) @ A)
+
+        restarts = np.zeros(network.number_of_nodes())
+        if restart_prob > 0:
+            restarts[:] = restart_prob
+            restarts[D == 0] = 1.
+        return T, restarts
+
+    def _transition_operator(self, transposed: bool = False) -> spl.LinearOperator:
+        """Returns the (transposed) transition matrix as linear operator, which adds
+        restarts to the sparse transition matrix without creating a dense matrix.
+        """
+        T = self._edge_transitions.transpose().tocsr() if transposed \
+            else self._edge_transitions
+        if self._restart_prob == 0:
+            return spl.aslinearoperator(T)
+
+        n = T.shape[0]
+        p = 1 - self._restart_prob
+        r = self._restarts
+
+        def matvec(x: np.ndarray) -> np.ndarray:
+            x = np.ravel(x)
+            if transposed:
+                return p * (T @ x) + np.dot(r, x) / n
+            return p * (T @ x) + r * np.sum(x) / n
+
+        return spl.LinearOperator((n, n), matvec=matvec,
+                                  dtype=T.dtype)
+
+    def _leading_eigenvector(self, **kwargs: Any) -> np.ndarray:
+        """Returns the normalized leading left eigenvector of the transition matrix
+        """
+        if self._edge_transitions.shape[0] > 2:
+            _, eigenvectors = spl.eigs(
+                self._transition_operator(transposed=True), k=1, which='LM', **kwargs)
+            pi = eigenvectors.reshape(eigenvectors.size, )
+        else:
+            eigenvals, eigenvectors = spla.eig(
+                self.transition_matrix.transpose().toarray())
+            x = np.argsort(-eigenvals)
+            pi = eigenvectors[x][:, 0]
+        return np.real(pi/np.sum(pi))
 
     @property
     def transition_matrix(self) -> sp.sparse.csr_matrix:
         """Returns the transition matrix of the random walk
-        """
+
+        With restarts, the transition matrix is dense and it is only created
+        when it is accessed for the first time.
+        """
+        if self._transition_matrix is None:
+            n = self._edge_transitions.shape[0]
+            if self._restart_prob > 0:
+                self._transition_matrix = sp.sparse.csr_matrix(
+                    (1-self._restart_prob) * self._edge_transitions.toarray()
+                    + self._restarts[:, None] / n)
+            else:
+                self._transition_matrix = self._edge_transitions
         return self._transition_matrix
 
     def transition_probabilities(self, node: str) -> np.array:
@@ -317,9 +470,10 @@ class RandomWalk(BaseProcess):
         node to all other nodes in the network.
 
         """
-        return np.nan_to_num(np.ravel(
-            self._transition_matrix[
-                self._network.nodes.index[node], :].todense()))
+        i = self.index[node]
+        n = self._edge_transitions.shape[0]
+        return np.nan_to_num((1-self._restart_prob) * np.ravel(
+            self._edge_transitions[i, :].toarray()) + self._restarts[i] / n)
 
     def visitation_probabilities(self, t, seed: str) -> np.ndarray:
         """Calculates visitation probabilities of nodes after t steps for a given start node
@@ -328,9 +482,12 @@ class RandomWalk(BaseProcess):
         """
         assert seed in self._network.nodes.uids
 
-        initial_dist = np.zeros(self._network.number_of_nodes())
-        initial_dist[self._network.nodes.index[seed]] = 1.0
-        return np.dot(initial_dist, (self._transition_matrix**t).todense())
+        dist = np.zeros(self._network.number_of_nodes())
+        dist[self.index[seed]] = 1.0
+        T = self._transition_operator(transposed=True)
+        for _ in range(t):
+            dist = T.matvec(dist)
+        return dist.reshape(1, -1)
 
     def transition_matrix_pd(self) -> DataFrame:
         """
@@ -342,15 +499,15 @@ class RandomWalk(BaseProcess):
     def current_node(self) -> str:
         return self._current_node
 
-    def get_path(self, data: DataFrame, run_id: Optional[int] = 0, first_order: Optional[bool] = True) -> Path:
+    def get_path(self, data: Union[DataFrame, ExperimentRecorder], run_id: Optional[int] = 0, first_order: Optional[bool] = True) -> Path:
         """Returns a path that represents the sequence of (first-order) nodes traversed
         by a single random walk.
 
         Parameters
         ----------
 
-        data: DataFrame
-            Pandas data frame containing the trajectory of one or more (higher-order) random walks, generated by a call of `run_experiment`
+        data: Union[DataFrame, ExperimentRecorder]
+            Pandas data frame or recorder containing the trajectory of one or more (higher-order) random walks, generated by a call of `run_experiment`
 
         run_uid: Optional[int]=0
                Uid of the random walk simulation to be returns as Path (default: 0).
@@ -366,21 +523,25 @@ class RandomWalk(BaseProcess):
 
         Path
         """
+        _, run = next(self._experiment_runs(data, [run_id]))
+        return self._walk_to_path(run)
+
+    def _walk_to_path(self, run: dict) -> Path:
+        """Returns the path traversed by a walker, given the recorded columns of a run."""
         # list of traversed nodes starting with seed node
-        walk_steps = list(data.loc[(data['run_id'] == run_id) & (
-            data['state'] == True)]['node'].values)
+        walk_steps = run['node'][run['state'] == True].tolist()
 
         # generate Path
-        return Path(*[walk_steps[i] for i in range(len(walk_steps))], directed=True, ordered=True)
+        return Path(*walk_steps, directed=True, ordered=True)
 
-    def get_paths(self, data: DataFrame, run_ids: Optional[Iterable] = None) -> PathCollection:
+    def get_paths(self, data: Union[DataFrame, ExperimentRecorder], run_ids: Optional[Iterable] = None) -> PathCollection:
         """Returns a PathCollection where each
 
         Parameters
         ----------
 
-        data: DataFrame
-            Pandas data frame containing the trajectory of one or more random walks, generated by 
+        data: Union[DataFrame, ExperimentRecorder]
+            Pandas data frame or recorder containing the trajectory of one or more random walks, generated by 
             `run_experiment`
 
         run_uids: Optional[Iterable]=None
@@ -398,14 +559,10 @@ class RandomWalk(BaseProcess):
         PathCollection
         """
 
-        if not run_ids:  # generate paths for all run_ids in the data frame
-            runs = data['run_id'].unique()
-        else:
-            runs = run_ids
-
         pc = PathCollection()
-        for i in runs:
-            pc.add(self.get_path(data, i))
+        # generate paths for all run_ids in the data if run_ids is None
+        for _, run in self._experiment_runs(data, run_ids or None):
+            pc.add(self._walk_to_path(run))
 
         return pc
 
@@ -425,10 +582,7 @@ class RandomWalk(BaseProcess):
         """
         _p = self._stationary_probabilities
         if kwargs:
-            _, eigenvectors = sp.sparse.linalg.eigs(
-                self._transition_matrix.transpose(), k=1, which='LM', **kwargs)
-            pi = eigenvectors.reshape(eigenvectors.size, )
-            _p = np.real(pi/np.sum(pi))
+            _p = self._leading_eigenvector(**kwargs)
         return _p
 
     @property
@@ -557,6 +711,7 @@ class HigherOrderRandomWalk(RandomWalk):
 
     def __init__(self, higher_order_network: HigherOrderNetwork, first_order_network, weight: Optional[Weight] = None, restart_prob: float = 0) -> None:
         self._first_order_network = first_order_network
+        self._first_order_index = first_order_network.nodes.index
         RandomWalk.__init__(self, higher_order_network, weight, restart_prob)
 
     def init(self, seed) -> None:
@@ -584,7 +739,7 @@ class HigherOrderRandomWalk(RandomWalk):
         # set number of times each first-order node has been visited
         self._first_order_visitations = np.ravel(
             np.zeros(shape=(1, self._first_order_network.number_of_nodes())))
-        self._first_order_visitations[self._first_order_network.nodes.index[self._network.nodes[seed].relations[-1]]] = 1
+        self._first_order_visitations[self._first_order_index[self._network.nodes[seed].relations[-1]]] = 1
         RandomWalk.init(self, seed)
 
     @property
@@ -605,8 +760,8 @@ class HigherOrderRandomWalk(RandomWalk):
         for v in self._network.nodes:
             # newly visited node in first_order network
             v1 = v.relations[-1]
-            first_order_stationary_state[self._first_order_network.nodes.index[v1]
-                                         ] += higher_order_stationary_dist[self._network.nodes.index[v.uid]]
+            first_order_stationary_state[self._first_order_index[v1]
+                                         ] += higher_order_stationary_dist[self.index[v.uid]]
         return first_order_stationary_state
 
     @property
@@ -646,11 +801,11 @@ class HigherOrderRandomWalk(RandomWalk):
         """
         (current_node, previous_node) = RandomWalk.step(self)
 
-        self._first_order_visitations[self._first_order_network.nodes.index[self._network.nodes[current_node].relations[-1]]] += 1
+        self._first_order_visitations[self._first_order_index[self._network.nodes[current_node].relations[-1]]] += 1
 
         return (current_node, previous_node)
 
-    def plot(self, data: DataFrame, run_id: Optional[int] = 0, timescale: Optional[int] = 1, **kwargs):
+    def plot(self, data: Union[DataFrame, ExperimentRecorder], run_id: Optional[int] = 0, timescale: Optional[int] = 1, **kwargs):
         """Displays an interactive plot of the random walk dynamics, projected to a first-order network based on a recorded simulation experiment
 
         Parameters
@@ -704,8 +859,8 @@ class HigherOrderRandomWalk(RandomWalk):
         TemporalNetwork, plot, RandomWalk, HigherOrderRandomWalk, EpidemicSIR
         """
 
-        evolution: DataFrame = data.loc[data['run_id'] == run_id]
-        steps = evolution.max()['time']
+        _, evolution = next(self._experiment_runs(data, [run_id]))
+        steps = evolution['time'].max()
 
         # create network with temporal attributes
         tn = TemporalNetwork(directed=self.network.directed)
@@ -721,22 +876,23 @@ class HigherOrderRandomWalk(RandomWalk):
             tn.nodes[v][0, 'color'] = self.state_to_color(False)
 
         # update state
-        for index, row in evolution.iterrows():
-            higher_order_node = self._network.nodes[row['node']]
+        for v, time, state in zip(evolution['node'].tolist(), evolution['time'].tolist(),
+                                  evolution['state'].tolist()):
+            higher_order_node = self._network.nodes[v]
             first_order_node = higher_order_node.relations[-1]
-            tn.nodes[first_order_node][row['time']*timescale,
-                                       'color'] = self.state_to_color(row['state'])
+            tn.nodes[first_order_node][time*timescale,
+                                       'color'] = self.state_to_color(state)
         return tn.plot(node_color=self.state_to_color(False), **kwargs)
 
-    def get_path(self, data: DataFrame, run_id: Optional[int] = 0) -> Path:
+    def get_path(self, data: Union[DataFrame, ExperimentRecorder], run_id: Optional[int] = 0) -> Path:
         """Returns a path that represents the sequence of (first-order) nodes traversed
         by a single random walk.
 
         Parameters
         ----------
 
-        data: DataFrame
-            Pandas data frame containing the trajectory of one or more (higher-order) random walks, generated by a call of `run_experiment`
+        data: Union[DataFrame, ExperimentRecorder]
+            Pandas data frame or recorder containing the trajectory of one or more (higher-order) random walks, generated by a call of `run_experiment`
 
         run_uid: Optional[int]=0
                Uid of the random walk simulation to be returns as Path (default: 0).
@@ -748,9 +904,13 @@ class HigherOrderRandomWalk(RandomWalk):
             Path object containing the sequence of nodes traversed by the random walk
 
         """
+        _, run = next(self._experiment_runs(data, [run_id]))
+        return self._walk_to_path(run)
+
+    def _walk_to_path(self, run: dict) -> Path:
+        """Returns the first-order path traversed by a walker, given the recorded columns of a run."""
         # list of traversed nodes starting with seed node
-        walk_steps = list(data.loc[(data['run_id'] == run_id) & (
-            data['state'] == True)]['node'].values)
+        walk_steps = run['node'][run['state'] == True].tolist()
 
         # for higher-order random walk, seed node is a higher-order node
         # consisting of one or more edges
@@ -763,14 +923,14 @@ class HigherOrderRandomWalk(RandomWalk):
 
         return Path(*walk)
 
-    def get_paths(self, data: DataFrame, run_ids: Optional[Iterable] = None) -> PathCollection:
+    def get_paths(self, data: Union[DataFrame, ExperimentRecorder], run_ids: Optional[Iterable] = None) -> PathCollection:
         """Returns a PathCollection where each
 
         Parameters
         ----------
 
-        data: DataFrame
-            Pandas data frame containing the trajectory of one or more random walks, generated by 
+        data: Union[DataFrame, ExperimentRecorder]
+            Pandas data frame or recorder containing the trajectory of one or more random walks, generated by 
             `run_experiment`
 
         run_uids: Optional[Iterable]=None
@@ -784,13 +944,9 @@ class HigherOrderRandomWalk(RandomWalk):
 
         """
 
-        if not run_ids:  # generate paths for all run_ids in the data frame
-            runs = data['run_id'].unique()
-        else:
-            runs = run_ids
-
         pc = PathCollection()
-        for i in runs:
-            pc.add(self.get_path(data, i))
+        # generate paths for all run_ids in the data if run_ids is None
+        for _, run in self._experiment_runs(data, run_ids or None):
+            pc.add(self._walk_to_path(run))
 
         return pc
@@ -0,0 +1,377 @@
+"""Columnar recording of node state changes in simulation experiments"""
+# !/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : recorder.py -- Columnar storage for simulation results
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 07:49 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+from __future__ import annotations
+import os
+from typing import Any, Dict, List, Optional, Iterable, Union
+
+import numpy as np
+from pandas import DataFrame
+
+from pathpy import logger
+from pathpy.utils.errors import MissingModuleError, ParameterError
+
+# create logger
+LOG = logger(__name__)
+
+# names of the recorded columns
+COLUMNS = ('run_id', 'time', 'node_idx', 'state')
+
+
+class ExperimentRecorder:
+    """Columnar storage for the node state changes recorded in simulation experiments.
+
+    Instead of creating one dictionary per recorded state change, the recorder
+    writes run ids, times, node indices and states into preallocated typed
+    arrays. Once a chunk of arrays is full, it is either kept in memory or - if
+    a spill directory is given - written to disk as an NPZ or Parquet file, so
+    that the memory needed for very large experiments is bounded by the chunk
+    size.
+
+    The data types of time and state columns are inferred from the recorded
+    values, i.e. boolean or integer states (as used by RandomWalk and
+    EpidemicSIR) are stored as compact numeric arrays. If later values do not
+    fit the data type of a column, e.g. float times after integer times, the
+    column is promoted to a common type rather than truncating values.
+
+    Parameters
+    ----------
+
+    nodes: Iterable[str]
+
+        uids of the nodes of the network on which the process is simulated,
+        where the i-th uid corresponds to node index i.
+
+    seeds: Optional[list] = None
+
+        seeds of the simulation runs, where seeds[i] is the seed of run i
+
+    chunk_size: int = 65536
+
+        number of rows in each chunk of preallocated arrays
+
+    spill: Optional[str] = None
+
+        directory in which full chunks are stored. If None (default), all
+        chunks are kept in memory.
+
+    spill_format: str = 'npz'
+
+        file format of spilled chunks, either 'npz' or 'parquet'. Parquet files
+        require the package pyarrow.
+
+    Examples
+    --------
+
+    Record the state changes of random walks and convert them to a data frame
+
+    >>> import pathpy as pp
+    >>> n = pp.Network(directed=False)
+    >>> n.add_edge('a', 'b')
+    >>> rw = pp.processes.RandomWalk(n)
+    >>> data = rw.run_experiment(steps=10, runs=5, columnar=True)
+    >>> data.columns()['node_idx']
+    array([0, 1, 1, 0, ... ])
+    >>> data.to_dataframe()
+        run_id seed  time node  state
+    0        0    a     0    a   True
+    ...
+
+    """
+
+    def __init__(self, nodes: Iterable[str], seeds: Optional[list] = None,
+                 chunk_size: int = 65536, spill: Optional[str] = None,
+                 spill_format: str = 'npz') -> None:
+        """Initialize an empty recorder."""
+
+        if spill_format not in ('npz', 'parquet'):
+            msg = 'Unknown spill format {0}'.format(spill_format)
+            LOG.error(msg)
+            raise ParameterError(msg)
+
+        self.nodes: np.ndarray = np.array(list(nodes), dtype=object)
+        self.seeds: list = list(seeds) if seeds is not None else []
+        self.chunk_size: int = chunk_size
+        self.spill: Optional[str] = spill
+        self.spill_format: str = spill_format
+
+        if spill is not None:
+            os.makedirs(spill, exist_ok=True)
+
+        # data types of columns, inferred and promoted from recorded values
+        self._dtypes: Dict[str, Any] = {
+            'run_id': np.int32, 'node_idx': np.int64}
+
+        # full chunks in memory or file names of spilled chunks
+        self._chunks: List[Union[Dict[str, np.ndarray], str]] = []
+
+        # the chunk that is currently written to
+        self._current: Optional[Dict[str, np.ndarray]] = None
+        self._fill: int = 0
+        self._rows: int = 0
+
+    def __len__(self) -> int:
+        """Returns the number of recorded rows."""
+        return self._rows
+
+    def _new_chunk(self) -> None:
+        """Allocates arrays for a new chunk."""
+        self._current = {c: np.empty(self.chunk_size, dtype=self._dtypes[c])
+                         for c in COLUMNS}
+        self._fill = 0
+
+    def record(self, run_id: int, time: Any, node_idx: Union[np.ndarray, list],
+               states: Union[np.ndarray, list]) -> None:
+        """Records the states of multiple nodes at a given time.
+
+        Parameters
+        ----------
+
+        run_id: int
+
+            identifier of the simulation run
+
+        time: Any
+
+            the time at which the state changes occurred
+
+        node_idx: Union[np.ndarray, list]
+
+            indices of the nodes whose state has changed
+
+        states: Union[np.ndarray, list]
+
+            new states of the nodes, where states[i] is the state of node
+            node_idx[i]
+        """
+        node_idx = np.asarray(node_idx, dtype=np.int64)
+        states = np.asarray(states)
+        if len(node_idx) == 0:
+            return
+
+        self._promote('time', np.asarray(time))
+        self._promote('state', states)
+        if self._current is None:
+            self._new_chunk()
+
+        # write values, possibly spanning multiple chunks
+        start = 0
+        while start < len(node_idx):
+            size = min(len(node_idx) - start, self.chunk_size - self._fill)
+            end = self._fill + size
+            chunk = self._current
+            chunk['run_id'][self._fill:end] = run_id
+            chunk['time'][self._fill:end] = time
+            chunk['node_idx'][self._fill:end] = node_idx[start:start+size]
+            chunk['state'][self._fill:end] = states[start:start+size]
+            self._fill = end
+            self._rows += size
+            start += size
+
+            if self._fill == self.chunk_size:
+                self._store_chunk()
+                self._new_chunk()
+
+    def extend(self, columns: Dict[str, np.ndarray]) -> None:
+        """Appends columns recorded elsewhere, e.g. in another process.
+
+        Parameters
+        ----------
+
+        columns: Dict[str, np.ndarray]
+
+            dictionary with arrays for the columns run_id, time, node_idx and
+            state, as returned by `columns`.
+        """
+        if len(columns['node_idx']) == 0:
+            return
+        self.flush()
+        self._promote('time', np.asarray(columns['time']))
+        self._promote('state', np.asarray(columns['state']))
+        self._current = {c: np.asarray(columns[c], dtype=self._dtypes[c])
+                         for c in COLUMNS}
+        self._fill = len(columns['node_idx'])
+        self._rows += self._fill
+        self._store_chunk()
+
+    def _promote(self, column: str, values: np.ndarray) -> None:
+        """Sets or promotes the data type of a column such that it can hold
+        the given values, where the current chunk is converted if needed.
+        Chunks stored before keep their data type and are promoted when
+        they are concatenated."""
+        dtype = _column_dtype(values)
+        if column in self._dtypes:
+            dtype = np.result_type(self._dtypes[column], dtype)
+            if dtype == self._dtypes[column]:
+                return
+        self._dtypes[column] = dtype
+        if self._current is not None:
+            self._current[column] = self._current[column].astype(dtype)
+
+    def _store_chunk(self) -> None:
+        """Moves the filled part of the current chunk to the list of chunks."""
+        if self._current is None or self._fill == 0:
+            return
+
+        chunk = {c: self._current[c][:self._fill] for c in COLUMNS}
+        self._current = None
+        self._fill = 0
+
+        if self.spill is None:
+            self._chunks.append(chunk)
+            return
+
+        file = os.path.join(self.spill, 'chunk_{0:06d}.{1}'.format(
+            len(self._chunks), self.spill_format))
+        if self.spill_format == 'npz':
+            np.savez(file, **chunk)
+        else:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ModuleNotFoundError:
+                msg = 'Package pyarrow is required to write parquet files. Please install module, e.g., using "pip install pyarrow".'
+                LOG.error(msg)
+                raise MissingModuleError(msg)
+            pq.write_table(pa.table(chunk), file)
+        self._chunks.append(file)
+
+    def flush(self) -> None:
+        """Stores the partially filled current chunk."""
+        self._store_chunk()
+
+    def _load_chunk(self, chunk: Union[Dict[str, np.ndarray], str]) -> Dict[str, np.ndarray]:
+        """Returns the columns of a chunk that is stored in memory or on disk."""
+        if isinstance(chunk, dict):
+            return chunk
+        if chunk.endswith('.npz'):
+            with np.load(chunk, allow_pickle=True) as data:
+                return {c: data[c] for c in COLUMNS}
+        import pyarrow.parquet as pq
+        table = pq.read_table(chunk)
+        return {c: table.column(c).to_numpy() for c in COLUMNS}
+
+    def chunks(self) -> Iterable[Dict[str, np.ndarray]]:
+        """Iterates through the columns of all chunks in the order of recording."""
+        for chunk in self._chunks:
+            yield self._load_chunk(chunk)
+        if self._current is not None and self._fill > 0:
+            yield {c: self._current[c][:self._fill] for c in COLUMNS}
+
+    def columns(self, run_id: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Returns the recorded data as a dictionary of arrays.
+
+        Parameters
+        ----------
+
+        run_id: Optional[int] = None
+
+            If given, only rows recorded for the run with this id are
+            returned.
+
+        Returns
+        -------
+
+        Dict[str, np.ndarray]
+
+            dictionary with arrays for the columns run_id, time, node_idx and
+            state, ordered in the sequence of recording.
+        """
+        parts: Dict[str, list] = {c: [] for c in COLUMNS}
+        for chunk in self.chunks():
+            mask = slice(None) if run_id is None else chunk['run_id'] == run_id
+            for c in COLUMNS:
+                parts[c].append(chunk[c][mask])
+
+        if not parts['run_id']:
+            return {c: np.empty(0, dtype=self._dtypes.get(c, np.int64))
+                    for c in COLUMNS}
+        return {c: np.concatenate(parts[c]) for c in COLUMNS}
+
+    @property
+    def run_ids(self) -> np.ndarray:
+        """Returns the sorted ids of all recorded runs."""
+        return np.unique(np.concatenate(
+            [np.empty(0, dtype=np.int32)] +
+            [np.unique(chunk['run_id']) for chunk in self.chunks()]))
+
+    def to_dataframe(self) -> DataFrame:
+        """Returns the recorded data as a pandas data frame.
+
+        The data frame has the columns run_id, seed, time, node and state, as
+        returned by `BaseProcess.run_experiment`.
+        """
+        data = self.columns()
+        seeds = np.empty(len(self.seeds), dtype=object)
+        seeds[:] = self.seeds
+        return DataFrame({
+            'run_id': data['run_id'],
+            'seed': seeds[data['run_id']] if len(seeds) else None,
+            'time': data['time'],
+            'node': self.nodes[data['node_idx']],
+            'state': data['state']})
+
+    @classmethod
+    def from_dataframe(cls, frame: DataFrame, nodes: Iterable[str]) -> ExperimentRecorder:
+        """Creates a recorder from a data frame returned by `run_experiment`.
+
+        Parameters
+        ----------
+
+        frame: DataFrame
+
+            data frame with columns run_id, time, node and state
+
+        nodes: Iterable[str]
+
+            uids of the nodes of the network, where the i-th uid corresponds
+            to node index i.
+        """
+        recorder = cls(nodes)
+        index = {v: i for i, v in enumerate(recorder.nodes)}
+
+        if 'seed' in frame.columns and len(frame) > 0:
+            seeds = frame.groupby('run_id', sort=True)['seed'].first()
+            recorder.seeds = [None] * (int(seeds.index.max()) + 1)
+            for run_id, seed in seeds.items():
+                recorder.seeds[int(run_id)] = seed
+
+        recorder.extend({
+            'run_id': frame['run_id'].to_numpy(),
+            'time': frame['time'].to_numpy(),
+            'node_idx': frame['node'].map(index).to_numpy(),
+            'state': frame['state'].to_numpy()})
+        return recorder
+
+
+def _column_dtype(values: np.ndarray) -> Any:
+    """Returns the data type used to store a column with the given values.
+
+    Strings and arbitrary objects are stored as object arrays, since fixed
+    width string types would truncate longer values recorded later.
+    """
+    if values.dtype.kind in 'iu':
+        return np.int64
+    if values.dtype.kind == 'f':
+        return np.float64
+    if values.dtype.kind == 'b':
+        return np.bool_
+    return object
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -10,9 +10,10 @@
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
 from __future__ import annotations
-from typing import Union
+from typing import Any, Optional, Union
 
 import numpy as np
+from scipy import sparse  # pylint: disable=import-error
 
 class VoseAliasSampling:
     """
@@ -105,4 +106,157 @@ class VoseAliasSampling:
         if x < self.probs[i]:
             return i-1
         else:
-            return self.aliases[i]-1
\ No newline at end of file
+            return self.aliases[i]-1
+
+
+class CSRAliasSampling:
+    """
+    Implementation of fast biased sampling from the rows of a sparse matrix
+
+    Different from VoseAliasSampling, which stores the probability and alias
+    tables of a single discrete distribution in dictionaries, this class stores
+    the tables of all rows of a sparse matrix in flat arrays that are aligned
+    with the CSR `indices` array of the matrix. Row i of the matrix contains the
+    relative weights of the column indices that can be sampled for row i, so
+    memory and setup time scale with the number of non-zero entries rather than
+    with the square of the number of rows. Sampling is vectorized, i.e. one call
+    draws one column index for each row in a given array of rows.
+
+    For a concise explanation of the alias method see
+    https://www.keithschwarz.com/darts-dice-coins/
+
+    Parameters
+    ----------
+
+    matrix: scipy.sparse.spmatrix
+
+        sparse matrix with non-negative entries, where matrix[i, j] is the
+        relative statistical weight of drawing column j for row i. The rows do
+        not need to be normalized. Rows without positive entries cannot be
+        sampled from.
+
+    See Also
+    --------
+    VoseAliasSampling, RandomWalk
+
+    Examples
+    --------
+
+    Create a sampler for the rows of an adjacency matrix
+
+    >>> import numpy as np
+    >>> import pathpy as pp
+    >>> from scipy.sparse import csr_matrix
+    >>> sampler = pp.processes.CSRAliasSampling(csr_matrix([[0, 1, 3], [1, 0, 0], [0, 0, 0]]))
+
+    Draw one column for each of the rows 0, 0, 1 and 2 in O(1) per row. Rows
+    without entries yield -1
+
+    >>> sampler.sample([0, 0, 1, 2], rng=np.random.default_rng(1))
+    array([ 2,  2,  0, -1])
+
+    """
+
+    def __init__(self, matrix: sparse.spmatrix) -> None:
+        """
+        Initializes flat probability and alias tables for all rows
+        """
+        matrix = sparse.csr_matrix(matrix, dtype=float)
+        matrix.sum_duplicates()
+
+        self.n: int = matrix.shape[0]
+        self.indptr: np.ndarray = matrix.indptr.astype(np.int64)
+        self.indices: np.ndarray = matrix.indices.astype(np.int64)
+
+        weights = np.nan_to_num(matrix.data)
+        counts = np.diff(self.indptr)
+        rows = np.repeat(np.arange(self.n), counts)
+        totals = np.bincount(rows, weights=weights, minlength=self.n)
+
+        # rows without positive weight cannot be sampled from
+        self.degrees: np.ndarray = np.where(totals > 0, counts, 0)
+
+        # scale weights such that the mean weight in each row is one
+        scale = np.divide(counts, totals, out=np.zeros(self.n),
+                          where=totals > 0)
+        scaled = weights * scale[rows]
+
+        # entries of rows with uniform weights never need an alias
+        self.probs: np.ndarray = np.ones(len(weights))
+        self.aliases: np.ndarray = np.arange(len(weights), dtype=np.int64)
+
+        skewed = np.bincount(rows, weights=np.abs(scaled - 1.0) > 1e-12,
+                             minlength=self.n) > 0
+        for row in np.flatnonzero(skewed & (self.degrees > 0)):
+            self._init_row(self.indptr[row], self.indptr[row+1], scaled)
+
+    def _init_row(self, start: int, end: int, scaled: np.ndarray) -> None:
+        """
+        Fills the probability and alias tables of entries start, ..., end-1
+        """
+        probs = scaled[start:end].tolist()
+
+        small = [i for i, p in enumerate(probs) if p < 1]
+        large = [i for i, p in enumerate(probs) if p >= 1]
+
+        while small and large:
+            l = small.pop()
+            g = large.pop()
+
+            self.probs[start+l] = probs[l]
+            self.aliases[start+l] = start+g
+            probs[g] = probs[l] + probs[g] - 1
+
+            if probs[g] < 1:
+                small.append(g)
+            else:
+                large.append(g)
+
+        # remaining entries are only subject to numerical imprecision
+        for i in small + large:
+            self.probs[start+i] = 1
+
+    def sample(self, rows: Union[int, np.ndarray, list],
+               rng: Optional[Any] = None) -> Union[int, np.ndarray]:
+        """
+        Vectorized biased sampling of one column index per row in O(1)
+
+        Parameters
+        ----------
+
+        rows: Union[int, np.ndarray, list]
+
+            row (or array of rows) for which column indices shall be sampled
+
+        rng: Optional[Any] = None
+
+            numpy random generator (or RandomState) used to draw random
+            numbers. If None (default), the global numpy random state is used.
+
+        Returns
+        -------
+            column index (or array of column indices) drawn from the given
+            rows, where -1 indicates a row without entries.
+
+        """
+        if np.isscalar(rows):
+            return int(self.sample(np.array([rows]), rng)[0])
+
+        rng = np.random if rng is None else rng
+        rows = np.asarray(rows, dtype=np.int64)
+        degrees = self.degrees[rows]
+
+        result = np.full(len(rows), -1, dtype=np.int64)
+        if len(self.indices) == 0:
+            return result
+
+        # draw a uniform entry of each row and accept it or its alias
+        k = np.minimum((rng.random(len(rows)) * degrees).astype(np.int64),
+                       np.maximum(degrees - 1, 0))
+        pos = np.minimum(self.indptr[rows] + k, len(self.indices) - 1)
+        pos = np.where(rng.random(len(rows)) < self.probs[pos],
+                       pos, self.aliases[pos])
+
+        valid = degrees > 0
+        result[valid] = self.indices[pos[valid]]
+        return result
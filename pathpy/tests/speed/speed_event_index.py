@@ -0,0 +1,107 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : speed_event_index.py -- Query performance of the event index
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 10:53 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+import numpy as np
+from intervaltree import IntervalTree
+from pathpy.core.temporal import EventIndex
+
+NUMBER_OF_EVENTS = 100000
+NUMBER_OF_QUERIES = 1000
+
+
+def events():
+    """Random events with durations between 1 and 100"""
+    rng = np.random.default_rng(0)
+    begin = rng.integers(0, 10**6, NUMBER_OF_EVENTS)
+    end = begin + rng.integers(1, 100, NUMBER_OF_EVENTS)
+    data = np.array(['e{}'.format(i % 5000) for i in range(NUMBER_OF_EVENTS)],
+                    dtype=object)
+    times = rng.integers(0, 10**6, NUMBER_OF_QUERIES).tolist()
+    return begin, end, data, times
+
+
+def index(tree=False):
+    """Creates an event index or an interval tree"""
+    begin, end, data, times = events()
+    if tree:
+        events_ = IntervalTree.from_tuples(
+            zip(begin.tolist(), end.tolist(), data.tolist()))
+    else:
+        events_ = EventIndex()
+        events_.extend(begin, end, data)
+        len(events_)
+    return events_, times
+
+
+def point_queries(events_, times):
+    """Queries events at points in time"""
+    return sum(len(events_[t]) for t in times)
+
+
+def slice_queries(events_, times):
+    """Queries events in time ranges"""
+    return sum(len(events_[t:t+1000]) for t in times[:100])
+
+
+def add_and_query(events_, times):
+    """Alternately adds an event and queries a point in time"""
+    for i, t in enumerate(times[:200]):
+        events_[t:t+5] = 'new{}'.format(i)
+        events_[t]
+    return len(events_)
+
+
+def test_point_queries_index(benchmark):
+    """Test point queries of the event index"""
+    result = benchmark(point_queries, *index())
+    assert result == point_queries(*index(tree=True))
+
+
+def test_point_queries_tree(benchmark):
+    """Test point queries of an interval tree"""
+    result = benchmark(point_queries, *index(tree=True))
+    assert result > 0
+
+
+def test_slice_queries_index(benchmark):
+    """Test range queries of the event index"""
+    result = benchmark(slice_queries, *index())
+    assert result == slice_queries(*index(tree=True))
+
+
+def test_slice_queries_tree(benchmark):
+    """Test range queries of an interval tree"""
+    result = benchmark(slice_queries, *index(tree=True))
+    assert result > 0
+
+
+def test_add_and_query_index(benchmark):
+    """Test alternating additions and queries of the event index"""
+    result = benchmark.pedantic(add_and_query, setup=lambda: (index(), {}),
+                                rounds=5)
+    assert result == NUMBER_OF_EVENTS + 200
+
+
+def test_add_and_query_tree(benchmark):
+    """Test alternating additions and queries of an interval tree"""
+    result = benchmark.pedantic(add_and_query,
+                                setup=lambda: (index(tree=True), {}),
+                                rounds=5)
+    assert result == NUMBER_OF_EVENTS + 200
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
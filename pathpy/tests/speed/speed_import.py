@@ -0,0 +1,55 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : speed_import.py -- Benchmark of the import time of pathpy
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 10:01 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+import subprocess
+import sys
+
+
+def import_pathpy(statement='import pathpy'):
+    """Import pathpy in a new interpreter."""
+    subprocess.run([sys.executable, '-c', statement], check=True)
+    return True
+
+
+def test_import_python(benchmark):
+    """Start the interpreter without pathpy as baseline"""
+    result = benchmark.pedantic(import_pathpy, args=('pass',), rounds=10)
+    assert result
+
+
+def test_import_pathpy(benchmark):
+    """Import pathpy, where submodules are imported on first access"""
+    result = benchmark.pedantic(import_pathpy, rounds=10)
+    assert result
+
+
+def test_import_network(benchmark):
+    """Import pathpy and create a network"""
+    result = benchmark.pedantic(import_pathpy, args=(
+        'import pathpy; pathpy.Network().add_edge("a", "b")',), rounds=10)
+    assert result
+
+
+def test_import_all(benchmark):
+    """Import pathpy and all submodules"""
+    result = benchmark.pedantic(import_pathpy, args=(
+        'import pathpy; [getattr(pathpy, m) for m in pathpy._SUBMODULES]',),
+        rounds=10)
+    assert result
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
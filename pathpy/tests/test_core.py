@@ -242,6 +242,34 @@ def test_PathPyCollection_iadd():
 
     c1 += c3
     assert c1.counter['ab'] == 30
+
+def test_PathPy_slots():
+    """Test the memory layout of the core classes"""
+    import copy
+    import pickle
+    from pathpy.core.node import Node
+    from pathpy.core.edge import Edge
+
+    u = Node('u')
+    e = Edge(u, 'v', uid='e')
+    assert not hasattr(u, '__dict__') and not hasattr(e, '__dict__')
+
+    # attributes are created when they are first set
+    assert u._attributes is None and u['color'] is None
+    u['color'] = 'red'
+    assert u.attributes == {'color': 'red'}
+
+    # directed relations are plain tuples
+    assert type(e.relations) is tuple
+    assert PathPyRelation(('a', 'b'), directed=False) == \
+        PathPyRelation(('b', 'a'), directed=False)
+
+    for obj in (u, e):
+        for other in (copy.deepcopy(obj), pickle.loads(pickle.dumps(obj))):
+            assert other.uid == obj.uid
+            assert other.relations == obj.relations
+            assert other.attributes == obj.attributes
+
 # =============================================================================
 # eof
 #
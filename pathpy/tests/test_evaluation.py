@@ -51,6 +51,16 @@ def test_shuffle_temporal_network(temp_net):
     assert t.number_of_nodes() == temp_net.number_of_nodes()
     assert t.number_of_edges() == temp_net.number_of_edges()
 
+    times = sorted(e.start for e in temp_net.edges[:])
+    for method in ['timestamps', 'links', 'edge_swap']:
+        t = pp.algorithms.evaluation.shuffle_temporal_network(temp_net, method=method)
+        assert t.number_of_nodes() == temp_net.number_of_nodes()
+        assert sorted(e.start for e in t.edges[:]) == times
+
+    # links keep their timelines
+    t = pp.algorithms.evaluation.shuffle_temporal_network(temp_net, method='links')
+    assert sorted(len(e._sorted_events()) for e in t.edges) == [1, 1, 2]
+
 
 def test_train_test_split_temporalnetwork(temp_net):
     """
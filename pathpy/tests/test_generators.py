@@ -12,6 +12,7 @@ import pytest
 
 import pathpy as pp
 import numpy as np
+from pathpy.utils.errors import ParameterError
 
 
 def test_Molloy_Reed():
@@ -86,6 +87,108 @@ def test_Watts_Strogatz_uids():
 
 
 
+def test_ER_complete():
+    """Test Erdös-Renyi Model for complete networks."""
+    n = pp.generators.ER_np(n=20, p=1)
+    assert n.number_of_edges() == 190
+
+    n = pp.generators.ER_np(n=20, p=1, directed=True, loops=True)
+    assert n.number_of_edges() == 400
+
+    n = pp.generators.ER_nm(n=20, m=190)
+    assert set(n.degrees().values()) == set([19])
+
+    assert pp.generators.ER_nm(n=20, m=191) is None
+
+
+def test_ER_nm_multiedges():
+    """Test Erdös-Renyi Model with multi-edges."""
+    n = pp.generators.ER_nm(n=5, m=50, multiedges=True)
+
+    assert n.number_of_nodes() == 5
+    assert sum(n.edges.counter.values()) == 50
+
+
+def test_Molloy_Reed_sequence():
+    """Test the degree sequence of a network."""
+    degrees = [3, 3, 2, 2, 2, 1, 1] * 20
+    n = pp.generators.Molloy_Reed(degrees)
+
+    assert [n.degrees()[str(i)] for i in range(len(degrees))] == degrees
+    assert all(e.v != e.w for e in n.edges)
+
+    assert not pp.generators.is_graphic_Erdos_Gallai([2])
+    assert pp.generators.Molloy_Reed([2]) is None
+
+
+def test_Watts_Strogatz_rewiring():
+    """Test rewired lattice construction"""
+    n = pp.generators.Watts_Strogatz(n=200, s=3, p=0.5)
+
+    assert n.number_of_edges() == 600
+    assert all(e.v != e.w for e in n.edges)
+    assert len(set(frozenset((e.v.uid, e.w.uid)) for e in n.edges)) == 600
+
+
+def test_ensemble():
+    """Test sampling of statistics in random graph ensembles."""
+    n = pp.generators.Watts_Strogatz(n=100, s=2, p=0.1)
+    degrees = n.degree_sequence()
+
+    samples = list(pp.generators.ensemble('Molloy_Reed', n, samples=10,
+                                          random_state=1))
+    assert len(samples) == 10
+    for A in samples:
+        assert A.shape == (100, 100)
+        assert np.array_equal(np.asarray(A.sum(axis=1)).ravel(), degrees)
+
+    edges = list(pp.generators.ensemble(
+        'ER_nm', n, samples=10, statistic=lambda A: A.nnz, random_state=1))
+    assert edges == [400] * 10
+
+    # samples do not depend on the number of processes
+    stats = list(pp.generators.ensemble(
+        'ER_np', n, samples=8, statistic=lambda A: A.nnz, random_state=2))
+    assert list(pp.generators.ensemble(
+        'ER_np', n, samples=8, n_jobs=2, statistic=lambda A: A.nnz,
+        random_state=2)) == stats
+
+    # consuming samples does not reseed the global random state
+    np.random.seed(123)
+    expected = np.random.random(2)
+    np.random.seed(123)
+    samples = pp.generators.ensemble('edge_swap', n, samples=2, random_state=3)
+    draws = [np.random.random() for _ in samples]
+    assert np.array_equal(draws, expected)
+
+    with pytest.raises(ParameterError):
+        pp.generators.ensemble('unknown', n)
+
+
+def test_edge_swaps():
+    """Test degree-preserving double edge swaps."""
+    n = pp.generators.ER_nm(n=100, m=300, directed=True)
+    r = pp.generators.edge_swap_randomize(n)
+
+    assert r.number_of_edges() == 300
+    assert r.indegrees() == n.indegrees()
+    assert r.outdegrees() == n.outdegrees()
+    assert all(e.v != e.w for e in r.edges)
+
+    n = pp.generators.Watts_Strogatz(n=100, s=2, p=0.0)
+    chain = pp.generators.EdgeSwapChain.from_network(n)
+    assert chain.swap(2000) > 0
+    for A in chain.samples(5, thinning=100):
+        assert np.array_equal(np.asarray(A.sum(axis=1)).ravel(),
+                              n.degree_sequence())
+        assert A.diagonal().sum() == 0
+        assert A.max() == 1
+
+    degrees = list(pp.generators.ensemble(
+        'edge_swap', n, samples=4, random_state=1,
+        statistic=lambda A: tuple(np.asarray(A.sum(axis=1)).ravel())))
+    assert set(degrees) == {tuple(n.degree_sequence())}
+
 
 # =============================================================================
 # eof
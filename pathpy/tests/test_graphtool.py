@@ -0,0 +1,102 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : test_graphtool.py -- Test graphtool binary format
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 07:55 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+
+import struct
+
+import pytest
+import pathpy as pp
+
+
+def _string(s: bytes, e: str) -> bytes:
+    """Encodes a string in graphtool format."""
+    return struct.pack(e + 'Q', len(s)) + s
+
+
+def _graphtool_bytes(e: str = '<') -> bytes:
+    """Encodes a directed network with edges 0->1, 0->2, 2->1 and property
+    maps in graphtool binary format."""
+    data = b'\xe2\x9b\xbe\x20\x67\x74' + bytes([1, e == '>'])
+    data += _string(b'test', e) + bytes([1]) + struct.pack(e + 'Q', 3)
+
+    # adjacency lists
+    data += struct.pack(e + 'QBB', 2, 1, 2)
+    data += struct.pack(e + 'Q', 0)
+    data += struct.pack(e + 'QB', 1, 1)
+
+    # property maps
+    data += struct.pack(e + 'Q', 4)
+    data += bytes([0]) + _string(b'description', e) + bytes([6])
+    data += _string(b'toy network', e)
+    data += bytes([1]) + _string(b'name', e) + bytes([6])
+    data += _string(b'a', e) + _string(b'b', e) + _string(b'c', e)
+    data += bytes([2]) + _string(b'weight', e) + bytes([4])
+    data += struct.pack(e + 'ddd', 1.5, 2.0, 0.5)
+    data += bytes([2]) + _string(b'ids', e) + bytes([9])
+    data += struct.pack(e + 'Qii', 2, 7, 8) + struct.pack(e + 'Q', 0) + \
+        struct.pack(e + 'Qi', 1, -1)
+    return data
+
+
+@pytest.mark.parametrize('endianness', ['<', '>'])
+def test_parse_graphtool_format(endianness):
+    """Test decoding of adjacency lists and property maps."""
+    n = pp.io.graphtool.parse_graphtool_format(_graphtool_bytes(endianness))
+
+    assert n.directed
+    assert n.number_of_nodes() == 3
+    assert n.number_of_edges() == 3
+    assert n['description'] == 'toy network'
+    assert n.nodes['0']['name'] == 'a'
+
+    weights = {(e.v.uid, e.w.uid): e['weight'] for e in n.edges}
+    assert weights == {('0', '1'): 1.5, ('0', '2'): 2.0, ('2', '1'): 0.5}
+    ids = {(e.v.uid, e.w.uid): list(e['ids']) for e in n.edges}
+    assert ids[('0', '1')] == [7, 8]
+    assert ids[('2', '1')] == [-1]
+
+
+def test_read_graphtool(tmp_path):
+    """Test reading a memory-mapped graphtool file."""
+    file = tmp_path / 'network.gt'
+    file.write_bytes(_graphtool_bytes())
+    n = pp.io.graphtool.read_graphtool(str(file))
+    assert n.number_of_edges() == 3
+    assert n.nodes['2']['name'] == 'c'
+
+
+def test_write_graphtool(tmp_path):
+    """Test binary round-trip of static and temporal networks."""
+    n = pp.Network(directed=False, uid='toy', name='toy network')
+    n.add_edge('a', 'b', weight=2.0, uid='a-b')
+    n.add_edge('b', 'c', weight=1.0, uid='b-c')
+    n.add_node('d', color='red')
+
+    file = str(tmp_path / 'network.gt')
+    pp.io.graphtool.write_graphtool(n, file, endianness='>')
+    m = pp.io.graphtool.read_graphtool(file)
+
+    assert m.uid == 'toy'
+    assert m['name'] == 'toy network'
+    assert not m.directed
+    assert m.nodes.index == n.nodes.index
+    assert m.edges['a-b']['weight'] == 2.0
+    assert m.edges['b-c'].v.uid == 'b'
+    assert m.nodes['d']['color'] == 'red'
+
+    tn = pp.TemporalNetwork(directed=True)
+    tn.add_edge('a', 'b', timestamp=1)
+    tn.add_edge('a', 'b', timestamp=3)
+    tn.add_edge('b', 'c', start=2, end=5)
+    pp.io.graphtool.write_graphtool(tn, file)
+    tm = pp.io.graphtool.read_graphtool(file)
+
+    assert isinstance(tm, pp.TemporalNetwork)
+    assert sorted((e.v.uid, e.w.uid, e.start, e.end) for e in tm.edges[:]) == \
+        [('a', 'b', 1, 2), ('a', 'b', 3, 4), ('b', 'c', 2, 5)]
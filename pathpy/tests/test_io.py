@@ -94,6 +94,97 @@ def test_pandas_temporal():
     te2 = len([e for e in tn2.edges[:]])
     assert te1 == te2
 
+
+def test_csv_read_chunks(tmp_path):
+    """Read networks from csv in chunks of rows."""
+    file = tmp_path / 'edges.csv'
+    file.write_text('v,w,timestamp,weight\n'
+                    'a,b,1,1.0\nb,c,2,2.0\na,b,3,3.0\n'
+                    'b,a,4,4.0\nc,c,5,5.0\nd,a,6,6.0\n')
+
+    net = pp.io.csv.read_network(str(file), directed=False, loops=False,
+                                 chunksize=2,
+                                 dtype={'v': 'category', 'w': 'category'})
+    assert net.nodes.uids == {'a', 'b', 'c', 'd'}
+    assert net.number_of_edges() == 3
+    assert net.edges.counter[net.edges['a', 'b'].uid] == 3
+    assert net.edges['a', 'b']['weight'] == 1.0
+    assert net.edges['a', 'b'].attributes['timestamp'] == 1
+
+    tn = pp.io.csv.read_temporal_network(str(file), chunksize=4)
+    assert tn.number_of_edges() == 5
+    assert len(list(tn.edges[:])) == 6
+    assert tn.edges['a', 'b'][3, 'weight'] == 3.0
+
+
+def test_sql_read_chunks(tmp_path):
+    """Read networks from a sql database in chunks of rows."""
+    import pandas as pd
+    file = str(tmp_path / 'edges.db')
+    frame = pd.DataFrame({'v': ['a', 'b', 'a', 'c'], 'w': ['b', 'c', 'b', 'a'],
+                          'timestamp': [1, 2, 3, 4]})
+    pp.io.sql.write_dataframe(frame, table='edges', filename=file)
+
+    chunks = pp.io.sql.read_dataframe(db_file=file, chunksize=3)
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+
+    net = pp.io.sql.read_network(db_file=file, chunksize=1)
+    assert net.number_of_edges() == 3
+    assert net.edges.counter[net.edges['a', 'b'].uid] == 2
+
+    tn = pp.io.sql.read_temporal_network(db_file=file, chunksize=2,
+                                         dtype={'v': 'category'})
+    assert len(list(tn.edges[:])) == 4
+
+
+def test_read_pathstore(tmp_path):
+    """Read paths into a compact path store in shards."""
+    file = tmp_path / 'paths.csv'
+    file.write_text('a,b,c,2\nb,c,1\na,b,c,1\n\nd,1\n')
+
+    store = pp.io.csv.read_pathstore(str(file), frequency=True)
+    assert dict(store.items()) == {('a', 'b', 'c'): 3, ('b', 'c'): 1,
+                                   ('d',): 1}
+    for shards in [2, 3, 50]:
+        sharded = pp.io.csv.read_pathstore(str(file), frequency=True,
+                                           shards=shards)
+        assert dict(sharded.items()) == dict(store.items())
+
+    paths = pp.io.csv.read_pathcollection(str(file), frequency=True)
+    assert paths.counter[paths['a', 'b', 'c'].uid] == 3
+
+
+def test_to_dataframe_chunks(tmp_path):
+    """Export networks as columns and in chunks."""
+    net = Network()
+    net.add_edge('a', 'b', color='red', uid='a-b')
+    net.add_edge('b', 'c', uid='b-c')
+    net.add_edge('c', 'a', weight=2, uid='c-a')
+
+    df = pp.io.to_dataframe(net, include_edge_uid=True, export_indices=True)
+    assert list(df.columns) == ['v', 'w', 'uid', 'color', 'weight']
+    assert df['v'].tolist() == [0, 1, 2]
+    assert df['uid'].tolist() == ['a-b', 'b-c', 'c-a']
+    assert df['weight'].dtype == float
+
+    chunks = list(pp.io.to_dataframe(net, chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert all(list(chunk.columns) == ['v', 'w', 'color', 'weight']
+               for chunk in chunks)
+
+    assert pp.io.csv.write(net, chunksize=1) == pp.io.csv.write(net)
+    file = str(tmp_path / 'network.db')
+    pp.io.sql.write(net, table='test', filename=file, chunksize=2)
+    assert pp.io.sql.read_network(db_file=file).number_of_edges() == 3
+
+    tn = TemporalNetwork(directed=True)
+    tn.add_edge('a', 'b', timestamp=3, weight=1)
+    tn.add_edge('b', 'c', start=1, end=5)
+    tn.add_edge('a', 'b', timestamp=2)
+    df = pp.io.to_dataframe(tn)
+    assert df['start'].tolist() == [1, 2, 3]
+    assert df['v'].tolist() == ['b', 'a', 'a']
+
 # =============================================================================
 # eof
 #
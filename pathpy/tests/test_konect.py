@@ -8,13 +8,87 @@
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
 
+import io
+import os
+import tarfile
+
 import pytest
 import pathpy as pp
 
 
+def _archive(path, name, edges, header='% asym unweighted'):
+    """Writes a KONECT data set with the given edges as tar.bz2 file."""
+    files = [('meta.' + name, 'name: {0}\ncategory: test\n'.format(name)),
+             ('out.' + name, header + '\n% 3 3 3\n' + edges)]
+    with tarfile.open(path, mode='w:bz2') as tar:
+        for f, content in files:
+            data = content.encode()
+            info = tarfile.TarInfo(name + '/' + f)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
 def test_karate_club():
 
     network = pp.io.konect.read_konect_name('ucidata-zachary')
 
     assert network.number_of_nodes() == 34
-    assert network.number_of_edges() == 78
\ No newline at end of file
+    assert network.number_of_edges() == 78
+
+
+def test_read_tsv_network(tmp_path):
+    path = str(tmp_path / 'toy.tar.bz2')
+    _archive(path, 'toy', '1 2\n2 3\n3 1\n')
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    for file in [path, data, io.BytesIO(data)]:
+        network = pp.io.konect.read_tsv_network(file)
+        assert network.directed
+        assert not network.multiedges
+        assert network.number_of_edges() == 3
+        assert network['name'] == 'toy'
+
+    _archive(path, 'toy', '1 2 1 10\n1 2 1 20\n2 3 1 15\n',
+             header='% sym positive')
+    tn = pp.io.konect.read_tsv_network(path)
+    assert isinstance(tn, pp.TemporalNetwork)
+    assert not tn.directed
+    assert sorted((e.v.uid, e.w.uid, e.start) for e in tn.edges[:]) == \
+        [('1', '2', 10), ('1', '2', 20), ('2', '3', 15)]
+
+    network = pp.io.konect.read_tsv_network(path, ignore_temporal=True)
+    assert network.multiedges
+    assert network.number_of_edges() == 3
+
+
+def test_read_konect_cache(tmp_path):
+    _archive(str(tmp_path / 'download.tsv.toy.tar.bz2'), 'toy', '1 2\n2 3\n')
+    base_url = (tmp_path / 'download.tsv.').as_uri()
+    cache = str(tmp_path / 'cache')
+
+    for _ in range(2):
+        network = pp.io.konect.read_konect_name(
+            'toy', base_url=base_url, cache=cache)
+        assert network.number_of_edges() == 2
+        assert network['name'] == 'toy'
+    files = sorted(os.listdir(cache))
+    assert len(files) == 2
+    assert files[0].startswith('toy-') and files[0].endswith('.npz')
+    assert files[1] == files[0][:-len('npz')] + 'tar.bz2'
+
+    # cached data sets are not downloaded again
+    os.remove(str(tmp_path / 'download.tsv.toy.tar.bz2'))
+    network = pp.io.konect.read_konect_name(
+        'toy', base_url=base_url, cache=cache)
+    assert network.number_of_nodes() == 3
+
+    # data sets of other mirrors are cached separately
+    os.makedirs(str(tmp_path / 'mirror'))
+    _archive(str(tmp_path / 'mirror' / 'download.tsv.toy.tar.bz2'), 'toy',
+             '1 2\n2 3\n3 4\n')
+    network = pp.io.konect.read_konect_name(
+        'toy', base_url=(tmp_path / 'mirror' / 'download.tsv.').as_uri(),
+        cache=cache)
+    assert network.number_of_edges() == 3
+    assert len(os.listdir(cache)) == 4
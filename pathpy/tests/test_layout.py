@@ -0,0 +1,82 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : test_layout.py -- Test environment for network layouts
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 09:41 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+
+import numpy as np
+import pathpy as pp
+from pathpy.visualisations.layout import layout, _repulsion
+
+
+def test_barnes_hut_repulsion():
+    """Test the quadtree approximation of repulsive forces."""
+    np.random.seed(1)
+    positions = np.random.rand(200, 2)
+    positions[1] = positions[0]
+
+    delta = positions[:, np.newaxis, :] - positions[np.newaxis, :, :]
+    distance = np.clip((delta**2).sum(axis=-1), 1e-4, None)
+    np.fill_diagonal(distance, np.inf)
+    exact = (delta * (0.01 / distance)[:, :, np.newaxis]).sum(axis=1)
+
+    assert np.allclose(_repulsion(positions, 0.1, 0.0), exact)
+    error = np.abs(_repulsion(positions, 0.1, 0.5) - exact).max()
+    assert error < 0.05 * np.abs(exact).max()
+
+
+def test_large_layout():
+    """Test the Barnes-Hut layout of large networks."""
+    net = pp.generators.Watts_Strogatz(n=600, s=2, p=0.05)
+
+    first = layout(net, layout='fr', seed=1, iterations=20)
+    second = layout(net, layout='fr', seed=1, iterations=20)
+    assert len(first) == 600
+    assert all(np.allclose(first[v], second[v]) for v in first)
+
+    fixed = layout(net, layout='fr', iterations=20, fixed=['0', '1'],
+                   positions={'0': (0.0, 0.0), '1': (1.0, 1.0)})
+    assert np.allclose(fixed['0'], (0.0, 0.0))
+    assert np.allclose(fixed['1'], (1.0, 1.0))
+
+
+def test_layout_cache(tmp_path):
+    """Test caching and warm starts of layouts."""
+    net = pp.generators.Watts_Strogatz(n=100, s=2, p=0.05)
+    cache = pp.LayoutCache(layout='fr', seed=1)
+
+    first = cache(net)
+    assert all(np.array_equal(first[v], p) for v, p in cache(net).items())
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # layouts of slightly changed networks are refined
+    net.add_node('new')
+    net.add_edge('new', '0')
+    second = cache(net)
+    assert cache.misses == 2
+    assert np.linalg.norm(second['new'] - second['0']) < 0.5
+    shift = [np.linalg.norm(first[v] - second[v]) for v in first]
+    assert np.median(shift) < 0.1
+
+    path = str(tmp_path / 'network.layout.npz')
+    cache.save(path)
+    loaded = pp.LayoutCache.load(path, layout='fr', seed=1)
+    assert len(loaded) == 2
+    third = loaded(net)
+    assert loaded.hits == 1
+    assert all(np.allclose(second[v], third[v]) for v in second)
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
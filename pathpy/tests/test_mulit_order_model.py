@@ -8,7 +8,7 @@
 # Copyright (c) 2016-2019 Pathpy Developers
 # =============================================================================
 
-from pathpy import PathCollection, MultiOrderModel, NullModel, HigherOrderNetwork
+from pathpy import PathCollection, PathStore, MultiOrderModel, NullModel, HigherOrderNetwork
 
 
 def test_basic():
@@ -31,6 +31,27 @@ def test_basic():
 
     assert mom.predict() == 1
 
+
+def test_path_store():
+    """Test fitting models to a path store."""
+    paths = PathCollection()
+    paths.add('a', 'c', 'd', count=20)
+    paths.add('b', 'c', 'e', count=20)
+    paths.add('a', 'c', count=5)
+    store = PathStore.from_paths(paths)
+
+    hon = HigherOrderNetwork(order=2)
+    hon.fit(store, order=2)
+    assert hon.nodes.counter[hon.nodes['a', 'c'].uid] == 25
+    assert hon.edges.counter[hon.edges['a-c', 'c-d'].uid] == 20
+    assert hon.observed[('a', 'c', 'd')] == 20
+
+    mom = MultiOrderModel.from_paths(store, max_order=2)
+    assert mom.predict() == 2
+    assert mom.likelihood(store, order=2) == \
+        MultiOrderModel.from_paths(paths, max_order=2).likelihood(
+            paths, order=2)
+
 # =============================================================================
 # eof
 #
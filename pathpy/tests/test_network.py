@@ -760,6 +760,26 @@ def test_network_from_pathpyobjects():
     trolls.add_edge(e1)
 
 
+def test_lazy_imports():
+    """Test that submodules and methods are imported on first access."""
+    import subprocess
+    import sys
+    script = """if True:
+    import sys
+    import pathpy as pp
+    heavy = ['pathpy.algorithms', 'pathpy.io', 'pathpy.generators',
+             'pathpy.visualisations', 'scipy', 'pandas', 'IPython']
+    assert not [m for m in heavy if m in sys.modules]
+    net = pp.Network(directed=False)
+    net.add_edges(('a', 'b'), ('b', 'c'))
+    assert net.diameter() == 2
+    assert 'diameter' in vars(pp.Network)
+    assert 'pathpy.algorithms' in sys.modules
+    assert 'io' in dir(pp) and pp.io is sys.modules['pathpy.io']
+    """
+    subprocess.run([sys.executable, '-c', script], check=True)
+
+
 # =============================================================================
 # eof
 #
@@ -0,0 +1,68 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : test_parquet.py -- Test parquet files
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 09:01 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+
+import pytest
+import pathpy as pp
+
+pytest.importorskip('pyarrow')
+
+
+def test_parquet_network(tmp_path):
+    """Test round-trip of static networks."""
+    n = pp.Network(directed=False, uid='toy')
+    n.add_edge('a', 'b', weight=2.0, uid='a-b')
+    n.add_edge('b', 'c', weight=1.0, uid='b-c')
+
+    path = str(tmp_path / 'network.parquet')
+    pp.io.parquet.write_network(n, path)
+    m = pp.io.parquet.read_network(path)
+
+    assert m.uid == 'toy'
+    assert not m.directed
+    assert m.number_of_edges() == 2
+    assert m.edges['a-b']['weight'] == 2.0
+
+    m = pp.io.parquet.read_network(path, filters=[('weight', '>', 1.5)])
+    assert m.number_of_edges() == 1
+
+
+def test_parquet_temporal_network(tmp_path):
+    """Test reading time slices of temporal networks."""
+    tn = pp.TemporalNetwork(directed=True)
+    for t in range(100):
+        tn.add_edge('a', 'b', start=t, end=t+1)
+    tn.add_edge('b', 'c', start=10, end=50)
+
+    path = str(tmp_path / 'temporal.parquet')
+    pp.io.parquet.write_network(tn, path, row_group_size=10)
+
+    tm = pp.io.parquet.read_temporal_network(path)
+    assert len(list(tm.edges[:])) == 101
+
+    tm = pp.io.parquet.read_temporal_network(path, start=20, end=25)
+    assert sorted((e.v.uid, e.start) for e in tm.edges[:]) == \
+        [('a', 20), ('a', 21), ('a', 22), ('a', 23), ('a', 24), ('b', 10)]
+
+
+def test_parquet_paths(tmp_path):
+    """Test round-trip of path collections."""
+    pc = pp.PathCollection()
+    pc.add('a', 'b', 'c', count=3)
+    pc.add('b', 'd')
+
+    path = str(tmp_path / 'paths.parquet')
+    pp.io.parquet.write_pathcollection(pc, path)
+
+    store = pp.io.parquet.read_pathstore(path)
+    assert dict(store.items()) == {('a', 'b', 'c'): 3, ('b', 'd'): 1}
+
+    qc = pp.io.parquet.read_pathcollection(path)
+    assert sorted((p.relations, qc.counter[p.uid]) for p in qc) == \
+        [(('a', 'b', 'c'), 3), (('b', 'd'), 1)]
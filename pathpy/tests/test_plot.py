@@ -272,6 +272,100 @@ def test_temporal_network():
 #     # print(a['color'])
 #     # print(a)
 
+def test_temporal_events():
+    """Test the encoding of temporal edges for animations."""
+    import base64
+    import numpy as np
+    from pathpy.visualisations.plot import _encode_events, _nearest, _varint
+
+    times = np.linspace(0, 10, 6)
+    assert _nearest(times, [-np.inf, 1, 3, 4.5, np.inf]).tolist() == \
+        [0, 0, 1, 2, 5]
+    assert base64.b64decode(_varint([0, 127, 128, 300])) == \
+        bytes([0, 127, 128, 1, 172, 2])
+
+    encoded = _encode_events(np.array([2, 0, 2, 0]), np.array([1, 1, 1, 0]),
+                             np.array([3, 1, 3, 2]), np.array([0, 1, 0, 0]),
+                             [{'color': 'red'}], 4)
+    # duplicate events are removed and edges are delta encoded per step
+    assert base64.b64decode(encoded['counts']) == bytes([1, 2, 0, 0])
+    assert base64.b64decode(encoded['edges']) == bytes([0, 0, 2])
+    assert base64.b64decode(encoded['lengths']) == bytes([2, 0, 2])
+    assert base64.b64decode(encoded['styles']) == bytes([0, 1, 0])
+
+
+def test_style_columns():
+    """Test the column-wise parsing of node and edge styles."""
+    import numpy as np
+    from copy import deepcopy
+    from pathpy.visualisations.plot import Parser, config
+    from pathpy.visualisations.utils import UnitConverter, to_rows, to_columns
+
+    assert np.allclose(UnitConverter('mm', 'cm')([10, 25]), [1, 2.5])
+
+    net = Network()
+    net.add_edges(('a', 'b'), ('b', 'c'))
+    colors = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    figure = Parser()(net, deepcopy(config['plot']), node_color=colors,
+                      node_size={'b': 2}, edge_size=[3], unit='px')
+    nodes = figure['data']['nodes']
+    assert nodes['color'] == ['rgb(255, 0,0)', 'rgb(0, 255,0)',
+                              'rgb(0, 0,255)']
+    assert nodes['size'][nodes['uid'].index('b')] == 2
+    assert figure['data']['edges']['size'][0] == 3
+
+    rows = [{'uid': 'a', 'size': 1}, {'uid': 'b', 'color': 'red'}]
+    assert to_columns(rows) == {'uid': ['a', 'b'], 'size': [1, None],
+                                'color': [None, 'red']}
+    assert to_rows(to_columns(rows)) == rows
+
+
+def test_level_of_detail():
+    """Test the reduction of plotted nodes and edges."""
+    from pathpy.visualisations.detail import level_of_detail
+    from pathpy.visualisations.utils import to_rows, to_columns
+
+    def figure(**config):
+        nodes = [{'uid': str(i), 'size': 5, 'group': i // 2}
+                 for i in range(6)]
+        edges = [{'uid': str(i), 'source': v, 'target': w, 'size': 1}
+                 for i, (v, w) in enumerate([('0', '1'), ('1', '0'),
+                                             ('1', '2'), ('2', '3'),
+                                             ('3', '4'), ('4', '5'),
+                                             ('5', '0')])]
+        return {'data': {'nodes': to_columns(nodes),
+                         'edges': to_columns(edges)},
+                'config': {'directed': False, **config}}
+
+    # nothing is changed by default
+    fig = level_of_detail(figure(max_elements=None))
+    assert len(fig['data']['edges']['uid']) == 7
+    assert 'max_elements' not in fig['config']
+
+    fig = level_of_detail(figure(edge_threshold=2))
+    assert to_rows(fig['data']['edges']) == []
+
+    # parallel edges are aggregated
+    fig = level_of_detail(figure(max_elements=12))
+    edges = to_rows(fig['data']['edges'])
+    assert len(edges) == 6
+    assert edges[0]['size'] > edges[1]['size'] == 1
+
+    # nodes are merged into clusters
+    fig = level_of_detail(figure(max_elements=6, clusters='group'))
+    nodes, edges = [to_rows(fig['data'][k]) for k in ['nodes', 'edges']]
+    assert [n['uid'] for n in nodes] == ['0', '1', '2']
+    assert all(n['size'] > 5 for n in nodes)
+    assert {(e['source'], e['target']) for e in edges} == \
+        {('0', '1'), ('1', '2'), ('2', '0')}
+
+    # the largest nodes and edges are kept
+    fig = level_of_detail(figure(max_elements=4))
+    nodes, edges = [to_rows(fig['data'][k]) for k in ['nodes', 'edges']]
+    assert len(nodes) + len(edges) <= 4
+    assert {n['uid'] for n in nodes} == {'0', '1'}
+
+
 # =============================================================================
 # eof
 #
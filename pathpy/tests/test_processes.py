@@ -0,0 +1,238 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : test_processes.py -- Test simulation of dynamical processes
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 07:45 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+
+import pytest
+import numpy as np
+from scipy.sparse import csr_matrix
+
+import pathpy as pp
+from pathpy.utils.errors import ParameterError
+
+
+@pytest.fixture
+def net():
+    """Weighted undirected toy network."""
+    n = pp.Network(directed=False)
+    n.add_edge('a', 'b', weight=1, uid='a-b')
+    n.add_edge('b', 'c', weight=1, uid='b-c')
+    n.add_edge('c', 'a', weight=2, uid='c-a')
+    n.add_edge('c', 'd', weight=1, uid='c-d')
+    return n
+
+
+def test_csr_alias_sampling():
+    """Test vectorized sampling from the rows of a sparse matrix."""
+    sampler = pp.processes.CSRAliasSampling(
+        csr_matrix([[0, 1, 3], [1, 0, 0], [0, 0, 0]]))
+
+    samples = sampler.sample(np.zeros(100000, dtype=int))
+    assert set(samples) == {1, 2}
+    assert pytest.approx(np.mean(samples == 2), abs=0.01) == 0.75
+
+    assert sampler.sample(1) == 0
+    assert sampler.sample(2) == -1
+
+
+def test_random_walk_batch(net):
+    """Test batched simulation of random walks."""
+    rw = pp.processes.RandomWalk(net, weight='weight')
+    walks = rw.run_batch(steps=50000, runs=20, rng=np.random.default_rng(42))
+
+    assert walks.shape == (20, 50001)
+
+    # all transitions follow edges of the network
+    A = pp.algorithms.adjacency_matrix(net)
+    assert np.all(A[walks[:, :-1].ravel(), walks[:, 1:].ravel()] == 1)
+
+    freq = np.bincount(walks.ravel(), minlength=4) / walks.size
+    assert np.allclose(freq, rw.stationary_state(), atol=0.01)
+
+
+def test_random_walk_batch_seeds(net):
+    """Test batched random walks with given start nodes and restarts."""
+    rw = pp.processes.RandomWalk(net, restart_prob=0.5)
+    walks = rw.run_batch(steps=5, runs=['d', 'd', 'a'])
+
+    idx = net.nodes.index
+    assert list(walks[:, 0]) == [idx['d'], idx['d'], idx['a']]
+
+
+def test_random_walk_transition_matrix(net):
+    """Test transition matrix of a random walk with restarts."""
+    rw = pp.processes.RandomWalk(net, weight='weight', restart_prob=0.2)
+    T = rw.transition_matrix.toarray()
+    idx = net.nodes.index
+
+    assert np.allclose(T.sum(axis=1), 1)
+    assert pytest.approx(T[idx['c'], idx['a']]) == 0.2/4 + 0.8*2/4
+    assert pytest.approx(T[idx['d'], idx['a']]) == 0.2/4
+
+
+def test_random_walk_sparse_restarts(net):
+    """Test that restarts do not require a dense transition matrix."""
+    rw = pp.processes.RandomWalk(net, weight='weight', restart_prob=0.2)
+    assert rw._transition_matrix is None
+
+    pi = rw.stationary_state()
+    T = rw.transition_matrix.toarray()
+    assert np.allclose(pi @ T, pi)
+    assert np.allclose(rw.visitation_probabilities(3, 'd'),
+                       np.linalg.matrix_power(T, 3)[net.nodes.index['d']])
+
+
+def test_random_walk_steps(net):
+    """Test that single steps of a random walk follow the edges."""
+    rw = pp.processes.RandomWalk(net)
+    for _, (current, previous) in rw.simulation_run(steps=100, seed='a'):
+        assert (previous, current) in net.edges
+    assert rw.visitation_frequencies.sum() == pytest.approx(1)
+
+
+def test_experiment_recorder(tmp_path):
+    """Test columnar recording of state changes in chunks."""
+    rec = pp.processes.ExperimentRecorder(['a', 'b', 'c'], seeds=['a'],
+                                          chunk_size=4)
+    rec.record(0, 0, [0, 1, 2], [True, False, False])
+    rec.record(0, 1, [1, 0], [True, False])
+    assert len(rec) == 5
+    assert list(rec.columns()['node_idx']) == [0, 1, 2, 1, 0]
+
+    df = rec.to_dataframe()
+    assert list(df['node']) == ['a', 'b', 'c', 'b', 'a']
+    assert list(df['seed']) == ['a'] * 5
+
+    spilled = pp.processes.ExperimentRecorder(
+        ['a', 'b', 'c'], chunk_size=2, spill=str(tmp_path))
+    spilled.record(0, 0, [0, 1, 2], [0, 1, 0])
+    spilled.record(1, 1, [2], [2])
+    spilled.flush()
+    assert len(list(tmp_path.iterdir())) == 2
+    assert list(spilled.columns()['state']) == [0, 1, 0, 2]
+    assert list(spilled.columns(run_id=1)['node_idx']) == [2]
+
+    # columns are promoted to hold values recorded later
+    promoted = pp.processes.ExperimentRecorder(['a', 'b'], chunk_size=3)
+    promoted.record(0, 0, [0, 1], [True, False])
+    promoted.record(0, 0.5, [0, 1], [0.3, 2])
+    columns = promoted.columns()
+    assert list(columns['time']) == [0, 0, 0.5, 0.5]
+    assert list(columns['state']) == [1, 0, 0.3, 2]
+
+
+def test_run_experiment_columnar(net):
+    """Test that columnar and data frame results can be used interchangeably."""
+    rw = pp.processes.RandomWalk(net, weight='weight')
+    rec = rw.run_experiment(steps=20, runs=['a', 'd'], columnar=True)
+    df = rec.to_dataframe()
+
+    assert len(rec) == 2 * 4 + 2 * 20 * 2
+    assert list(df.loc[df['time'] == 0, 'state']) == [
+        True, False, False, False, False, False, False, True]
+
+    paths = rw.get_paths(rec)
+    assert len(paths) == 2
+    for p in paths:
+        assert len(p) == 20
+    assert rw.get_path(df, 1).relations == rw.get_path(rec, 1).relations
+
+    dag = rw.to_directed_acylic_graph(rec, run_id=0, states=[True])
+    assert dag.number_of_nodes() == 21
+
+
+def test_run_experiment_parallel(net):
+    """Test that parallel experiments are reproducible."""
+    rw = pp.processes.RandomWalk(net, weight='weight')
+    serial = rw.run_experiment(steps=20, runs=8, random_state=7)
+    parallel = rw.run_experiment(steps=20, runs=8, random_state=7, n_jobs=2)
+    assert serial.equals(parallel)
+
+    # the global random state is not reseeded
+    np.random.seed(123)
+    expected = np.random.random(3)
+    np.random.seed(123)
+    rw.run_experiment(steps=20, runs=8, random_state=7)
+    assert np.array_equal(np.random.random(3), expected)
+
+    sir = pp.processes.EpidemicSIR(net, 0.5, 0.2)
+    serial = sir.run_experiment(steps=10, runs=6, random_state=3)
+    parallel = sir.run_experiment(steps=10, runs=6, random_state=3, n_jobs=3)
+    assert serial.equals(parallel)
+
+    hon = pp.HigherOrderNetwork()
+    nodes = {e.uid: pp.HigherOrderNode(e.v, e.w, uid=e.uid)
+             for e in net.edges}
+    hon.add_edge(nodes['a-b'], nodes['b-c'], weight=1)
+    hon.add_edge(nodes['b-c'], nodes['c-a'], weight=1)
+    hon.add_edge(nodes['c-a'], nodes['a-b'], weight=1)
+    hon.add_edge(nodes['b-c'], nodes['c-d'], weight=1)
+    hon.add_edge(nodes['c-d'], nodes['c-a'], weight=1)
+    hrw = pp.processes.HigherOrderRandomWalk(hon, net, weight='weight')
+    serial = hrw.run_experiment(steps=10, runs=['a-b', 'b-c'], random_state=1)
+    parallel = hrw.run_experiment(
+        steps=10, runs=['a-b', 'b-c'], random_state=1, n_jobs=2)
+    assert serial.equals(parallel)
+
+
+def test_epidemic_sir(net):
+    """Test vectorized discrete-time SIR, SIS and SEIR dynamics."""
+    sir = pp.processes.EpidemicSIR(net, 1, 1.0)
+    sir.init('d')
+    assert sir.step() == {'c'}
+    assert sir.infected == {'c', 'd'}
+    assert sir.step() == {'a', 'b'}
+    assert sir.step() == {'c', 'd'}
+    assert sir.recovered == {'c', 'd'}
+    assert list(sir.states) == [1, 1, 2, 2]
+
+    sis = pp.processes.EpidemicSIS(net, 0, 1.0)
+    sis.init('d')
+    sis.step()
+    sis.step()
+    assert sis.node_state('d') == 0
+
+    seir = pp.processes.EpidemicSEIR(net, 2, 1.0, incubation_time=1)
+    seir.init('d')
+    seir.step()
+    assert seir.exposed == {'c'}
+    seir.step()
+    assert seir.exposed == {'c'}
+    seir.step()
+    assert seir.infected == {'c', 'd'}
+
+
+def test_epidemic_sir_temporal():
+    """Test SIR dynamics on a temporal network."""
+    tn = pp.TemporalNetwork(directed=False)
+    tn.add_edge('a', 'b', timestamp=0)
+    tn.add_edge('c', 'd', timestamp=0)
+    tn.add_edge('b', 'c', timestamp=1)
+    sir = pp.processes.EpidemicSIR(tn, 5, 1.0)
+    data = sir.run_experiment(steps=3, runs=['a'])
+    infected = data.loc[(data['state'] == 1) & (data['time'] > 0)]
+    assert list(infected['node']) == ['b', 'c']
+
+    with pytest.raises(ParameterError):
+        pp.processes.EpidemicSIR(tn, 5, 1.0, continuous=True)
+
+
+def test_epidemic_sir_continuous(net):
+    """Test continuous-time SIR simulation."""
+    sir = pp.processes.EpidemicSIR(net, 1, 5.0, continuous=True)
+    data = sir.run_experiment(steps=100, runs=5, random_state=1)
+    final = data.groupby(['run_id', 'node'])['state'].last()
+    assert set(final) <= {0, 2}
+    assert data['time'].dtype == np.float64
+    assert np.all(np.diff(data.loc[data['run_id'] == 0, 'time']) >= 0)
+
+    # waiting times of recovery and incubation must be positive
+    with pytest.raises(ParameterError):
+        pp.processes.EpidemicSIR(net, 0, 0.5, continuous=True)
+    with pytest.raises(ParameterError):
+        pp.processes.EpidemicSEIR(net, 3, 0.5, 0, continuous=True)
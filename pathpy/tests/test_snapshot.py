@@ -0,0 +1,106 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : test_snapshot.py -- Test binary snapshots
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 08:07 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+
+import numpy as np
+import pytest
+import pathpy as pp
+
+
+@pytest.mark.parametrize('name', ['network', 'network.npz'])
+def test_snapshot_network(tmp_path, name):
+    """Test round-trip of static networks."""
+    n = pp.Network(directed=False, uid='toy', name='toy network')
+    n.add_edge('a', 'b', weight=2.0, uid='a-b')
+    n.add_edge('b', 'c', label='x', uid='b-c')
+    n.add_node('d', color='red')
+    n.edges.counter['a-b'] += 2
+
+    path = str(tmp_path / name)
+    pp.io.save(n, path)
+    m = pp.io.load(path)
+
+    assert m.uid == 'toy'
+    assert m['name'] == 'toy network'
+    assert not m.directed
+    assert m.nodes.index == n.nodes.index
+    assert m.edges.counter['a-b'] == 3
+    assert m.edges['a-b'].attributes == {'weight': 2.0}
+    assert m.edges['b-c'].attributes == {'label': 'x'}
+    assert m.nodes['d']['color'] == 'red'
+
+
+def test_snapshot_arrays(tmp_path):
+    """Test memory-mapped CSR adjacency."""
+    n = pp.Network(directed=True)
+    n.add_edges(('a', 'b'), ('a', 'c'), ('c', 'a'))
+    path = str(tmp_path / 'network')
+    pp.io.save(n, path)
+
+    meta, arrays = pp.io.snapshot.load_arrays(path)
+    assert meta['type'] == 'Network'
+    assert isinstance(arrays['adjacency.indices'], np.memmap)
+    uids = arrays['nodes.uid'].tolist()
+    indptr, indices = arrays['adjacency.indptr'], arrays['adjacency.indices']
+    successors = {v: sorted(uids[j] for j in indices[indptr[i]:indptr[i+1]])
+                  for i, v in enumerate(uids)}
+    assert successors == {'a': ['b', 'c'], 'b': [], 'c': ['a']}
+
+
+def test_snapshot_temporal_network(tmp_path):
+    """Test round-trip of temporal networks."""
+    tn = pp.TemporalNetwork(directed=True, uid='temporal')
+    tn.add_edge('a', 'b', timestamp=1, weight=3)
+    tn.add_edge('a', 'b', timestamp=3)
+    tn.add_edge('b', 'c', start=2, end=5)
+
+    path = str(tmp_path / 'temporal')
+    pp.io.save(tn, path)
+    tm = pp.io.load(path)
+
+    assert isinstance(tm, pp.TemporalNetwork)
+    assert tm.uid == 'temporal'
+    assert sorted((e.v.uid, e.w.uid, e.start, e.end) for e in tm.edges[:]) == \
+        [('a', 'b', 1, 2), ('a', 'b', 3, 4), ('b', 'c', 2, 5)]
+    assert tm.edges['a', 'b'][1, 'weight'] == 3
+
+
+def test_snapshot_bulk_events(tmp_path):
+    """Test that saving keeps events added in bulk without interval trees."""
+    tn = pp.TemporalNetwork.from_arrays(['a', 'a', 'b'], ['b', 'b', 'c'],
+                                        [1, 3, 2], [2, 4, 5])
+    path = str(tmp_path / 'bulk')
+    pp.io.save(tn, path)
+
+    assert all(e._bulk_events is not None for e in tn.edges)
+
+    tm = pp.io.load(path)
+    assert sorted((e.v.uid, e.w.uid, e.start, e.end) for e in tm.edges[:]) == \
+        [('a', 'b', 1, 2), ('a', 'b', 3, 4), ('b', 'c', 2, 5)]
+
+
+def test_snapshot_paths(tmp_path):
+    """Test round-trip of path collections and higher-order networks."""
+    pc = pp.PathCollection()
+    pc.add('a', 'b', 'c', uid='abc', count=3, kind='x')
+    pc.add('a', 'b', uid='ab')
+
+    pp.io.save(pc, str(tmp_path / 'paths'))
+    qc = pp.io.load(str(tmp_path / 'paths'))
+    assert dict(qc.counter) == {'abc': 3, 'ab': 1}
+    assert qc['abc'].relations == ('a', 'b', 'c')
+    assert qc['abc']['kind'] == 'x'
+
+    hon = pp.HigherOrderNetwork.from_paths(pc, order=2)
+    pp.io.save(hon, str(tmp_path / 'hon'))
+    h = pp.io.load(str(tmp_path / 'hon'))
+    assert h.order == 2
+    assert dict(h.nodes.counter) == dict(hon.nodes.counter)
+    assert [(e.v.uid, e.w.uid) for e in h.edges] == [('a-b', 'b-c')]
+    assert h.subpaths == hon.subpaths
@@ -33,7 +33,39 @@ def test_state_file_export(paths):
     with io.open('pathpy/tests/data/correct.state', 'r') as f:
         lines2 = f.readlines()
     assert sorted(lines1) == sorted(lines2)
-        
-    
 
 
+def test_state_file_vertex_order(tmp_path):
+    """Test that vertices are listed in the order of the nodes."""
+    pc = pp.PathCollection()
+    pc.add('d', 'c', 'b', count=2)
+    pc.add('c', 'a', 'd')
+    file = str(tmp_path / 'paths.state')
+    pp.io.infomap.to_state_file(pc, file)
+    with io.open(file, 'r') as f:
+        lines = f.read().split('\n')
+    assert lines[1:5] == ['4 "d"', '3 "c"', '2 "b"', '1 "a"']
+
+
+def test_state_file_import(paths, tmp_path):
+    """Test round-trip of state files."""
+    file = str(tmp_path / 'paths.state')
+    pp.io.infomap.to_state_file(paths, file, max_memory=2)
+    vertices, states, labels, links = pp.io.infomap.from_state_file(file)
+
+    assert vertices == ['a', 'b', 'c', 'd']
+    assert labels[:4] == ['{}_a', '{}_b', '{b}_c', '{}_d']
+    assert [vertices[i] for i in states] == [l[-1] for l in labels]
+    assert links[labels.index('{}_b'), labels.index('{b}_c')] == 2
+    assert links.sum() == 10
+
+    copy = str(tmp_path / 'copy.state')
+    pp.io.infomap.write_state_file(copy, vertices, states, labels, links)
+    with io.open(file, 'r') as f, io.open(copy, 'r') as g:
+        assert sorted(f.readlines()) == sorted(g.readlines())
+
+    store = pp.PathStore.from_paths(paths)
+    pp.io.infomap.to_state_file(store, copy, max_memory=2)
+    with io.open(file, 'r') as f, io.open(copy, 'r') as g:
+        assert f.read() == g.read()
+
@@ -559,6 +559,79 @@ def test_temporal_network():
 # # print(tn.edges)
 
 
+def test_event_index():
+    """Test the array-based index of events"""
+    from pathpy.core.temporal import EventIndex
+
+    index = EventIndex()
+    index.extend([1, 3, 1], [2, 5, 2], ['a', 'b', 'a'])
+    index[0:4] = 'c'
+
+    assert len(index) == 3
+    assert index.begin() == 0
+    assert index.end() == 5
+    assert {i.data for i in index[1.5:3.5]} == {'a', 'b', 'c'}
+    assert {i.data for i in index[4]} == {'b'}
+
+    index.remove_data('c')
+    assert [tuple(i) for i in sorted(index)] == [(1, 2, 'a'), (3, 5, 'b')]
+
+    with pytest.raises(ValueError):
+        index[2:2] = 'd'
+
+
+def test_event_index_merge():
+    """Test queries of the event index while events are added"""
+    from intervaltree import Interval, IntervalTree
+    from pathpy.core.temporal import EventIndex
+
+    begin = np.arange(0, 2000, 2)
+    index, tree = EventIndex(), IntervalTree()
+    index.extend(begin, begin + 3, ['a'] * len(begin))
+    for start in begin.tolist():
+        tree[start:start + 3] = 'a'
+
+    # events added after a query are either scanned or merged
+    for i in range(300):
+        start, data = (7 * i) % 2000, 'ab'[i % 2]
+        index[start:start + 1 + i % 5] = data
+        tree[start:start + 1 + i % 5] = data
+        assert index[start] == tree[start]
+        assert index[start - 2:start + 2] == tree[start - 2:start + 2]
+
+    assert index[0:1] == {Interval(0, 3, 'a'), Interval(0, 1, 'a')}
+    assert len(index) == len(tree)
+    assert set(index) == set(tree)
+    assert [i.begin for i in index] == sorted(i.begin for i in tree)
+    assert index.end() == tree.end()
+
+
+def test_from_arrays():
+    """Test the bulk construction of temporal networks"""
+    df = pd.DataFrame({'v': ['a', 'a', 'b', 'b'],
+                       'w': ['b', 'b', 'c', 'a'],
+                       'time': [1, 3, 2, 4],
+                       'weight': [1.0, 2.0, 3.0, 4.0]})
+    net = pp.io.to_temporal_network(df, directed=False)
+
+    assert net.number_of_nodes() == 3
+    assert net.number_of_edges() == 2
+    assert len(net.edges.events) == 4
+    assert net.start == 1
+    assert net.end == 5
+    assert sorted((e.start, e.end, e.attributes['weight'])
+                  for e in net.edges['a', 'b'][:]) == \
+        [(1, 2.0, 1.0), (3, 4.0, 2.0), (4, 5.0, 4.0)]
+    assert {e.v.uid for e in net.edges[2:3]} == {'b'}
+
+    net = TemporalNetwork.from_arrays([0, 0, 1], [1, 1, 1], start=[1, 3, 2],
+                                      end=[2, 4, 5], nodes=['x', 'y'],
+                                      loops=False, multiedges=True,
+                                      uids=['e1', 'e2', 'e3'])
+    assert set(net.edges.keys()) == {'e1', 'e2'}
+    assert len(net.edges.events) == 2
+
+
 # def test_read_csv():
 #     """Read temporal network from csv"""
 #     # tn = pp.io.csv.read_temporal_network(
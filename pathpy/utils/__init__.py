@@ -8,7 +8,7 @@
 # Copyright (c) 2016-2019 Pathpy Developers
 # =============================================================================
 
-from .helper import window
+from .helper import window, atomic_write
 
 # =============================================================================
 # eof
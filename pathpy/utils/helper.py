@@ -7,6 +7,10 @@
 #
 # Copyright (c) 2016-2019 Pathpy Developers
 # =============================================================================
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
 
 
 def window(iterable, size=2):
@@ -21,6 +25,22 @@ def window(iterable, size=2):
         yield win
 
 
+@contextmanager
+def atomic_write(file: str) -> Iterator[BinaryIO]:
+    """Opens a temporary binary file next to the given file, which replaces
+    the file once it is written completely. If writing fails, the temporary
+    file is removed and an existing file is kept."""
+    directory = os.path.dirname(file) or '.'
+    handle, part = tempfile.mkstemp(suffix='.part', dir=directory)
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            yield f
+        os.replace(part, file)
+    except BaseException:
+        os.remove(part)
+        raise
+
+
 # =============================================================================
 # eof
 #
@@ -0,0 +1,96 @@
+"""Deferred imports of pathpy modules"""
+# !/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : lazy.py -- Import modules when they are first used
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 10:01 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+import importlib
+from typing import Any, Optional
+
+
+class DeferredMethod:
+    """Method of a class which is imported from a module on first access.
+
+    The descriptor replaces itself by the function of the module with the
+    same name, so only the first access imports the module. This allows to
+    add functions of modules like `pathpy.algorithms` as methods to classes
+    without importing the modules together with pathpy.
+
+    Parameters
+    ----------
+    module : str
+
+        name of the module which contains the function
+
+    name : str
+
+        name of the function, which is also the name of the method
+
+    Examples
+    --------
+    >>> Network.diameter = DeferredMethod('pathpy.algorithms', 'diameter')
+
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        self.module = module
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        function = getattr(importlib.import_module(self.module), self.name)
+
+        # replace the descriptor in the class where it is defined
+        owner = type(instance) if owner is None else owner
+        for cls in owner.__mro__:
+            if cls.__dict__.get(self.name, None) is self:
+                setattr(cls, self.name, function)
+                break
+        return function.__get__(instance, owner)
+
+
+def import_attribute(package: str, name: str, submodules: frozenset,
+                     attributes: dict) -> Any:
+    """Returns a submodule or attribute of a package, which is imported when
+    it is first accessed (PEP 562).
+
+    Parameters
+    ----------
+    package : str
+
+        name of the package
+
+    name : str
+
+        name of the accessed attribute
+
+    submodules : frozenset
+
+        names of the submodules of the package which are imported lazily
+
+    attributes : dict
+
+        dictionary of the names of attributes and the modules they are
+        imported from
+
+    """
+    if name in submodules:
+        return importlib.import_module('{0}.{1}'.format(package, name))
+    if name in attributes:
+        return getattr(importlib.import_module(attributes[name]), name)
+    raise AttributeError(
+        "module '{0}' has no attribute '{1}'".format(package, name))
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -0,0 +1,110 @@
+"""Parallel execution of independent random experiments"""
+# !/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : parallel.py -- Random streams and worker pools
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 10:24 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+import multiprocessing
+from typing import Any, Callable, Iterator, List, Optional
+
+import numpy as np
+
+
+def seed_sequence(random_state: Optional[Any] = None) -> np.random.SeedSequence:
+    """Returns the seed sequence from which the random streams of independent
+    experiments are spawned.
+
+    Parameters
+    ----------
+    random_state : Optional[Any] = None
+
+        entropy of the seed sequence. If None, the entropy is drawn from
+        numpy's global random state, which is advanced but not reseeded.
+
+    """
+    if random_state is None:
+        random_state = np.random.randint(
+            np.iinfo(np.int32).max, size=4).tolist()
+    return np.random.SeedSequence(random_state)
+
+
+def generator(stream: np.random.SeedSequence) -> np.random.Generator:
+    """Returns a random number generator which draws from a spawned stream."""
+    return np.random.Generator(np.random.PCG64(stream))
+
+
+def number_of_jobs(n_jobs: int, tasks: int) -> int:
+    """Returns the number of worker processes for a number of tasks, where
+    -1 means one process per CPU."""
+    if n_jobs == -1:
+        n_jobs = multiprocessing.cpu_count()
+    return max(1, min(n_jobs, tasks))
+
+
+def batches(items: list, n_jobs: int) -> List[list]:
+    """Splits items into consecutive batches, where each worker process
+    receives about four batches."""
+    return [[items[i] for i in batch.tolist()] for batch in np.array_split(
+        np.arange(len(items)), max(1, min(len(items), 4*n_jobs)))]
+
+
+def imap_batches(function: Callable[[list], Any], batches: List[list],
+                 n_jobs: int) -> Iterator[Any]:
+    """Yields the results of a function applied to batches of items, which
+    are computed in a pool of worker processes.
+
+    Worker processes are forked where possible, so the function and the data
+    it refers to are shared with the workers rather than copied. The results
+    are yielded in the order of the batches.
+
+    Parameters
+    ----------
+    function : Callable[[list], Any]
+
+        function that is applied to each batch
+
+    batches : List[list]
+
+        batches of items, e.g. as returned by `batches`
+
+    n_jobs : int
+
+        number of worker processes
+
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+    else:
+        context = multiprocessing.get_context()
+    with context.Pool(n_jobs, initializer=_init_worker,
+                      initargs=(function,)) as pool:
+        yield from pool.imap(_run_worker, batches)
+
+
+_WORKER_FUNCTION: Optional[Callable[[list], Any]] = None
+
+
+def _init_worker(function: Callable[[list], Any]) -> None:
+    """Stores the function in a worker process."""
+    global _WORKER_FUNCTION
+    _WORKER_FUNCTION = function
+
+
+def _run_worker(batch: list) -> Any:
+    """Applies the function to a batch in a worker process."""
+    return _WORKER_FUNCTION(batch)
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -9,10 +9,11 @@
 # Copyright (c) 2016-2019 Pathpy Developers
 # =============================================================================
 from typing import Any
-from tqdm import tqdm as tq  # pylint: disable=import-error
-from tqdm.notebook import tqdm as tqn  # pylint: disable=import-error
 from pathpy import config
 
+# tqdm is imported with the first progress bar, since the notebook version
+# imports IPython
+
 
 def tqdm_disabled(it, *args, **kwargs):
     """Disable the progress bar and return initial iterator."""
@@ -22,6 +23,7 @@ def tqdm_disabled(it, *args, **kwargs):
 def tqdm_console(*args, **kwargs):
     """Progressbar for a console environment."""
     if len(args[0]) > config['progress']['min_iter']:
+        from tqdm import tqdm as tq  # pylint: disable=import-error
         return tq(*args, **kwargs)
     else:
         return args[0]
@@ -30,6 +32,7 @@ def tqdm_console(*args, **kwargs):
 def tqdm_notebook(*args, **kwargs):
     """Progressbar for a notebook environment."""
     if len(args[0]) > config['progress']['min_iter']:
+        from tqdm.notebook import tqdm as tqn  # pylint: disable=import-error
         return tqn(*args, **kwargs)
     else:
         return args[0]
@@ -13,6 +13,7 @@
 
 from pathpy.visualisations.plot import plot
 from pathpy.visualisations.layout import layout
+from pathpy.visualisations.layout_cache import LayoutCache
 
 # =============================================================================
 # eof
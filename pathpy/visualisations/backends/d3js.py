@@ -15,6 +15,8 @@ import json
 
 from string import Template
 
+import numpy as np
+
 from pathpy import logger, config
 
 # create logger for the Network class
@@ -56,10 +58,16 @@ class D3js:
         data['links'] = data.pop('edges')
 
         # mirrow y axis
-        if _config['coordinates']:
-            for node in data['nodes']:
-                _x, _y = node['coordinates']
-                node['coordinates'] = (_x, _config['height']-_y)
+        coordinates = data['nodes'].get('coordinates', None)
+        if _config['coordinates'] and coordinates:
+            _xy = np.array(coordinates, dtype=float)
+            _xy[:, 1] = _config['height'] - _xy[:, 1]
+            data['nodes']['coordinates'] = _xy.tolist()
+
+        # nodes and links are given by columns of their properties
+        for key in ['nodes', 'links']:
+            data[key] = {'length': len(data[key].get('uid', [])),
+                         'columns': data[key]}
 
         # load js template
         temp_name = 'template.html'
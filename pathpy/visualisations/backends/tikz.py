@@ -12,7 +12,7 @@ from __future__ import annotations  # remove for python 3.8
 from random import uniform
 
 from pathpy import logger
-from pathpy.visualisations.utils import UnitConverter, bend_factor
+from pathpy.visualisations.utils import UnitConverter, bend_factor, to_rows
 
 # create logger
 LOG = logger(__name__)
@@ -91,7 +91,8 @@ class Tikz:
             config[key] = px2cm(config[key])
 
         # clean data
-        data = figure['data']
+        data = {key: to_rows(figure['data'][key])
+                for key in ['nodes', 'edges']}
 
         for node in data['nodes']:
             node['size'] = px2cm(node['size'])
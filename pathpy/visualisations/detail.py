@@ -0,0 +1,250 @@
+"""Level of detail of plotted networks"""
+# !/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : detail.py -- Reduce the number of plotted elements
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 09:50 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pathpy import logger
+from pathpy.visualisations.utils import to_rows, to_columns
+
+# create logger
+LOG = logger(__name__)
+
+# aggregated objects are at most this many times larger than the largest
+# original object
+SCALE = 4.0
+
+
+def level_of_detail(figure: Any) -> Any:
+    """Reduces the number of nodes and edges of a parsed figure.
+
+    The stage sits between the parser and the backends and is controlled by
+    the plot options `max_elements`, `clusters` and `edge_threshold`. Edges
+    whose size is below `edge_threshold` are removed. If the figure has more
+    than `max_elements` nodes and edges, the following steps are applied
+    until the figure is small enough:
+
+    1. Edges between the same pair of nodes are aggregated.
+    2. Nodes with the same label in `clusters` are merged into super-nodes,
+       where edges between clusters are aggregated and edges within clusters
+       are removed. Clusters are either given by a dictionary of node uids
+       and community labels, e.g. the result of
+       `pathpy.algorithms.modularity_maximisation`, or by the name of a node
+       property such as 'group'.
+    3. The nodes with the largest total size of edges and the largest edges
+       are kept.
+
+    Sizes of edges serve as their importance. The size of aggregated edges
+    and super-nodes grows with their total size, or the number of merged
+    nodes, respectively, and is at most `SCALE` times the largest original
+    size. Temporal networks are not reduced, since the events of the
+    animation refer to individual edges.
+
+    Parameters
+    ----------
+    figure : Any
+
+        figure returned by the parser, which is modified in place
+
+    Returns
+    -------
+    Any
+
+        the reduced figure
+
+    """
+    config = figure['config']
+    max_elements = config.pop('max_elements', None)
+    clusters = config.pop('clusters', None)
+    threshold = config.pop('edge_threshold', None)
+    if max_elements is None and threshold is None:
+        return figure
+
+    if config.get('temporal', False):
+        LOG.warning('The level of detail of temporal networks is not reduced')
+        return figure
+
+    nodes: list = to_rows(figure['data']['nodes'])
+    edges: list = to_rows(figure['data']['edges'])
+    directed = bool(config.get('directed', False))
+
+    def too_large() -> bool:
+        return max_elements is not None and \
+            len(nodes) + len(edges) > max_elements
+
+    if threshold is not None:
+        edges = [e for e, w in zip(edges, _sizes(edges)) if w >= threshold]
+
+    if too_large():
+        edges = _aggregate_edges(edges, directed)
+
+    if too_large() and clusters is not None:
+        nodes, edges = _cluster_nodes(nodes, edges, clusters, directed)
+
+    if too_large():
+        nodes, edges = _prune(nodes, edges, max_elements)
+
+    figure['data']['nodes'] = to_columns(nodes)
+    figure['data']['edges'] = to_columns(edges)
+    return figure
+
+
+def _sizes(objects: List[dict]) -> np.ndarray:
+    """Returns the sizes of objects, where missing sizes are 1."""
+    return np.array([o.get('size', None) or 1.0 for o in objects],
+                    dtype=float)
+
+
+def _scaled(values: np.ndarray, counts: np.ndarray,
+            sizes: np.ndarray) -> np.ndarray:
+    """Returns the sizes of aggregated objects, which are the original sizes
+    of single objects and grow linearly with the total value otherwise."""
+    if len(values) == 0:
+        return values
+    low, high = sizes.min(), sizes.max()
+    result = values.copy()
+    merged = counts > 1
+    if merged.any():
+        top = values[merged].max()
+        result[merged] = np.maximum(
+            values[merged] / top * SCALE * high, low)
+    return result
+
+
+def _aggregate(objects: List[dict], keys: np.ndarray,
+               values: np.ndarray) -> Tuple[List[dict], np.ndarray,
+                                            np.ndarray]:
+    """Merges objects with the same key into their first object, and
+    returns the merged objects, their total values and counts."""
+    codes, _ = pd.factorize(keys)
+    first = np.unique(codes, return_index=True)[1]
+    total = np.bincount(codes, weights=values)
+    counts = np.bincount(codes)
+    return [dict(objects[i]) for i in first.tolist()], total, counts
+
+
+def _edge_keys(sources: np.ndarray, targets: np.ndarray,
+               directed: bool) -> np.ndarray:
+    """Returns keys of the node pairs of edges."""
+    if not directed:
+        sources, targets = np.minimum(sources, targets), \
+            np.maximum(sources, targets)
+    return sources.astype(np.int64) * (max(sources.max(initial=0),
+                                           targets.max(initial=0)) + 1) \
+        + targets
+
+
+def _aggregate_edges(edges: List[dict], directed: bool) -> List[dict]:
+    """Aggregates edges between the same pair of nodes."""
+    if not edges:
+        return edges
+    codes, _ = pd.factorize(np.array(
+        [e['source'] for e in edges] + [e['target'] for e in edges],
+        dtype=object))
+    keys = _edge_keys(codes[:len(edges)], codes[len(edges):], directed)
+    sizes = _sizes(edges)
+    merged, total, counts = _aggregate(edges, keys, sizes)
+    for edge, size in zip(merged, _scaled(total, counts, sizes).tolist()):
+        edge['size'] = size
+    return merged
+
+
+def _cluster_nodes(nodes: List[dict], edges: List[dict], clusters: Any,
+                   directed: bool) -> Tuple[List[dict], List[dict]]:
+    """Merges nodes with the same cluster label into super-nodes."""
+    uids = [n['uid'] for n in nodes]
+    if isinstance(clusters, str):
+        labels = [n.get(clusters, None) for n in nodes]
+    else:
+        labels = [clusters.get(uid, None) for uid in uids]
+
+    # nodes without label are clusters of their own
+    keys = np.empty(len(nodes), dtype=object)
+    keys[:] = [('cluster', label) if label is not None else ('node', uid)
+               for uid, label in zip(uids, labels)]
+    codes, _ = pd.factorize(keys)
+    sizes = _sizes(nodes)
+    merged, _, counts = _aggregate(nodes, codes, np.ones(len(nodes)))
+
+    taken = {uid for uid, label in zip(uids, labels) if label is None}
+    groups = np.split(np.argsort(codes, kind='stable'),
+                      np.cumsum(counts)[:-1])
+    for node, members in zip(merged, groups):
+        if len(members) == 1:
+            continue
+        label = labels[members[0]]
+        uid = str(label)
+        while uid in taken:
+            uid = '{0}*'.format(uid)
+        taken.add(uid)
+        node['uid'] = uid
+        node['label'] = uid
+        node.pop('text', None)
+        coordinates = [nodes[j].get('coordinates', None)
+                       for j in members.tolist()]
+        if all(c is not None for c in coordinates):
+            node['coordinates'] = tuple(np.mean(coordinates, axis=0).tolist())
+    scaled = _scaled(np.sqrt(counts).astype(float) * sizes[
+        np.unique(codes, return_index=True)[1]], counts, sizes)
+    for node, size in zip(merged, scaled.tolist()):
+        node['size'] = size
+
+    # edges between clusters, where edges within clusters are removed
+    index = {uid: codes[i] for i, uid in enumerate(uids)}
+    _uids = [n['uid'] for n in merged]
+    remaining = []
+    for edge in edges:
+        v, w = index[edge['source']], index[edge['target']]
+        if v != w:
+            edge = dict(edge)
+            edge['source'], edge['target'] = _uids[v], _uids[w]
+            remaining.append(edge)
+    return merged, _aggregate_edges(remaining, directed)
+
+
+def _prune(nodes: List[dict], edges: List[dict],
+           max_elements: int) -> Tuple[List[dict], List[dict]]:
+    """Keeps the nodes with the largest total size of edges and the largest
+    edges."""
+    sizes = _sizes(edges)
+    if len(nodes) > max_elements:
+        index = {n['uid']: i for i, n in enumerate(nodes)}
+        strength = np.zeros(len(nodes))
+        np.add.at(strength, [index[e['source']] for e in edges], sizes)
+        np.add.at(strength, [index[e['target']] for e in edges], sizes)
+        order = np.argsort(-strength, kind='stable')
+        keep = np.sort(order[:max(1, max_elements // 2)])
+        nodes = [nodes[i] for i in keep.tolist()]
+        kept = {n['uid'] for n in nodes}
+        select = [i for i, e in enumerate(edges)
+                  if e['source'] in kept and e['target'] in kept]
+        edges = [edges[i] for i in select]
+        sizes = sizes[select]
+
+    budget = max(0, max_elements - len(nodes))
+    if len(edges) > budget:
+        keep = np.sort(np.argsort(-sizes, kind='stable')[:budget])
+        edges = [edges[i] for i in keep.tolist()]
+    return nodes, edges
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -133,6 +133,16 @@ def layout(network, **kwds):
       the seed used by the random number generator, if None, the a random seed
       by created by the numpy random number generator is used.
 
+    - ``theta`` : float, optional (default = 0.9)
+      Accuracy of the Barnes-Hut approximation used for networks with 500 or
+      more nodes. Cells of nodes whose size is less than theta times their
+      distance act as a single node. Smaller values are more accurate, but
+      slower.
+
+    - ``multilevel`` : bool, optional (default = True)
+      Whether or not the initial positions of networks with 500 or more
+      nodes are obtained from layouts of successively coarsened networks.
+
     In the layout style dictionary multiple keywords can be used to address
     attributes. These keywords will be converted to an unique key word,
     used in the remaining code.
@@ -210,6 +220,16 @@ def layout(network, **kwds):
     if _weight is None:
         _weight = kwds.get('layout_weight', None)
 
+    nodes, adjacency_matrix = _network_data(network, _weight)
+
+    # create layout class
+    layout = Layout(nodes, adjacency_matrix, **kwds)
+    # return the layout
+    return layout.generate_layout()
+
+
+def _network_data(network, _weight=None):
+    """Returns the node ids and the adjacency matrix of a network."""
     # check type of network
     if 'cnet' in str(type(network)):
         # log.debug('The network is of type "cnet".')
@@ -249,10 +269,7 @@ def layout(network, **kwds):
                   ' and "node/edge list" is supported!')
         raise NotImplementedError
 
-    # create layout class
-    layout = Layout(nodes, adjacency_matrix, **kwds)
-    # return the layout
-    return layout.generate_layout()
+    return nodes, adjacency_matrix
 
 
 class Layout(object):
@@ -317,6 +334,9 @@ class Layout(object):
         self.radius = attr.get('radius', 1.0)
         self.direction = attr.get('direction', 1.0)
         self.start_angle = attr.get('start_angle', 0.0)
+        self.theta = attr.get('theta', 0.9)
+        self.multilevel = attr.get('multilevel', True)
+        self.temperature = attr.get('temperature', None)
 
         # TODO: allow also higher dimensional layouts
         if self.dimension > 2:
@@ -366,12 +386,15 @@ class Layout(object):
 
         return {**_kwds, **kwds}
 
+    # names of the Fruchterman-Reingold algorithm
+    names_fr = ['Fruchterman-Reingold', 'fruchterman_reingold', 'fr',
+                'spring_layout', 'spring layout', 'FR']
+
     def generate_layout(self):
         """Function to pick and generate the right layout."""
         # method names
         names_rand = ['Random', 'random', 'rand', None]
-        names_fr = ['Fruchterman-Reingold', 'fruchterman_reingold', 'fr',
-                    'spring_layout', 'spring layout', 'FR']
+        names_fr = self.names_fr
         names_circular = ['circular', 'circle', 'ring', '1d-lattice', 'lattice-1d']
         names_grid = ['grid', '2d-lattice', 'lattice-2d']
         # check which layout should be plotted
@@ -464,6 +487,19 @@ class Layout(object):
           the seed used by the random number generator, if None, the a random seed
           by created by the numpy random number generator is used.
 
+        - ``theta`` : float, optional (default = 0.9)
+          Accuracy of the Barnes-Hut approximation of repulsive forces in
+          networks with 500 or more nodes.
+
+        - ``multilevel`` : bool, optional (default = True)
+          Whether or not initial positions of networks with 500 or more nodes
+          are obtained by refining layouts of coarsened networks.
+
+        - ``temperature`` : float or None, optional (default = None)
+          Largest initial step of nodes. If None, the step is limited to a
+          tenth of the size of the domain. Small values refine given initial
+          positions without destroying them.
+
         Returns
         -------
         layout : dict
@@ -477,9 +513,10 @@ class Layout(object):
         if self.fixed is not None:
             self.fixed = np.asarray([self.nodes.index(v) for v in self.fixed])
 
+        _size = 1
         if self.positions is not None:
             # Determine size of existing domain to adjust initial positions
-            _size = max(coord for t in layout.values() for coord in t)
+            _size = max(coord for t in self.positions.values() for coord in t)
             if _size == 0:
                 _size = 1
             np.random.seed(self.seed)
@@ -496,13 +533,11 @@ class Layout(object):
             # We must adjust k by domain size for layouts not near 1x1
             self.k = _size / np.sqrt(len(self.nodes))
 
-        try:
-            # Sparse matrix
-            if len(self.nodes) < 500:  # sparse solver for large graphs
-                raise ValueError
-            layout = self._sparse_fruchterman_reingold()
-        except:
+        if len(self.nodes) < 500:
             layout = self._fruchterman_reingold()
+        else:
+            # Barnes-Hut solver for large graphs
+            layout = self._sparse_fruchterman_reingold()
 
         layout = dict(zip(self.nodes, layout))
 
@@ -548,6 +583,8 @@ class Layout(object):
         # to be much bigger than 1x1
         t = max(max(layout.T[0]) - min(layout.T[0]),
                 max(layout.T[1]) - min(layout.T[1])) * 0.1
+        if self.temperature is not None:
+            t = min(t, self.temperature)
         # simple cooling scheme.
         # linearly step down by dt on each iteration so last iteration is size dt.
         dt = t / float(self.iterations + 1)
@@ -583,81 +620,101 @@ class Layout(object):
         return layout
 
     def _sparse_fruchterman_reingold(self):
-        """Fruchterman-Reingold algorithm for sparse matrices.
+        """Fruchterman-Reingold algorithm for large sparse networks.
 
-        This algorithm is based on the Fruchterman-Reingold algorithm provided
-        by networkx. (Copyright (C) 2004-2018 by Aric Hagberg <hagberg@lanl.gov>
-        Dan Schult <dschult@colgate.edu> Pieter Swart <swart@lanl.gov> Richard
-        Penney <rwpenney@users.sourceforge.net> All rights reserved. BSD
-        license.)
+        The repulsive forces between all pairs of nodes are approximated with
+        a Barnes-Hut quadtree, where distant cells of nodes act as a single
+        node in their center of mass. Attractive forces are only calculated
+        for the non-zero entries of the sparse adjacency matrix, so that each
+        iteration takes O(n log n + m) time and memory. If no initial
+        positions are given, the nodes are placed by a multilevel scheme,
+        i.e. the layout of a coarsened network is refined on successively
+        finer networks.
 
         """
-        A = self.adjacency_matrix
-        k = self.k
-        try:
-            _n, _ = A.shape
-        except AttributeError:
-            log.error('Fruchterman-Reingold algorithm needs an adjacency '
-                      'matrix as input')
-            raise AttributeError
-        try:
-            from scipy.sparse import spdiags, coo_matrix
-        except ImportError:
-            log.error('The sparse Fruchterman-Reingold algorithm needs the '
-                      'scipy package: http://scipy.org/')
-            raise ImportError
-        # make sure we have a LIst of Lists representation
-        try:
-            A = A.tolil()
-        except:
-            A = (coo_matrix(A)).tolil()
-
-        if self.layout is None:
-            # random initial positions
-            np.random.seed(self.seed)
-            layout = np.asarray(np.random.rand(
-                _n, self.dimension), dtype=A.dtype)
-        else:
-            # make sure positions are of same type as matrix
-            layout = layout.astype(A.dtype)
+        from scipy.sparse import coo_matrix
 
-        # no fixed nodes
-        if self.fixed is None:
-            self.fixed = []
+        A = coo_matrix(self.adjacency_matrix).tocsr()
+        _n = A.shape[0]
 
         # optimal distance between nodes
+        k = self.k
         if k is None:
             k = np.sqrt(1.0 / _n)
+
+        np.random.seed(self.seed)
+        if self.layout is not None:
+            layout = self.layout.astype(float)
+            return self._barnes_hut(A, layout, k, self.fixed,
+                                    self.temperature)
+
+        if self.multilevel:
+            return self._multilevel(A, k)
+
+        layout = np.random.rand(_n, self.dimension)
+        return self._barnes_hut(A, layout, k, self.fixed, self.temperature)
+
+    def _multilevel(self, A, k):
+        """Places nodes by refining layouts of coarsened networks."""
+        # coarsen the network by matching pairs of adjacent nodes
+        networks = [A]
+        parents = []
+        while networks[-1].shape[0] > 100:
+            parent, coarse = _coarsen(networks[-1])
+            if coarse.shape[0] > 0.8 * networks[-1].shape[0]:
+                break
+            parents.append(parent)
+            networks.append(coarse)
+
+        # the area of the layout is the same on all levels
+        _n = A.shape[0]
+        layout = np.random.rand(networks[-1].shape[0], self.dimension)
+        for level in range(len(networks) - 1, -1, -1):
+            _k = k * np.sqrt(_n / networks[level].shape[0])
+            if level < len(networks) - 1:
+                # place nodes next to the node they have been merged into
+                layout = layout[parents[level]] + \
+                    (np.random.rand(len(parents[level]), self.dimension)
+                     - 0.5) * _k
+            fixed = self.fixed if level == 0 else None
+            temperature = None if level == len(networks) - 1 else 2 * _k
+            layout = self._barnes_hut(networks[level], layout, _k, fixed,
+                                      temperature)
+        return layout
+
+    def _barnes_hut(self, A, layout, k, fixed=None, temperature=None):
+        """Moves nodes by Barnes-Hut approximated forces until convergence."""
+        _n = A.shape[0]
+        A = A.tocoo()
+        rows, cols, weights = A.row, A.col, A.data
+
         # the initial "temperature"  is about .1 of domain area (=1x1)
         # this is the largest step allowed in the dynamics.
-        t = max(max(layout.T[0]) - min(layout.T[0]),
-                max(layout.T[1]) - min(layout.T[1])) * 0.1
+        t = np.ptp(layout, axis=0).max() * 0.1
+        if temperature is not None:
+            t = min(t, temperature)
         # simple cooling scheme.
         # linearly step down by dt on each iteration so last iteration is size dt.
         dt = t / float(self.iterations + 1)
 
-        displacement = np.zeros((self.dimension, _n))
         for iteration in range(self.iterations):
-            displacement *= 0
-            # loop over rows
-            for i in range(A.shape[0]):
-                if i in self.fixed:
-                    continue
-                # difference between this row's node position and all others
-                delta = (layout[i] - layout).T
-                # distance between points
-                distance = np.sqrt((delta**2).sum(axis=0))
-                # enforce minimum distance of 0.01
-                distance = np.where(distance < 0.01, 0.01, distance)
-                # the adjacency matrix row
-                Ai = np.asarray(A.getrowview(i).toarray())
-                # displacement "force"
-                displacement[:, i] +=\
-                    (delta * (k * k / distance**2 - Ai * distance / k)).sum(axis=1)
+            # repulsive forces between all nodes
+            displacement = _repulsion(layout, k, self.theta)
+            # attractive forces between adjacent nodes
+            delta = layout[rows] - layout[cols]
+            distance = np.sqrt((delta**2).sum(axis=1))
+            np.clip(distance, 0.01, None, out=distance)
+            force = weights * distance / k
+            for d in range(layout.shape[1]):
+                displacement[:, d] -= np.bincount(
+                    rows, weights=delta[:, d] * force, minlength=_n)
             # update positions
-            length = np.sqrt((displacement**2).sum(axis=0))
+            length = np.sqrt((displacement**2).sum(axis=1))
             length = np.where(length < 0.01, 0.1, length)
-            delta_layout = (displacement * t / length).T
+            delta_layout = displacement * (t / length)[:, np.newaxis]
+            if fixed is not None:
+                # don't change positions of fixed nodes
+                delta_layout[fixed] = 0.0
             layout += delta_layout
             # cool temperature
             t -= dt
@@ -666,7 +723,6 @@ class Layout(object):
                 break
         return layout
 
-
     def circular(self):
         """Position nodes on a circle with given radius. 
 
@@ -733,6 +789,141 @@ class Layout(object):
 
         return layout
 
+
+# maximal depth of the quadtree used for the Barnes-Hut approximation
+_DEPTH = 20
+
+
+def _morton(x, y):
+    """Interleaves the bits of integer coordinates to codes of a z-order."""
+    code = np.zeros(len(x), dtype=np.int64)
+    for i, value in enumerate((y, x)):
+        value = value.astype(np.int64)
+        value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+        value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+        value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+        value = (value | (value << 2)) & 0x3333333333333333
+        value = (value | (value << 1)) & 0x5555555555555555
+        code |= value << i
+    return code
+
+
+def _repulsion(layout, k, theta):
+    """Returns the repulsive forces on all nodes approximated by a quadtree.
+
+    Nodes are sorted along a z-order curve, such that every cell of the
+    quadtree is a contiguous range of sorted nodes. The tree is traversed
+    level by level for all nodes at once, where a cell acts as a single node
+    in its center of mass if its size is less than theta times its distance.
+
+    """
+    _n = len(layout)
+    low = layout.min(axis=0)
+    extent = np.ptp(layout, axis=0).max()
+    if extent == 0:
+        extent = 1.0
+    grid = np.minimum(((layout - low) / extent * (1 << _DEPTH))
+                      .astype(np.int64), (1 << _DEPTH) - 1)
+    codes = _morton(grid[:, 0], grid[:, 1])
+    order = np.argsort(codes, kind='stable')
+    codes = codes[order]
+    position = layout[order]
+
+    # cells of all levels given by their code, first node, number of nodes
+    # and center of mass
+    levels = []
+    for level in range(1, _DEPTH + 1):
+        cells = codes >> 2 * (_DEPTH - level)
+        first = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+        count = np.diff(np.r_[first, _n])
+        center = np.add.reduceat(position, first, axis=0) / count[:, None]
+        levels.append((cells[first], first, count, center))
+
+    # range of the children of each cell
+    children = []
+    for (_, first, _, _), (_, below, _, _) in zip(levels[:-1], levels[1:]):
+        bounds = np.searchsorted(below, np.r_[first, _n])
+        children.append((bounds[:-1], bounds[1:]))
+
+    force = np.zeros((_n, layout.shape[1]))
+    node = np.repeat(np.arange(_n), len(levels[0][0]))
+    cell = np.tile(np.arange(len(levels[0][0])), _n)
+    for level, (code, first, count, center) in enumerate(levels, 1):
+        if len(node) == 0:
+            break
+        size = extent / (1 << level)
+        last = level == _DEPTH
+
+        delta = position[node] - center[cell]
+        distance = np.einsum('ij,ij->i', delta, delta)
+        own = (codes[node] >> 2 * (_DEPTH - level)) == code[cell]
+        mass = count[cell]
+        done = (~own & (size * size < theta * theta * distance)) | \
+            (mass == 1)
+        if not last:
+            # open the remaining cells
+            start, stop = children[level - 1]
+            opened = cell[~done]
+            number = stop[opened] - start[opened]
+            next_cell = np.repeat(stop[opened] - number.cumsum(), number) + \
+                np.arange(number.sum())
+            next_node = np.repeat(node[~done], number)
+            node, cell, delta, distance, own, mass = \
+                node[done], cell[done], delta[done], distance[done], \
+                own[done], mass[done]
+
+        # the node itself does not contribute to its own cell
+        mass = mass.astype(float)
+        mass[own & (mass == 1)] = 0
+        leaf = own & (mass > 1)
+        delta[leaf] *= (mass[leaf] / (mass[leaf] - 1))[:, None]
+        distance[leaf] = np.einsum('ij,ij->i', delta[leaf], delta[leaf])
+        mass[leaf] -= 1
+
+        np.clip(distance, 1e-4, None, out=distance)
+        weight = mass * (k * k) / distance
+        for d in range(layout.shape[1]):
+            force[:, d] += np.bincount(node, weights=delta[:, d] * weight,
+                                       minlength=_n)
+        if last:
+            break
+        node, cell = next_node, next_cell
+
+    result = np.empty_like(force)
+    result[order] = force
+    return result
+
+
+def _coarsen(A):
+    """Coarsens a network by merging randomly matched pairs of adjacent
+    nodes, and returns the index of the merged node for each node and the
+    adjacency matrix of the coarsened network."""
+    from scipy.sparse import csr_matrix, diags
+
+    _n = A.shape[0]
+    match = np.full(_n, -1)
+    index = np.arange(_n)
+    for _ in range(4):
+        free = diags((match < 0).astype(float))
+        B = (free @ A @ free).tocsr()
+        B.eliminate_zeros()
+        if B.nnz == 0:
+            break
+        # every node chooses a random heavy neighbor, mutual choices match
+        B.data = np.abs(B.data) * (1 + np.random.random_sample(B.nnz))
+        choice = np.asarray(B.argmax(axis=1)).ravel()
+        mutual = (np.diff(B.indptr) > 0) & (choice[choice] == index) & \
+            (choice != index)
+        match[mutual] = choice[mutual]
+
+    merged = np.where(match < 0, index, np.minimum(index, match))
+    _, parent = np.unique(merged, return_inverse=True)
+    P = csr_matrix((np.ones(_n), (index, parent)))
+    coarse = (P.T @ A @ P).tocsr()
+    coarse.setdiag(0)
+    coarse.eliminate_zeros()
+    return parent, coarse
+
 # =============================================================================
 # eof
 #
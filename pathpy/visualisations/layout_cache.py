@@ -0,0 +1,282 @@
+"""Cache of network layouts"""
+# !/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : layout_cache.py -- Reuse and incrementally update layouts
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 09:44 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from pathpy import logger
+from pathpy.utils.helper import atomic_write
+from pathpy.visualisations.layout import Layout, _network_data
+
+# create logger
+LOG = logger(__name__)
+
+# version of the cache format, which is part of all keys
+VERSION = 1
+
+# bound of the distance nodes move in warm starts relative to the size of
+# the layout
+_STEP = 0.04
+
+
+class LayoutCache:
+    """Cache of node layouts of networks.
+
+    Layouts are stored under a key which is derived from the node ids, the
+    adjacency matrix and the options of the layout, so a network is only
+    laid out again if its structure or the options change. If the layout of
+    a network with the same uid has been computed before and only a small
+    fraction of nodes and edges changed, the previous positions are used as
+    initial positions of a short Fruchterman-Reingold refinement (warm
+    start), where new nodes are placed at the center of their neighbors.
+
+    Parameters
+    ----------
+    maxsize : int = 128
+
+        maximal number of cached layouts, where the least recently used
+        layouts are removed first
+
+    tolerance : float = 0.1
+
+        maximal fraction of changed nodes and edges for which layouts are
+        refined rather than computed from scratch. If 0, warm starts are
+        disabled.
+
+    iterations : int = 20
+
+        number of iterations of warm starts
+
+    kwds : Any
+
+        options of the layouts as in `pathpy.layout`, e.g. `layout='fr'`
+        or `seed=1`
+
+    Examples
+    --------
+    >>> import pathpy as pp
+    >>> cache = pp.LayoutCache(layout='fr', seed=1)
+    >>> net = pp.generators.Watts_Strogatz(n=1000, s=2, p=0.05)
+    >>> net.plot(layout=cache, filename='a.html')
+    >>> net.plot(layout=cache, filename='b.html', node_color='red')
+    >>> cache.hits
+    1
+    >>> cache.save('network.layout.npz')
+
+    """
+
+    def __init__(self, maxsize: int = 128, tolerance: float = 0.1,
+                 iterations: int = 20, **kwds: Any) -> None:
+        self.maxsize = maxsize
+        self.tolerance = tolerance
+        self.iterations = iterations
+        self.options: dict = kwds
+        self.entries: OrderedDict = OrderedDict()
+        self.latest: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __call__(self, network: Any, **kwds: Any) -> dict:
+        return self.layout(network, **kwds)
+
+    def layout(self, network: Any, **kwds: Any) -> dict:
+        """Returns the layout of a network, which is computed if it is not
+        cached.
+
+        Parameters
+        ----------
+        network : Any
+
+            network of any type supported by `pathpy.layout`
+
+        kwds : Any
+
+            options of the layout, which override the options of the cache
+
+        Returns
+        -------
+        dict
+
+            A dictionary of positions keyed by node
+
+        """
+        options = {**self.options, **kwds}
+        _weight = options.get('weight', options.get('layout_weight', None))
+        nodes, adjacency_matrix = _network_data(network, _weight)
+        A = adjacency_matrix.tocsr().astype(float)
+        A.sum_duplicates()
+        A.sort_indices()
+
+        key = self.key(nodes, A, options)
+        uid = str(getattr(network, 'uid', None))
+
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            self.latest[uid] = key
+            _nodes, positions, _, _ = self.entries[key]
+            return dict(zip(_nodes, positions))
+
+        self.misses += 1
+        positions = self._warm_start(uid, nodes, A, options)
+        if positions is None:
+            result = Layout(nodes, A, **options).generate_layout()
+        else:
+            result = Layout(nodes, A, **{
+                **options, 'positions': positions,
+                'iterations': self.iterations,
+                'temperature': _STEP * _extent(positions) / self.iterations
+            }).generate_layout()
+
+        coo = A.tocoo()
+        positions = np.array([result[v] for v in nodes], dtype=float)
+        self.entries[key] = (list(nodes), positions.reshape(len(nodes), -1),
+                             coo.row, coo.col)
+        self.latest[uid] = key
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return result
+
+    @staticmethod
+    def key(nodes: list, adjacency_matrix: Any, options: dict) -> str:
+        """Returns the key of a layout, which is a hash of the node ids, the
+        adjacency matrix and the options of the layout."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(
+            [VERSION, {k: v for k, v in options.items()
+                       if k not in ('positions', 'fixed')},
+             options.get('positions', None), options.get('fixed', None)],
+            sort_keys=True, default=str).encode())
+        digest.update('\0'.join(str(v) for v in nodes).encode())
+        for array in (adjacency_matrix.indptr, adjacency_matrix.indices,
+                      adjacency_matrix.data):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    def _warm_start(self, uid: str, nodes: list, A: Any,
+                    options: dict) -> Optional[dict]:
+        """Returns initial positions of nodes derived from the previous layout
+        of a network, or None if too many nodes or edges changed."""
+        if self.tolerance <= 0 or uid not in self.latest or \
+                self.latest[uid] not in self.entries or \
+                options.get('positions', None) is not None or \
+                options.get('layout', None) not in Layout.names_fr:
+            return None
+        _nodes, positions, rows, cols = self.entries[self.latest[uid]]
+
+        # indices of previous nodes in the current network, or -1
+        index = {v: i for i, v in enumerate(nodes)}
+        mapping = np.array([index.get(v, -1) for v in _nodes], dtype=np.int64)
+        kept = mapping >= 0
+
+        # changed edges are given by their keys in the current network
+        n = len(nodes)
+        coo = A.tocoo()
+        current = np.sort(coo.row.astype(np.int64) * n + coo.col)
+        valid = kept[rows] & kept[cols]
+        previous = np.sort(mapping[rows[valid]] * n + mapping[cols[valid]])
+        common = np.isin(current, previous, assume_unique=True).sum()
+        changed = (len(current) - common) + (len(rows) - common) + \
+            (n - kept.sum()) + (len(_nodes) - kept.sum())
+        if changed > self.tolerance * max(1, len(current) + n):
+            return None
+
+        layout = np.full((n, positions.shape[1]), np.nan)
+        layout[mapping[kept]] = positions[kept]
+
+        # new nodes are placed at the center of their placed neighbors
+        placed = ~np.isnan(layout[:, 0])
+        for _ in range(2):
+            missing = np.flatnonzero(~placed)
+            if len(missing) == 0:
+                break
+            B = A[missing][:, placed]
+            counts = np.asarray((B != 0).sum(axis=1)).ravel()
+            center = (B != 0) @ layout[placed]
+            found = counts > 0
+            layout[missing[found]] = center[found] / counts[found, None]
+            placed[missing[found]] = True
+
+        np.random.seed(options.get('seed', None))
+        low = np.nanmin(layout, axis=0)
+        high = np.nanmax(layout, axis=0)
+        missing = np.flatnonzero(~placed)
+        layout[missing] = low + np.random.rand(
+            len(missing), layout.shape[1]) * (high - low)
+        # avoid coinciding positions of new nodes
+        new = np.ones(n, dtype=bool)
+        new[mapping[kept]] = False
+        layout[new] += (np.random.rand(new.sum(), layout.shape[1]) - 0.5) * \
+            1e-3 * _extent(layout)
+        return dict(zip(nodes, layout))
+
+    def save(self, file: str) -> None:
+        """Stores the cached layouts in an uncompressed npz file, e.g. next
+        to the file of the network."""
+        keys = list(self.entries)
+        meta = json.dumps({'version': VERSION, 'keys': keys,
+                           'latest': self.latest,
+                           'nodes': [self.entries[key][0] for key in keys]})
+        arrays = {}
+        for i, key in enumerate(keys):
+            _, positions, rows, cols = self.entries[key]
+            arrays['positions_{0}'.format(i)] = positions
+            arrays['rows_{0}'.format(i)] = rows
+            arrays['cols_{0}'.format(i)] = cols
+
+        with atomic_write(file) as f:
+            np.savez(f, meta=np.array(meta), **arrays)
+
+    @classmethod
+    def load(cls, file: str, **kwds: Any) -> LayoutCache:
+        """Loads layouts stored by `save` into a new cache, where `kwds` are
+        passed to the constructor of the cache."""
+        cache = cls(**kwds)
+        with np.load(file, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            if meta['version'] != VERSION:
+                LOG.warning('Ignoring layouts of cache version %s',
+                            meta['version'])
+                return cache
+            for i, (key, nodes) in enumerate(zip(meta['keys'],
+                                                 meta['nodes'])):
+                cache.entries[key] = (
+                    nodes, data['positions_{0}'.format(i)],
+                    data['rows_{0}'.format(i)], data['cols_{0}'.format(i)])
+        cache.latest = meta['latest']
+        return cache
+
+
+def _extent(positions: Any) -> float:
+    """Returns the size of the domain of positions."""
+    if isinstance(positions, dict):
+        positions = np.array(list(positions.values()), dtype=float)
+    extent = float(np.ptp(positions, axis=0).max()) if len(positions) else 0
+    return extent if extent > 0 else 1.0
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -14,11 +14,15 @@ from collections import defaultdict
 from copy import deepcopy
 from singledispatchmethod import singledispatchmethod  # remove for python 3.8
 from datetime import datetime
+import base64
+import json
 import numpy as np
 import pandas as pd
 
 from pathpy import logger, config
-from pathpy.visualisations.utils import UnitConverter
+from pathpy.visualisations.utils import UnitConverter, to_rows
+from pathpy.visualisations.layout_cache import LayoutCache
+from pathpy.visualisations.detail import level_of_detail
 
 from pathpy.visualisations.backends import (D3js,
                                             Tikz,
@@ -51,6 +55,9 @@ config['plot']['euclidean'] = False
 config['plot']['min_max_node_size'] = None
 config['plot']['min_max_edge_size'] = None
 config['plot']['keep_aspect_ratio'] = True
+config['plot']['max_elements'] = None
+config['plot']['clusters'] = None
+config['plot']['edge_threshold'] = None
 
 config['plot']['forceCharge'] = -20  # -30
 config['plot']['forceRepel'] = -300  # -100
@@ -223,6 +230,9 @@ def plot(obj, filename: Optional[str] = None,
     # parse object to json like dict
     data: defaultdict = parser(obj, _config, **kwargs)
 
+    # reduce the number of plotted elements
+    data = level_of_detail(data)
+
     # check filename
     # if no file name is given
     if filename is None:
@@ -404,29 +414,44 @@ class Parser:
         #         edge_temp_attr[edge.uid][time].update(**values)
 
         def find_nearest(array, value, index=True):
-            value = array[0] if value == float('-inf') else value
-            value = array[-1] if value == float('inf') else value
-            idx = np.abs(array - value).argmin()
+            idx = int(_nearest(array, [value])[0])
             if index:
-                result = int(idx)
+                result = idx
             else:
                 result = array[idx]
             return result
 
         # generate temporal edges
-        temporal_edges = []
         times = np.linspace(start, end, num=steps)
+        links = {uid: i for i, uid in
+                 enumerate(self.figure['data']['edges']['uid'])}
+
+        # events overlapping with the animation, where attributes of events
+        # are given by their index in a list of distinct attributes
+        _links, _starts, _ends, _styles = [], [], [], []
+        styles: dict = {}
+        for edge in obj.edges:
+            link = links.get(edge.uid, None)
+            if link is None:
+                continue
+            for _start, _end, attributes in edge._sorted_events():
+                if _start >= end or _end <= start:
+                    continue
+                _links.append(link)
+                _starts.append(_start)
+                _ends.append(_end)
+                if attributes:
+                    key = json.dumps(attributes, sort_keys=True, default=str)
+                    _styles.append(styles.setdefault(key, len(styles)) + 1)
+                else:
+                    _styles.append(0)
 
-        for edge in obj.edges[start:end]:
-            for event in edge[start:end]:
-                _edge = {'uid': edge.uid}
-                _start = event.attributes.pop('start', start)
-                _end = event.attributes.pop('end', end)
-                _edge['startTime'] = find_nearest(times, _start)
-                _edge['endTime'] = find_nearest(times, _end)
-                _edge['active'] = True
-                _edge.update(event.attributes)
-                temporal_edges.append(_edge)
+        self.figure['data']['tedges'] = _encode_events(
+            np.array(_links, dtype=np.int64),
+            _nearest(times, np.array(_starts, dtype=float)),
+            _nearest(times, np.array(_ends, dtype=float)),
+            np.array(_styles, dtype=np.int64),
+            [json.loads(key) for key in styles], steps)
 
         # # get static edges
         # static_edges = {n['uid']: n for n in self.figure['data']['edges']}
@@ -476,10 +501,10 @@ class Parser:
         # print(temporal_edges)
         # add temporal edges to the data
         # self.figure['data']['tedges'] = list(_temporal_edges.values())
-        self.figure['data']['tedges'] = temporal_edges
 
         # get static nodes
-        static_nodes = {n['uid']: n for n in self.figure['data']['nodes']}
+        static_nodes = {n['uid']: n for n in
+                        to_rows(self.figure['data']['nodes'])}
 
         temporal_nodes = {}
 
@@ -581,14 +606,16 @@ class Parser:
 
         # parse layout
         _layout = self.config.get('layout', None)
+        if isinstance(_layout, LayoutCache):
+            _layout = _layout(obj)
         if isinstance(_layout, dict):
             self.config['node'].update({'coordinates': _layout})
             self.config['layout'] = 'euclidean'
 
         # parse nodes an edges
-        nodes = self.parse_static_objects(
+        nodes = self.parse_static_columns(
             obj.nodes, otype='node', temporal=temporal, **kwargs)
-        edges = self.parse_static_objects(
+        edges = self.parse_static_columns(
             obj.edges, otype='edge', temporal=temporal, **kwargs)
 
         # convert units to px
@@ -596,18 +623,15 @@ class Parser:
         for key in ['width', 'height']:
             self.config[key] = u2px(self.config[key])
 
-        nodes = self._convert_size(nodes, u2px, otype='node')
-        nodes = self._convert_color(nodes)
-        edges = self._convert_size(edges, u2px, otype='edge')
-        edges = self._convert_color(edges)
+        self._convert_size(nodes, u2px)
+        self._convert_color(nodes)
+        self._convert_size(edges, u2px)
+        self._convert_color(edges)
 
         # update layout
-        try:
-            layout = {n['uid']: n['coordinates'] for n in nodes}
-        except KeyError:
-            pass
-        else:
-            nodes = self._update_layout(nodes, layout, u2px)
+        if nodes['uid'] and \
+                all(c is not None for c in nodes.get('coordinates', [None])):
+            self._update_layout(nodes, u2px)
             self.config['coordinates'] = True
 
         # add nodes, edges and config to the figure
@@ -618,97 +642,60 @@ class Parser:
         # return the figure
         return self.figure
 
-    def _convert_color(self, objects):
-        """Helper function to convert rgb color tuples to JScript color strings"""
-        for obj in objects:
-            if type(obj['color']) == tuple:
-                c = 255*np.array(obj['color'])
-                obj['color'] = 'rgb(' + str(int(c[0])) + ', ' + \
-                    str(int(c[1])) + ',' + str(int(c[2])) + ')'
-            else:
-                obj['color'] = obj['color']
-
-        return objects
-
-    def _convert_size(self, objects, converter, otype='node'):
-        """Helper function to convert the units  of the size of an object."""
-
-        for obj in objects:
-            obj['size'] = converter(obj['size'])
-
-        return objects
-
-    def _update_layout(self, nodes, layout, converter):
-        """Helper function to update the layout"""
+    @staticmethod
+    def _convert_color(columns: Dict[str, list]) -> None:
+        """Helper function to convert rgb color tuples to JScript color
+        strings."""
+        colors = columns['color']
+        select = [i for i, c in enumerate(colors) if type(c) == tuple]
+        if not select:
+            return
+        rgb = (255*np.array([colors[i][:3] for i in select],
+                            dtype=float)).astype(int).tolist()
+        for i, (r, g, b) in zip(select, rgb):
+            colors[i] = 'rgb({0}, {1},{2})'.format(r, g, b)
+
+    @staticmethod
+    def _convert_size(columns: Dict[str, list], converter) -> None:
+        """Helper function to convert the units of the sizes of objects."""
+        sizes = np.array(columns['size'], dtype=float)
+        converted = converter(sizes).astype(object)
+        converted[np.isnan(sizes)] = None
+        columns['size'] = converted.tolist()
+
+    def _update_layout(self, columns: Dict[str, list], converter) -> None:
+        """Helper function to scale and center the layout on the canvas."""
         # get canvas size and margins
         width = self.config['width']
         height = self.config['height']
         keep_aspect_ratio = self.config['keep_aspect_ratio']
 
         if self.config['margin'] is None:
-            margin = max([n['size'] for n in nodes])/2+4
+            margin = np.nanmax(np.array(columns['size'], dtype=float))/2+4
         elif isinstance(self.config['margin'], (int, float)):
             margin = converter(self.config['margin'])
         else:
             margin = 0
 
-        margins = {'top': margin, 'left': margin,
-                   'bottom': margin, 'right': margin}
+        # area of the canvas within the margins
+        area = np.array([width-2*margin, height-2*margin], dtype=float)
+        layout = np.array(columns['coordinates'], dtype=float)[:, :2]
 
         # calculate the scaling ratio
-        ratio_x = float('inf')
-        ratio_y = float('inf')
+        extent = np.ptp(layout, axis=0)
+        scaling = np.full(2, float('inf'))
+        scaling[extent > 0] = area[extent > 0] / extent[extent > 0]
 
-        # find min and max values of the points
-        min_x = min(layout.items(), key=lambda item: item[1][0])[1][0]
-        max_x = max(layout.items(), key=lambda item: item[1][0])[1][0]
-        min_y = min(layout.items(), key=lambda item: item[1][1])[1][1]
-        max_y = max(layout.items(), key=lambda item: item[1][1])[1][1]
+        if keep_aspect_ratio:
+            scaling[:] = scaling.min()
+        scaling[scaling == float('inf')] = 1
 
-        if max_x-min_x > 0:
-            ratio_x = (width-margins['left']-margins['right']) / (max_x-min_x)
-        if max_y-min_y > 0:
-            ratio_y = (height-margins['top']-margins['bottom']) / (max_y-min_y)
+        # apply scaling and translate the center to the center of the canvas
+        layout *= scaling
+        low, high = layout.min(axis=0), layout.max(axis=0)
+        layout += area/2 + margin - ((high-low)/2 + low)
 
-        if keep_aspect_ratio:
-            scaling = (min(ratio_x, ratio_y), min(ratio_x, ratio_y))
-        else:
-            scaling = (ratio_x, ratio_y)
-
-        if scaling[0] == float('inf'):
-            scaling = (1, scaling[1])
-        if scaling[1] == float('inf'):
-            scaling = (scaling[0], 1)
-
-        # apply scaling to the points
-        _layout = {}
-        for n, (x, y) in layout.items():
-            _x = (x)*scaling[0]
-            _y = (y)*scaling[1]
-            _layout[n] = (_x, _y)
-
-        # find min and max values of new the points
-        min_x = min(_layout.items(), key=lambda item: item[1][0])[1][0]
-        max_x = max(_layout.items(), key=lambda item: item[1][0])[1][0]
-        min_y = min(_layout.items(), key=lambda item: item[1][1])[1][1]
-        max_y = max(_layout.items(), key=lambda item: item[1][1])[1][1]
-
-        # calculate the translation
-        translation = (((width-margins['left']-margins['right'])/2
-                        + margins['left']) - ((max_x-min_x)/2 + min_x),
-                       ((height-margins['top']-margins['bottom'])/2
-                       + margins['bottom']) - ((max_y-min_y)/2 + min_y))
-
-        # apply translation to the points
-        for n, (x, y) in _layout.items():
-            _x = (x)+translation[0]
-            _y = (y)+translation[1]
-            _layout[n] = (_x, _y)
-
-        for node in nodes:
-            node['coordinates'] = _layout[node['uid']]
-
-        return nodes
+        columns['coordinates'] = list(map(tuple, layout.tolist()))
 
     def parse_config(self, properties: dict, **kwargs: Any) -> defaultdict:
         """Parse the config file."""
@@ -739,75 +726,143 @@ class Parser:
 
         return _config
 
-    def parse_static_objects(self, objects, otype='node', temporal=False, **kwargs) -> List:
+    def parse_static_objects(self, objects, otype='node', temporal=False,
+                             **kwargs) -> List:
         """Parse static objects such as nodes and edges."""
+        return to_rows(self.parse_static_columns(
+            objects, otype=otype, temporal=temporal, **kwargs))
 
-        # initialize temporal dict
-        _obj: defaultdict = defaultdict(dict)
+    def parse_static_columns(self, objects, otype='node', temporal=False,
+                             **kwargs) -> Dict[str, list]:
+        """Parse the properties of static objects such as nodes and edges
+        into columns, i.e. lists of the values of a property of all objects,
+        where missing values are None."""
 
         # get mapping if defined
         mapping = kwargs.get('mapping', None)
 
-        # iterate over objects
-        for uid, obj in objects.items():
-
-            # add default properties to the obj
-            _obj[uid] = self.default_properties[otype].copy()
-
-            # add obj uid
-            _obj[uid]['uid'] = uid
-
-            # if obj is an edge add source and target nodes
-            if otype == 'edge':
-                _obj[uid]['source'] = obj.v.uid
-                _obj[uid]['target'] = obj.w.uid
-
-            # add obj attributes
-            for attr, value in obj.attributes.items():
-                # if mapping is given map the attribute
-                if mapping is not None and attr in mapping and not temporal:
-                    attr = mapping[attr]
-
-                # check if attribute is in the default object
-                if attr in self.default_properties[otype] and not temporal:
-
-                    # update attribute if given
-                    _obj[uid][attr] = value
+        # add default properties and uids of the objects
+        uids = list(objects.keys())
+        n = len(uids)
+        columns = {attr: [value]*n for attr, value in
+                   self.default_properties[otype].items()}
+        columns['uid'] = uids
+
+        # if obj is an edge add source and target nodes
+        if otype == 'edge':
+            columns['source'] = [obj.v.uid for obj in objects.values()]
+            columns['target'] = [obj.w.uid for obj in objects.values()]
+
+        # add obj attributes
+        if not temporal:
+            for i, obj in enumerate(objects.values()):
+                for attr, value in obj.attributes.items():
+                    # if mapping is given map the attribute
+                    if mapping is not None and attr in mapping:
+                        attr = mapping[attr]
+
+                    # update attribute if it is in the default object
+                    if attr in columns:
+                        columns[attr][i] = value
 
         # update objects based on the kwargs
         # iterate over the kwargs config
+        index = None
         for key, values in self.config[otype].items():
 
             # check if new attribute is a single object
             if isinstance(values, (str, int, float, bool)):
-                for obj in _obj.values():
-                    obj.update({key: values})
+                columns[key] = [values]*n
 
-            # check if new attribute is a list
-            elif isinstance(values, list):
-                for i, obj in enumerate(_obj.values()):
-                    try:
-                        obj[key] = values[i]
-                    except KeyError:
-                        pass
+            # check if new attribute is a list or an array
+            elif isinstance(values, (list, np.ndarray)):
+                if isinstance(values, np.ndarray):
+                    values = [tuple(v) if isinstance(v, list) else v
+                              for v in values.tolist()]
+                column = columns.setdefault(key, [None]*n)
+                m = min(n, len(values))
+                column[:m] = values[:m]
 
             # check if new attribute is a dict
             elif isinstance(values, dict):
-                for k in _obj:
-                    if k in values:
-                        _obj[k][key] = values[k]
+                if index is None:
+                    index = {uid: i for i, uid in enumerate(uids)}
+                column = columns.setdefault(key, [None]*n)
+                for k, value in values.items():
+                    if k in index:
+                        column[index[k]] = value
             # otherwise raise error
             else:
                 LOG.error('Something went wrong, by formatting the values!')
                 raise ValueError
 
-        # remove None values from the objects
-        for key, values in _obj.items():
-            for attr, value in list(values.items()):
-                if value is None:
-                    _obj[key].pop(attr)
-
-        return list(_obj.values())
+        return columns
+
+
+def _nearest(array: np.ndarray, values: Any) -> np.ndarray:
+    """Returns the indices of the nearest elements of a sorted array, where
+    the first index is returned for ties."""
+    values = np.clip(np.asarray(values, dtype=float), array[0], array[-1])
+    if len(array) == 1:
+        return np.zeros(len(values), dtype=np.int64)
+    right = np.searchsorted(array, values, side='left').clip(1, len(array)-1)
+    left = right - 1
+    return np.where(values - array[left] <= array[right] - values,
+                    left, right).astype(np.int64)
+
+
+def _varint(values: np.ndarray) -> str:
+    """Encodes non-negative integers as base64 string of LEB128 varints."""
+    values = np.asarray(values, dtype=np.uint64)
+    size = np.ones(len(values), dtype=np.int64)
+    rest = values >> np.uint64(7)
+    while rest.any():
+        size += rest > 0
+        rest >>= np.uint64(7)
+    position = np.cumsum(size) - size
+    data = np.zeros(int(size.sum()), dtype=np.uint8)
+    for i in range(int(size.max()) if len(size) else 0):
+        select = size > i
+        byte = (values[select] >> np.uint64(7 * i)) & np.uint64(127)
+        more = (size[select] > i + 1).astype(np.uint64) << np.uint64(7)
+        data[position[select] + i] = byte | more
+    return base64.b64encode(data.tobytes()).decode('ascii')
+
+
+def _encode_events(links: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                   styles: np.ndarray, attributes: list, steps: int) -> dict:
+    """Encodes the events of temporal edges, given as the index of the
+    edge, the time step of the start and end, and the index of attributes
+    (or 0), in buckets of time steps.
+
+    Events are sorted by time steps and duplicates are removed, such that
+    the number of events is bounded by the number of time steps and edges.
+    The number of events per time step, the differences of edge indices
+    within time steps, the durations and the attributes are stored as
+    varint encoded arrays, which the d3js template decodes once."""
+    lengths = ends - starts
+    order = np.lexsort((styles, lengths, links, starts))
+    links, starts, lengths, styles = \
+        links[order], starts[order], lengths[order], styles[order]
+    unique = np.ones(len(links), dtype=bool)
+    unique[1:] = (starts[1:] != starts[:-1]) | (links[1:] != links[:-1]) | \
+        (lengths[1:] != lengths[:-1]) | (styles[1:] != styles[:-1])
+    links, starts, lengths, styles = \
+        links[unique], starts[unique], lengths[unique], styles[unique]
+
+    # edge indices are delta encoded within each time step
+    deltas = links.copy()
+    deltas[1:] -= links[:-1]
+    first = np.ones(len(links), dtype=bool)
+    first[1:] = starts[1:] != starts[:-1]
+    deltas[first] = links[first]
+
+    return {'encoding': 'varint',
+            'counts': _varint(np.bincount(starts, minlength=steps)),
+            'edges': _varint(deltas),
+            'lengths': _varint(lengths),
+            'styles': _varint(styles),
+            'attributes': attributes}
 
 # =============================================================================
 # eof
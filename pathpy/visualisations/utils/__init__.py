@@ -11,6 +11,7 @@
 
 from .units import UnitConverter
 from .bending import bend_factor
+from .columns import to_rows, to_columns
 
 # =============================================================================
 # eof
@@ -0,0 +1,38 @@
+"""Columnar representation of plotted objects."""
+# !/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : columns.py -- Convert between rows and columns of objects
+# Author    : Pathpy Developers
+# Time-stamp: <Mon 2026-10-19 09:55 pathpy>
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+from itertools import chain
+from typing import Dict, List
+
+
+def to_rows(columns: Dict[str, list]) -> List[dict]:
+    """Returns objects given by columns, i.e. lists of the values of each
+    property, as list of dicts, where None values are removed."""
+    keys = list(columns)
+    return [{k: v for k, v in zip(keys, values) if v is not None}
+            for values in zip(*columns.values())]
+
+
+def to_columns(rows: List[dict]) -> Dict[str, list]:
+    """Returns the properties of a list of dicts as columns, where missing
+    properties are None."""
+    keys = dict.fromkeys(chain.from_iterable(rows))
+    return {k: [row.get(k, None) for row in rows] for k in keys}
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -25,6 +25,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 # =============================================================================
 
+import numpy as np
+
 from pathpy import logger
 
 LOG = logger(__name__)
@@ -128,18 +130,24 @@ class UnitConverter(object):
 
         Returns
         -------
-        measure : float
-            Returns the converted measure.
+        measure : float or numpy.ndarray
+            Returns the converted measure. Arrays and lists of measures are
+            converted at once and returned as float array.
 
         Examples
         --------
         >>> mm2cm = cn.UnitConverter('mm','cm')
         >>> mm2cm.convert(10)
         1
+        >>> mm2cm.convert([10, 20])
+        array([1., 2.])
 
         """
         try:
-            measure = float(value)
+            if isinstance(value, (np.ndarray, list)):
+                measure = np.asarray(value, dtype=float)
+            else:
+                measure = float(value)
         except:
             LOG.error('Value "{}" is not a number, and therefor can not'
                       ' converted to an other unit!.'.format(value))
@@ -188,6 +196,8 @@ class UnitConverter(object):
             raise NotImplementedError
 
         # return the converted measure
+        if isinstance(value, np.ndarray):
+            return np.round(value, self.digits)
         return round(value, self.digits)
 
 # =============================================================================